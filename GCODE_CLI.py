@@ -0,0 +1,196 @@
+# Command line batch mode of the pen plotting GCODE processor.
+# Runs every job of a manifest (TOML or JSON) through process_gcode, spread over a pool of worker
+# processes, and writes a summary report. A manifest looks like:
+#
+#   [defaults]                       # applies to every job, each job can override any of it
+#   cut_feed = "4500"
+#   preamble_file = "preamble.gcode"
+#
+#   [[jobs]]
+#   input = "drawings/part.gcode"
+#   output = "out/part_2x2.gcode"
+#   tiling_n_x = 2
+#   tiling_n_y = 2
+#
+# or the same structure as JSON. Any keyword argument of process_gcode can be set (batch_pens = true and
+# alternate_pens = true, say, to draw a drawing's layers pen by pen, in alternating order); preamble_file,
+# cycle_subroutine_file and pen_change_file read the preamble and subroutines from a file instead. Relative
+# paths are taken from the directory of the manifest. Jobs that don't set a preamble or subroutine get the
+# GUI's defaults.
+#
+#   python GCODE_CLI.py manifest.toml --workers 8 --report summary.json
+#
+# Jobs processed with --index (or index = true) can be restarted from any cycle and tile without
+# processing them again:
+#
+#   python GCODE_CLI.py --resume out/book.gcode --cycle 37 --tile 2,1 --resume-output out/book_resumed.gcode
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from gcode_processor import (process_gcode, resume_job, format_duration, format_number, DEFAULT_PREAMBLE,
+                             DEFAULT_CYCLE_SUBROUTINE, DEFAULT_PEN_CHANGE)
+from stage_cache import StageCache
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11, where only JSON manifests can be read
+    tomllib = None
+
+# every process_gcode setting a job can give, apart from the files, the cache and the serial sender
+PROCESS_ARGUMENTS = set(inspect.signature(process_gcode).parameters) - {'input_file_path', 'output_file_path',
+                                                                         'cache', 'sender'}
+FILE_ARGUMENTS = {'preamble_file': 'preamble', 'cycle_subroutine_file': 'cycle_subroutine',
+                  'pen_change_file': 'pen_change'}
+
+
+def read_text_files(settings, base_directory):
+    # A copy of a job's (or the defaults') settings with the text files of FILE_ARGUMENTS read in
+    settings = dict(settings)
+    for file_key, text_key in FILE_ARGUMENTS.items():
+        if file_key in settings:
+            with open(os.path.join(base_directory, settings.pop(file_key)), 'r') as file:
+                settings[text_key] = file.read().strip()
+    return settings
+
+
+def load_manifest(manifest_path):
+    # Reads a manifest and returns its list of jobs, each with the defaults filled in,
+    # its text files read and its paths made absolute. Raises ValueError for a malformed manifest,
+    # before any job is started.
+    if manifest_path.lower().endswith('.toml'):
+        if tomllib is None:
+            raise ValueError('TOML manifests need Python 3.11 or later; use a JSON manifest instead')
+        with open(manifest_path, 'rb') as file:
+            manifest = tomllib.load(file)
+    else:
+        with open(manifest_path, 'r') as file:
+            manifest = json.load(file)
+
+    base_directory = os.path.dirname(os.path.abspath(manifest_path))
+    defaults = manifest.get('defaults', {})
+    jobs = []
+    for number, settings in enumerate(manifest.get('jobs', []), start=1):
+        # a job's own text (or text file) wins over the defaults' text file, so the files are read on each side
+        job = read_text_files(defaults, base_directory)
+        job.update(read_text_files(settings, base_directory))
+        name = job.pop('name', None) or os.path.splitext(os.path.basename(str(job.get('input', number))))[0]
+        for key in ('input', 'output'):
+            if key not in job:
+                raise ValueError(f'job {number} ({name}) has no {key} file')
+            job[key] = os.path.join(base_directory, job[key])
+        unknown = set(job) - PROCESS_ARGUMENTS - {'input', 'output'}
+        if unknown:
+            raise ValueError(f'job {number} ({name}) has unknown settings: {", ".join(sorted(unknown))}')
+        job.setdefault('preamble', DEFAULT_PREAMBLE.strip())
+        job.setdefault('cycle_subroutine', DEFAULT_CYCLE_SUBROUTINE.strip())
+        job.setdefault('pen_change', DEFAULT_PEN_CHANGE.strip())
+        # the feeds are spliced into the gcode as text
+        for key in ('cut_feed', 'trav_feed'):
+            if isinstance(job.get(key), (int, float)):
+                job[key] = format_number(job[key])
+        job['name'] = name
+        jobs.append(job)
+    if not jobs:
+        raise ValueError('the manifest has no jobs')
+    return jobs
+
+
+def run_job(job, cache=None):
+    # Runs one job in a worker process and returns its report entry; errors are reported rather than raised,
+    # so one bad job doesn't stop the rest of the batch
+    job = dict(job, cache=cache)
+    report = {'name': job.pop('name'), 'input': job.pop('input'), 'output': job.pop('output')}
+    start = time.perf_counter()
+    try:
+        output_directory = os.path.dirname(report['output'])
+        if output_directory:
+            os.makedirs(output_directory, exist_ok=True)
+        report.update(process_gcode(report['input'], report['output'], **job))
+        report['status'] = 'ok'
+    except Exception as e:
+        report['status'] = 'failed'
+        report['error'] = f'{type(e).__name__}: {e}'
+    report['seconds'] = time.perf_counter() - start
+    return report
+
+
+def run_jobs(jobs, workers=None, cache=None):
+    # Runs the jobs over a pool of worker processes, yielding (job index, report) as each job finishes.
+    # Variants of the same input share its parsed and prepared cell through the stage cache.
+    if workers == 1:
+        yield from enumerate(run_job(job, cache) for job in jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_job, job, cache): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Batch process pen plotting gcode from a manifest of jobs.')
+    parser.add_argument('manifest', nargs='?', help='TOML or JSON manifest of jobs')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--report', help='write a JSON summary of every job to this file')
+    parser.add_argument('--cache-dir', help='stage cache directory (default: the per-user cache directory)')
+    parser.add_argument('--no-cache', action='store_true', help="don't read or write the stage cache")
+    parser.add_argument('--profile', action='store_true',
+                        help='trace the memory of every stage and write <output>.profile.json for each job')
+    parser.add_argument('--index', action='store_true',
+                        help='write <output>.index.json for each job, so it can be resumed from any tile')
+    parser.add_argument('--resume', metavar='OUTPUT', help='restart an indexed output file instead of running jobs')
+    parser.add_argument('--cycle', type=int, default=1, help='with --resume, the cycle to restart at (from 1)')
+    parser.add_argument('--tile', default='1',
+                        help='with --resume, the tile to restart at: its number, or column,row of the grid (from 1)')
+    parser.add_argument('--resume-output', help='with --resume, where to write the restarted job '
+                                                '(default: OUTPUT with _resumed added)')
+    args = parser.parse_args(argv)
+
+    if args.resume:
+        resume_path = args.resume_output or '_resumed'.join(os.path.splitext(args.resume))
+        try:
+            tile = tuple(int(value) for value in args.tile.split(',')) if ',' in args.tile else int(args.tile)
+            entry = resume_job(args.resume, resume_path, args.cycle, tile)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        print(f"{resume_path}: resumes at cycle {entry['cycle']}, tile {entry['tile']}")
+        return 0
+    if not args.manifest:
+        parser.error('give a manifest, or --resume')
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    for flag in ('profile', 'index'):
+        if getattr(args, flag):
+            for job in jobs:
+                job[flag] = True
+
+    # the report keeps the manifest order, whatever order the jobs finish in
+    reports = [None] * len(jobs)
+    cache = None if args.no_cache else StageCache(args.cache_dir)
+    for done, (index, report) in enumerate(run_jobs(jobs, args.workers, cache), start=1):
+        reports[index] = report
+        if report['status'] == 'ok':
+            estimate = '' if report['total_time'] is None else f"est. {format_duration(report['total_time'])}, "
+            print(f"[{done}/{len(jobs)}] {report['name']}: {report['output']} "
+                  f"(work {report['x_work_bound']:.1f} x {report['y_work_bound']:.1f}mm, "
+                  f"{estimate}{report['seconds']:.1f}s)")
+        else:
+            print(f"[{done}/{len(jobs)}] {report['name']}: FAILED {report['error']}", file=sys.stderr)
+
+    if args.report:
+        with open(args.report, 'w') as file:
+            json.dump(reports, file, indent=2)
+    failed = sum(report['status'] != 'ok' for report in reports)
+    print(f'{len(reports) - failed} of {len(reports)} jobs done' + (f', {failed} failed' if failed else ''))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,26 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, simpledialog, ttk
 from tkinter.font import Font
-from tkinter import StringVar
-import re
+from tkinter import StringVar, DoubleVar
+import queue
+import threading
+from gcode_processor import (process_gcode, resume_job, format_duration, ProcessingCancelled,
+                             DEFAULT_PREAMBLE, DEFAULT_CYCLE_SUBROUTINE, DEFAULT_PEN_CHANGE, FIRMWARE_TARGETS)
+from stage_cache import StageCache
+from stage_profiler import format_stages
+from serial_sender import GcodeSender, open_serial
+from toolpath_preview import ToolpathPreview
 # pyinstaller --onefile --windowed GCODE_GUI.py
+# Streaming to the plotter needs the optional pyserial (pip install pyserial) installed before building;
+# without it the GUI still makes files and says so when asked to stream.
 
 
 def open_input_file():
-    # prompt Windows file open dialog for input file
+    # prompt Windows file open dialog for input file (gcode, or a DXF drawing to convert directly)
     input_file_path = filedialog.askopenfilename(
         title="Select your gcode input file",
-        filetypes=[("GCODE files", "*.gcode*"), ("Text files", "*.txt"), ("All files", "*.*")]
+        filetypes=[("GCODE files", "*.gcode*"), ("DXF drawings", "*.dxf"), ("Text files", "*.txt"),
+                   ("All files", "*.*")]
     )
     if input_file_path:
         input_file_entry.delete(0, tk.END)
@@ -28,137 +38,34 @@ def open_output_file():
         output_file_entry.insert(0, output_file_path)
 
 
-def search_and_replace(content, search_string, replace_string):
-    # substitutes all unique instances of a search string.
-    pattern = r'\b' + re.escape(search_string) + r'\b'
-    return re.sub(pattern, replace_string, content)
-
-
-def add_to_lines(content, flag, code, value):
-    # appends a string to lines which contain the specified flag,
-    # (provided that a feed isn't already in the line)
-    modified_lines = []
-    for line in content:
-        if flag in line and 'F' not in line:
-            line = line.rstrip() + ' ' + code + value
-        modified_lines.append(line)
-    return modified_lines
-
-
-def calculate_bounds(content, flag1, flag2):
-    # Computes the maximum G1 cutting dimensions of the gcode part
-    last_positive_x_value = 0
-    last_positive_y_value = 0
-    last_negative_x_value = 0
-    last_negative_y_value = 0
-    # for every line, check that the X/Y is there, and pull out the numerical value
-    # only keep the largest value that is encountered
-    for i, line in enumerate(content):
-        if flag1 or flag2 in line:
-            if 'X' in line:
-                x_start_index = line.index('X') + 1
-                x_end_index = line.index(' ', x_start_index)
-                x_value = float(line[x_start_index:x_end_index])
-                # if i == 1 or i == 2:
-                #    debug_var.set(f'{x_value}')
-                if x_value < 0:
-                    if last_negative_x_value < abs(x_value):
-                        last_negative_x_value = abs(x_value)
-                elif x_value > 0:
-                    if last_positive_x_value < x_value:
-                        last_positive_x_value = x_value
-
-            if 'Y' in line:
-                y_start_index = line.index('Y') + 1
-
-                try:
-                    y_value = float(line[y_start_index:])
-                except ValueError:
-                    y_end_index = line.index(' ', y_start_index)
-                    y_value = float(line[y_start_index:y_end_index])
-
-                if y_value < 0:
-                    if last_negative_y_value < abs(y_value):
-                        last_negative_y_value = abs(y_value)
-                elif y_value > 0:
-                    if last_positive_y_value < y_value:
-                        last_positive_y_value = y_value
-
-    return [last_negative_x_value + last_positive_x_value, last_negative_y_value + last_positive_y_value]
-
-
-def offset_cell(n_x, s_x, n_y, s_y, tiling_scale, content_cell):
-    # Before each page cycle is repeated, we need to repeat the unit cell gcode n * m times,
-    # offsetting the cell the requisite distances in x and y each time.
-    # The absolute offsets should be added to each cell (the code remains in absolute coordinates).
-    offset_tile_set_list = []
-    # offset_content_single = ''
-    # loop through each 'tile' (user inputted gcode), and for each tile,
-    # loop through each line.
-    for i in range(n_x):
-        for j in range(n_y):
-            offset_cell_content_list = []
-            # debug_var.set(f'i: {i} j: {j}')
-            # Calculate the offsets
-            offset_x = i * s_x
-            offset_y = j * s_y
-            # For every line, check that the X/Y is there, and apply the requisite offsets to
-            # the extracted absolute coordinates, finally putting it back into the gcode.
-            # x_value = 0
-            # y_value = 0
-            for k, line in enumerate(content_cell):
-                # debug_var.set(f'k: {k}')
-                # if k == 1:
-                #   debug_var.set(line)
-                if 'G01' in line or 'G00' in line:
-                    # debug_var.set(line)
-                    if 'X' in line:
-                        # debug_var.set(line)
-                        x_start_index = line.index('X') + 1
-                        x_end_index = line.find(' ', x_start_index)
-                        if x_end_index == -1:
-                            x_end_index = len(line)
-                        modified_x_value = float(line[x_start_index:x_end_index]) * tiling_scale + offset_x
-                        line = line[:x_start_index] + f'{modified_x_value}' + line[x_end_index:]
-
-                        # debug_var.set(f'Offset line: {line}')
-                        # debug_var.set(f'SF,EF: {line[:x_start_index]}~~{line[x_end_index:]}')
-                        # debug_var.set(f'Offset line: {line}')
-
-                    if 'Y' in line:
-                        y_start_index = line.index('Y') + 1
-                        y_end_index = line.find(' ', y_start_index)
-                        if y_end_index == -1:
-                            y_end_index = len(line)
-                        modified_y_value = float(line[y_start_index:y_end_index]) * tiling_scale + offset_y
-                        line = line[:y_start_index] + f'{modified_y_value}' + line[y_end_index:]
-
-                # for every line, add the offset line to the cell content list
-                offset_cell_content_list.append(line)
-                # debug_var.set(f'Offset line list: {offset_cell_content_list}')
-            # after all the lines added, convert cell to a string and add to the tile set list.
-            offset_cell_content = '\n'.join(offset_cell_content_list) + '\n'
-            # debug_var.set(f'Offset cell content: {offset_cell_content}')
-            offset_tile_set_list.append(offset_cell_content)
-    # Join the set of offset tiles back into a single string
-    offset_tile_set = '\n'.join(offset_tile_set_list) + '\n'
-    return offset_tile_set
-
-
-def process_file():
+def process_file(stream=False):
     # get the file paths and preamble text from the GUI
     input_file_path = input_file_entry.get()
     output_file_path = output_file_entry.get()
     preamble = preamble_text.get("1.0", tk.END).strip()
     cycle_subroutine = cycles_text.get("1.0", tk.END).strip()
+    pen_change = pen_change_text.get("1.0", tk.END).strip()
+    # when streaming to the plotter, the output file is only written if asked for
+    if stream and not save_stream_var.get():
+        output_file_path = None
     # make sure that files have actually been selected
-    if not input_file_path or not output_file_path:
+    if not input_file_path or not (output_file_path or stream):
         messagebox.showerror("Error", "Please select both input and output files.")
         return
+    if stream:
+        try:
+            stream = (port_entry.get().strip(), int(baud_entry.get()),
+                      'count' if char_counting_var.get() else 'ok')
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a whole number for the baud rate.")
+            return
+        if not stream[0]:
+            messagebox.showerror("Error", "Please enter the plotter's serial port.")
+            return
+    else:
+        stream = None
 
     try:
-        with open(input_file_path, 'r') as file:
-            content = file.read()
         # Get search and replace strings from GUI
         # mso = M start old
         # meo = M end old
@@ -177,6 +84,13 @@ def process_file():
         tiling_s_x = tiling_s_x_entry.get()
         tiling_s_y = tiling_s_y_entry.get()
         tiling_scale = tiling_scale_entry.get()
+        tiling_rotation = tiling_rotation_entry.get()
+        simplify_tolerance = simplify_tolerance_entry.get()
+        dxf_tolerance = dxf_tolerance_entry.get()
+        bed_width = bed_width_entry.get()
+        bed_height = bed_height_entry.get()
+        bed_margin = bed_margin_entry.get()
+        nest_spacing = nest_spacing_entry.get()
 
         # list of all user inputs which want to be integers
         numerical_input_name_list = ['Cutting Speed',
@@ -187,7 +101,14 @@ def process_file():
                                      'Tile Spacing X',
                                      'No. Tiles Y',
                                      'Tile Spacing Y',
-                                     'Tile Scale']
+                                     'Tile Scale',
+                                     'Tile Rotation',
+                                     'Simplify Tolerance',
+                                     'DXF Tolerance',
+                                     'Bed Width',
+                                     'Bed Height',
+                                     'Bed Margin',
+                                     'Part Spacing']
         numerical_input_value_list = [cut_feed,
                                       trav_feed,
                                       cycles,
@@ -196,7 +117,14 @@ def process_file():
                                       tiling_s_x,
                                       tiling_n_y,
                                       tiling_s_y,
-                                      tiling_scale]
+                                      tiling_scale,
+                                      tiling_rotation,
+                                      simplify_tolerance,
+                                      dxf_tolerance,
+                                      bed_width,
+                                      bed_height,
+                                      bed_margin,
+                                      nest_spacing]
 
         # Convert numerical inputs to integers
         # loop through the numerical input lists and attempt to type cast to int.
@@ -219,228 +147,224 @@ def process_file():
         tiling_n_y = int(numerical_input_value_list[6])
         tiling_s_y = int(numerical_input_value_list[7])
         tiling_scale = float(numerical_input_value_list[8])
-
-        # compute bounds of work area and update the GUI
-        x_bound, y_bound = calculate_bounds(content.split('\n'), 'G01', 'G00')
-        x_work_bound = x_bound * tiling_scale * tiling_n_x + (int(tiling_n_x) - 1) * tiling_s_x
-        y_work_bound = y_bound * tiling_scale * tiling_n_y + (int(tiling_n_y) - 1) * tiling_s_y
-        bounds_var.set('Part Bounds: X: ' + str(x_bound * tiling_scale) + 'mm  Y: ' + str(y_bound*tiling_scale) + 'mm\n' +
-                       'Work Bounds: X: ' + str(x_work_bound) +
-                       'mm  Y: ' + str(y_work_bound) + 'mm')
-
-        # Repeat the tool paths for the requested number of cycles
-        content_single = search_and_replace(content, 'M02', '')
-
-        # Before each page cycle is repeated, we need to repeat the unit cell gcode n * m times,
-        # offsetting the cell the requisite distances in x and y each time.
-        # The absolute offsets should be added to each cell (the code remains in absolute coordinates).
-        content_single = offset_cell(tiling_n_x, tiling_s_x, tiling_n_y, tiling_s_y, tiling_scale, content_single.split('\n'))
-
-        content_loop = content_single
-        # debug_var.set(f'Cycles: {cycles}')
-        for i in range(cycles - 1):
-            z_offset = i * cycle_offset
-            content_loop = content_loop + f'\nG01 Z{z_offset}\nG92 Z0' + cycle_subroutine + content_single
-        content = content_loop + '\n' + 'M02'
-
-        # add skirt tool path to beginning of gcode, and a short safety dwell
-        skirt_minor = (f'G01 X{x_bound * tiling_scale} Y0\n'
-                 f'G01 X{x_bound * tiling_scale} Y{y_bound * tiling_scale}\n'
-                 f'G01 X0 Y{y_bound * tiling_scale}\n'
-                 f'G01 X0 Y0\n'
-                 'G4 S2') + '\n'
-
-        skirt_major = (f'G01 X{x_work_bound} Y0\n'
-                 f'G01 X{x_work_bound} Y{y_work_bound}\n'
-                 f'G01 X0 Y{y_work_bound}\n'
-                 f'G01 X0 Y0\n'
-                 'G4 S2') + '\n'
-
-
-        # add preamble text to beginning of gcode
-        new_content = preamble + '\n' + skirt_minor + skirt_major + '\n' + content
-
-        # Find and replace the cut M commands from the gcode
-        new_content = search_and_replace(new_content, mso, msn)
-        new_content = search_and_replace(new_content, meo, men)
-
-        # Add feeds after every G00 and G01 move command
-        new_content = add_to_lines(new_content.split('\n'), 'G01', 'F', cut_feed)
-        new_content = add_to_lines(new_content, 'G00', 'F', trav_feed)
-
-        # Add a new-line character to each list item and join back into a single string
-        new_list = [item + '\n' for item in new_content]
-        new_content = ''.join(new_list)
-
-        # Write to output file
-        with open(output_file_path, 'w') as file:
-            file.write(new_content)
-
-        messagebox.showinfo("Success",
-                            f"File processed and saved: {output_file_path}")
+        tiling_rotation = float(numerical_input_value_list[9])
+        simplify_tolerance = float(numerical_input_value_list[10])
+        dxf_tolerance = float(numerical_input_value_list[11])
+        bed_width = float(numerical_input_value_list[12])
+        bed_height = float(numerical_input_value_list[13])
+        bed_margin = float(numerical_input_value_list[14])
+        nest_spacing = float(numerical_input_value_list[15])
+        # blank for exact coordinates
+        precision = precision_entry.get().strip()
+        try:
+            precision = int(precision) if precision else None
+        except ValueError:
+            messagebox.showwarning("Invalid Input",
+                                   "Invalid input for Decimal Places. Please enter an integer, or leave it blank.")
+            precision = None
+
+        settings = dict(
+            preamble=preamble, cycle_subroutine=cycle_subroutine,
+            mso=mso, meo=meo, msn=msn, men=men, cut_feed=cut_feed, trav_feed=trav_feed,
+            cycles=cycles, cycle_offset=cycle_offset,
+            tiling_n_x=tiling_n_x, tiling_s_x=tiling_s_x, tiling_n_y=tiling_n_y, tiling_s_y=tiling_s_y,
+            tiling_scale=tiling_scale, tiling_rotation=tiling_rotation,
+            tiling_mirror_x=tiling_mirror_x_var.get(), tiling_mirror_y=tiling_mirror_y_var.get(),
+            optimize_travel=optimize_travel_var.get(),
+            simplify_tolerance=simplify_tolerance, fit_arcs=fit_arcs_var.get(), dxf_tolerance=dxf_tolerance,
+            nest=nest_var.get(), bed_width=bed_width, bed_height=bed_height, bed_margin=bed_margin,
+            nest_spacing=nest_spacing, nest_rotate=nest_rotate_var.get(), nest_stagger=nest_stagger_var.get(),
+            precision=precision, compact=compact_var.get(), omit_modal_words=omit_modal_words_var.get(),
+            profile=profile_var.get(), index=index_var.get(), firmware=firmware_var.get(),
+            batch_pens=batch_pens_var.get(), pen_change=pen_change, alternate_pens=alternate_pens_var.get(),
+            estimate=estimate_var.get())
     # Please don't be used :/
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred: {str(e)}")
+        return
+
+    # run the transform on a worker thread, streaming the result into the output file,
+    # while the window keeps responding and shows its progress
+    cancel_event.clear()
+    process_button.config(state=tk.DISABLED)
+    stream_button.config(state=tk.DISABLED)
+    cancel_button.config(state=tk.NORMAL)
+    progress_var.set(0)
+    threading.Thread(target=run_worker, args=(input_file_path, output_file_path, settings, stream),
+                     daemon=True).start()
+    root.after(100, poll_worker, output_file_path, settings)
+
+
+def run_worker(input_file_path, output_file_path, settings, stream=None):
+    # Runs process_gcode off the Tk thread. tkinter may only be used from the thread that created it,
+    # so progress and the outcome are passed back through worker_queue for poll_worker to pick up.
+    # With stream set to (port, baud rate, flow control), the job is sent to the plotter as it's generated.
+    def progress(stage, fraction):
+        if cancel_event.is_set():
+            raise ProcessingCancelled()
+        worker_queue.put(('progress', stage, fraction))
+
+    sender = None
+    try:
+        if stream is not None:
+            port, baudrate, flow_control = stream
+            worker_queue.put(('progress', f'Connecting to {port}', 0.0))
+            sender = streaming['sender'] = GcodeSender(open_serial(port, baudrate), flow_control)
+            sender.start()
+        summary = process_gcode(input_file_path, output_file_path, cache=stage_cache, progress=progress,
+                                preview=True, sender=sender, **settings)
+        worker_queue.put(('done', summary))
+    except ProcessingCancelled:
+        worker_queue.put(('cancelled',))
+    except Exception as e:
+        worker_queue.put(('error', e))
+    finally:
+        if sender is not None:
+            streaming.clear()
+            sender.close()
+
+
+def poll_worker(output_file_path, settings):
+    # Shows the worker's progress, checking back every 100ms until it reports how it finished
+    while not worker_queue.empty():
+        message = worker_queue.get()
+        if message[0] == 'progress':
+            status_var.set(message[1])
+            progress_var.set(100 * message[2])
+            continue
+        process_button.config(state=tk.NORMAL)
+        stream_button.config(state=tk.NORMAL)
+        cancel_button.config(state=tk.DISABLED)
+        if message[0] == 'done':
+            status_var.set('Done')
+            last_preview['job'] = message[1].pop('preview')
+            last_preview['title'] = f"Toolpath Preview - {output_file_path or 'streamed job'}"
+            preview_button.config(state=tk.NORMAL)
+            show_summary(message[1], output_file_path, settings)
+        elif message[0] == 'cancelled':
+            status_var.set('Cancelled')
+            progress_var.set(0)
+            messagebox.showinfo("Cancelled", "Processing was cancelled; the output file was not changed.")
+        else:
+            status_var.set('Failed')
+            messagebox.showerror("Error", f"An error occurred: {str(message[1])}")
+        return
+    root.after(100, poll_worker, output_file_path, settings)
 
 
-# Create main window
-root = tk.Tk()
-root.title("3D Printer Pen Plotting GCODE Processor")
-
-# Input file selection
-tk.Label(root, text="Input File:").grid(row=0, column=0, sticky="e", padx=5, pady=5)
-input_file_entry = tk.Entry(root, width=50)
-input_file_entry.grid(row=0, column=1, padx=5, pady=5)
-tk.Button(root, text="Browse", command=open_input_file).grid(row=0, column=2, padx=5, pady=5)
-input_file_entry.insert(0, 'Select your input file (.txt, .gcode)')
-
-# Output file selection
-tk.Label(root, text="Output File:").grid(row=1, column=0, sticky="e", padx=5, pady=5)
-output_file_entry = tk.Entry(root, width=50)
-output_file_entry.grid(row=1, column=1, padx=5, pady=5)
-tk.Button(root, text="Browse", command=open_output_file).grid(row=1, column=2, padx=5, pady=5)
-output_file_entry.insert(0, 'Select your output file (.txt, .gcode)')
-
-# Command inputs
-tk.Label(root, text="Existing start-cut GCODE:").grid(row=2, column=0, sticky="e", padx=5, pady=5)
-mso_entry = tk.Entry(root)
-mso_entry.grid(row=2, column=1, sticky="w", padx=5, pady=5)
-mso_entry.insert(0, "M09")
-
-tk.Label(root, text="Existing end-cut GCODE:").grid(row=3, column=0, sticky="e", padx=5, pady=5)
-meo_entry = tk.Entry(root)
-meo_entry.grid(row=3, column=1, sticky="w", padx=5, pady=5)
-meo_entry.insert(0, "M10")
-
-tk.Label(root, text="New start-cut GCODE:").grid(row=4, column=0, sticky="e", padx=5, pady=5)
-msn_entry = tk.Entry(root)
-msn_entry.grid(row=4, column=1, sticky="w", padx=5, pady=5)
-msn_entry.insert(0, "G01 Z-3")
-
-tk.Label(root, text="New end-cut GCODE:").grid(row=5, column=0, sticky="e", padx=5, pady=5)
-men_entry = tk.Entry(root)
-men_entry.grid(row=5, column=1, sticky="w", padx=5, pady=5)
-men_entry.insert(0, "G01 Z0")
-
-tk.Label(root, text="Cutting speed (mm/min):").grid(row=6, column=0, sticky="e", padx=5, pady=5)
-cut_feed_entry = tk.Entry(root)
-cut_feed_entry.grid(row=6, column=1, sticky="w", padx=5, pady=5)
-cut_feed_entry.insert(0, "4500")
-
-tk.Label(root, text="Travel speed (mm/min):").grid(row=7, column=0, sticky="e", padx=5, pady=5)
-trav_feed_entry = tk.Entry(root)
-trav_feed_entry.grid(row=7, column=1, sticky="w", padx=5, pady=5)
-trav_feed_entry.insert(0, "9000")
-
-tk.Label(root, text="No. cycles:").grid(row=8, column=0, sticky="e", padx=5, pady=5)
-cycles_entry = tk.Entry(root)
-cycles_entry.grid(row=8, column=1, sticky="w", padx=5, pady=5)
-cycles_entry.insert(0, "2")
-
-tk.Label(root, text="Cycle z-offset (mm):").grid(row=9, column=0, sticky="e", padx=5, pady=5)
-cycle_offset_entry = tk.Entry(root)
-cycle_offset_entry.grid(row=9, column=1, sticky="w", padx=5, pady=5)
-cycle_offset_entry.insert(0, "-0.086")
-
-# Tiling
-(tk.Label(root, text="No. tiles X:")
- .grid(row=10, column=0, sticky="e", padx=5, pady=5))
-tiling_n_x_entry = tk.Entry(root)
-tiling_n_x_entry.grid(row=10, column=1, sticky="w", padx=5, pady=5)
-tiling_n_x_entry.insert(0, "1")
-
-(tk.Label(root, text="Tile spacing X (mm):")
- .grid(row=11, column=0, sticky="e", padx=5, pady=5))
-tiling_s_x_entry = tk.Entry(root)
-tiling_s_x_entry.grid(row=11, column=1, sticky="w", padx=5, pady=5)
-tiling_s_x_entry.insert(0, "10")
-
-(tk.Label(root, text="No. tiles Y:")
- .grid(row=12, column=0, sticky="e", padx=5, pady=5))
-tiling_n_y_entry = tk.Entry(root)
-tiling_n_y_entry.grid(row=12, column=1, sticky="w", padx=5, pady=5)
-tiling_n_y_entry.insert(0, "1")
-
-(tk.Label(root, text="Tile spacing Y (mm):")
- .grid(row=13, column=0, sticky="e", padx=5, pady=5))
-tiling_s_y_entry = tk.Entry(root)
-tiling_s_y_entry.grid(row=13, column=1, sticky="w", padx=5, pady=5)
-tiling_s_y_entry.insert(0, "10")
-
-(tk.Label(root, text="Tile Scale")
- .grid(row=14, column=0, sticky="e", padx=5, pady=5))
-tiling_scale_entry = tk.Entry(root)
-tiling_scale_entry.grid(row=14, column=1, sticky="w", padx=5, pady=5)
-tiling_scale_entry.insert(0, "1")
-
-# Preamble text box
-small_font = Font(family="Helvetica", size=8)  # Define a smaller font
-tk.Label(root, text="GCODE Preamble:").grid(row=15, column=0, sticky="ne", padx=5, pady=5)
-preamble_text = tk.Text(root, height=5, width=50, font=small_font, wrap=tk.NONE)
-preamble_text.grid(row=15, column=1, columnspan=1, padx=10, pady=5)
-preamble_text.insert(tk.END, """M201 X1000 Y1000 Z1000 E5000 ; sets maximum accelerations, mm/sec^2
-M203 X400 Y400 Z48 E120 ; sets maximum feedrates, mm / sec
-M204 S400 T1250 ; sets acceleration (S) and retract acceleration (R), mm/sec^2
-M205 X8.00 Y8.00 Z0.40 E1.50 ; sets the jerk limits, mm/sec
-M205 S0 T0 ; sets the minimum extruding and travel feed rate, mm/sec
-
-;TYPE:Custom
-; Initial setups
-G90 ; use absolute coordinates
-G92 ; reset coordinates to 0
-G01 Z-3 F100
-G01 Z0 F100
-G4 S2
-;
-; """)
-
-# Repeater text box
-small_font = Font(family="Helvetica", size=8)  # Define a smaller font
-tk.Label(root, text="Next-Cycle Subroutine GCODE:").grid(row=16, column=0, sticky="ne", padx=5, pady=5)
-cycles_text = tk.Text(root, height=5, width=50, font=small_font, wrap=tk.NONE)
-cycles_text.grid(row=16, column=1, columnspan=1, padx=10, pady=5)
-cycles_text.insert(tk.END, """;;;;;;;;;;;;;;;;;;;;;;;
-G01 Z0
-G4 S2
-G01 X100 Y-10
-M106 S255
-G01 Z-3 F500
-G4 S3
-G01 Z20 F250
-G00 Y200 Z200 
-M107
-G00 X0 Y-10 Z0
-G00 Z-3
-G01 X100
-G01 Z0
-G00 X0 Y0
-;;;;;;;;;;;;;;;;;;;;;;;;;;;\n
-""")
-
-# Description text box
-tk.Label(root, text="Description:").grid(row=17, column=0, sticky="ne", padx=5, pady=5)
-description_text = tk.Text(root, height=5, width=50, font=small_font, wrap=tk.WORD)
-description_text.grid(row=17, column=1, columnspan=1, padx=10, pady=5)
-description_text.insert(tk.END, "This program is designed to process basic 2D gcode from: "
-                                "https://cnc-apps.com/en/app/dxf2gcode\n"
-                                "The program will search and replace the default start and end-cut M-Commands with "
-                                "user-specified ones suitable to their machine, as well as inserting both cut "
-                                "and travel feed rates. For most machines, M106-M107 control the extruder fan, "
-                                "providing a convenient 12/24V switchable power source. Z axis movements can also be "
-                                "used. "
-                                "GCODE from the user can also be tiled in the X and Y directions,"
-                                "with specified spacings and numbers."
-                                "The tile sets can be cycled a specified number of times, with provision for a "
-                                "z offset for each cycle (e.g. plotting every page"
-                                " of a book offsetting by page thickness). "
-                                "A GCODE subroutine can be specified at the end of each cycle, "
-                                "for example to flip the page of the book being plotted on"
-                                " The online gcode converter"
-                                " should be set to MARK, DXF arc as polyline: Yes, "
-                                "Coordinates: Absolute, and M codes on.\n"
-                                "See: https://reprap.org/wiki/G-code\n for a full list "
-                                "of gcode commands.\n\n"
-                                """
+def cancel_processing():
+    # asks the worker to stop at its next progress report, or its next line when streaming
+    cancel_event.set()
+    if 'sender' in streaming:
+        streaming['sender'].cancel()
+    status_var.set('Cancelling...')
+
+
+def resume_from_tile():
+    # writes a copy of the (indexed) output file that restarts the job at a chosen cycle and tile
+    output_file_path = output_file_entry.get()
+    cycle = simpledialog.askinteger("Resume Job", "Resume at cycle:", parent=root, minvalue=1)
+    if cycle is None:
+        return
+    tile = simpledialog.askstring("Resume Job", "Resume at tile (number, or column,row of the grid):",
+                                  parent=root, initialvalue="1")
+    if tile is None:
+        return
+    resume_file_path = filedialog.asksaveasfilename(
+        title="Save the resumed job as",
+        filetypes=[("GCODE files", "*.gcode*"), ("Text files", "*.txt"), ("All files", "*.*")]
+    )
+    if not resume_file_path:
+        return
+    try:
+        tile = tuple(int(value) for value in tile.split(',')) if ',' in tile else int(tile)
+        entry = resume_job(output_file_path, resume_file_path, cycle, tile)
+    except FileNotFoundError:
+        messagebox.showerror("Error", f"{output_file_path} has no resume index; process it with "
+                                      f"'Write resume index' ticked first.")
+        return
+    except (ValueError, OSError) as e:
+        messagebox.showerror("Error", f"An error occurred: {str(e)}")
+        return
+    messagebox.showinfo("Success", f"Resumed job saved: {resume_file_path}\n"
+                                   f"Starts at cycle {entry['cycle']}, tile {entry['tile']}. Put the machine where "
+                                   f"the job was first started before running it.")
+
+
+def open_preview():
+    # opens a preview window of the last job processed
+    if last_preview:
+        ToolpathPreview(root, last_preview['job'], last_preview['title'])
+
+
+def show_summary(summary, output_file_path, settings):
+    # update the GUI with the bounds of the work area and the estimated run time
+    tiling_scale = settings['tiling_scale']
+    if summary['total_time'] is None:
+        estimated_time = 'Estimated Time: not estimated'
+    else:
+        estimated_time = ('Estimated Time: Tile: ' + format_duration(max(summary['tile_times'], default=0)) +
+                          '  Cycle: ' + format_duration(summary['cycle_time']) +
+                          '  Total: ' + format_duration(summary['total_time']))
+    bounds_var.set('Part Bounds: X: ' + str(summary['x_bound'] * tiling_scale) +
+                   'mm  Y: ' + str(summary['y_bound'] * tiling_scale) + 'mm\n' +
+                   'Work Bounds: X: ' + str(summary['x_work_bound']) +
+                   'mm  Y: ' + str(summary['y_work_bound']) + 'mm\n' + estimated_time)
+    # and how long each stage took, with its peak memory when profiled
+    debug_var.set(format_stages(summary['stages']))
+
+    message = f"File processed and saved: {output_file_path}" if output_file_path else "Job streamed"
+    if 'streamed' in summary:
+        message += (f"\nSent to the plotter: {summary['streamed']['lines']} lines, "
+                    f"{summary['streamed']['bytes']} bytes, {summary['streamed']['resends']} resends")
+    if settings['firmware'] != 'expanded' and settings['cycles'] > 2:
+        message += (f"\nCycles 2-{settings['cycles']} are written once, for the {settings['firmware']} firmware "
+                    f"to repeat; run the file from the SD card")
+    if summary['pens']:
+        changes = len(summary['pens'])
+        message += (f"\nBatched {changes} pens ({', '.join(summary['pens'])}): {changes} pen changes per cycle")
+        if settings['alternate_pens'] and settings['cycles'] > 1:
+            message += f" ({changes - 1} after the first, as the pen order alternates)"
+    elif settings['batch_pens']:
+        message += "\nThe drawing has only one layer, so there was nothing to batch"
+    if settings['nest']:
+        message += f"\nNested {summary['tiles']} parts on the bed"
+    elif summary['x_work_bound'] > settings['bed_width'] or summary['y_work_bound'] > settings['bed_height']:
+        message += (f"\nWarning: the work area runs past the {settings['bed_width']:g} x "
+                    f"{settings['bed_height']:g}mm bed (shown in red in the preview)")
+    if settings['optimize_travel']:
+        message += (f"\nPen-up travel per tile: {summary['travel_before']:.0f}mm -> "
+                    f"{summary['travel_after']:.0f}mm")
+    if settings['simplify_tolerance'] > 0:
+        reduction = 100 * (1 - summary['cell_lines_after'] / max(summary['cell_lines_before'], 1))
+        message += (f"\nSimplified cell: {summary['cell_lines_before']} -> {summary['cell_lines_after']} "
+                    f"lines ({reduction:.0f}% fewer)")
+    if settings['profile'] and output_file_path:
+        message += f"\nStage profile saved: {output_file_path}.profile.json"
+    messagebox.showinfo("Success", message)
+
+
+# What the description box says
+DESCRIPTION = ("This program is designed to process basic 2D gcode from: "
+               "https://cnc-apps.com/en/app/dxf2gcode\n"
+               "The program will search and replace the default start and end-cut M-Commands with "
+               "user-specified ones suitable to their machine, as well as inserting both cut "
+               "and travel feed rates. For most machines, M106-M107 control the extruder fan, "
+               "providing a convenient 12/24V switchable power source. Z axis movements can also be "
+               "used. "
+               "GCODE from the user can also be tiled in the X and Y directions,"
+               "with specified spacings and numbers."
+               "The tile sets can be cycled a specified number of times, with provision for a "
+               "z offset for each cycle (e.g. plotting every page"
+               " of a book offsetting by page thickness). "
+               "A GCODE subroutine can be specified at the end of each cycle, "
+               "for example to flip the page of the book being plotted on"
+               " The online gcode converter"
+               " should be set to MARK, DXF arc as polyline: Yes, "
+               "Coordinates: Absolute, and M codes on.\n"
+               "See: https://reprap.org/wiki/G-code\n for a full list "
+               "of gcode commands.\n\n"
+               """
 Example Input GCODE: \n
 G21
 M10
@@ -465,19 +389,294 @@ M10
 G00 X0 Y0
 M02""")
 
-# Display work area bounds
-bounds_var = StringVar()
-bounds_var.set('Work Bounds: Pending data input')
-bounds_label = tk.Label(root, textvariable=bounds_var, font=small_font)
-bounds_label.grid(row=18, column=0, columnspan=2, padx=10, pady=5)
-
-# Debugging box
-debug_var = StringVar()
-debug_var.set('DEBUGGER OUTPUT')
-debug_label = tk.Label(root, textvariable=debug_var, font=small_font)
-debug_label.grid(row=19, column=0, columnspan=2, padx=10, pady=5)
-
-# Process button
-tk.Button(root, text="Process File", command=process_file).grid(row=20, column=0, pady=20)
-
-root.mainloop()
+if __name__ == '__main__':
+    # Parsed cells, bounds and tile sets from earlier runs, so that re-processing after changing
+    # only the feeds, preamble or subroutine doesn't start from scratch
+    stage_cache = StageCache()
+    # messages from the processing worker thread, and the flag that asks it to stop
+    worker_queue = queue.Queue()
+    cancel_event = threading.Event()
+    # what the preview window draws, from the last job processed
+    last_preview = {}
+    # the serial sender of the job being streamed, if any, so that it can be cancelled
+    streaming = {}
+
+    # Create main window
+    root = tk.Tk()
+    root.title("3D Printer Pen Plotting GCODE Processor")
+
+    # Input file selection
+    tk.Label(root, text="Input File:").grid(row=0, column=0, sticky="e", padx=5, pady=5)
+    input_file_entry = tk.Entry(root, width=50)
+    input_file_entry.grid(row=0, column=1, padx=5, pady=5)
+    tk.Button(root, text="Browse", command=open_input_file).grid(row=0, column=2, padx=5, pady=5)
+    input_file_entry.insert(0, 'Select your input file (.txt, .gcode)')
+
+    # Output file selection
+    tk.Label(root, text="Output File:").grid(row=1, column=0, sticky="e", padx=5, pady=5)
+    output_file_entry = tk.Entry(root, width=50)
+    output_file_entry.grid(row=1, column=1, padx=5, pady=5)
+    tk.Button(root, text="Browse", command=open_output_file).grid(row=1, column=2, padx=5, pady=5)
+    output_file_entry.insert(0, 'Select your output file (.txt, .gcode)')
+
+    # Command inputs
+    tk.Label(root, text="Existing start-cut GCODE:").grid(row=2, column=0, sticky="e", padx=5, pady=5)
+    mso_entry = tk.Entry(root)
+    mso_entry.grid(row=2, column=1, sticky="w", padx=5, pady=5)
+    mso_entry.insert(0, "M09")
+
+    tk.Label(root, text="Existing end-cut GCODE:").grid(row=3, column=0, sticky="e", padx=5, pady=5)
+    meo_entry = tk.Entry(root)
+    meo_entry.grid(row=3, column=1, sticky="w", padx=5, pady=5)
+    meo_entry.insert(0, "M10")
+
+    tk.Label(root, text="New start-cut GCODE:").grid(row=4, column=0, sticky="e", padx=5, pady=5)
+    msn_entry = tk.Entry(root)
+    msn_entry.grid(row=4, column=1, sticky="w", padx=5, pady=5)
+    msn_entry.insert(0, "G01 Z-3")
+
+    tk.Label(root, text="New end-cut GCODE:").grid(row=5, column=0, sticky="e", padx=5, pady=5)
+    men_entry = tk.Entry(root)
+    men_entry.grid(row=5, column=1, sticky="w", padx=5, pady=5)
+    men_entry.insert(0, "G01 Z0")
+
+    tk.Label(root, text="Cutting speed (mm/min):").grid(row=6, column=0, sticky="e", padx=5, pady=5)
+    cut_feed_entry = tk.Entry(root)
+    cut_feed_entry.grid(row=6, column=1, sticky="w", padx=5, pady=5)
+    cut_feed_entry.insert(0, "4500")
+
+    tk.Label(root, text="Travel speed (mm/min):").grid(row=7, column=0, sticky="e", padx=5, pady=5)
+    trav_feed_entry = tk.Entry(root)
+    trav_feed_entry.grid(row=7, column=1, sticky="w", padx=5, pady=5)
+    trav_feed_entry.insert(0, "9000")
+
+    tk.Label(root, text="No. cycles:").grid(row=8, column=0, sticky="e", padx=5, pady=5)
+    cycles_entry = tk.Entry(root)
+    cycles_entry.grid(row=8, column=1, sticky="w", padx=5, pady=5)
+    cycles_entry.insert(0, "2")
+
+    tk.Label(root, text="Cycle z-offset (mm):").grid(row=9, column=0, sticky="e", padx=5, pady=5)
+    cycle_offset_entry = tk.Entry(root)
+    cycle_offset_entry.grid(row=9, column=1, sticky="w", padx=5, pady=5)
+    cycle_offset_entry.insert(0, "-0.086")
+
+    # Tiling
+    (tk.Label(root, text="No. tiles X:")
+     .grid(row=10, column=0, sticky="e", padx=5, pady=5))
+    tiling_n_x_entry = tk.Entry(root)
+    tiling_n_x_entry.grid(row=10, column=1, sticky="w", padx=5, pady=5)
+    tiling_n_x_entry.insert(0, "1")
+
+    (tk.Label(root, text="Tile spacing X (mm):")
+     .grid(row=11, column=0, sticky="e", padx=5, pady=5))
+    tiling_s_x_entry = tk.Entry(root)
+    tiling_s_x_entry.grid(row=11, column=1, sticky="w", padx=5, pady=5)
+    tiling_s_x_entry.insert(0, "10")
+
+    (tk.Label(root, text="No. tiles Y:")
+     .grid(row=12, column=0, sticky="e", padx=5, pady=5))
+    tiling_n_y_entry = tk.Entry(root)
+    tiling_n_y_entry.grid(row=12, column=1, sticky="w", padx=5, pady=5)
+    tiling_n_y_entry.insert(0, "1")
+
+    (tk.Label(root, text="Tile spacing Y (mm):")
+     .grid(row=13, column=0, sticky="e", padx=5, pady=5))
+    tiling_s_y_entry = tk.Entry(root)
+    tiling_s_y_entry.grid(row=13, column=1, sticky="w", padx=5, pady=5)
+    tiling_s_y_entry.insert(0, "10")
+
+    (tk.Label(root, text="Tile Scale")
+     .grid(row=14, column=0, sticky="e", padx=5, pady=5))
+    tiling_scale_entry = tk.Entry(root)
+    tiling_scale_entry.grid(row=14, column=1, sticky="w", padx=5, pady=5)
+    tiling_scale_entry.insert(0, "1")
+
+    (tk.Label(root, text="Tile rotation (deg):")
+     .grid(row=10, column=3, sticky="e", padx=5, pady=5))
+    tiling_rotation_entry = tk.Entry(root)
+    tiling_rotation_entry.grid(row=10, column=4, sticky="w", padx=5, pady=5)
+    tiling_rotation_entry.insert(0, "0")
+
+    tiling_mirror_x_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Mirror tiles in X", variable=tiling_mirror_x_var)
+     .grid(row=11, column=4, sticky="w", padx=5, pady=5))
+
+    tiling_mirror_y_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Mirror tiles in Y", variable=tiling_mirror_y_var)
+     .grid(row=12, column=4, sticky="w", padx=5, pady=5))
+
+    optimize_travel_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Optimise stroke and tile order", variable=optimize_travel_var)
+     .grid(row=13, column=4, sticky="w", padx=5, pady=5))
+
+    profile_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Profile stages (memory + JSON report)", variable=profile_var)
+     .grid(row=14, column=4, sticky="w", padx=5, pady=5))
+
+    (tk.Label(root, text="Repeat cycles with:")
+     .grid(row=0, column=3, sticky="e", padx=5, pady=5))
+    firmware_var = StringVar(value='expanded')
+    (ttk.Combobox(root, textvariable=firmware_var, values=FIRMWARE_TARGETS, state="readonly", width=10)
+     .grid(row=0, column=4, sticky="w", padx=5, pady=5))
+
+    # the estimate takes about as long as the rest of a large job, so it can be left out
+    estimate_var = tk.BooleanVar(value=True)
+    (tk.Checkbutton(root, text="Estimate run time", variable=estimate_var)
+     .grid(row=1, column=4, sticky="w", padx=5, pady=5))
+
+    index_var = tk.BooleanVar(value=True)
+    (tk.Checkbutton(root, text="Write resume index", variable=index_var)
+     .grid(row=20, column=4, sticky="w", padx=5, pady=5))
+
+    # Simplification
+    (tk.Label(root, text="Simplify tolerance (mm):")
+     .grid(row=2, column=3, sticky="e", padx=5, pady=5))
+    simplify_tolerance_entry = tk.Entry(root)
+    simplify_tolerance_entry.grid(row=2, column=4, sticky="w", padx=5, pady=5)
+    simplify_tolerance_entry.insert(0, "0")
+
+    fit_arcs_var = tk.BooleanVar(value=True)
+    (tk.Checkbutton(root, text="Fit arcs (G02/G03) when simplifying", variable=fit_arcs_var)
+     .grid(row=3, column=4, sticky="w", padx=5, pady=5))
+
+    # DXF import
+    (tk.Label(root, text="DXF curve tolerance (mm):")
+     .grid(row=4, column=3, sticky="e", padx=5, pady=5))
+    dxf_tolerance_entry = tk.Entry(root)
+    dxf_tolerance_entry.grid(row=4, column=4, sticky="w", padx=5, pady=5)
+    dxf_tolerance_entry.insert(0, "0.01")
+
+    # Output encoding, exact and in full by default so the output is what it always was until asked otherwise
+    (tk.Label(root, text="Decimal places (blank = exact):")
+     .grid(row=5, column=3, sticky="e", padx=5, pady=5))
+    precision_entry = tk.Entry(root)
+    precision_entry.grid(row=5, column=4, sticky="w", padx=5, pady=5)
+
+    compact_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Compact output (drop repeated axes, feeds and no-op moves)", variable=compact_var)
+     .grid(row=6, column=4, sticky="w", padx=5, pady=5))
+
+    omit_modal_words_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Also drop repeated G words (not for Marlin)", variable=omit_modal_words_var)
+     .grid(row=7, column=4, sticky="w", padx=5, pady=5))
+
+    # Nesting on the bed, instead of the tile grid
+    nest_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Nest parts on the bed (instead of the tile grid)", variable=nest_var)
+     .grid(row=8, column=4, sticky="w", padx=5, pady=5))
+
+    nest_rotate_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Nesting: allow quarter turns", variable=nest_rotate_var)
+     .grid(row=9, column=4, sticky="w", padx=5, pady=5))
+
+    # The machine's bed, that nested parts are packed onto and every job is checked against
+    (tk.Label(root, text="Bed width (mm):")
+     .grid(row=15, column=3, sticky="e", padx=5, pady=5))
+    bed_width_entry = tk.Entry(root)
+    bed_width_entry.grid(row=15, column=4, sticky="w", padx=5, pady=5)
+    bed_width_entry.insert(0, "200")
+
+    (tk.Label(root, text="Bed height (mm):")
+     .grid(row=16, column=3, sticky="e", padx=5, pady=5))
+    bed_height_entry = tk.Entry(root)
+    bed_height_entry.grid(row=16, column=4, sticky="w", padx=5, pady=5)
+    bed_height_entry.insert(0, "200")
+
+    (tk.Label(root, text="Bed margin (mm):")
+     .grid(row=17, column=3, sticky="e", padx=5, pady=5))
+    bed_margin_entry = tk.Entry(root)
+    bed_margin_entry.grid(row=17, column=4, sticky="w", padx=5, pady=5)
+    bed_margin_entry.insert(0, "5")
+
+    (tk.Label(root, text="Part spacing (mm):")
+     .grid(row=18, column=3, sticky="e", padx=5, pady=5))
+    nest_spacing_entry = tk.Entry(root)
+    nest_spacing_entry.grid(row=18, column=4, sticky="w", padx=5, pady=5)
+    nest_spacing_entry.insert(0, "2")
+
+    nest_stagger_var = tk.BooleanVar(value=True)
+    (tk.Checkbutton(root, text="Nesting: try staggered rows", variable=nest_stagger_var)
+     .grid(row=19, column=4, sticky="w", padx=5, pady=5))
+
+    # Preamble text box
+    small_font = Font(family="Helvetica", size=8)  # Define a smaller font
+    tk.Label(root, text="GCODE Preamble:").grid(row=15, column=0, sticky="ne", padx=5, pady=5)
+    preamble_text = tk.Text(root, height=5, width=50, font=small_font, wrap=tk.NONE)
+    preamble_text.grid(row=15, column=1, columnspan=1, padx=10, pady=5)
+    preamble_text.insert(tk.END, DEFAULT_PREAMBLE)
+
+    # Repeater text box
+    small_font = Font(family="Helvetica", size=8)  # Define a smaller font
+    tk.Label(root, text="Next-Cycle Subroutine GCODE:").grid(row=16, column=0, sticky="ne", padx=5, pady=5)
+    cycles_text = tk.Text(root, height=5, width=50, font=small_font, wrap=tk.NONE)
+    cycles_text.grid(row=16, column=1, columnspan=1, padx=10, pady=5)
+    cycles_text.insert(tk.END, DEFAULT_CYCLE_SUBROUTINE)
+
+    # Description text box
+    tk.Label(root, text="Description:").grid(row=17, column=0, sticky="ne", padx=5, pady=5)
+    description_text = tk.Text(root, height=5, width=50, font=small_font, wrap=tk.WORD)
+    description_text.grid(row=17, column=1, columnspan=1, padx=10, pady=5)
+    description_text.insert(tk.END, DESCRIPTION)
+
+    # Display work area bounds
+    bounds_var = StringVar()
+    bounds_var.set('Work Bounds: Pending data input')
+    bounds_label = tk.Label(root, textvariable=bounds_var, font=small_font)
+    bounds_label.grid(row=18, column=0, columnspan=2, padx=10, pady=5)
+
+    # Debugging box
+    debug_var = StringVar()
+    debug_var.set('DEBUGGER OUTPUT')
+    debug_label = tk.Label(root, textvariable=debug_var, font=small_font, justify=tk.LEFT)
+    debug_label.grid(row=19, column=0, columnspan=2, padx=10, pady=5)
+
+    # Process and cancel buttons
+    process_button = tk.Button(root, text="Process File", command=process_file)
+    process_button.grid(row=20, column=0, pady=20)
+    cancel_button = tk.Button(root, text="Cancel", command=cancel_processing, state=tk.DISABLED)
+    cancel_button.grid(row=20, column=1, sticky="w", pady=20)
+    preview_button = tk.Button(root, text="Preview Toolpath", command=open_preview, state=tk.DISABLED)
+    preview_button.grid(row=20, column=1, sticky="e", pady=20)
+    stream_button = tk.Button(root, text="Stream to Plotter", command=lambda: process_file(stream=True))
+    stream_button.grid(row=20, column=2, pady=20)
+    tk.Button(root, text="Resume From...", command=resume_from_tile).grid(row=20, column=3, pady=20)
+
+    # Progress of the current run
+    progress_var = DoubleVar(value=0)
+    ttk.Progressbar(root, variable=progress_var, maximum=100, length=300).grid(row=21, column=0, columnspan=2,
+                                                                               padx=10, pady=5)
+    status_var = StringVar()
+    status_var.set('Idle')
+    tk.Label(root, textvariable=status_var, font=small_font).grid(row=21, column=2, columnspan=2, sticky="w",
+                                                                  padx=5, pady=5)
+
+    # Streaming straight to the plotter over USB serial (needs pyserial, see the top of the file)
+    tk.Label(root, text="Plotter serial port:").grid(row=22, column=0, sticky="e", padx=5, pady=5)
+    port_entry = tk.Entry(root)
+    port_entry.grid(row=22, column=1, sticky="w", padx=5, pady=5)
+    tk.Label(root, text="Baud rate:").grid(row=23, column=0, sticky="e", padx=5, pady=5)
+    baud_entry = tk.Entry(root)
+    baud_entry.grid(row=23, column=1, sticky="w", padx=5, pady=5)
+    baud_entry.insert(0, "115200")
+    char_counting_var = tk.BooleanVar(value=True)
+    (tk.Checkbutton(root, text="Character-counting flow control", variable=char_counting_var)
+     .grid(row=22, column=2, columnspan=2, sticky="w", padx=5, pady=5))
+    save_stream_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Save to the output file while streaming", variable=save_stream_var)
+     .grid(row=23, column=2, columnspan=2, sticky="w", padx=5, pady=5))
+
+    # Pen change text box, for drawings with more than one layer
+    tk.Label(root, text="Pen-Change Subroutine GCODE:").grid(row=24, column=0, sticky="ne", padx=5, pady=5)
+    pen_change_text = tk.Text(root, height=5, width=50, font=small_font, wrap=tk.NONE)
+    pen_change_text.grid(row=24, column=1, columnspan=1, padx=10, pady=5)
+    pen_change_text.insert(tk.END, DEFAULT_PEN_CHANGE)
+    batch_pens_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Batch strokes by pen (layer), changing pens once per cycle",
+                    variable=batch_pens_var)
+     .grid(row=24, column=2, columnspan=2, sticky="nw", padx=5, pady=5))
+    alternate_pens_var = tk.BooleanVar(value=False)
+    (tk.Checkbutton(root, text="Alternate the pen order every other cycle (expanded output only)",
+                    variable=alternate_pens_var)
+     .grid(row=24, column=2, columnspan=2, sticky="w", padx=5, pady=5))
+
+    root.mainloop()
@@ -0,0 +1,227 @@
+# Benchmarks for the stages of the pen plotting GCODE processor.
+# Runs each stage of process_gcode (parsing, bounds, the M code substitution and feed insertion,
+# tiling and the cycle loop, and the whole job end to end) over synthetic cells of a chosen size
+# and over the bundled sample. Throughput (lines per second) and peak memory are recorded for each
+# stage, and compared against the baselines in benchmark_baselines.json. Headless; no display needed.
+#
+#   python benchmark.py                      # run everything, fail (exit 1) on a regression
+#   python benchmark.py -s tile_grid -r 5    # one scenario, best of 5
+#   python benchmark.py --update-baselines   # record this machine's numbers as the new baselines
+#
+# Baselines are only meaningful on the machine they were recorded on, so the baselines file is kept out
+# of git: the first run on a machine (or of a scenario) records its numbers as the baselines, and later
+# runs compare against them.
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+from gcode_processor import (parse_gcode, calculate_bounds, search_and_replace, add_to_lines, finish_texts,
+                             move_suffixes, part_extents, grid_transforms, tile_moves, build_tile_set, finish_lines,
+                             iter_job_lines, process_gcode)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINES_PATH = os.path.join(HERE, 'benchmark_baselines.json')
+SAMPLE_PATH = os.path.join(HERE, 'nausicaaCroppedV2_INPUT.gcode')
+
+# cell size (lines), stroke length (G01 moves per stroke), tile grid and cycles of each scenario
+SCENARIOS = {
+    'dense_cell': {'lines': 100000, 'stroke_length': 400, 'tiles': (1, 1), 'cycles': 1},
+    'short_strokes': {'lines': 100000, 'stroke_length': 4, 'tiles': (1, 1), 'cycles': 1},
+    'tile_grid': {'lines': 10000, 'stroke_length': 50, 'tiles': (6, 6), 'cycles': 1},
+    'many_cycles': {'lines': 5000, 'stroke_length': 50, 'tiles': (2, 2), 'cycles': 100},
+    'sample': {'path': SAMPLE_PATH, 'tiles': (2, 2), 'cycles': 3},
+}
+STAGES = ('parse_gcode', 'calculate_bounds', 'search_and_replace', 'add_to_lines', 'finish_texts',
+          'offset_cell', 'cycle_loop', 'process_gcode')
+SUBSTITUTIONS = [('M02', ''), ('M09', 'G01 Z-3'), ('M10', 'G01 Z0')]
+# stages quicker than this (seconds) are too close to the timer's noise for their speed to be checked
+MIN_CHECKED_SECONDS = 0.02
+
+
+def synthetic_gcode(lines, stroke_length=50, seed=0):
+    # A cell of about the given number of lines, in the dxf2gcode format the tool expects:
+    # strokes of stroke_length short G01 moves wandering about a 200mm square, joined by G00 travel
+    # with M09/M10 putting the pen down and lifting it.
+    rng = random.Random(seed)
+    content = ['G21', 'M10']
+    while len(content) < lines:
+        x, y = rng.uniform(0, 200), rng.uniform(0, 200)
+        heading = rng.uniform(0, 2 * math.pi)
+        content += [f'G00 X{x:.4f} Y{y:.4f}', 'M09']
+        for _ in range(stroke_length):
+            heading += rng.uniform(-0.3, 0.3)
+            x += 0.5 * math.cos(heading)
+            y += 0.5 * math.sin(heading)
+            content.append(f'G01 X{x:.4f} Y{y:.4f}')
+        content.append('M10')
+    content += ['G00 X0 Y0', 'M02']
+    return content
+
+
+def scenario_content(scenario):
+    if 'path' in scenario:
+        with open(scenario['path'], 'r') as file:
+            return file.read().splitlines()
+    return synthetic_gcode(scenario['lines'], scenario['stroke_length'])
+
+
+def stage_runs(content, tiles, cycles, scratch_path):
+    # The stages in pipeline order, as {name: run}, where run() does the stage's work the way
+    # process_gcode does and returns how many lines it handled. Later stages use what earlier ones left
+    # in state, so they have to be run in order.
+    state = {}
+    finish = partial(finish_lines, mso='M09', meo='M10', msn='G01 Z-3', men='G01 Z0',
+                     cut_feed='4500', trav_feed='9000')
+
+    def parse():
+        state['program'] = parse_gcode(content)
+        return len(content)
+
+    def bounds():
+        calculate_bounds(state['program'])
+        return len(state['program'])
+
+    def substitute():
+        # the substitutions over every line of the cell, as the tool used to run them
+        for search_string, replace_string in SUBSTITUTIONS:
+            for line in content:
+                search_and_replace(line, search_string, replace_string)
+        return len(content)
+
+    def add_feeds():
+        for _ in add_to_lines(add_to_lines(content, 'G01', 'F', '4500'), 'G00', 'F', '9000'):
+            pass
+        return len(content)
+
+    def texts():
+        # the substitutions and feeds as the pipeline runs them now, once per distinct line
+        state['texts'] = finish_texts(state['program'].texts, SUBSTITUTIONS, '4500', '9000')
+        return len(state['program'])
+
+    def tile():
+        program = state['program']
+        min_x, min_y, max_x, max_y = part_extents(program)
+        state['transforms'] = grid_transforms(tiles[0], max_x - min_x + 10, tiles[1], max_y - min_y + 10, 1.0)
+        state['tile_set'] = build_tile_set(tile_moves(state['transforms'], program), program, state['texts'],
+                                           move_suffixes(program, '4500', '9000'))
+        return sum(map(len, state['tile_set']))
+
+    def cycle_loop():
+        lines = 0
+        with open(os.devnull, 'w') as file:
+            for line in iter_job_lines('G90', [], state['tile_set'], cycles, -0.1, 'G4 S1', finish):
+                file.write(line + '\n')
+                lines += 1
+        return lines
+
+    def end_to_end():
+        process_gcode(scratch_path + '.in.gcode', scratch_path + '.out.gcode', preamble='G90',
+                      cycle_subroutine='G4 S1', cycles=cycles, cycle_offset=-0.1,
+                      tiling_n_x=tiles[0], tiling_s_x=10, tiling_n_y=tiles[1], tiling_s_y=10)
+        return len(content) * tiles[0] * tiles[1] * cycles
+
+    with open(scratch_path + '.in.gcode', 'w') as file:
+        file.writelines(line + '\n' for line in content)
+    return {'parse_gcode': parse, 'calculate_bounds': bounds, 'search_and_replace': substitute,
+            'add_to_lines': add_feeds, 'finish_texts': texts, 'offset_cell': tile, 'cycle_loop': cycle_loop,
+            'process_gcode': end_to_end}
+
+
+def benchmark_scenario(scenario, repeat, scratch_path):
+    # {stage: {'lines': ..., 'seconds': ..., 'lines_per_second': ..., 'peak_bytes': ...}} for a scenario.
+    # Timings are the best of repeat runs without tracing; peak memory comes from one more, traced, run.
+    content = scenario_content(scenario)
+    runs = stage_runs(content, scenario['tiles'], scenario['cycles'], scratch_path)
+    results = {stage: {'seconds': math.inf} for stage in STAGES}
+    for _ in range(repeat):
+        for stage in STAGES:
+            start = time.perf_counter()
+            lines = runs[stage]()
+            seconds = time.perf_counter() - start
+            if seconds < results[stage]['seconds']:
+                results[stage].update(lines=lines, seconds=seconds, lines_per_second=lines / max(seconds, 1e-9))
+    tracemalloc.start()
+    try:
+        for stage in STAGES:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            runs[stage]()
+            results[stage]['peak_bytes'] = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def regressions(results, baselines, threshold):
+    # Messages for every stage that is more than threshold (a fraction) slower, or bigger in peak memory,
+    # than its baseline. Stages too quick to time reliably only have their memory checked, and memory gets
+    # an extra 1MB of slack so that small stages don't trip over noise.
+    messages = []
+    for name, stages in results.items():
+        for stage, result in stages.items():
+            baseline = baselines.get(name, {}).get(stage)
+            if baseline is None:
+                continue
+            if (result['lines_per_second'] < baseline['lines_per_second'] * (1 - threshold)
+                    and max(result['seconds'], baseline['seconds']) >= MIN_CHECKED_SECONDS):
+                messages.append(f"{name}/{stage}: {result['lines_per_second']:,.0f} lines/s, baseline "
+                                f"{baseline['lines_per_second']:,.0f}")
+            if result['peak_bytes'] > baseline['peak_bytes'] * (1 + threshold) + 1024 * 1024:
+                messages.append(f"{name}/{stage}: peak {result['peak_bytes'] / 1e6:.1f}MB, baseline "
+                                f"{baseline['peak_bytes'] / 1e6:.1f}MB")
+    return messages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the stages of the GCODE processor.')
+    parser.add_argument('-s', '--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='scenario to run (repeatable; default: all)')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='timed runs per stage, best is kept')
+    parser.add_argument('-t', '--threshold', type=float, default=0.25,
+                        help='fractional slow-down or memory growth that counts as a regression')
+    parser.add_argument('--baselines', default=BASELINES_PATH, help='baselines file')
+    parser.add_argument('--update-baselines', action='store_true', help='record these results as the baselines')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name in args.scenario or SCENARIOS:
+            results[name] = benchmark_scenario(SCENARIOS[name], args.repeat, os.path.join(directory, name))
+            print(f'{name}:')
+            for stage, result in results[name].items():
+                print(f"  {stage:<20}{result['lines']:>12,} lines {result['seconds']:>9.3f}s "
+                      f"{result['lines_per_second']:>14,.0f} lines/s {result['peak_bytes'] / 1e6:>9.1f}MB peak")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+    baselines = {}
+    if os.path.exists(args.baselines):
+        with open(args.baselines, 'r') as file:
+            baselines = json.load(file)
+    # scenarios without a baseline on this machine yet get these results as theirs
+    recorded = results if args.update_baselines else {name: stages for name, stages in results.items()
+                                                      if name not in baselines}
+    messages = regressions({name: stages for name, stages in results.items() if name not in recorded},
+                           baselines, args.threshold)
+    for message in messages:
+        print('REGRESSION ' + message, file=sys.stderr)
+    if recorded:
+        baselines.update(recorded)
+        with open(args.baselines, 'w') as file:
+            json.dump(baselines, file, indent=2)
+        print(f"Baselines for {', '.join(recorded)} written to {args.baselines}")
+    if len(recorded) < len(results) and not messages:
+        print(f'No regressions against the baselines (threshold {args.threshold:.0%})')
+    return 1 if messages else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
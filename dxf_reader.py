@@ -0,0 +1,241 @@
+# Streaming DXF reader for the pen plotting GCODE processor.
+# Reads an ASCII DXF one group code / value pair at a time and turns each LINE, LWPOLYLINE,
+# POLYLINE, ARC, CIRCLE and SPLINE in the ENTITIES section into a toolpath as soon as that
+# entity ends, so only one entity is ever held in memory, however big the drawing is.
+# Blocks (INSERT) and 3D entities aren't supported and are skipped.
+import math
+from bisect import bisect_right
+
+NAN = float('nan')
+# $INSUNITS codes that aren't millimetres; anything else (including unitless) is taken as mm
+UNIT_SCALES = {1: 25.4, 2: 304.8, 5: 10.0, 6: 1000.0}
+ENTITY_TYPES = {'LINE', 'LWPOLYLINE', 'POLYLINE', 'VERTEX', 'SEQEND', 'ARC', 'CIRCLE', 'SPLINE'}
+
+
+def iter_pairs(file):
+    # Yields the (group code, value) pairs of a DXF file, two lines at a time
+    lines = iter(file)
+    for code in lines:
+        value = next(lines, '')
+        yield int(code), value.strip()
+
+
+def iter_entities(file):
+    # Yields (entity type, pairs, scale) for every supported entity of the ENTITIES section,
+    # where pairs is the list of (group code, value) pairs of just that entity, and scale
+    # converts the drawing units from the header to millimetres.
+    scale = 1.0
+    section = None
+    header_variable = None
+    entity = None
+    for code, value in iter_pairs(file):
+        if code == 0:
+            if entity is not None:
+                yield entity[0], entity[1], scale
+                entity = None
+            if value == 'EOF':
+                return
+            if section == 'ENTITIES' and value in ENTITY_TYPES:
+                entity = (value, [])
+            elif value == 'ENDSEC':
+                section = None
+        elif entity is not None:
+            entity[1].append((code, value))
+        elif code == 2 and section is None:
+            section = value
+        elif section == 'HEADER':
+            if code == 9:
+                header_variable = value
+            elif header_variable == '$INSUNITS' and code == 70:
+                scale = UNIT_SCALES.get(int(value), 1.0)
+
+
+def arc_move(start, end, centre, clockwise):
+    # An arc move in the form the paths use: (word, x, y, i, j), with I/J relative to the start
+    return 'G02' if clockwise else 'G03', end[0], end[1], centre[0] - start[0], centre[1] - start[1]
+
+
+def bulge_move(start, end, bulge):
+    # The move for one LWPOLYLINE/POLYLINE segment. The bulge is tan(included angle / 4),
+    # positive for an anticlockwise arc and 0 for a straight segment.
+    if not bulge or start == end:
+        return 'G01', end[0], end[1], NAN, NAN
+    # the centre sits off the middle of the chord, along its normal
+    offset = (1 - bulge * bulge) / (4 * bulge)
+    centre = ((start[0] + end[0]) / 2 - offset * (end[1] - start[1]),
+              (start[1] + end[1]) / 2 + offset * (end[0] - start[0]))
+    return arc_move(start, end, centre, bulge < 0)
+
+
+def polyline_moves(vertices, closed):
+    # Moves for a polyline given as a list of (x, y, bulge)
+    if not vertices:
+        return []
+    if closed:
+        vertices = vertices + vertices[:1]
+    moves = [('G00', vertices[0][0], vertices[0][1], NAN, NAN)]
+    for (x0, y0, bulge), (x1, y1, next_bulge) in zip(vertices, vertices[1:]):
+        moves.append(bulge_move((x0, y0), (x1, y1), bulge))
+    return moves
+
+
+def circle_moves(centre, radius, start_angle, end_angle):
+    # Moves for an anticlockwise arc of a circle between two angles (degrees).
+    # Arcs over half a turn (including full circles) are split in two, so no firmware
+    # has to guess what a zero-length or near-full arc means.
+    start_angle = math.radians(start_angle)
+    sweep = (math.radians(end_angle) - start_angle) % (2 * math.pi) or 2 * math.pi
+    if sweep > math.pi:
+        angles = [start_angle, start_angle + sweep / 2, start_angle + sweep]
+    else:
+        angles = [start_angle, start_angle + sweep]
+    points = [(centre[0] + radius * math.cos(angle), centre[1] + radius * math.sin(angle)) for angle in angles]
+    if sweep == 2 * math.pi:
+        points[-1] = points[0]
+    moves = [('G00', points[0][0], points[0][1], NAN, NAN)]
+    for start, end in zip(points, points[1:]):
+        moves.append(arc_move(start, end, centre, False))
+    return moves
+
+
+def de_boor(degree, knots, points, u):
+    # Point of a (rational) B-spline at parameter u, by de Boor's algorithm.
+    # points are homogeneous (x * w, y * w, w).
+    span = bisect_right(knots, u) - 1
+    span = min(max(span, degree), len(points) - 1)
+    d = points[span - degree:span + 1]
+    for r in range(1, degree + 1):
+        for j in range(degree, r - 1, -1):
+            low = knots[j + span - degree]
+            high = knots[j + 1 + span - r]
+            alpha = 0.0 if high == low else (u - low) / (high - low)
+            (x0, y0, w0), (x1, y1, w1) = d[j - 1], d[j]
+            d[j] = (x0 + alpha * (x1 - x0), y0 + alpha * (y1 - y0), w0 + alpha * (w1 - w0))
+    x, y, w = d[degree]
+    return x / w, y / w
+
+
+def flatten_spline(degree, knots, control_points, weights, tolerance):
+    # Flattens a B-spline into a list of points that stay within tolerance of the curve.
+    # Each knot span is split in half until the quarter and middle points of every piece are
+    # within tolerance of its chord.
+    if weights and len(weights) == len(control_points):
+        points = [(x * w, y * w, w) for (x, y), w in zip(control_points, weights)]
+    else:
+        points = [(x, y, 1.0) for x, y in control_points]
+    if degree < 1 or len(knots) != len(control_points) + degree + 1:
+        # not a spline we can evaluate, so fall back to its control polygon
+        return list(control_points)
+
+    def chord_distance(point, start, end):
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return math.hypot(point[0] - start[0], point[1] - start[1])
+        return abs(dx * (point[1] - start[1]) - dy * (point[0] - start[0])) / length
+
+    spans = sorted(set(knots[degree:len(control_points) + 1]))
+    flattened = [de_boor(degree, knots, points, spans[0])]
+    for u0, u1 in zip(spans, spans[1:]):
+        # depth first, pushing the second half before the first so the points come out in order
+        pending = [(u0, flattened[-1], u1, de_boor(degree, knots, points, u1), 0)]
+        while pending:
+            u_start, start, u_end, end, depth = pending.pop()
+            quarters = [de_boor(degree, knots, points, u_start + (u_end - u_start) * t) for t in (0.25, 0.5, 0.75)]
+            if depth < 16 and max(chord_distance(q, start, end) for q in quarters) > tolerance:
+                u_middle = (u_start + u_end) / 2
+                pending.append((u_middle, quarters[1], u_end, end, depth + 1))
+                pending.append((u_start, start, u_middle, quarters[1], depth + 1))
+            else:
+                flattened.append(end)
+    return flattened
+
+
+def entity_moves(entity_type, pairs, tolerance):
+    # Moves for a single entity, as a list of (word, x, y, i, j) starting with a G00 to its start point
+    values = {}
+    for code, value in pairs:
+        values.setdefault(code, value)
+
+    def number(code, default=0.0):
+        return float(values.get(code, default))
+
+    if entity_type == 'LINE':
+        return [('G00', number(10), number(20), NAN, NAN), ('G01', number(11), number(21), NAN, NAN)]
+    if entity_type == 'ARC':
+        return circle_moves((number(10), number(20)), number(40), number(50), number(51))
+    if entity_type == 'CIRCLE':
+        return circle_moves((number(10), number(20)), number(40), 0.0, 360.0)
+    if entity_type == 'LWPOLYLINE':
+        vertices = []
+        for code, value in pairs:
+            if code == 10:
+                vertices.append([float(value), 0.0, 0.0])
+            elif code == 20 and vertices:
+                vertices[-1][1] = float(value)
+            elif code == 42 and vertices:
+                vertices[-1][2] = float(value)
+        return polyline_moves([tuple(vertex) for vertex in vertices], int(number(70)) & 1)
+    if entity_type == 'SPLINE':
+        knots = [float(value) for code, value in pairs if code == 40]
+        weights = [float(value) for code, value in pairs if code == 41]
+        control_points = [[float(value), 0.0] for code, value in pairs if code == 10]
+        for point, (code, value) in zip(control_points, [pair for pair in pairs if pair[0] == 20]):
+            point[1] = float(value)
+        fit_points = [[float(value), 0.0] for code, value in pairs if code == 11]
+        for point, (code, value) in zip(fit_points, [pair for pair in pairs if pair[0] == 21]):
+            point[1] = float(value)
+        if control_points:
+            points = flatten_spline(int(number(71, 3)), knots, [tuple(point) for point in control_points],
+                                    weights, tolerance)
+        else:
+            points = [tuple(point) for point in fit_points]
+        if not points:
+            return []
+        return [('G00', points[0][0], points[0][1], NAN, NAN)] + \
+               [('G01', x, y, NAN, NAN) for x, y in points[1:]]
+    return []
+
+
+def ocs_transform(entity_type, moves, pairs):
+    # Arcs, circles and 2D polylines are drawn in their own coordinate system, which for an
+    # extrusion direction of (0, 0, -1) (a common result of mirroring in a CAD program)
+    # is mirrored in X, and that also turns their arcs round.
+    if entity_type not in ('ARC', 'CIRCLE', 'LWPOLYLINE', 'SEQEND') or float(dict(pairs).get(230, 1.0)) >= 0:
+        return moves
+    flipped = {'G02': 'G03', 'G03': 'G02'}
+    return [(flipped.get(word, word), -x, y, -i, j) for word, x, y, i, j in moves]
+
+
+def iter_dxf_paths(file, tolerance=0.01):
+    # Yields (layer, moves) for every entity of a DXF file, in drawing order, where moves is a list
+    # of (word, x, y, i, j) in millimetres: a G00 to the start of the path, followed by G01 lines and
+    # G02/G03 arcs (I, J relative to the start of the arc; NaN on lines). Splines are flattened into
+    # lines to within tolerance (mm).
+    polyline = None
+    for entity_type, pairs, scale in iter_entities(file):
+        if entity_type == 'POLYLINE':
+            polyline = (pairs, [])
+            continue
+        if entity_type == 'VERTEX':
+            flags = int(dict(pairs).get(70, 0))
+            # spline frame control points (16) aren't part of the drawn shape
+            if polyline is not None and not flags & 16:
+                values = dict(pairs)
+                polyline[1].append((float(values.get(10, 0)), float(values.get(20, 0)), float(values.get(42, 0))))
+            continue
+        if entity_type == 'SEQEND':
+            if polyline is None:
+                continue
+            pairs, vertices = polyline
+            polyline = None
+            moves = polyline_moves(vertices, int(dict(pairs).get(70, 0)) & 1)
+        else:
+            moves = entity_moves(entity_type, pairs, tolerance / scale)
+        if not moves:
+            continue
+        moves = ocs_transform(entity_type, moves, pairs)
+        if scale != 1.0:
+            moves = [(word, x * scale, y * scale, i * scale, j * scale) for word, x, y, i, j in moves]
+        yield dict(pairs).get(8, '0'), moves
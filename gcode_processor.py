@@ -0,0 +1,2044 @@
+# Processing core of the pen plotting GCODE processor: parses the input (gcode or DXF) into a compact
+# program, optionally reorders and simplifies its strokes, tiles it and writes the finished job.
+# Nothing here touches tkinter, so it can be driven from the GUI, the command line or other scripts.
+import os
+import re
+import math
+import json
+import shutil
+import itertools
+from array import array
+from functools import partial
+from dxf_reader import iter_dxf_paths
+from stage_cache import file_digest
+from stage_profiler import StageProfiler
+
+# Opcodes for the rows of a parsed program
+OP_TEXT = 0     # any line that isn't a plain move, kept verbatim
+OP_RAPID = 1    # G00
+OP_LINEAR = 2   # G01
+OP_CW_ARC = 3   # G02
+OP_CCW_ARC = 4  # G03
+MOVE_OPS = {'G00': OP_RAPID, 'G0': OP_RAPID, 'G01': OP_LINEAR, 'G1': OP_LINEAR,
+            'G02': OP_CW_ARC, 'G2': OP_CW_ARC, 'G03': OP_CCW_ARC, 'G3': OP_CCW_ARC}
+MOVE_WORDS = {OP_RAPID: 'G00', OP_LINEAR: 'G01', OP_CW_ARC: 'G02', OP_CCW_ARC: 'G03'}
+# an arc drawn through a mirror image turns the other way
+MIRRORED_ARCS = {OP_CW_ARC: OP_CCW_ARC, OP_CCW_ARC: OP_CW_ARC}
+NAN = float('nan')
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+# Comment lines that start the strokes of a layer (or pen): ';LAYER:name', as written for DXF layers,
+# and the likes of '; pen = name' or '(Layer: name)' from other converters
+LAYER_MARKER = re.compile(r'^\s*[;(]\s*(?:layer|pen)\s*[:=]\s*(.*?)\s*\)?\s*$', re.IGNORECASE)
+# Rows, strokes or motion steps the long loops get through between calls to their progress(fraction done)
+# callback, which can raise ProcessingCancelled to stop them
+PROGRESS_INTERVAL = 5000
+
+
+class GcodeProgram:
+    # Compact, array-backed form of a gcode file, so that it only has to be parsed once
+    # and every stage after that works on numbers rather than on text.
+    # Each line becomes one row across the columns. Moves (G00/G01 with nothing but X, Y, Z and F words,
+    # and G02/G03 arcs which may also have the I and J centre offsets) keep their values as floats,
+    # with NaN standing in for a word the line didn't have.
+    # Every other line goes into the texts table, which holds each distinct line only once,
+    # and the text column points into it (for moves it points at a trailing comment, or is -1).
+    def __init__(self):
+        self.ops = array('B')
+        self.x = array('d')
+        self.y = array('d')
+        self.z = array('d')
+        self.f = array('d')
+        self.i = array('d')
+        self.j = array('d')
+        self.text = array('l')
+        self.texts = []
+        self.text_ids = {}
+
+    def __len__(self):
+        return len(self.ops)
+
+    def text_id(self, line):
+        # index of a line in the texts table, adding it if it's new
+        text_id = self.text_ids.get(line)
+        if text_id is None:
+            text_id = self.text_ids[line] = len(self.texts)
+            self.texts.append(line)
+        return text_id
+
+    def add_text(self, line):
+        self.ops.append(OP_TEXT)
+        self.x.append(NAN)
+        self.y.append(NAN)
+        self.z.append(NAN)
+        self.f.append(NAN)
+        self.i.append(NAN)
+        self.j.append(NAN)
+        self.text.append(self.text_id(line))
+
+    def add_move(self, op, x=NAN, y=NAN, z=NAN, f=NAN, comment='', i=NAN, j=NAN):
+        self.ops.append(op)
+        self.x.append(x)
+        self.y.append(y)
+        self.z.append(z)
+        self.f.append(f)
+        self.i.append(i)
+        self.j.append(j)
+        self.text.append(self.text_id(comment) if comment else -1)
+
+    def copy_row(self, source, k):
+        # appends row k of another program
+        if source.ops[k] == OP_TEXT:
+            self.add_text(source.texts[source.text[k]])
+        else:
+            comment = source.texts[source.text[k]] if source.text[k] >= 0 else ''
+            self.add_move(source.ops[k], source.x[k], source.y[k], source.z[k], source.f[k], comment,
+                          source.i[k], source.j[k])
+
+
+def parse_gcode(content):
+    # Tokenizes gcode lines into a GcodeProgram. Anything that isn't a G00-G03 made up only of
+    # X, Y, Z and F words (and I, J for arcs) is kept as a text row (M codes, dwells, G92, blank lines...).
+    program = GcodeProgram()
+    for line in content:
+        line = line.rstrip('\r\n')
+        code, semicolon, comment = line.partition(';')
+        words = code.split()
+        op = MOVE_OPS.get(words[0]) if words else None
+        if op is not None:
+            values = {'X': NAN, 'Y': NAN, 'Z': NAN, 'F': NAN}
+            if op in MIRRORED_ARCS:
+                values['I'] = values['J'] = NAN
+            try:
+                for word in words[1:]:
+                    if word[0] not in values:
+                        raise ValueError(word)
+                    values[word[0]] = float(word[1:])
+            except ValueError:
+                op = None
+        if op is None:
+            program.add_text(line)
+        else:
+            program.add_move(op, values['X'], values['Y'], values['Z'], values['F'], semicolon + comment,
+                             values.get('I', NAN), values.get('J', NAN))
+    return program
+
+
+def parse_dxf(file, mso, meo, tolerance=0.01):
+    # Builds a GcodeProgram straight from a DXF drawing, laid out the way the online dxf2gcode converter
+    # lays out its output: each path is a travel, the start-cut code, its moves and the end-cut code.
+    # Paths that start where the last one finished carry on without lifting the pen.
+    # Each change of layer is marked with a ';LAYER:name' line (see split_layers), with the pen lifted first.
+    # Like the converter, the drawing is moved so its lower left corner sits at 0, 0.
+    program = GcodeProgram()
+    program.add_text('G21')
+    program.add_text(meo)
+    position = None
+    current_layer = None
+    for layer, moves in iter_dxf_paths(file, tolerance):
+        word, x, y, i, j = moves[0]
+        if layer != current_layer or position is None or math.hypot(x - position[0], y - position[1]) > 1e-6:
+            if position is not None:
+                program.add_text(meo)
+            if layer != current_layer:
+                program.add_text(f';LAYER:{layer}')
+                current_layer = layer
+            program.add_move(OP_RAPID, x, y)
+            program.add_text(mso)
+        for word, x, y, i, j in moves[1:]:
+            program.add_move(MOVE_OPS[word], x, y, i=i, j=j)
+        position = (x, y)
+    if position is not None:
+        program.add_text(meo)
+
+    min_x, min_y, max_x, max_y = part_extents(program)
+    for k in range(len(program)):
+        program.x[k] -= min_x
+        program.y[k] -= min_y
+    program.add_move(OP_RAPID, 0.0, 0.0)
+    program.add_text('M02')
+    return program
+
+
+def format_number(value, precision=None):
+    # Shortest text that reads back as the same float, without the exponent notation
+    # that gcode interpreters don't understand, and without a trailing '.0'.
+    # With a precision, rounded to that many decimal places instead (dropping trailing zeros),
+    # which also does away with float artifacts such as 102.36720000000001.
+    if precision is not None:
+        text = f'{value:.{precision}f}'
+        if '.' in text:
+            text = text.rstrip('0').rstrip('.')
+        return '0' if text == '-0' else text
+    text = repr(value)
+    if text[-2:] == '.0':
+        return '0' if text == '-0.0' else text[:-2]
+    if 'e' in text:
+        text = f'{value:.10f}'.rstrip('0').rstrip('.')
+        return '0' if text == '-0' else text
+    return text
+
+
+def search_and_replace(content, search_string, replace_string):
+    # substitutes all unique instances of a search string.
+    pattern = r'\b' + re.escape(search_string) + r'\b'
+    return re.sub(pattern, replace_string, content)
+
+
+def add_to_lines(content, flag, code, value):
+    # appends a string to lines which contain the specified flag,
+    # (provided that a feed isn't already in the line)
+    # lines are passed through one at a time, so this can sit anywhere in a streaming pipeline.
+    for line in content:
+        if flag in line and 'F' not in line:
+            line = line.rstrip() + ' ' + code + value
+        yield line
+
+
+def finish_texts(texts, substitutions, cut_feed, trav_feed):
+    # Applies the M code substitutions and feed insertion to the texts table of a parsed program.
+    # Each distinct line is only stored once, so this runs once per distinct line rather than once per line
+    # of the file. Lines that a substitution empties out are returned as None, so they get dropped.
+    finished_texts = texts
+    for search_string, replace_string in substitutions:
+        finished_texts = [search_and_replace(text, search_string, replace_string) if search_string in text else text
+                          for text in finished_texts]
+    finished_texts = add_to_lines(finished_texts, 'G01', 'F', cut_feed)
+    finished_texts = add_to_lines(finished_texts, 'G00', 'F', trav_feed)
+    return [None if text.strip() == '' and original.strip() != '' else text
+            for text, original in zip(finished_texts, texts)]
+
+
+def move_suffixes(program, cut_feed, trav_feed, precision=None):
+    # The parts of each move that tiling never touches (Z, feed and any trailing comment), formatted once.
+    # Moves without their own feed get the cut or travel feed added here.
+    feeds = {OP_RAPID: ' F' + trav_feed, OP_LINEAR: ' F' + cut_feed,
+             OP_CW_ARC: ' F' + cut_feed, OP_CCW_ARC: ' F' + cut_feed}
+    suffixes = []
+    for op, z, f, text_id in zip(program.ops, program.z, program.f, program.text):
+        if op == OP_TEXT:
+            suffixes.append(None)
+            continue
+        suffix = '' if z != z else ' Z' + format_number(z, precision)
+        suffix += feeds[op] if f != f else ' F' + format_number(f, precision)
+        if text_id >= 0:
+            suffix += ' ' + program.texts[text_id]
+        suffixes.append(suffix)
+    return suffixes
+
+
+def finish_lines(content, mso, meo, msn, men, cut_feed, trav_feed, precision=None, compact=False,
+                 omit_modal_words=False):
+    # Find and replace the cut M commands, then add feeds after every G00 and G01 move command,
+    # for short blocks of gcode (preamble, skirts, subroutine) that go through the same representation.
+    program = parse_gcode(content)
+    texts = finish_texts(program.texts, [(mso, msn), (meo, men)], cut_feed, trav_feed)
+    lines = offset_cell([IDENTITY], program, texts, move_suffixes(program, cut_feed, trav_feed, precision), precision)
+    return compact_lines(lines, omit_modal_words) if compact else lines
+
+
+def compact_lines(lines, omit_modal_words=False):
+    # Drops what each move only repeats of the modal state the lines before it left: axes that don't change,
+    # a feed that's already in effect and, optionally, the G word itself (which Marlin doesn't accept,
+    # but GRBL and most CNC controllers do), along with moves that end up going nowhere.
+    # Arcs keep all their words. Any other line may change the state in ways that aren't followed
+    # (G92, homing, a change of units...), so the state is forgotten after one, and nothing is
+    # compacted in relative (G91) mode. The state starts out unknown, so the lines can follow anything.
+    op = None
+    state = {}
+    relative = False
+    for line in lines:
+        code, semicolon, comment = line.partition(';')
+        words = code.split()
+        if not words:
+            yield line
+            continue
+        line_op = MOVE_OPS.get(words[0])
+        letters = 'XYZFIJ' if line_op in MIRRORED_ARCS else 'XYZF'
+        if line_op is None or relative or any(len(word) < 2 or word[0] not in letters for word in words[1:]):
+            if 'G91' in words or 'G90' in words:
+                relative = 'G91' in words
+            op = None
+            state.clear()
+            yield line
+            continue
+
+        arc = line_op in MIRRORED_ARCS
+        parts = [] if omit_modal_words and line_op == op else [words[0]]
+        moved = arc
+        feed = False
+        for word in words[1:]:
+            if arc or state.get(word[0]) != word:
+                parts.append(word)
+                state[word[0]] = word
+                if word[0] == 'F':
+                    feed = True
+                else:
+                    moved = True
+        if not (moved or feed or semicolon):
+            continue
+        if not moved and parts[:1] != words[:1]:
+            # a move that only changes the feed (or keeps its comment) still needs its G word
+            parts.insert(0, words[0])
+        op = line_op
+        yield ' '.join(parts) + (' ;' + comment if semicolon else '')
+
+
+def calculate_bounds(program):
+    # Computes the maximum G1 cutting dimensions of the gcode part
+    last_positive_x_value = 0
+    last_positive_y_value = 0
+    last_negative_x_value = 0
+    last_negative_y_value = 0
+    # for every move, only keep the largest value that is encountered
+    # (words a move didn't have are NaN, which never compares larger)
+    for x_value in program.x:
+        if x_value < 0:
+            if last_negative_x_value < abs(x_value):
+                last_negative_x_value = abs(x_value)
+        elif x_value > 0:
+            if last_positive_x_value < x_value:
+                last_positive_x_value = x_value
+
+    for y_value in program.y:
+        if y_value < 0:
+            if last_negative_y_value < abs(y_value):
+                last_negative_y_value = abs(y_value)
+        elif y_value > 0:
+            if last_positive_y_value < y_value:
+                last_positive_y_value = y_value
+
+    return [last_negative_x_value + last_positive_x_value, last_negative_y_value + last_positive_y_value]
+
+
+def resolve_positions(program):
+    # Gcode words are modal, so a move may leave out X or Y. This fills them in from the
+    # previous position (starting from 0, 0) so every row has an absolute X and Y.
+    resolved_x = array('d')
+    resolved_y = array('d')
+    x_value = y_value = 0.0
+    for x, y in zip(program.x, program.y):
+        if x == x:
+            x_value = x
+        if y == y:
+            y_value = y
+        resolved_x.append(x_value)
+        resolved_y.append(y_value)
+    return resolved_x, resolved_y
+
+
+def arc_extreme_points(start_x, start_y, end_x, end_y, centre_x, centre_y, clockwise):
+    # The points where an arc crosses the horizontal and vertical lines through its centre,
+    # which is where it can stick out past its end points
+    radius = math.hypot(start_x - centre_x, start_y - centre_y)
+    start_angle = math.atan2(start_y - centre_y, start_x - centre_x)
+    end_angle = math.atan2(end_y - centre_y, end_x - centre_x)
+    direction = -1 if clockwise else 1
+    sweep = (direction * (end_angle - start_angle)) % (2 * math.pi) or 2 * math.pi
+    points = []
+    for quarter in range(4):
+        angle = quarter * math.pi / 2
+        if (direction * (angle - start_angle)) % (2 * math.pi) <= sweep:
+            points.append((centre_x + radius * math.cos(angle), centre_y + radius * math.sin(angle)))
+    return points
+
+
+def part_extents(program):
+    # Smallest and largest X and Y reached by the moves (including the bulge of arcs),
+    # as [min_x, min_y, max_x, max_y]
+    xs, ys = resolve_positions(program)
+    moves = [k for k, op in enumerate(program.ops) if op != OP_TEXT]
+    if not moves:
+        return [0.0, 0.0, 0.0, 0.0]
+    reached_x = [xs[k] for k in moves]
+    reached_y = [ys[k] for k in moves]
+    for k in moves:
+        if program.ops[k] in MIRRORED_ARCS:
+            start_x, start_y = (xs[k - 1], ys[k - 1]) if k else (0.0, 0.0)
+            centre_x = start_x + (program.i[k] if program.i[k] == program.i[k] else 0.0)
+            centre_y = start_y + (program.j[k] if program.j[k] == program.j[k] else 0.0)
+            for x, y in arc_extreme_points(start_x, start_y, xs[k], ys[k], centre_x, centre_y,
+                                           program.ops[k] == OP_CW_ARC):
+                reached_x.append(x)
+                reached_y.append(y)
+    return [min(reached_x), min(reached_y), max(reached_x), max(reached_y)]
+
+
+def grid_transforms(n_x, s_x, n_y, s_y, tiling_scale, rotation=0.0, mirror_x=False, mirror_y=False,
+                    centre=(0.0, 0.0), serpentine=False):
+    # One affine transform (a, b, c, d, e, f) per tile of the grid, mapping cell coordinates to
+    # x' = a*x + b*y + e and y' = c*x + d*y + f.
+    # Mirroring and rotation (degrees, anticlockwise) are about the centre of the part so that the tile
+    # stays where it was, then the tile is scaled and offset by i * s_x, j * s_y as before.
+    # With serpentine set, every other column of tiles runs back down the grid, so the pen never
+    # has to travel back across the whole grid to start the next column.
+    if rotation % 90 == 0:
+        # keep quarter turns exact, rather than picking up 6e-17 from cos(pi / 2)
+        cos_r, sin_r = [(1, 0), (0, 1), (-1, 0), (0, -1)][int(rotation // 90) % 4]
+    else:
+        cos_r = math.cos(math.radians(rotation))
+        sin_r = math.sin(math.radians(rotation))
+    m_x = -1 if mirror_x else 1
+    m_y = -1 if mirror_y else 1
+    a = tiling_scale * cos_r * m_x
+    b = -tiling_scale * sin_r * m_y
+    c = tiling_scale * sin_r * m_x
+    d = tiling_scale * cos_r * m_y
+    c_x, c_y = centre
+    e = tiling_scale * c_x - (a * c_x + b * c_y)
+    f = tiling_scale * c_y - (c * c_x + d * c_y)
+    return [(a, b, c, d, e + i * s_x, f + j * s_y) for i, j in grid_cells(n_x, n_y, serpentine)]
+
+
+def grid_cells(n_x, n_y, serpentine=False):
+    # (column, row) of every tile of the grid, in the order they're plotted
+    cells = []
+    for i in range(n_x):
+        rows = range(n_y - 1, -1, -1) if serpentine and i % 2 else range(n_y)
+        cells.extend((i, j) for j in rows)
+    return cells
+
+
+def compose_transforms(outer, inner):
+    # The transform that applies inner, then outer
+    a, b, c, d, e, f = outer
+    p, q, r, s, t, u = inner
+    return (a * p + b * r, a * q + b * s, c * p + d * r, c * q + d * s, a * t + b * u + e, c * t + d * u + f)
+
+
+def transform_points(transform, points):
+    a, b, c, d, e, f = transform
+    return [(a * x + b * y + e, c * x + d * y + f) for x, y in points]
+
+
+def convex_hull(points):
+    # Convex hull of (x, y) points, anticlockwise (Andrew's monotone chain)
+    points = sorted(set(points))
+    if len(points) < 3:
+        return points
+
+    def half(chain_points):
+        chain = []
+        for point in chain_points:
+            while len(chain) >= 2 and ((chain[-1][0] - chain[-2][0]) * (point[1] - chain[-2][1])
+                                       - (chain[-1][1] - chain[-2][1]) * (point[0] - chain[-2][0])) <= 0:
+                chain.pop()
+            chain.append(point)
+        return chain[:-1]
+    return half(points) + half(reversed(points))
+
+
+def part_outline(program):
+    # The true outline of what the cell draws: the convex hull of its cut moves (arcs included).
+    # Travel moves don't mark the sheet, so they don't count.
+    cuts, travels = toolpath_polylines(program)
+    return convex_hull([point for xs, ys in cuts for point in zip(xs, ys)])
+
+
+def separating_axes(polygon):
+    # (nx, ny) unit normals of a convex polygon's edges, plus the X and Y axes
+    axes = [(1.0, 0.0), (0.0, 1.0)]
+    for (x0, y0), (x1, y1) in zip(polygon, polygon[1:] + polygon[:1]):
+        length = math.hypot(x1 - x0, y1 - y0)
+        if length > 1e-12:
+            axes.append(((y1 - y0) / length, (x0 - x1) / length))
+    return axes
+
+
+def convex_separation(polygon_a, polygon_b):
+    # Separating axis test for two convex polygons: the widest gap between their projections onto any
+    # edge normal (or X or Y), negative if they overlap. It never overstates how far apart they are.
+    separation = -math.inf
+    for nx, ny in separating_axes(polygon_a) + separating_axes(polygon_b):
+        a = [nx * x + ny * y for x, y in polygon_a]
+        b = [nx * x + ny * y for x, y in polygon_b]
+        separation = max(separation, min(b) - max(a), min(a) - max(b))
+    return separation
+
+
+def nest_transforms(outline, base, bed_width, bed_height, margin, spacing, rotate=False, stagger=True,
+                    serpentine=False, progress=None):
+    # Packs as many copies of a part as fit on the bed, at least margin from its edges and spacing apart,
+    # as one transform per copy, row by row from the lower left corner. outline is the part's convex hull in
+    # cell coordinates and base the transform of a single tile (scale, rotation, mirroring).
+    # The copies sit on a lattice: a row pitch along X, and a pitch (and, for staggered rows, a half pitch
+    # shift) between rows. Both pitches are the smallest that keep every pair of copies apart by the
+    # separating axis test, and the layout that fits the most copies of every candidate (as drawn, or turned
+    # a quarter turn, each in straight and staggered rows) wins, the plainest one on a tie.
+    # With serpentine set, every other row runs back the other way.
+    # If given, progress(fraction done) is called at every step of the search for each candidate's row pitch.
+    usable_width = bed_width - 2 * margin
+    usable_height = bed_height - 2 * margin
+    best = []
+    turns = (IDENTITY, (0.0, -1.0, 1.0, 0.0, 0.0, 0.0)) if rotate else (IDENTITY,)
+    shifts = 2 if stagger else 1
+    for turn_number, turn in enumerate(turns):
+        transform = compose_transforms(turn, base)
+        hull = transform_points(transform, outline)
+        min_x = min(x for x, y in hull)
+        min_y = min(y for x, y in hull)
+        width = max(x for x, y in hull) - min_x
+        height = max(y for x, y in hull) - min_y
+        if width > usable_width or height > usable_height:
+            continue
+        # the gap between a copy and one moved by (dx, dy) is max(|n.(dx, dy)| - extent along n) over the axes
+        axes = []
+        for nx, ny in separating_axes(hull):
+            projections = [nx * x + ny * y for x, y in hull]
+            axes.append((nx, ny, max(projections) - min(projections)))
+
+        def clear(dx, dy):
+            return max(abs(nx * dx + ny * dy) - extent for nx, ny, extent in axes) >= spacing - 1e-9
+
+        # along a row the gap only grows with the pitch, so the smallest pitch comes straight from the axes
+        pitch_x = min((spacing + extent) / abs(nx) for nx, ny, extent in axes if abs(nx) > 1e-12)
+        for shift_number, shift in enumerate((0.0, pitch_x / 2) if stagger else (0.0,)):
+            def rows_clear(pitch_y):
+                # every copy in the rows above that could reach the first copy of the bottom row
+                row = 1
+                while row * pitch_y < height + spacing:
+                    offset = shift * (row % 2)
+                    first = math.floor((-width - spacing - offset) / pitch_x)
+                    last = math.ceil((width + spacing - offset) / pitch_x)
+                    if not all(clear(offset + k * pitch_x, row * pitch_y) for k in range(first, last + 1)):
+                        return False
+                    row += 1
+                return True
+
+            # binary search for the row pitch, between touching rows and rows clear of each other along Y
+            low, high = 0.0, height + spacing
+            steps = max(math.ceil(math.log2((height + spacing) / 1e-4)), 1)
+            step = 0
+            while high - low > 1e-4:
+                if progress is not None:
+                    progress((turn_number * shifts + shift_number + step / steps) / (len(turns) * shifts))
+                step += 1
+                middle = (low + high) / 2
+                if rows_clear(middle):
+                    high = middle
+                else:
+                    low = middle
+            pitch_y = high
+
+            placements = []
+            for row in range(int((usable_height - height) / pitch_y + 1e-9) + 1):
+                offset = shift * (row % 2)
+                if usable_width - width - offset < -1e-9:
+                    continue
+                columns = range(int((usable_width - width - offset) / pitch_x + 1e-9) + 1)
+                for column in (reversed(columns) if serpentine and row % 2 else columns):
+                    placements.append((margin + offset + column * pitch_x - min_x,
+                                       margin + row * pitch_y - min_y, transform))
+            if len(placements) > len(best):
+                best = placements
+    return [compose_transforms((1.0, 0.0, 0.0, 1.0, e, f), transform) for e, f, transform in best]
+
+
+def offset_cell(transforms, program, texts, suffixes, precision=None):
+    # Before each page cycle is repeated, we need to repeat the unit cell gcode once per tile,
+    # moving the cell to its place in the grid each time (the code remains in absolute coordinates).
+    for lines in finish_tiles(tile_moves(transforms, program, precision), program, texts, suffixes):
+        yield from lines
+
+
+def tile_moves(transforms, program, precision=None):
+    # The moves of the cell in every tile, as one list per tile of each move's G word and coordinates,
+    # which finish_tiles completes with the rest of the line (so feeds and M codes can change without this).
+    # The cell's moves are turned into templates once. Each tile then maps all of its
+    # coordinates through its transform in one pass and formats them in one batch,
+    # so the cost is proportional to the size of the output rather than to re-parsing the cell.
+    # Transforms that mix X into Y (rotation) need both words on every move, so then the
+    # modal positions are filled in first. Arc centre offsets (I, J) only take the linear part
+    # of the transform, and arcs swap direction in tiles that are mirrored.
+    # Coordinates are written with format_number, to the given precision if there is one.
+    number = format_number if precision is None else partial(format_number, precision=precision)
+    mixes_axes = any(b or c for a, b, c, d, e, f in transforms)
+    if mixes_axes:
+        xs, ys = resolve_positions(program)
+    else:
+        xs, ys = program.x, program.y
+    has_arcs = any(op in MIRRORED_ARCS for op in program.ops)
+
+    move_templates = []
+    move_ops = []
+    cell_x = []
+    cell_y = []
+    cell_i = []
+    cell_j = []
+    for k, op in enumerate(program.ops):
+        if op == OP_TEXT:
+            continue
+        template = '{4}' if op in MIRRORED_ARCS else MOVE_WORDS[op]
+        if mixes_axes or xs[k] == xs[k]:
+            template += ' X{0}'
+        if mixes_axes or ys[k] == ys[k]:
+            template += ' Y{1}'
+        if op in MIRRORED_ARCS:
+            template += ' I{2} J{3}'
+        move_templates.append(template)
+        move_ops.append(op)
+        cell_x.append(xs[k])
+        cell_y.append(ys[k])
+        # an arc that leaves out I or J has a zero offset on that axis
+        cell_i.append(program.i[k] if program.i[k] == program.i[k] else 0.0)
+        cell_j.append(program.j[k] if program.j[k] == program.j[k] else 0.0)
+
+    for a, b, c, d, e, f in transforms:
+        if mixes_axes:
+            tile_x = [a * x + b * y + e for x, y in zip(cell_x, cell_y)]
+            tile_y = [c * x + d * y + f for x, y in zip(cell_x, cell_y)]
+        else:
+            tile_x = [a * x + e for x in cell_x]
+            tile_y = [d * y + f for y in cell_y]
+        if not has_arcs:
+            yield [template.format(x_text, y_text)
+                   for template, x_text, y_text in zip(move_templates, map(number, tile_x), map(number, tile_y))]
+            continue
+        tile_i = [a * i + b * j for i, j in zip(cell_i, cell_j)]
+        tile_j = [c * i + d * j for i, j in zip(cell_i, cell_j)]
+        if a * d - b * c < 0:
+            words = [MOVE_WORDS[MIRRORED_ARCS.get(op, op)] for op in move_ops]
+        else:
+            words = [MOVE_WORDS[op] for op in move_ops]
+        yield [template.format(x_text, y_text, i_text, j_text, word)
+               for template, x_text, y_text, i_text, j_text, word in zip(
+                   move_templates, map(number, tile_x), map(number, tile_y),
+                   map(number, tile_i), map(number, tile_j), words)]
+
+
+def finish_tiles(tiles, program, texts, suffixes):
+    # The lines of every tile from its moves (see tile_moves): each move with its suffix (see move_suffixes),
+    # between the cell's other lines from its finished texts, leaving out the ones a substitution emptied out
+    cell_lines = []
+    move_positions = []
+    for op, text_id in zip(program.ops, program.text):
+        if op == OP_TEXT:
+            if texts[text_id] is not None:
+                cell_lines.append(texts[text_id])
+            continue
+        move_positions.append(len(cell_lines))
+        cell_lines.append(None)
+    suffixes = [suffix for suffix in suffixes if suffix is not None]
+    for moves in tiles:
+        tile_lines = cell_lines.copy()
+        for position, move, suffix in zip(move_positions, moves, suffixes):
+            tile_lines[position] = move + suffix
+        yield tile_lines
+
+
+def split_strokes(program, mso, meo):
+    # Splits a parsed program into pen-down strokes, each running from a start-cut (mso) line
+    # to the next end-cut (meo) line, and the gaps between them.
+    # Returns (gaps, strokes), where gaps has one more entry than strokes (the header before
+    # the first stroke and the trailer after the last), and each entry is a list of row indices.
+    gaps = [[]]
+    strokes = []
+    stroke = None
+    for k, (op, text_id) in enumerate(zip(program.ops, program.text)):
+        text = program.texts[text_id].strip() if op == OP_TEXT else None
+        if stroke is None:
+            if text == mso:
+                stroke = [k]
+            else:
+                gaps[-1].append(k)
+        else:
+            stroke.append(k)
+            if text == meo:
+                strokes.append(stroke)
+                gaps.append([])
+                stroke = None
+    if stroke is not None:
+        # an unfinished stroke at the end of the file is left where it is
+        gaps[-1].extend(stroke)
+    return gaps, strokes
+
+
+def split_layers(program):
+    # Splits a parsed program into one program per layer (see LAYER_MARKER), in the order the layers first
+    # appear, as a list of (layer name, program). Whatever comes before the first marker goes with the first layer.
+    # A program with fewer than two layers is returned as it is, along with its layer name (None without any).
+    layer_of_row = array('l')
+    names = []
+    layer = 0
+    for op, text_id in zip(program.ops, program.text):
+        if op == OP_TEXT:
+            marker = LAYER_MARKER.match(program.texts[text_id])
+            if marker:
+                if marker.group(1) not in names:
+                    names.append(marker.group(1))
+                layer = names.index(marker.group(1))
+        layer_of_row.append(layer)
+    if len(names) < 2:
+        return [(names[0] if names else None, program)]
+    layers = [GcodeProgram() for _ in names]
+    for k, layer in enumerate(layer_of_row):
+        layers[layer].copy_row(program, k)
+    return list(zip(names, layers))
+
+
+def join_programs(programs):
+    # One program running through each of the given programs in turn
+    joined = GcodeProgram()
+    for program in programs:
+        for k in range(len(program)):
+            joined.copy_row(program, k)
+    return joined
+
+
+def is_plain_travel(program, k):
+    # A G00 with nothing but X and Y, which can be dropped and replaced by a travel of our own
+    return (program.ops[k] == OP_RAPID and program.z[k] != program.z[k] and program.f[k] != program.f[k]
+            and program.text[k] == -1)
+
+
+class PointGrid:
+    # Uniform grid of points for nearest-neighbour lookups, so finding the closest stroke
+    # doesn't mean scanning every stroke. Points can be removed once they have been used.
+    def __init__(self, points, cell_size):
+        self.points = points
+        self.cell_size = cell_size
+        self.cells = {}
+        for point_id, (x, y) in enumerate(points):
+            self.cells.setdefault(self.cell(x, y), set()).add(point_id)
+        cell_keys = self.cells.keys() or [(0, 0)]
+        self.max_ring = max(max(abs(i), abs(j)) for i, j in cell_keys) + 1
+
+    def cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def remove(self, point_id):
+        self.cells[self.cell(*self.points[point_id])].discard(point_id)
+
+    def nearest(self, x, y, count=1):
+        # The count closest points to x, y as a list of (distance, point_id), closest first.
+        # Searches outwards ring by ring, until no unsearched ring can hold anything closer.
+        c_x, c_y = self.cell(x, y)
+        found = []
+        ring = 0
+        while ring <= self.max_ring + max(abs(c_x), abs(c_y)):
+            for i in range(c_x - ring, c_x + ring + 1):
+                for j in range(c_y - ring, c_y + ring + 1):
+                    if max(abs(i - c_x), abs(j - c_y)) != ring:
+                        continue
+                    for point_id in self.cells.get((i, j), ()):
+                        p_x, p_y = self.points[point_id]
+                        found.append((math.hypot(p_x - x, p_y - y), point_id))
+            if len(found) >= count:
+                found.sort()
+                # everything in the next ring is at least this far away
+                if found[count - 1][0] <= ring * self.cell_size:
+                    break
+            ring += 1
+        found.sort()
+        return found[:count]
+
+
+def order_strokes(ends, reversible, start, progress=None):
+    # Orders strokes to keep pen-up travel short. ends[s] is ((start_x, start_y), (end_x, end_y))
+    # of stroke s and reversible[s] says whether it may be drawn backwards.
+    # A greedy nearest-neighbour tour (looked up through a PointGrid) is improved by a 2-opt pass,
+    # which reverses runs of reversible strokes wherever that shortens the travel around them.
+    # Returns a list of (stroke, reversed) in drawing order. If given, progress(fraction done) is called every
+    # PROGRESS_INTERVAL strokes, the nearest-neighbour tour counting as the first half and the 2-opt passes
+    # (at most 20) as the second.
+    n_strokes = len(ends)
+    if n_strokes < 2:
+        return [(s, False) for s in range(n_strokes)]
+    # point 2s is the start of stroke s, point 2s + 1 its end (only entered if the stroke is reversible)
+    points = [point for stroke_ends in ends for point in stroke_ends]
+    xs = [x for x, y in points]
+    ys = [y for x, y in points]
+    area = max(max(xs) - min(xs), 1.0) * max(max(ys) - min(ys), 1.0)
+    cell_size = max(math.sqrt(area / n_strokes), 1e-3)
+
+    grid = PointGrid(points, cell_size)
+    for s in range(n_strokes):
+        if not reversible[s]:
+            grid.remove(2 * s + 1)
+    order = []
+    position = start
+    while len(order) < n_strokes:
+        if progress is not None and not len(order) % PROGRESS_INTERVAL:
+            progress(0.5 * len(order) / n_strokes)
+        distance, point_id = grid.nearest(*position)[0]
+        s, reverse = divmod(point_id, 2)
+        grid.remove(2 * s)
+        grid.remove(2 * s + 1)
+        order.append((s, bool(reverse)))
+        position = ends[s][0 if reverse else 1]
+
+    # neighbour lists for the 2-opt pass: the strokes closest to each end of every stroke, and to the start
+    grid = PointGrid(points, cell_size)
+    neighbours = [[point_id // 2 for distance, point_id in grid.nearest(x, y, 10)] for x, y in points]
+    start_neighbours = [point_id // 2 for distance, point_id in grid.nearest(*start, 10)]
+
+    def entry(p):
+        s, reverse = order[p]
+        return ends[s][1 if reverse else 0]
+
+    def exit(p):
+        s, reverse = order[p]
+        return ends[s][0 if reverse else 1]
+
+    def gap(a, b):
+        return math.hypot(a[0] - b[0], a[1] - b[1])
+
+    def index_order():
+        # where each stroke sits in the order, and a running count of the strokes that can't be reversed
+        places = [0] * n_strokes
+        fixed = [0] * (n_strokes + 1)
+        for p, (s, reverse) in enumerate(order):
+            places[s] = p
+            fixed[p + 1] = fixed[p] + (not reversible[s])
+        return places, fixed
+
+    places, fixed = index_order()
+    for attempt in range(20):
+        improved = False
+        for i in range(n_strokes):
+            if progress is not None and not i % PROGRESS_INTERVAL:
+                progress(0.5 + 0.5 * (attempt + i / n_strokes) / 20)
+            before = start if i == 0 else exit(i - 1)
+            if i == 0:
+                candidates = start_neighbours
+            else:
+                s, reverse = order[i - 1]
+                candidates = neighbours[2 * s + (0 if reverse else 1)]
+            for s in candidates:
+                j = places[s]
+                if j < i or fixed[j + 1] != fixed[i]:
+                    continue
+                after = entry(j + 1) if j + 1 < n_strokes else None
+                old_cost = gap(before, entry(i)) + (gap(exit(j), after) if after else 0)
+                new_cost = gap(before, exit(j)) + (gap(entry(i), after) if after else 0)
+                if new_cost < old_cost - 1e-9:
+                    order[i:j + 1] = [(s2, not reverse) for s2, reverse in reversed(order[i:j + 1])]
+                    places, fixed = index_order()
+                    improved = True
+                    break
+        if not improved:
+            break
+    return order
+
+
+def optimize_stroke_order(program, mso, meo, progress=None):
+    # Reorders (and where possible reverses) the pen-down strokes of a parsed program to
+    # minimise pen-up travel, rebuilding the G00 travels between them.
+    # Anything other than plain travel between two strokes (a Z move, a comment...) stays where it is,
+    # and the strokes on either side of it are ordered separately.
+    # If given, progress(fraction done) is called as the strokes are ordered (see order_strokes).
+    gaps, strokes = split_strokes(program, mso, meo)
+    if len(strokes) < 2:
+        return program
+    xs, ys = resolve_positions(program)
+
+    # runs of strokes that can be freely reordered, split wherever a gap holds more than travel
+    # (blank lines don't count)
+    runs = [[]]
+    for s in range(len(strokes)):
+        if s and not all(is_plain_travel(program, k) or
+                         (program.ops[k] == OP_TEXT and not program.texts[program.text[k]].strip())
+                         for k in gaps[s]):
+            runs.append([])
+        runs[-1].append(s)
+
+    optimized = GcodeProgram()
+
+    def copy_row(k):
+        optimized.copy_row(program, k)
+
+    def copy_gap(gap):
+        for k in gap:
+            if not is_plain_travel(program, k):
+                copy_row(k)
+
+    copy_gap(gaps[0])
+    header_moves = [k for k in gaps[0] if program.ops[k] != OP_TEXT and not is_plain_travel(program, k)]
+    position = (xs[header_moves[-1]], ys[header_moves[-1]]) if header_moves else (0.0, 0.0)
+    ordered = 0
+    for run in runs:
+        if run[0]:
+            copy_gap(gaps[run[0]])
+        ends = []
+        reversible = []
+        for s in run:
+            stroke = strokes[s]
+            ends.append(((xs[stroke[0]], ys[stroke[0]]), (xs[stroke[-1]], ys[stroke[-1]])))
+            # only strokes made of nothing but plain G01 moves can be drawn backwards
+            reversible.append(all(program.ops[k] == OP_LINEAR and program.z[k] != program.z[k]
+                                  and program.f[k] != program.f[k] and program.text[k] == -1
+                                  for k in stroke[1:-1]))
+
+        def run_progress(fraction, done=ordered, size=len(run)):
+            progress((done + fraction * size) / len(strokes))
+
+        ordered += len(run)
+        for s, reverse in order_strokes(ends, reversible, position, run_progress if progress is not None else None):
+            stroke = strokes[run[s]]
+            start, end = ends[s][::-1] if reverse else ends[s]
+            optimized.add_move(OP_RAPID, start[0], start[1])
+            copy_row(stroke[0])
+            if reverse:
+                for k in reversed(stroke[:-2]):
+                    optimized.add_move(OP_LINEAR, xs[k], ys[k])
+            else:
+                for k in stroke[1:-1]:
+                    copy_row(k)
+            copy_row(stroke[-1])
+            position = end
+    for k in gaps[-1]:
+        copy_row(k)
+    return optimized
+
+
+def is_plain_cut(program, k):
+    # A G01 with nothing but X and Y, which can be merged into other moves or drawn backwards
+    return (program.ops[k] == OP_LINEAR and program.z[k] != program.z[k] and program.f[k] != program.f[k]
+            and program.text[k] == -1)
+
+
+def chord_distances(xs, ys, first, last):
+    # Distance of every point strictly between first and last from the straight line joining them
+    x0, y0 = xs[first], ys[first]
+    dx = xs[last] - x0
+    dy = ys[last] - y0
+    length = math.hypot(dx, dy)
+    if length == 0:
+        return [math.hypot(x - x0, y - y0) for x, y in zip(xs[first + 1:last], ys[first + 1:last])]
+    return [abs(dx * (y - y0) - dy * (x - x0)) / length for x, y in zip(xs[first + 1:last], ys[first + 1:last])]
+
+
+def douglas_peucker(xs, ys, first, last, tolerance):
+    # Ramer-Douglas-Peucker simplification of the points first..last: returns the indices to keep
+    # so that no dropped point is further than tolerance from the simplified line.
+    # Uses its own stack rather than recursion, so very long strokes are fine.
+    if last <= first:
+        return [first]
+    keep = [first, last]
+    pending = [(first, last)]
+    while pending:
+        start, end = pending.pop()
+        if end - start < 2:
+            continue
+        distances = chord_distances(xs, ys, start, end)
+        furthest = max(distances)
+        if furthest > tolerance:
+            split = start + 1 + distances.index(furthest)
+            keep.append(split)
+            pending.append((start, split))
+            pending.append((split, end))
+    return sorted(keep)
+
+
+def fit_arc(xs, ys, first, last, tolerance):
+    # Tries to replace the points first..last with a single arc, through the circle that passes through
+    # the first, middle and last points. Returns (centre_x, centre_y, clockwise) if the arc stays within
+    # tolerance of the polyline through the points, and the polyline within tolerance of the arc; otherwise None.
+    # Runs that are nearly straight are refused too, since a G01 covers those with fewer surprises.
+    middle = (first + last) // 2
+    x1, y1, x2, y2, x3, y3 = xs[first], ys[first], xs[middle], ys[middle], xs[last], ys[last]
+    determinant = 2 * (x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2))
+    if abs(determinant) < 1e-12 or max(chord_distances(xs, ys, first, last)) <= tolerance:
+        return None
+    square_1 = x1 * x1 + y1 * y1
+    square_2 = x2 * x2 + y2 * y2
+    square_3 = x3 * x3 + y3 * y3
+    centre_x = (square_1 * (y2 - y3) + square_2 * (y3 - y1) + square_3 * (y1 - y2)) / determinant
+    centre_y = (square_1 * (x3 - x2) + square_2 * (x1 - x3) + square_3 * (x2 - x1)) / determinant
+    radius = math.hypot(x1 - centre_x, y1 - centre_y)
+    clockwise = determinant < 0
+
+    segment_x = xs[first:last + 1]
+    segment_y = ys[first:last + 1]
+    if max(abs(math.hypot(x - centre_x, y - centre_y) - radius) for x, y in zip(segment_x, segment_y)) > tolerance:
+        return None
+    # the arc has to keep turning the same way and sweep less than a full turn
+    angles = [math.atan2(y - centre_y, x - centre_x) for x, y in zip(segment_x, segment_y)]
+    steps = [(after - before + math.pi) % (2 * math.pi) - math.pi for before, after in zip(angles, angles[1:])]
+    if clockwise:
+        steps = [-step for step in steps]
+    if min(steps) <= 0 or sum(steps) >= 2 * math.pi - 1e-6:
+        return None
+    # Every ray from the centre between two neighbouring points crosses both the arc and the chord between them,
+    # so the two are never further apart than the chord gets from the circle: at its ends (checked above),
+    # or where it passes closest to the centre, which for a chord cutting inside the circle is further in.
+    for before_x, after_x, before_y, after_y in zip(segment_x, segment_x[1:], segment_y, segment_y[1:]):
+        dx, dy = after_x - before_x, after_y - before_y
+        length_squared = dx * dx + dy * dy
+        if not length_squared:
+            continue
+        t = min(max(((centre_x - before_x) * dx + (centre_y - before_y) * dy) / length_squared, 0.0), 1.0)
+        if radius - math.hypot(before_x + t * dx - centre_x, before_y + t * dy - centre_y) > tolerance:
+            return None
+    return centre_x, centre_y, clockwise
+
+
+def simplify_polyline(xs, ys, tolerance, fit_arcs=True):
+    # Simplifies one polyline, returning the moves that replace it (after its first point) as a list of
+    # (op, x, y, i, j). Runs of points that sit on a circle become G02/G03 arcs, and what is left
+    # between them is thinned out with Douglas-Peucker.
+    last = len(xs) - 1
+    arcs = []
+    if fit_arcs:
+        start = 0
+        while start <= last - 3:
+            # grow the arc while it keeps fitting, doubling its length and then closing in on the longest fit
+            good, end = None, start + 3
+            while end <= last:
+                arc = fit_arc(xs, ys, start, end, tolerance)
+                if arc is None:
+                    break
+                good = (end, arc)
+                end = start + 2 * (end - start)
+            if good is None:
+                start += 1
+                continue
+            low, high = good[0], min(end, last + 1)
+            while high - low > 1:
+                end = (low + high) // 2
+                arc = fit_arc(xs, ys, start, end, tolerance)
+                if arc is None:
+                    high = end
+                else:
+                    low, good = end, (end, arc)
+            arcs.append((start, good[0], good[1]))
+            start = good[0]
+
+    moves = []
+    line_start = 0
+    for start, end, (centre_x, centre_y, clockwise) in arcs:
+        for k in douglas_peucker(xs, ys, line_start, start, tolerance)[1:]:
+            moves.append((OP_LINEAR, xs[k], ys[k], NAN, NAN))
+        moves.append((OP_CW_ARC if clockwise else OP_CCW_ARC, xs[end], ys[end],
+                      centre_x - xs[start], centre_y - ys[start]))
+        line_start = end
+    for k in douglas_peucker(xs, ys, line_start, last, tolerance)[1:]:
+        moves.append((OP_LINEAR, xs[k], ys[k], NAN, NAN))
+    return moves
+
+
+def simplify_paths(program, tolerance, fit_arcs=True, progress=None):
+    # Geometry simplification for dense G01 streams (e.g. DXF arcs exported as polylines):
+    # every run of plain G01 moves is simplified to within tolerance (mm) by simplify_polyline().
+    # Everything else is copied across as it was.
+    # If given, progress(fraction done) is called every PROGRESS_INTERVAL rows or so.
+    xs, ys = resolve_positions(program)
+    simplified = GcodeProgram()
+    k = 0
+    next_progress = 0
+    while k < len(program):
+        if progress is not None and k >= next_progress:
+            progress(k / len(program))
+            next_progress = k + PROGRESS_INTERVAL
+        if not is_plain_cut(program, k):
+            simplified.copy_row(program, k)
+            k += 1
+            continue
+        end = k
+        while end < len(program) and is_plain_cut(program, end):
+            end += 1
+        # the run starts from wherever the previous row left the pen
+        run_x = [xs[k - 1] if k else 0.0] + list(xs[k:end])
+        run_y = [ys[k - 1] if k else 0.0] + list(ys[k:end])
+        for op, x, y, i, j in simplify_polyline(run_x, run_y, tolerance, fit_arcs):
+            simplified.add_move(op, x, y, i=i, j=j)
+        k = end
+    return simplified
+
+
+def travel_distance(program):
+    # Total length of the G00 moves of a parsed program
+    xs, ys = resolve_positions(program)
+    distance = 0.0
+    last_x = last_y = 0.0
+    for op, x, y in zip(program.ops, xs, ys):
+        if op == OP_RAPID:
+            distance += math.hypot(x - last_x, y - last_y)
+        last_x, last_y = x, y
+    return distance
+
+
+def read_machine_limits(preamble):
+    # Reads the motion limits set in the preamble: M201 maximum accelerations, M203 maximum feedrates,
+    # M204 print (S/P) and travel (T) accelerations and M205 X/Y/Z jerk, in mm/s and mm/s^2.
+    # Anything the preamble doesn't set keeps Marlin's defaults.
+    limits = {'max_acceleration': {'X': 3000.0, 'Y': 3000.0, 'Z': 100.0},
+              'max_feedrate': {'X': 300.0, 'Y': 300.0, 'Z': 5.0},
+              'jerk': {'X': 10.0, 'Y': 10.0, 'Z': 0.3},
+              'print_acceleration': 3000.0, 'travel_acceleration': 3000.0}
+    axis_limits = {'M201': 'max_acceleration', 'M203': 'max_feedrate', 'M205': 'jerk'}
+    for line in preamble.split('\n'):
+        words = line.partition(';')[0].upper().split()
+        if not words:
+            continue
+        values = {}
+        for word in words[1:]:
+            try:
+                values[word[0]] = float(word[1:])
+            except ValueError:
+                pass
+        if words[0] in axis_limits:
+            for axis in 'XYZ':
+                # a zero acceleration or feedrate would stop the machine dead, so those are ignored
+                if axis in values and (values[axis] > 0 or words[0] == 'M205'):
+                    limits[axis_limits[words[0]]][axis] = values[axis]
+        elif words[0] == 'M204':
+            if values.get('S', 0) > 0:
+                limits['print_acceleration'] = limits['travel_acceleration'] = values['S']
+            if values.get('P', 0) > 0:
+                limits['print_acceleration'] = values['P']
+            if values.get('T', 0) > 0:
+                limits['travel_acceleration'] = values['T']
+    return limits
+
+
+def text_step(text):
+    # What a text line does to the machine, for the time estimate: a move for substituted pen moves
+    # like 'G01 Z-3 F4500', ('dwell', seconds) for a G4, ('set', x, y, z) for a G92, and None for
+    # anything that takes no time (M codes, comments...)
+    row = parse_gcode([text])
+    if row.ops[0] != OP_TEXT:
+        return ('move', row.ops[0], row.x[0], row.y[0], row.z[0], row.f[0], row.i[0], row.j[0])
+    words = text.partition(';')[0].upper().split()
+    if not words or words[0] not in ('G4', 'G04', 'G92'):
+        return None
+    values = {}
+    for word in words[1:]:
+        try:
+            values[word[0]] = float(word[1:])
+        except ValueError:
+            pass
+    if words[0] == 'G92':
+        # a bare G92 zeroes every axis
+        default = NAN if values else 0.0
+        return ('set', values.get('X', default), values.get('Y', default), values.get('Z', default))
+    return ('dwell', values.get('S', 0.0) + values.get('P', 0.0) / 1000)
+
+
+def motion_steps(program, texts, cut_feed, trav_feed):
+    # The machine's view of a parsed block, for the time estimate: a list of
+    # ('move', op, x, y, z, feed, i, j), ('dwell', seconds) and ('set', x, y, z) steps.
+    # Text rows are read through their finished texts, so the pen moves substituted for the M codes
+    # count as moves. Positions are filled in modally within the block, and stay NaN until the
+    # block first sets them; feeds are in mm/min, with the cut or travel feed for moves that had none.
+    feeds = {OP_RAPID: float(trav_feed), OP_LINEAR: float(cut_feed),
+             OP_CW_ARC: float(cut_feed), OP_CCW_ARC: float(cut_feed)}
+    text_steps = {}
+    steps = []
+    x = y = z = NAN
+    for k, (op, text_id) in enumerate(zip(program.ops, program.text)):
+        if op == OP_TEXT:
+            if text_id not in text_steps:
+                text_steps[text_id] = None if texts[text_id] is None else text_step(texts[text_id])
+            step = text_steps[text_id]
+            if step is None:
+                continue
+            if step[0] == 'set':
+                x, y, z = (old if new != new else new for old, new in zip((x, y, z), step[1:]))
+            elif step[0] == 'move':
+                op, x_word, y_word, z_word, f, i, j = step[1:]
+                x, y, z = (old if new != new else new for old, new in zip((x, y, z), (x_word, y_word, z_word)))
+                step = ('move', op, x, y, z, f, i, j)
+            steps.append(step)
+            continue
+        if program.x[k] == program.x[k]:
+            x = program.x[k]
+        if program.y[k] == program.y[k]:
+            y = program.y[k]
+        if program.z[k] == program.z[k]:
+            z = program.z[k]
+        f = program.f[k] if program.f[k] == program.f[k] else feeds[op]
+        steps.append(('move', op, x, y, z, f, program.i[k], program.j[k]))
+    return steps
+
+
+def trapezoid_time(length, entry, exit_speed, nominal, acceleration):
+    # Time for one move that accelerates from entry towards its nominal speed and decelerates to exit,
+    # cruising in between if it's long enough to get there
+    accelerate = (nominal * nominal - entry * entry) / (2 * acceleration)
+    decelerate = (nominal * nominal - exit_speed * exit_speed) / (2 * acceleration)
+    if accelerate + decelerate <= length:
+        return ((nominal - entry) + (nominal - exit_speed)) / acceleration + \
+            (length - accelerate - decelerate) / nominal
+    peak = math.sqrt((2 * acceleration * length + entry * entry + exit_speed * exit_speed) / 2)
+    return ((peak - entry) + (peak - exit_speed)) / acceleration
+
+
+class MotionPlanner:
+    # Estimates the run time of gcode the way a Marlin-style firmware plans it: every move gets a
+    # trapezoidal speed profile, capped by its feed and the per-axis feedrate and acceleration limits,
+    # and the speed through each corner is limited by the jerk (the largest instant change of speed
+    # on any one axis). Corner speeds are found with a backward and a forward pass over each run
+    # of moves between dwells. The planner keeps the machine position and feed between calls,
+    # so a job can be estimated a block at a time. If given, progress(steps planned so far) is called
+    # every PROGRESS_INTERVAL steps.
+    def __init__(self, limits, progress=None):
+        self.limits = limits
+        self.position = (0.0, 0.0, 0.0)
+        self.feed = 3000.0
+        self.progress = progress
+        self.steps_planned = 0
+
+    def run(self, steps, transform=IDENTITY):
+        # Time (s) to run a list of motion steps, with the X and Y of the moves mapped through
+        # an affine transform (as offset_cell does for each tile). Starts and ends at a standstill.
+        a, b, c, d, e, f = transform
+        mirrored = a * d - b * c < 0
+        x, y, z = self.position
+        feed = self.feed
+        total = 0.0
+        run = []
+        progress = self.progress
+        for count, step in enumerate(steps, self.steps_planned):
+            if progress is not None and not count % PROGRESS_INTERVAL:
+                progress(count)
+            if step[0] == 'move':
+                op, x_word, y_word, z_word, feed_word, i, j = step[1:]
+                if x_word == x_word and y_word == y_word:
+                    new_x = a * x_word + b * y_word + e
+                    new_y = c * x_word + d * y_word + f
+                elif not (b or c):
+                    new_x = a * x_word + e if x_word == x_word else x
+                    new_y = d * y_word + f if y_word == y_word else y
+                else:
+                    new_x, new_y = x, y
+                new_z = z_word if z_word == z_word else z
+                if feed_word == feed_word:
+                    feed = feed_word
+                dx, dy, dz = new_x - x, new_y - y, new_z - z
+                length = math.sqrt(dx * dx + dy * dy + dz * dz)
+                if op in MIRRORED_ARCS:
+                    length = math.hypot(self.arc_length(dx, dy, i, j, op, transform, mirrored), dz)
+                run.append((dx, dy, dz, length, feed, op == OP_RAPID))
+                x, y, z = new_x, new_y, new_z
+            elif step[0] == 'dwell':
+                total += self.plan(run) + step[1]
+                run = []
+            else:
+                total += self.plan(run)
+                run = []
+                x, y, z = (old if new != new else new for old, new in zip((x, y, z), step[1:]))
+        total += self.plan(run)
+        self.position = (x, y, z)
+        self.feed = feed
+        self.steps_planned += len(steps)
+        return total
+
+    @staticmethod
+    def arc_length(dx, dy, i, j, op, transform, mirrored):
+        # Length of an arc with its chord (dx, dy) already transformed, and its I/J still in cell coordinates
+        a, b, c, d, e, f = transform
+        i = i if i == i else 0.0
+        j = j if j == j else 0.0
+        centre_x, centre_y = a * i + b * j, c * i + d * j
+        radius = math.hypot(centre_x, centre_y)
+        start_angle = math.atan2(-centre_y, -centre_x)
+        end_angle = math.atan2(dy - centre_y, dx - centre_x)
+        sweep = end_angle - start_angle
+        if (op == OP_CW_ARC) != mirrored:
+            sweep = -sweep
+        sweep %= 2 * math.pi
+        if sweep == 0:
+            # an arc that ends where it started is a full circle
+            sweep = 2 * math.pi
+        return radius * sweep
+
+    def plan(self, run):
+        # Time (s) for a run of moves (dx, dy, dz, length, feed, travel) from a standstill back to a standstill
+        limits = self.limits
+        acceleration_limits = [limits['max_acceleration'][axis] for axis in 'XYZ']
+        feedrate_limits = [limits['max_feedrate'][axis] for axis in 'XYZ']
+        jerk_limits = [limits['jerk'][axis] for axis in 'XYZ']
+        lengths = []
+        nominals = []
+        accelerations = []
+        entries = []
+        previous = None
+        for dx, dy, dz, length, feed, travel in run:
+            if length < 1e-9 or feed <= 0:
+                continue
+            chord = math.sqrt(dx * dx + dy * dy + dz * dz) or length
+            unit = (dx / chord, dy / chord, dz / chord)
+            nominal = feed / 60
+            acceleration = limits['travel_acceleration'] if travel else limits['print_acceleration']
+            # the fastest it could start from, or stop at, a standstill
+            safe = nominal
+            for u, feedrate_limit, acceleration_limit, jerk_limit in zip(
+                    unit, feedrate_limits, acceleration_limits, jerk_limits):
+                if u:
+                    u = abs(u)
+                    nominal = min(nominal, feedrate_limit / u)
+                    acceleration = min(acceleration, acceleration_limit / u)
+                    safe = min(safe, jerk_limit / u)
+            entry = min(safe, nominal)
+            if previous is not None:
+                previous_unit, previous_nominal = previous
+                entry = min(nominal, previous_nominal)
+                for u, previous_u, jerk_limit in zip(unit, previous_unit, jerk_limits):
+                    change = abs(u - previous_u)
+                    if change > 1e-9:
+                        entry = min(entry, jerk_limit / change)
+            lengths.append(length)
+            nominals.append(nominal)
+            accelerations.append(acceleration)
+            entries.append(entry)
+            previous = unit, nominal
+            last_safe = min(safe, nominal)
+        if not lengths:
+            return 0.0
+
+        # backward pass: every move has to be able to slow down to the entry speed of the next one
+        exits = entries[1:] + [last_safe]
+        for k in range(len(lengths) - 1, -1, -1):
+            reachable = math.sqrt(exits[k] * exits[k] + 2 * accelerations[k] * lengths[k])
+            if entries[k] > reachable:
+                entries[k] = reachable
+                if k:
+                    exits[k - 1] = reachable
+        # forward pass: and be able to speed up to it from its own entry speed
+        for k in range(len(lengths)):
+            reachable = math.sqrt(entries[k] * entries[k] + 2 * accelerations[k] * lengths[k])
+            if exits[k] > reachable:
+                exits[k] = reachable
+                if k + 1 < len(lengths):
+                    entries[k + 1] = reachable
+        return sum(map(trapezoid_time, lengths, entries, exits, nominals, accelerations))
+
+
+def split_cell_steps(steps):
+    # Splits the motion steps of a cell into the ones before its first full X/Y position
+    # (the travel into each tile, which depends on where the previous tile left off),
+    # and the rest, which take the same time in every tile with the same rotation, scale and mirroring.
+    # Also returns the cell coordinates the cell ends at, and its last feed.
+    for k, step in enumerate(steps):
+        if step[0] == 'move' and step[2] == step[2] and step[3] == step[3]:
+            entry, rest = steps[:k + 1], steps[k + 1:]
+            break
+    else:
+        entry, rest = steps, []
+    end = (NAN, NAN, NAN)
+    feed = NAN
+    for step in steps:
+        if step[0] == 'move':
+            end = (step[2], step[3], step[4])
+            feed = step[5] if step[5] == step[5] else feed
+        elif step[0] == 'set':
+            end = tuple(old if new != new else new for old, new in zip(end, step[1:]))
+    return entry, rest, end, feed
+
+
+def tile_set_times(planner, cell, transforms, rest_times):
+    # Time (s) of every tile of a tile set, starting from wherever the planner is.
+    # The time of the bulk of the cell only depends on the linear part of the tile's transform,
+    # so it's planned once per distinct one (kept in rest_times) and only the travel in is planned per tile.
+    entry, rest, (end_x, end_y, end_z), end_feed = cell
+    times = []
+    for transform in transforms:
+        a, b, c, d, e, f = transform
+        tile_time = planner.run(entry, transform)
+        if (a, b, c, d) not in rest_times:
+            rest_times[(a, b, c, d)] = planner.run(rest, transform)
+        tile_time += rest_times[(a, b, c, d)]
+        x, y, z = planner.position
+        if end_x == end_x and end_y == end_y:
+            x, y = a * end_x + b * end_y + e, c * end_x + d * end_y + f
+        planner.position = (x, y, end_z if end_z == end_z else z)
+        if end_feed == end_feed:
+            planner.feed = end_feed
+        times.append(tile_time)
+    return times
+
+
+def cycle_tile_times(planner, cells, pen_change_steps, transforms, rest_times, alternate=False):
+    # Time (s) of every tile of one cycle, summed over the tile sets of its pens (see tile_set_times),
+    # which each start with their pen change. With alternate set, the pens go in the opposite order, and the
+    # first of them is already in the holder (see pen_order). Returns the tile times and the time of the pen changes.
+    tile_times = [0.0] * len(transforms)
+    change_time = 0.0
+    pens = list(zip(cells, pen_change_steps, rest_times))
+    for position, (cell, change_steps, cell_rest_times) in enumerate(pens[::-1] if alternate else pens):
+        if position or not alternate:
+            change_time += planner.run(change_steps)
+        times = tile_set_times(planner, cell, transforms, cell_rest_times)
+        tile_times = [tile_time + time for tile_time, time in zip(tile_times, times)]
+    return tile_times, change_time
+
+
+def estimate_job_time(limits, preamble_steps, layer_steps, pen_change_steps, transforms, cycles, cycle_offset,
+                      subroutine_steps, cut_feed, progress=None, alternate_pens=False):
+    # Estimates the run time of the whole job from the motion steps of its parts (see motion_steps),
+    # in the order iter_job_lines writes them: the cell's steps come as one list per pen, each with the steps
+    # of the pen change before it (an empty list for a single pen). Every cycle after the first starts
+    # from the same place, so the subroutine and tile set are only planned for the first of them and reused
+    # after that.
+    # With alternate_pens, the cycles after the first are planned with their pens backwards and no pen change to
+    # start with (see pen_order); the ones that go forwards again only differ in the travel between pens.
+    # Returns the tile times of a repeated cycle, the time of one cycle (tile set, pen changes, z offset
+    # and subroutine), and the total, all in seconds.
+    # If given, progress(fraction done) is called as the steps are planned, going by the cell being planned
+    # once for every distinct scale, rotation and mirroring of its tiles.
+    if progress is not None:
+        expected = max(len(preamble_steps) + len({transform[:4] for transform in transforms})
+                       * sum(map(len, layer_steps)), 1)
+        planner = MotionPlanner(limits, lambda planned: progress(min(planned / expected, 1.0)))
+    else:
+        planner = MotionPlanner(limits)
+    total = planner.run(preamble_steps)
+    cells = [split_cell_steps(steps) for steps in layer_steps]
+    rest_times = [{} for _ in cells]
+    tile_times, change_time = cycle_tile_times(planner, cells, pen_change_steps, transforms, rest_times)
+    cycle_time = sum(tile_times) + change_time
+    total += cycle_time
+    repeat = None
+    for i in range(cycles - 1):
+        boundary = [('move', OP_LINEAR, NAN, NAN, i * cycle_offset, float(cut_feed), NAN, NAN),
+                    ('set', NAN, NAN, 0.0)]
+        boundary_time = planner.run(boundary)
+        if repeat is None:
+            repeat_time = planner.run(subroutine_steps)
+            tile_times, change_time = cycle_tile_times(planner, cells, pen_change_steps, transforms, rest_times,
+                                                       alternate_pens)
+            repeat_time += sum(tile_times) + change_time
+            repeat = planner.position, planner.feed
+        else:
+            planner.position, planner.feed = repeat
+        cycle_time = boundary_time + repeat_time
+        total += cycle_time
+    return {'tile_times': tile_times, 'cycle_time': cycle_time, 'total_time': total}
+
+
+def format_duration(seconds):
+    # h:mm:ss, for showing estimated times
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours}:{minutes:02d}:{seconds:02d}'
+
+
+def toolpath_polylines(program, arc_tolerance=0.05):
+    # The cell's toolpath as polylines for previewing, in cell coordinates: (cuts, travels), each a list
+    # of (xs, ys) point lists. Every run of G01-G03 moves is one cut polyline, with arcs flattened to
+    # within arc_tolerance, and every G00 is a two point travel.
+    xs, ys = resolve_positions(program)
+    cuts = []
+    travels = []
+    cut = None
+    last_x = last_y = 0.0
+    for k, op in enumerate(program.ops):
+        if op == OP_TEXT:
+            continue
+        x, y = xs[k], ys[k]
+        if op == OP_RAPID:
+            if (x, y) != (last_x, last_y):
+                travels.append(([last_x, x], [last_y, y]))
+            cut = None
+        else:
+            if cut is None:
+                cut = ([last_x], [last_y])
+                cuts.append(cut)
+            if op in MIRRORED_ARCS:
+                centre_x = last_x + (program.i[k] if program.i[k] == program.i[k] else 0.0)
+                centre_y = last_y + (program.j[k] if program.j[k] == program.j[k] else 0.0)
+                radius = math.hypot(last_x - centre_x, last_y - centre_y)
+                start_angle = math.atan2(last_y - centre_y, last_x - centre_x)
+                direction = -1 if op == OP_CW_ARC else 1
+                sweep = (direction * (math.atan2(y - centre_y, x - centre_x) - start_angle)) % (2 * math.pi) \
+                    or 2 * math.pi
+                step = 2 * math.acos(max(1 - arc_tolerance / radius, -1)) if radius > arc_tolerance else math.pi
+                steps = max(int(math.ceil(sweep / step)), 1)
+                for n in range(1, steps):
+                    angle = start_angle + direction * sweep * n / steps
+                    cut[0].append(centre_x + radius * math.cos(angle))
+                    cut[1].append(centre_y + radius * math.sin(angle))
+            cut[0].append(x)
+            cut[1].append(y)
+        last_x, last_y = x, y
+    return cuts, travels
+
+
+def build_tile_set(tiles, program, texts, suffixes, compact=False, omit_modal_words=False):
+    # The finished lines of the cell in every tile, from the moves tile_moves placed in them, as one list of
+    # lines per tile. When compacted, each tile starts from an unknown modal state, so it can follow anything
+    # (the preamble, the cycle subroutine, or the tile before it).
+    tile_set = list(finish_tiles(tiles, program, texts, suffixes))
+    if compact:
+        tile_set = [list(compact_lines(tile, omit_modal_words)) for tile in tile_set]
+    return tile_set
+
+
+# The loops firmwares can repeat the cycles after the first with, so that they are written once
+# rather than once each: the line opening the loop (given its count), the line closing it (RepRapFirmware
+# closes its loops by indentation instead), the indent of the lines inside it, and the z move the
+# cycles start with. RepRapFirmware counts the iterations of its loop, so it moves down further every
+# cycle just as the expanded job does. Marlin's repeat markers (which need GCODE_REPEAT_MARKERS built in)
+# and Klipper's SDCARD_LOOP (which needs an [sdcard_loop] section) can only repeat the same move, which
+# can't follow the expanded job down (constant_step), so process_gcode only loops them with no cycle_offset.
+# All of them only loop when the job runs from the SD card.
+FIRMWARE_LOOPS = {
+    'marlin': {'begin': 'M808 L{count}', 'end': 'M808', 'indent': '',
+               'boundary': 'G01 Z{step}', 'constant_step': True},
+    'reprap': {'begin': 'while iterations < {count}', 'end': None, 'indent': '  ',
+               'boundary': 'G01 Z{{iterations * {step}}}', 'constant_step': False},
+    'klipper': {'begin': 'SDCARD_LOOP_BEGIN COUNT={count}', 'end': 'SDCARD_LOOP_END', 'indent': '',
+                'boundary': 'G01 Z{step}', 'constant_step': True},
+}
+FIRMWARE_TARGETS = ['expanded'] + list(FIRMWARE_LOOPS)
+
+
+def job_loop(firmware, cycles):
+    # The FIRMWARE_LOOPS entry the job's cycles are repeated with, or None if they are all written out.
+    # Two cycles take no more lines written out than looped.
+    if firmware not in FIRMWARE_TARGETS:
+        raise ValueError(f"unknown firmware loop '{firmware}', expected one of {', '.join(FIRMWARE_TARGETS)}")
+    return FIRMWARE_LOOPS[firmware] if firmware != 'expanded' and cycles > 2 else None
+
+
+def pen_order(cycle, pens, alternate=False):
+    # The order the pens of a job batched by pen draw in during a cycle (counted from 0), as their indices.
+    # With alternate set, every other cycle goes through them backwards, so that each cycle starts with the pen
+    # the one before it ended with.
+    order = list(range(pens))
+    return order[::-1] if alternate and cycle % 2 else order
+
+
+def iter_job_lines(preamble, skirts, tile_set, cycles, cycle_offset, cycle_subroutine, finish, progress=None,
+                   firmware='expanded', pen_changes=None, alternate_pens=False):
+    # Yields every line of the finished job in order: preamble, skirts, then the tile set
+    # once per cycle with the z offset and subroutine in between, and finally M02.
+    # The tile set (a list of lines per tile) is the only part that has to be kept in memory, as it is
+    # repeated every cycle, and it arrives already finished; everything else goes through finish()
+    # as it is yielded. If given, progress(cycle, tile, pen change) is called before each tile, with the
+    # pen change lines about to be written before it (an empty list if there are none).
+    # pen_changes, if given, holds the finished pen change lines of each pen, when the tiles are batched by
+    # pen: the tile set then holds the tiles of each pen in turn, and each pen's tiles start with its change.
+    # With alternate_pens set, every other cycle goes through the pens backwards (see pen_order) and starts
+    # without a pen change, as the pen the cycle before ended with is still in the holder.
+    # For a firmware loop (see job_loop), the second cycle is written inside a loop that runs it
+    # for every cycle after the first, so progress only sees the first two cycles. As every run of the loop
+    # is the same, its pens always keep their order and it starts with a pen change.
+    pens = len(pen_changes) if pen_changes else 1
+    pen_tiles = len(tile_set) // pens
+
+    def cycle_lines(cycle, boundary, alternate):
+        if cycle:
+            yield from finish([boundary, 'G92 Z0'] + cycle_subroutine.split('\n'))
+        for position, pen in enumerate(pen_order(cycle, pens, alternate)):
+            for tile in range(pen * pen_tiles, (pen + 1) * pen_tiles):
+                change = []
+                if pen_changes and tile == pen * pen_tiles and not (alternate and cycle and not position):
+                    change = pen_changes[pen]
+                if progress is not None:
+                    progress(cycle, tile, change)
+                yield from change
+                yield from tile_set[tile]
+
+    yield from finish(preamble.split('\n'))
+    yield from finish(skirts)
+    loop = job_loop(firmware, cycles)
+    if loop is None:
+        for cycle in range(cycles):
+            yield from cycle_lines(cycle, f'G01 Z{(cycle - 1) * cycle_offset}', alternate_pens)
+    else:
+        yield from cycle_lines(0, None, False)
+        yield loop['begin'].format(count=cycles - 1)
+        body = cycle_lines(1, loop['boundary'].format(step=format_number(cycle_offset)), False)
+        yield from (loop['indent'] + line for line in body) if loop['indent'] else body
+        if loop['end'] is not None:
+            yield loop['end']
+    yield 'M02'
+
+
+def track_modal_state(lines, state, pen_down, pen_up):
+    # Follows the modal state through lines of finished gcode: the x, y and z position and the feed
+    # (all None until known), and whether the pen is 'down' or 'up' (after a line that starts with
+    # the words of pen_down or pen_up). G92 resets the axes it names, or all of them without any.
+    # Updates state and returns it.
+    down_words = pen_down.split()
+    up_words = pen_up.split()
+    for line in lines:
+        words = line.split(';', 1)[0].split()
+        if not words:
+            continue
+        if words[:len(down_words)] == down_words:
+            state['pen'] = 'down'
+        elif words[:len(up_words)] == up_words:
+            state['pen'] = 'up'
+        if words[0] == 'G92' and len(words) == 1:
+            state.update(x=0.0, y=0.0, z=0.0)
+        elif words[0] in MOVE_OPS or words[0] == 'G92':
+            for word in words[1:]:
+                if word[:1] in ('X', 'Y', 'Z', 'F'):
+                    try:
+                        state['feed' if word[0] == 'F' else word[0].lower()] = float(word[1:])
+                    except ValueError:
+                        pass
+    return state
+
+
+def resume_job(output_file_path, resume_file_path, cycle, tile=1):
+    # Writes a copy of an indexed job that starts at the given cycle and tile (both counted from 1; the tile
+    # can also be the (column, row) of a tile of the grid, counted from 1; in a job batched by pen, the tiles
+    # of each pen are counted in turn), without processing anything again.
+    # The copy starts with a restart header (the preamble, the cycle's Z offset re-applied with G92 Z0,
+    # a pen-up travel to where the tile starts and the pen and feed as they were there) and goes on with
+    # the rest of the output file as it is, from the tile's offset in the index.
+    # Like the job itself, the header expects the machine to be where the job was started (the preamble
+    # zeroes the coordinates). Returns the index entry it resumed from.
+    with open(output_file_path + '.index.json', 'r') as file:
+        index = json.load(file)
+    if os.path.getsize(output_file_path) != index['bytes']:
+        raise ValueError(f'{output_file_path} has changed since its index was written')
+    if isinstance(tile, (tuple, list)):
+        if index['grid'] is None:
+            raise ValueError('the job was nested or batched by pen, so its tiles have no grid column and row')
+        cell = [tile[0] - 1, tile[1] - 1]
+        if cell not in index['grid']:
+            raise ValueError(f'the grid has no tile at column {tile[0]}, row {tile[1]}')
+        tile = index['grid'].index(cell) + 1
+    if not (1 <= cycle <= index['cycles'] and 1 <= tile <= index['tiles']):
+        raise ValueError(f"the job has {index['cycles']} cycles of {index['tiles']} tiles")
+    # the entries are in the order the tiles were written, which for a job batched by pen changes every cycle
+    entry = next(entry for entry in index['entries'] if (entry['cycle'], entry['tile']) == (cycle, tile))
+
+    restart = index['restart']
+    header = [f'; resumed at cycle {cycle}, tile {tile} of {os.path.basename(output_file_path)}']
+    header += restart['preamble']
+    header += restart['pen_up']
+    if entry['z_origin']:
+        header += [f"G01 Z{format_number(entry['z_origin'])}", 'G92 Z0']
+    if entry['x'] is not None and entry['y'] is not None:
+        header.append(f"G00 X{format_number(entry['x'])} Y{format_number(entry['y'])} F{restart['travel_feed']}")
+    if entry['pen'] == 'down':
+        header += restart['pen_down']
+    if entry['feed'] is not None:
+        header.append(f"G01 F{format_number(entry['feed'])}")
+
+    temporary_path = resume_file_path + '.part'
+    try:
+        with open(temporary_path, 'w') as file:
+            file.writelines(line + '\n' for line in header)
+        with open(temporary_path, 'ab') as file, open(output_file_path, 'rb') as output_file:
+            output_file.seek(entry['offset'])
+            shutil.copyfileobj(output_file, file, 1 << 20)
+        os.replace(temporary_path, resume_file_path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    return entry
+
+
+def saved_lines(lines, file):
+    # Passes the lines through, writing each one to the file on its way
+    for line in lines:
+        file.write(line + '\n')
+        yield line
+
+
+class ProcessingCancelled(Exception):
+    # Raised from a progress callback to stop process_gcode, leaving any existing output file untouched
+    pass
+
+
+# The preamble, next-cycle and pen-change subroutines the GUI starts with, and the command line uses by default
+DEFAULT_PREAMBLE = """M201 X1000 Y1000 Z1000 E5000 ; sets maximum accelerations, mm/sec^2
+M203 X400 Y400 Z48 E120 ; sets maximum feedrates, mm / sec
+M204 S400 T1250 ; sets acceleration (S) and retract acceleration (R), mm/sec^2
+M205 X8.00 Y8.00 Z0.40 E1.50 ; sets the jerk limits, mm/sec
+M205 S0 T0 ; sets the minimum extruding and travel feed rate, mm/sec
+
+;TYPE:Custom
+; Initial setups
+G90 ; use absolute coordinates
+G92 ; reset coordinates to 0
+G01 Z-3 F100
+G01 Z0 F100
+G4 S2
+;
+; """
+
+DEFAULT_CYCLE_SUBROUTINE = """;;;;;;;;;;;;;;;;;;;;;;;
+G01 Z0
+G4 S2
+G01 X100 Y-10
+M106 S255
+G01 Z-3 F500
+G4 S3
+G01 Z20 F250
+G00 Y200 Z200 
+M107
+G00 X0 Y-10 Z0
+G00 Z-3
+G01 X100
+G01 Z0
+G00 X0 Y0
+;;;;;;;;;;;;;;;;;;;;;;;;;;;\n
+"""
+
+DEFAULT_PEN_CHANGE = """;;;;;;;;;;;;;;;;;;;;;;;
+; pen {pen}: {layer}
+G01 Z0
+G00 X0 Y-10
+M0 Load pen {pen} ({layer})
+;;;;;;;;;;;;;;;;;;;;;;;;;;;
+"""
+
+
+def process_gcode(input_file_path, output_file_path, preamble='', cycle_subroutine='',
+                  mso='M09', meo='M10', msn='G01 Z-3', men='G01 Z0', cut_feed='4500', trav_feed='9000',
+                  cycles=1, cycle_offset=0.0, tiling_n_x=1, tiling_s_x=10, tiling_n_y=1, tiling_s_y=10,
+                  tiling_scale=1.0, tiling_rotation=0.0, tiling_mirror_x=False, tiling_mirror_y=False,
+                  optimize_travel=False, simplify_tolerance=0.0, fit_arcs=True, dxf_tolerance=0.01, cache=None,
+                  nest=False, bed_width=200.0, bed_height=200.0, bed_margin=5.0, nest_spacing=2.0,
+                  nest_rotate=False, nest_stagger=True,
+                  precision=None, compact=False, omit_modal_words=False, progress=None, preview=False,
+                  profile=False, sender=None, index=False, firmware='expanded', batch_pens=False, pen_change='',
+                  alternate_pens=False, estimate=True):
+    # Runs the whole transform from the input file (gcode, or a DXF drawing, whose splines are flattened
+    # to within dxf_tolerance) to the output file, and returns a summary
+    # of the job (part and work bounds, pen-up travel, cell size before and after simplification,
+    # estimated run time per tile, per cycle and in total, and the time and lines in and out of every stage)
+    # for display.
+    # Only the parsed input cell and one finished tile set are ever held in memory;
+    # everything else is streamed straight into the output file.
+    # With a StageCache, the parsed and prepared cell, its bounds and the tile set are kept on disk,
+    # keyed by the input file's contents and the settings each of them depends on, so a run that only
+    # changes later settings (preamble, subroutine, cycles) picks them up instead of recomputing them.
+    # If given, progress(stage, fraction done) is called between stages, every PROGRESS_INTERVAL strokes or
+    # steps within the long ones (ordering, simplifying, nesting and the estimate) and before every tile written,
+    # and may raise ProcessingCancelled to stop. The output is written to a temporary file that only
+    # replaces the output file once it is complete, so a cancelled or failed run never leaves half a file.
+    # With preview set, the summary also holds what toolpath_preview needs to draw the job:
+    # the cell's polylines, the tile transforms, the skirts and the bed (which nest packs the tiles onto,
+    # and every job has to stay on), and the part's outline if nest needed it.
+    # With profile set, the peak memory of every stage is traced as well (which slows the run down),
+    # and the stages are written to a JSON profile next to the output file.
+    # With nest set, the tiles aren't laid out on the tiling grid but packed onto the bed instead
+    # (see nest_transforms), keeping the tiling scale, rotation and mirroring.
+    # Coordinates are written to precision decimal places if given (exactly otherwise), and with compact set
+    # the moves leave out what they'd only repeat of the modal state (see compact_lines).
+    # With a serial_sender.GcodeSender, the job is streamed to the plotter as it is generated, and
+    # only saved as well if there is an output file.
+    # With index set, an index of where every tile of every cycle starts in the output file, and the
+    # machine state there, is written next to it, so that resume_job can restart the job from any tile.
+    # With a firmware other than 'expanded', the cycles after the first are written once, inside a loop
+    # that firmware repeats them with (see FIRMWARE_LOOPS), so the file doesn't grow with the cycle count.
+    # Such a job can't be streamed, and has no index. The machine moves just as it would for the expanded
+    # job, so the firmwares whose loops can't follow its cycle offset are refused one.
+    # With batch_pens set, the strokes are grouped by their layer (see split_layers) and each cycle draws
+    # every tile with one pen before going on to the next, starting each pen's pass with the pen_change
+    # subroutine, in which {pen} and {layer} stand for the pen's number (from 1) and layer name.
+    # With alternate_pens set as well, every other cycle takes the pens in the opposite order, starting with
+    # the one already loaded, which saves a pen change per cycle. A firmware loop repeats one cycle as it is,
+    # so it can't alternate them.
+    # With estimate cleared, the run time isn't estimated (the motion planning is plain Python, and
+    # takes about as long as the rest of a large job), and the summary's times are empty.
+    loop = job_loop(firmware, cycles)
+    if loop is not None and sender is not None:
+        raise ValueError('firmware loops only run from the SD card, so a streamed job is always expanded')
+    if loop is not None and loop['constant_step'] and cycle_offset:
+        raise ValueError(f"the {firmware} loop repeats the same z move every cycle, so it can't move down by a "
+                         f"cycle offset; use the reprap or expanded target, or no cycle offset")
+    if loop is not None and alternate_pens:
+        raise ValueError('a firmware loop repeats the same cycle, so it can only alternate the pen order '
+                         'when the cycles are expanded')
+    is_dxf = input_file_path.lower().endswith('.dxf')
+    profiler = StageProfiler(trace_memory=profile)
+    profiler.start()
+    try:
+        def report(stage_name, fraction):
+            if progress is not None:
+                progress(stage_name, fraction)
+
+        def stage(key, compute, record):
+            # a cached stage, marked as such in its profile record when it didn't have to be computed
+            if cache is None:
+                return compute()
+            misses = cache.misses
+            value = cache.cached(key, compute)
+            if cache.misses == misses:
+                record['name'] += ' (cached)'
+            return value
+
+        def read_input():
+            report('Reading input', 0.0)
+            with profiler.stage('read input') as record:
+                if is_dxf:
+                    with open(input_file_path, 'r', errors='replace') as file:
+                        program = parse_dxf(file, mso, meo, dxf_tolerance)
+                else:
+                    with open(input_file_path, 'r') as file:
+                        program = parse_gcode(file)
+                record['lines_out'] = len(program)
+            return program
+
+        def prepare_cell():
+            with profiler.stage('parsed input') as record:
+                program = stage(parsed_key, read_input, record)
+                record['lines_out'] = len(program)
+            # with pens batched, the strokes of each layer are kept together, and only reordered among themselves
+            if batch_pens:
+                with profiler.stage('group by pen', len(program)) as record:
+                    layers = split_layers(program)
+                    if len(layers) > 1:
+                        program = join_programs(layer for _, layer in layers)
+                    record['lines_out'] = len(program)
+            # optionally reorder the strokes of the cell to cut down pen-up travel
+            travel_before = travel_distance(program)
+            if optimize_travel:
+                report('Optimising stroke order', 0.1)
+                with profiler.stage('optimise stroke order', len(program)) as record:
+                    program = optimize_stroke_order(program, mso, meo,
+                                                    lambda fraction: report('Optimising stroke order',
+                                                                            0.1 + 0.15 * fraction))
+                    record['lines_out'] = len(program)
+            travel_after = travel_distance(program)
+
+            # optionally simplify the dense G01 runs, before tiling so that every tile and cycle benefits
+            cell_lines_before = len(program)
+            if simplify_tolerance > 0:
+                report('Simplifying', 0.25)
+                with profiler.stage('simplify', len(program)) as record:
+                    program = simplify_paths(program, simplify_tolerance, fit_arcs,
+                                             lambda fraction: report('Simplifying', 0.25 + 0.05 * fraction))
+                    record['lines_out'] = len(program)
+            return program, {'travel_before': travel_before, 'travel_after': travel_after,
+                             'cell_lines_before': cell_lines_before, 'cell_lines_after': len(program)}
+
+        def cell_bounds():
+            return calculate_bounds(program), part_extents(program)
+
+        parsed_key = cell_key = None
+        if cache is not None:
+            parsed_key = cache.key('parsed', file_digest(input_file_path), is_dxf,
+                                   (mso, meo, dxf_tolerance) if is_dxf else ())
+            cell_key = cache.key('cell', parsed_key, optimize_travel, mso, meo, simplify_tolerance, fit_arcs,
+                                 batch_pens)
+        with profiler.stage('prepare cell') as record:
+            program, cell_summary = stage(cell_key, prepare_cell, record)
+            record['lines_out'] = len(program)
+
+        # compute bounds of work area
+        with profiler.stage('bounds', len(program)) as record:
+            (x_bound, y_bound), (min_x, min_y, max_x, max_y) = stage(cache and cache.key('bounds', cell_key),
+                                                                     cell_bounds, record)
+        # the part's outline (its convex hull) is only needed to nest it; the preview works it out from the cell's
+        # cuts if it's ever opened (see toolpath_preview.preview_outline)
+        outline = None
+        if nest:
+            with profiler.stage('outline', len(program)) as record:
+                outline = stage(cache and cache.key('outline', cell_key), lambda: part_outline(program), record)
+                record['lines_out'] = len(outline)
+        if tiling_rotation % 180:
+            # a rotated part takes up the bounding box of its rotated bounds
+            cos_r = abs(math.cos(math.radians(tiling_rotation)))
+            sin_r = abs(math.sin(math.radians(tiling_rotation)))
+            x_bound, y_bound = x_bound * cos_r + y_bound * sin_r, x_bound * sin_r + y_bound * cos_r
+
+        # Before each page cycle is repeated, we need to repeat the unit cell gcode n * m times,
+        # offsetting the cell the requisite distances in x and y each time.
+        # The tile set is identical for every cycle, so it is built once here and then reused.
+        transforms = grid_transforms(tiling_n_x, tiling_s_x, tiling_n_y, tiling_s_y, tiling_scale,
+                                     tiling_rotation, tiling_mirror_x, tiling_mirror_y,
+                                     centre=((min_x + max_x) / 2, (min_y + max_y) / 2),
+                                     serpentine=optimize_travel)
+        if nest:
+            report('Nesting', 0.3)
+            with profiler.stage('nest') as record:
+                transforms = nest_transforms(outline, transforms[0], bed_width, bed_height, bed_margin,
+                                             nest_spacing, nest_rotate, nest_stagger, serpentine=optimize_travel,
+                                             progress=lambda fraction: report('Nesting', 0.3 + 0.05 * fraction))
+                record['lines_out'] = len(transforms)
+            if not transforms:
+                raise ValueError(f'the part does not fit on a {bed_width} x {bed_height}mm bed '
+                                 f'with a {bed_margin}mm margin')
+            # the work area reaches as far as the furthest copy
+            placed = [point for transform in transforms for point in transform_points(transform, outline)]
+            x_work_bound = max(x for x, y in placed)
+            y_work_bound = max(y for x, y in placed)
+        else:
+            x_work_bound = x_bound * tiling_scale * tiling_n_x + (int(tiling_n_x) - 1) * tiling_s_x
+            y_work_bound = y_bound * tiling_scale * tiling_n_y + (int(tiling_n_y) - 1) * tiling_s_y
+
+        # With pens batched, every layer of the (grouped) cell is tiled on its own, so that its tiles can be
+        # drawn one after another
+        layers = split_layers(program) if batch_pens else [(None, program)]
+        pens = [name for name, _ in layers] if len(layers) > 1 else []
+
+        # Find and replace the cut M commands and add the feeds, once for every distinct line of the cell.
+        # The program end is added once at the very end of the job, so it's taken out of the cell here.
+        report('Tiling', 0.35)
+        with profiler.stage('finish texts', sum(len(layer.texts) for _, layer in layers)) as record:
+            layer_texts = [finish_texts(layer.texts, [('M02', ''), (mso, msn), (meo, men)], cut_feed, trav_feed)
+                           for _, layer in layers]
+            record['lines_out'] = sum(map(len, layer_texts))
+
+        # Placing the moves in the tiles is cached apart from finishing their lines, so that changing only what
+        # is written (feeds, M codes, compaction) picks the placed tiles up again and just finishes them anew
+        tiles_key = cache and cache.key('tiles', cell_key, transforms, precision)
+
+        def place_tiles():
+            # without a cache, the moves go straight into the finished lines rather than being kept
+            if cache is None:
+                return [tile_moves(transforms, layer, precision) for _, layer in layers]
+            with profiler.stage('offset cell', len(program) * len(transforms)) as record:
+                layer_tiles = stage(tiles_key, lambda: [list(tile_moves(transforms, layer, precision))
+                                                        for _, layer in layers], record)
+                record['lines_out'] = sum(map(len, itertools.chain.from_iterable(layer_tiles)))
+            return layer_tiles
+
+        with profiler.stage('tile', len(program) * len(transforms)) as record:
+            tile_sets = stage(cache and cache.key('tile_set', tiles_key, mso, meo, msn, men, cut_feed, trav_feed,
+                                                  compact, omit_modal_words),
+                              lambda: [build_tile_set(tiles, layer, texts,
+                                                      move_suffixes(layer, cut_feed, trav_feed, precision),
+                                                      compact, omit_modal_words)
+                                       for tiles, (_, layer), texts in zip(place_tiles(), layers, layer_texts)],
+                              record)
+            # the tiles of every pen in turn
+            tile_set = [tile_lines for layer_tile_set in tile_sets for tile_lines in layer_tile_set]
+            tile_set_lines = sum(map(len, tile_set))
+            record['lines_out'] = tile_set_lines
+        finish = partial(finish_lines, mso=mso, meo=meo, msn=msn, men=men, cut_feed=cut_feed, trav_feed=trav_feed,
+                         precision=precision)
+        finish_output = partial(finish, compact=compact, omit_modal_words=omit_modal_words)
+
+        # each pen's pass over the tiles starts with a pen change, when there is more than one pen
+        pen_change_blocks = [[] for _ in layers]
+        pen_changes = None
+        if len(layers) > 1:
+            if pen_change.strip():
+                pen_change_blocks = [pen_change.replace('{pen}', str(number)).replace('{layer}', name).split('\n')
+                                     for number, (name, _) in enumerate(layers, start=1)]
+            pen_changes = [list(finish_output(block)) for block in pen_change_blocks]
+
+        # add skirt tool path to beginning of gcode, and a short safety dwell
+        skirt_minor = [f'G01 X{x_bound * tiling_scale} Y0',
+                       f'G01 X{x_bound * tiling_scale} Y{y_bound * tiling_scale}',
+                       f'G01 X0 Y{y_bound * tiling_scale}',
+                       f'G01 X0 Y0',
+                       'G4 S2']
+
+        skirt_major = [f'G01 X{x_work_bound} Y0',
+                       f'G01 X{x_work_bound} Y{y_work_bound}',
+                       f'G01 X0 Y{y_work_bound}',
+                       f'G01 X0 Y0',
+                       'G4 S2']
+
+        # estimate the run time from the machine limits in the preamble, planning the cell once rather than per line
+        if estimate:
+            report('Estimating run time', 0.45)
+            with profiler.stage('estimate time', len(program)):
+                finished_steps = [motion_steps(block, block.texts, cut_feed, trav_feed) for block in (
+                    parse_gcode(finish(preamble.split('\n') + skirt_minor + skirt_major)),
+                    parse_gcode(finish(cycle_subroutine.split('\n'))))]
+                pen_change_steps = [motion_steps(block, block.texts, cut_feed, trav_feed)
+                                    for block in (parse_gcode(finish(lines)) for lines in pen_change_blocks)]
+                times = estimate_job_time(read_machine_limits(preamble), finished_steps[0],
+                                          [motion_steps(layer, texts, cut_feed, trav_feed)
+                                           for (_, layer), texts in zip(layers, layer_texts)], pen_change_steps,
+                                          transforms, cycles, cycle_offset, finished_steps[1], cut_feed,
+                                          lambda fraction: report('Estimating run time', 0.45 + 0.05 * fraction),
+                                          alternate_pens=alternate_pens)
+        else:
+            times = {'tile_times': [], 'cycle_time': None, 'total_time': None}
+
+        written_cycles = cycles if loop is None else 2
+
+        def writing(position, cycle, tile):
+            action = 'Writing' if sender is None else 'Sending'
+            pen = f', pen {tile // len(transforms) + 1}/{len(layers)}' if len(layers) > 1 else ''
+            report(f'{action} cycle {cycle + 1}/{written_cycles}{pen}, '
+                   f'tile {tile % len(transforms) + 1}/{len(transforms)}',
+                   0.5 + 0.5 * position / (written_cycles * len(tile_set)))
+
+        # The machine state at the start of each tile is followed block by block rather than line by line:
+        # what each tile sets is worked out once, and only the short blocks between cycles are gone through each time
+        indexing = index and output_file_path is not None and loop is None
+        index_entries = []
+        if indexing:
+            track = partial(track_modal_state, pen_down=msn, pen_up=men)
+            tile_changes = [track(tile_lines, {}) for tile_lines in tile_set]
+            machine = {'x': None, 'y': None, 'z': None, 'feed': None, 'pen': None, 'z_origin': 0.0}
+            track(finish(preamble.split('\n') + skirt_minor + skirt_major), machine)
+            cells = None if nest or len(layers) > 1 else grid_cells(tiling_n_x, tiling_n_y, optimize_travel)
+
+        # the tiles in the order they are written (which, batched by pen, isn't the tile set's every cycle)
+        tiles_started = itertools.count()
+
+        def tile_started(cycle, tile, change):
+            position = next(tiles_started)
+            if progress is not None:
+                writing(position, cycle, tile)
+            if not indexing:
+                return
+            if cycle and not position % len(tile_set):
+                z_offset = (cycle - 1) * cycle_offset
+                track(finish([f'G01 Z{z_offset}', 'G92 Z0'] + cycle_subroutine.split('\n')), machine)
+                machine['z_origin'] += z_offset
+            entry = {'cycle': cycle + 1, 'tile': tile + 1, 'offset': output_file.tell(), **machine}
+            if len(layers) > 1:
+                entry['layer'] = layers[tile // len(transforms)][0]
+            index_entries.append(entry)
+            # where the pen change and the tile leave the machine, for the next tile
+            track(change, machine)
+            machine.update(tile_changes[tile])
+
+        # Everything outside the tile set is finished on the fly as it is written
+        new_content = iter_job_lines(preamble, skirt_minor + skirt_major, tile_set, cycles, cycle_offset,
+                                     cycle_subroutine, finish_output,
+                                     tile_started if progress is not None or indexing else None, firmware, pen_changes,
+                                     alternate_pens)
+
+        # Write to output file, one line at a time, through a temporary file next to it,
+        # and/or stream it to the plotter
+        with profiler.stage('write' if sender is None else 'stream', tile_set_lines * written_cycles) as record:
+            lines_written = itertools.count()
+            new_content = (line for line, _ in zip(new_content, lines_written))
+            if output_file_path is None:
+                sender.stream(new_content)
+            else:
+                temporary_path = output_file_path + '.part'
+                try:
+                    with open(temporary_path, 'w') as output_file:
+                        if sender is None:
+                            output_file.writelines(line + '\n' for line in new_content)
+                        else:
+                            sender.stream(saved_lines(new_content, output_file))
+                        output_bytes = output_file.tell()
+                    os.replace(temporary_path, output_file_path)
+                except BaseException:
+                    if os.path.exists(temporary_path):
+                        os.remove(temporary_path)
+                    raise
+            record['lines_out'] = next(lines_written)
+        if output_file_path is not None and not indexing and os.path.exists(output_file_path + '.index.json'):
+            # an index of an earlier output would no longer match
+            os.remove(output_file_path + '.index.json')
+        if indexing:
+            restart = {'preamble': list(finish(preamble.split('\n'))), 'pen_up': list(finish([men])),
+                       'pen_down': list(finish([msn])), 'travel_feed': trav_feed}
+            with open(output_file_path + '.index.json', 'w') as file:
+                json.dump({'output': os.path.basename(output_file_path), 'bytes': output_bytes, 'cycles': cycles,
+                           'tiles': len(tile_set), 'grid': cells, 'pens': pens, 'restart': restart,
+                           'entries': index_entries}, file)
+        report('Done', 1.0)
+    finally:
+        # tracemalloc is switched off again however the run ends, cancelled or failed included
+        profiler.stop()
+
+    summary = {'x_bound': x_bound, 'y_bound': y_bound, 'x_work_bound': x_work_bound, 'y_work_bound': y_work_bound,
+               **cell_summary, 'tiles': len(transforms),
+               'tile_times': times['tile_times'], 'cycle_time': times['cycle_time'],
+               'total_time': times['total_time'], 'stages': profiler.stages,
+               'pens': pens}
+    if sender is not None:
+        summary['streamed'] = {'lines': sender.lines_acked, 'bytes': sender.bytes_sent, 'resends': sender.resends}
+    if profile and output_file_path is not None:
+        profiler.write_json(output_file_path + '.profile.json', input=input_file_path, output=output_file_path)
+    if preview:
+        cuts, travels = toolpath_polylines(program)
+        summary['preview'] = {'cuts': cuts, 'travels': travels, 'transforms': transforms, 'cycles': cycles,
+                              'extents': (min_x, min_y, max_x, max_y), 'outline': outline,
+                              'skirts': [(0.0, 0.0, x_bound * tiling_scale, y_bound * tiling_scale),
+                                         (0.0, 0.0, x_work_bound, y_work_bound)],
+                              'bed': (0.0, 0.0, bed_width, bed_height)}
+    return summary
@@ -0,0 +1,394 @@
+# Serial streaming for the pen plotting GCODE processor.
+# Sends gcode to the plotter's firmware (Marlin style) over USB serial as it is generated, instead of
+# copying a file to the SD card. Every line is numbered and checksummed (N123 G01 X1*45), lines the
+# firmware reports as damaged are sent again from where it asks (Resend: 123), and the firmware is
+# kept busy by one of two kinds of flow control:
+#   ok     one line at a time, the next one going out when the last is acknowledged
+#   count  character counting: as many lines as fit in the firmware's receive buffer (127 bytes by
+#          default) are kept in flight, each "ok" freeing the oldest, so the planner never runs dry
+#          between lines, which it does on dense G01 runs with ok flow control at lower baud rates
+# FakePrinter is a firmware stand-in on a pseudo-terminal (Linux and macOS only), for trying the sender,
+# or a change to it, without a plotter:
+#
+#   python serial_sender.py job.gcode --port COM4 --baud 250000
+#   python serial_sender.py job.gcode --fake --corrupt 10 --corrupt 500
+#
+# Streaming needs pyserial (pip install pyserial); everything else works without it.
+import argparse
+import collections
+import os
+import select
+import sys
+import threading
+import time
+from gcode_processor import ProcessingCancelled
+
+try:
+    import serial
+except ImportError:  # streaming isn't available, but files can still be made
+    serial = None
+
+# the receive buffer of Marlin's default serial port, less one byte
+DEFAULT_BUFFER_SIZE = 127
+# how many sent lines are kept for resending; the firmware only ever asks for ones still in flight
+HISTORY_LINES = 1000
+# commands that wait for the user (to change the pen, say) before the firmware answers them, however long that takes
+USER_WAIT_COMMANDS = {'M0', 'M1'}
+
+
+class SenderError(Exception):
+    # The firmware stopped answering, halted, or asked for a line that can't be sent again
+    pass
+
+
+def checksum(text):
+    # The firmware's line checksum: the XOR of every byte of the line up to the '*'
+    value = 0
+    for byte in text.encode('ascii', errors='replace'):
+        value ^= byte
+    return value
+
+
+def numbered_line(number, command):
+    text = f'N{number} {command}'
+    return f'{text}*{checksum(text)}'
+
+
+def clean_command(line):
+    # The command of a line without its comment and surrounding spaces, or '' if there's nothing to send.
+    # The firmware only takes ASCII, so anything else (an accent in an M117 message, say) becomes '?'.
+    return line.split(';', 1)[0].strip().encode('ascii', errors='replace').decode('ascii')
+
+
+def waits_for_user(line):
+    # Whether a (numbered) line is one of the USER_WAIT_COMMANDS
+    words = line.split('*', 1)[0].split()
+    if words and words[0].startswith('N'):
+        words = words[1:]
+    if not words or words[0][:1].upper() != 'M':
+        return False
+    try:
+        return f'M{int(words[0][1:])}' in USER_WAIT_COMMANDS
+    except ValueError:
+        return False
+
+
+def open_serial(port, baudrate=115200):
+    # Opens the plotter's serial port; many boards reset when it's opened, and say 'start' once they're up
+    if serial is None:
+        raise SenderError('streaming to the plotter needs pyserial (pip install pyserial)')
+    return serial.Serial(port, baudrate, timeout=0.1, write_timeout=10)
+
+
+class GcodeSender:
+    # Streams commands to the firmware over connection (a pyserial Serial, or anything with
+    # write(bytes), readline() -> bytes, returning what it has after a short timeout, and close()).
+    # Counts of the lines acknowledged and resent, and the bytes sent, are kept as it goes.
+    # The firmware is given up on when it says nothing for timeout seconds, except while one of the
+    # USER_WAIT_COMMANDS is in flight; anything it says (such as Marlin's 'busy: paused for user') restarts
+    # the wait.
+    def __init__(self, connection, flow_control='count', buffer_size=DEFAULT_BUFFER_SIZE, line_numbers=True,
+                 timeout=60.0, log=None):
+        if flow_control not in ('ok', 'count'):
+            raise ValueError(f'unknown flow control {flow_control!r}')
+        self.connection = connection
+        self.flow_control = flow_control
+        self.buffer_size = buffer_size
+        self.line_numbers = line_numbers
+        self.timeout = timeout
+        self.log = log
+        self.history = {}
+        self.next_number = 1
+        # lines waiting to be sent, and (bytes, waits for user) of the lines sent but not yet acknowledged, oldest first
+        self.outbox = collections.deque()
+        self.in_flight = collections.deque()
+        self.resend_request = None
+        self.partial = b''
+        self.stopped = threading.Event()
+        self.lines_acked = 0
+        self.resends = 0
+        self.bytes_sent = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def cancel(self):
+        # Asks a stream running on another thread to stop before its next line
+        self.stopped.set()
+
+    def start(self, startup_seconds=2.0):
+        # Waits for the firmware to come up (a board that resets on connect says 'start'), then resets
+        # its line numbering so the stream can begin at N1
+        deadline = time.monotonic() + startup_seconds
+        while time.monotonic() < deadline:
+            response = self.read_line()
+            if response is not None and response.startswith('start'):
+                break
+        if self.line_numbers:
+            self.history[0] = 'M110 N0'
+            self.outbox.append(numbered_line(0, 'M110 N0'))
+            self.next_number = 1
+            self.drain()
+            self.lines_acked = 0
+
+    def stream(self, lines):
+        # Sends every line (comments and blank lines are dropped), pulling each from lines only once
+        # there's room for it, so a generator is sent as fast as it's produced and no faster.
+        # Returns once the firmware has acknowledged everything. Raises ProcessingCancelled if cancelled.
+        for line in lines:
+            if self.stopped.is_set():
+                raise ProcessingCancelled()
+            command = clean_command(line)
+            if not command:
+                continue
+            self.queue(command)
+            while self.outbox:
+                self.send_ready()
+                if self.outbox:
+                    self.handle_response()
+        self.drain()
+
+    def queue(self, command):
+        if not self.line_numbers:
+            self.outbox.append(command)
+            return
+        number = self.next_number
+        self.next_number += 1
+        self.history[number] = command
+        self.history.pop(number - HISTORY_LINES, None)
+        self.outbox.append(numbered_line(number, command))
+
+    def drain(self):
+        # Sends whatever is waiting and waits for all of it to be acknowledged
+        while self.outbox or self.in_flight:
+            self.send_ready()
+            self.handle_response()
+
+    def send_ready(self):
+        # Sends lines from the outbox while the flow control allows
+        while self.outbox:
+            data = (self.outbox[0] + '\n').encode('ascii', errors='replace')
+            if self.in_flight and (self.flow_control == 'ok'
+                                   or sum(size for size, _ in self.in_flight) + len(data) > self.buffer_size):
+                return
+            line = self.outbox.popleft()
+            self.connection.write(data)
+            self.in_flight.append((len(data), waits_for_user(line)))
+            self.bytes_sent += len(data)
+
+    def read_line(self):
+        # One line from the firmware, or None if nothing complete arrived before the connection's timeout
+        data = self.connection.readline()
+        if not data:
+            return None
+        self.partial += data
+        if not self.partial.endswith(b'\n'):
+            return None
+        line, self.partial = self.partial.decode('ascii', errors='replace').strip(), b''
+        if self.log is not None and line != 'ok':
+            self.log(line)
+        return line
+
+    def handle_response(self):
+        # Waits for and acts on the firmware's next response
+        deadline = time.monotonic() + self.timeout
+        while True:
+            response = self.read_line()
+            if response is not None:
+                break
+            if self.stopped.is_set():
+                raise ProcessingCancelled()
+            if time.monotonic() > deadline and not any(waits for _, waits in self.in_flight):
+                raise SenderError(f'no response from the firmware in {self.timeout:.0f}s')
+
+        if response.startswith('ok'):
+            # every line the firmware takes from its buffer is answered with exactly one ok
+            if self.resend_request is None:
+                if self.in_flight:
+                    self.in_flight.popleft()
+                self.lines_acked += 1
+            else:
+                # the ok of the refused line, after which the firmware empties its receive buffer (as Marlin does),
+                # so the lines sent after it will never be answered: they all go again with it
+                self.in_flight.clear()
+                self.settle()
+                self.rewind(self.resend_request)
+                self.resend_request = None
+        else:
+            self.check_response(response)
+
+    def check_response(self, response):
+        # Notes a request to send a line again, and gives up on a firmware that has stopped
+        if response.startswith(('Resend:', 'rs ')):
+            number = response.replace(':', ' ').split()[1].lstrip('N')
+            self.resend_request = int(number)
+        elif response.startswith(('!!', 'Error:')) and any(word in response.lower()
+                                                          for word in ('halted', 'killed', 'stopped')):
+            raise SenderError(f'the firmware stopped: {response}')
+
+    def settle(self):
+        # Waits for the firmware to go quiet after asking for a line again. The lines that were still on their way
+        # then are refused as they arrive, each emptying the receive buffer again, so anything sent before they
+        # have all been refused would be thrown away too. The last line asked for is the one to go on from.
+        while True:
+            response = self.read_line()
+            if response is None:
+                return
+            self.check_response(response)
+
+    def rewind(self, number):
+        # Sends everything again from line number on
+        if not self.line_numbers or number not in self.history:
+            raise SenderError(f'the firmware asked for line {number} again, which is no longer kept')
+        self.resends += 1
+        self.outbox = collections.deque(numbered_line(k, self.history[k]) for k in range(number, self.next_number))
+
+
+class FakePrinter:
+    # Marlin-like firmware on a pseudo-terminal, for testing the sender without a plotter. Connect to its port.
+    # It reads one line at a time, taking line_seconds over each, checks line numbers and checksums like
+    # the firmware does, and treats the lines numbered in corrupt_lines as damaged the first time they arrive.
+    # Like Marlin, it empties its receive buffer when it asks for a line again, so the lines sent after that one
+    # are lost without an answer.
+    # The USER_WAIT_COMMANDS keep it waiting user_wait_seconds before it answers, saying nothing meanwhile
+    # (as Marlin does without its host keepalive).
+    # Counts overflows of its rx_buffer byte receive buffer, which would lose data on a real board.
+    def __init__(self, rx_buffer=128, line_seconds=0.0, corrupt_lines=(), user_wait_seconds=0.0):
+        self.rx_buffer = rx_buffer
+        self.line_seconds = line_seconds
+        self.corrupt_lines = set(corrupt_lines)
+        self.user_wait_seconds = user_wait_seconds
+        self.commands = []
+        self.overflows = 0
+        self.errors = 0
+        self.last_number = 0
+        self.received = b''
+        self.running = threading.Event()
+        self.thread = None
+        self.master = self.slave = None
+        self.port = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        import tty
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)
+        self.port = os.ttyname(self.slave)
+        self.running.set()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running.clear()
+        self.thread.join()
+        os.close(self.master)
+        os.close(self.slave)
+
+    def reply(self, *lines):
+        # what can't be written, as the host has stopped reading, is lost once the printer is stopped
+        data = ''.join(line + '\n' for line in lines).encode('ascii')
+        while data and self.running.is_set():
+            if select.select([], [self.master], [], 0.05)[1]:
+                data = data[os.write(self.master, data):]
+
+    def run(self):
+        self.reply('start')
+        while self.running.is_set():
+            # take in whatever has arrived; only wait for more when there's no whole line to work on
+            ready, _, _ = select.select([self.master], [], [], 0 if b'\n' in self.received else 0.05)
+            if ready:
+                self.received += os.read(self.master, 4096)
+                if len(self.received) > self.rx_buffer:
+                    self.overflows += 1
+            if b'\n' not in self.received:
+                continue
+            line, self.received = self.received.split(b'\n', 1)
+            time.sleep(self.line_seconds)
+            self.process(line.decode('ascii', errors='replace').strip())
+
+    def process(self, line):
+        if not line:
+            return
+        command = line
+        if line.startswith('N'):
+            text, _, sent_checksum = line.partition('*')
+            number_word, _, command = text.partition(' ')
+            number = int(number_word[1:])
+            damaged = number in self.corrupt_lines
+            self.corrupt_lines.discard(number)
+            if damaged or not sent_checksum or checksum(text) != int(sent_checksum):
+                return self.refuse('checksum mismatch')
+            if command.startswith('M110'):
+                self.last_number = int(command.split('N')[-1]) if 'N' in command else number
+                return self.reply('ok')
+            if number != self.last_number + 1:
+                return self.refuse('Line Number is not Last Line Number+1')
+            self.last_number = number
+        self.commands.append(command)
+        if waits_for_user(command):
+            time.sleep(self.user_wait_seconds)
+        self.reply('ok')
+
+    def refuse(self, message):
+        self.errors += 1
+        # everything waiting in the receive buffer is thrown away, whether it has been read in yet or not
+        self.received = b''
+        while select.select([self.master], [], [], 0)[0]:
+            os.read(self.master, 4096)
+        self.reply(f'Error:{message}, Last Line: {self.last_number}', f'Resend: {self.last_number + 1}', 'ok')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Stream a gcode file to the plotter over serial.')
+    parser.add_argument('gcode', help='gcode file to send')
+    parser.add_argument('--port', help='serial port of the plotter (e.g. COM4 or /dev/ttyUSB0)')
+    parser.add_argument('--baud', type=int, default=115200, help='baud rate')
+    parser.add_argument('--flow', choices=('ok', 'count'), default='count', help='flow control')
+    parser.add_argument('--buffer', type=int, default=DEFAULT_BUFFER_SIZE,
+                        help='firmware receive buffer for character counting, in bytes')
+    parser.add_argument('--no-line-numbers', action='store_true', help="don't number and checksum the lines")
+    parser.add_argument('--fake', action='store_true', help='send to a fake printer on a pseudo-terminal instead')
+    parser.add_argument('--corrupt', type=int, action='append', default=[],
+                        help='with --fake, line number to damage once (repeatable)')
+    args = parser.parse_args(argv)
+    if not args.port and not args.fake:
+        parser.error('give a --port, or --fake')
+
+    fake = FakePrinter(corrupt_lines=args.corrupt) if args.fake else None
+    if fake is not None:
+        fake.start()
+    start = time.perf_counter()
+    try:
+        with GcodeSender(open_serial(fake.port if fake else args.port, args.baud), args.flow, args.buffer,
+                         not args.no_line_numbers, log=lambda line: print('<', line)) as sender:
+            sender.start()
+            with open(args.gcode, 'r') as file:
+                sender.stream(file)
+    except SenderError as e:
+        print(f'Failed: {e}', file=sys.stderr)
+        return 1
+    finally:
+        if fake is not None:
+            fake.stop()
+    print(f'{sender.lines_acked} lines, {sender.bytes_sent} bytes sent in {time.perf_counter() - start:.1f}s, '
+          f'{sender.resends} resends')
+    if fake is not None:
+        print(f'fake printer: {len(fake.commands)} commands run, {fake.errors} refused, '
+              f'{fake.overflows} receive buffer overflows')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+# Content-addressed on-disk cache for the stages of the pen plotting GCODE processor.
+# Each stage result is pickled into its own file, named by a hash of everything the stage depends on
+# (the input file's contents and the stage's parameters, including the keys of the stages before it),
+# so a changed setting simply misses and anything it doesn't affect is picked up again.
+# Files are written atomically, so several processes can share one cache directory, and the least
+# recently used ones are deleted once the cache grows past its size limit.
+import hashlib
+import os
+import pickle
+import tempfile
+
+# bump this whenever a cached stage changes what it returns, so old entries are never picked up
+CACHE_VERSION = 6
+
+
+def default_cache_directory():
+    # The per-user cache directory: %LOCALAPPDATA% on Windows, ~/.cache elsewhere
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'gcode_processor')
+
+
+def file_digest(path):
+    # sha256 of a file's contents, read in chunks so big drawings aren't loaded whole
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StageCache:
+    # A directory of pickled stage results, at most max_bytes in total, with hit and miss counts
+    # so callers can tell what was picked up
+    def __init__(self, directory=None, max_bytes=512 * 1024 * 1024):
+        self.directory = directory or default_cache_directory()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts):
+        # Key for a stage from its name and parameters (strings, numbers, bools and tuples of them)
+        return hashlib.sha256(repr((CACHE_VERSION,) + parts).encode()).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def get(self, key):
+        # The cached value for a key, or None. A hit is touched so it counts as recently used.
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # a damaged entry is just a miss
+            self.remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key, value):
+        # Writes a value through a temporary file, so readers never see a half-written entry
+        os.makedirs(self.directory, exist_ok=True)
+        handle, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.path(key))
+        except BaseException:
+            self.remove(temporary_path)
+            raise
+        self.evict()
+
+    def cached(self, key, compute):
+        # The cached value for a key, computing and storing it on a miss
+        value = self.get(key)
+        if value is None:
+            self.misses += 1
+            value = compute()
+            try:
+                self.put(key, value)
+            except OSError:
+                # a cache that can't be written to (full or read-only disk) only costs the speed-up
+                pass
+        else:
+            self.hits += 1
+        return value
+
+    def evict(self):
+        # Deletes the least recently used entries until the cache fits in its size limit
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pickle'):
+                try:
+                    status = entry.stat()
+                except OSError:
+                    continue
+                entries.append((status.st_mtime, status.st_size, entry.path))
+        total = sum(size for mtime, size, path in entries)
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self.remove(path)
+            total -= size
+
+    def clear(self):
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(('.pickle', '.tmp')):
+                    self.remove(entry.path)
+
+    @staticmethod
+    def remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,85 @@
+# Per-stage instrumentation for the pen plotting GCODE processor.
+# Records the wall time and the lines going in and out of each stage of a run, and, when memory
+# tracing is on, the peak memory allocated while it ran (tracemalloc slows everything down a few
+# times over, so that's only for when a job is being looked into). Stages can be nested, and a stage's
+# peak includes those of the stages inside it.
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class StageProfiler:
+    # The stage records of one run, in the order the stages started, each a dict of
+    # name, depth (of nesting), lines_in, lines_out, seconds and peak_bytes (None when not traced)
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.stages = []
+        self.open_stages = []
+        self.started_tracing = False
+        self.start_time = None
+        self.total_seconds = None
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        self.start_time = time.perf_counter()
+
+    def stop(self):
+        self.total_seconds = time.perf_counter() - self.start_time
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    @contextmanager
+    def stage(self, name, lines_in=None):
+        # Times the body of a with block as a stage. The record it yields can have its 'lines_out'
+        # (and 'lines_in', if it wasn't known up front) filled in before the block ends.
+        record = {'name': name, 'depth': len(self.open_stages), 'lines_in': lines_in, 'lines_out': None,
+                  'seconds': None, 'peak_bytes': None}
+        self.stages.append(record)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            # fold the peak so far into the stages this one is nested in, before resetting it
+            for outer in self.open_stages:
+                outer['peak_bytes'] = max(outer['peak_bytes'], peak - outer['traced_before'])
+            record['traced_before'] = current
+            record['peak_bytes'] = 0
+            tracemalloc.reset_peak()
+        self.open_stages.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            self.open_stages.pop()
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1]
+                for stage in self.open_stages + [record]:
+                    stage['peak_bytes'] = max(stage['peak_bytes'], peak - stage['traced_before'])
+                del record['traced_before']
+
+    def summary(self):
+        return format_stages(self.stages)
+
+    def write_json(self, path, **details):
+        # Writes the stages, and any other details of the run, as a JSON profile
+        with open(path, 'w') as file:
+            json.dump({**details, 'total_seconds': self.total_seconds,
+                       'memory_traced': self.trace_memory, 'stages': self.stages}, file, indent=2)
+
+
+def format_stages(stages):
+    # One line per stage record, indented by nesting, for showing in the GUI
+    lines = []
+    for record in stages:
+        line = f"{'  ' * record['depth']}{record['name']}: {1000 * record['seconds']:.0f}ms"
+        if record['lines_in'] is not None or record['lines_out'] is not None:
+            line += f", lines {record['lines_in'] if record['lines_in'] is not None else '-'}"
+            line += f" -> {record['lines_out'] if record['lines_out'] is not None else '-'}"
+        if record['peak_bytes'] is not None:
+            line += f", peak {record['peak_bytes'] / 1e6:.1f}MB"
+        lines.append(line)
+    return '\n'.join(lines)
@@ -0,0 +1,2 @@
+# Behavioural tests of the pen plotting GCODE processor. Run from the repository root with: python -m pytest
+# The serial sender's tests need the optional pyserial (pip install pyserial) and are skipped without it.
@@ -0,0 +1,48 @@
+# Shared fixtures and helpers for the tests
+import os
+import re
+import pytest
+from gcode_processor import process_gcode, DEFAULT_PREAMBLE, DEFAULT_CYCLE_SUBROUTINE
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA = os.path.join(REPOSITORY, 'tests', 'data')
+# the full sample drawing, as gcode from the online converter and as the DXF it came from
+SAMPLE_GCODE = os.path.join(REPOSITORY, 'nausicaaCroppedV2_INPUT.gcode')
+SAMPLE_DXF = os.path.join(REPOSITORY, 'nausicaaCroppedV2.dxf')
+# a few hundred lines cut out of the sample, for the tests that run whole jobs
+CELL = os.path.join(DATA, 'cell.gcode')
+NUMBER_WORD = re.compile(r'([A-Z])(-?[\d.]+)$')
+
+
+def normalised(lines):
+    # The lines of a job as the machine sees them: blank lines dropped, and every number word rounded
+    # to 6 decimal places (and -0 made 0), so that 102.36720000000001 and 102.3672 compare equal
+    result = []
+    for line in lines:
+        if not line.strip():
+            continue
+        code, semicolon, comment = line.partition(';')
+        words = []
+        for word in code.split():
+            match = NUMBER_WORD.match(word)
+            words.append((match.group(1), round(float(match.group(2)), 6) + 0.0) if match else word)
+        result.append((words, semicolon + comment.strip()))
+    return result
+
+
+def read_lines(path):
+    with open(path, 'r') as file:
+        return file.read().split('\n')
+
+
+@pytest.fixture
+def run_job(tmp_path):
+    # Runs process_gcode on the test cell (or another input) into a temporary output file with the GUI's
+    # preamble and subroutine, and returns (summary, output lines, output path)
+    def run(input_file_path=CELL, **settings):
+        output_file_path = str(tmp_path / settings.pop('output_name', 'out.gcode'))
+        settings.setdefault('preamble', DEFAULT_PREAMBLE.strip())
+        settings.setdefault('cycle_subroutine', DEFAULT_CYCLE_SUBROUTINE.strip())
+        summary = process_gcode(input_file_path, output_file_path, **settings)
+        return summary, read_lines(output_file_path), output_file_path
+    return run
@@ -0,0 +1,3228 @@
+M201 X1000 Y1000 Z1000 E5000 ; sets maximum accelerations, mm/sec^2
+M203 X400 Y400 Z48 E120 ; sets maximum feedrates, mm / sec
+M204 S400 T1250 ; sets acceleration (S) and retract acceleration (R), mm/sec^2
+M205 X8.00 Y8.00 Z0.40 E1.50 ; sets the jerk limits, mm/sec
+M205 S0 T0 ; sets the minimum extruding and travel feed rate, mm/sec
+
+;TYPE:Custom
+; Initial setups
+G90 ; use absolute coordinates
+G92 ; reset coordinates to 0
+G01 Z-3 F100
+G01 Z0 F100
+G4 S2
+;
+;
+G01 X178.8203 Y0 F4500
+G01 X178.8203 Y137.3397 F4500
+G01 X0 Y137.3397 F4500
+G01 X0 Y0 F4500
+G4 S2
+G01 X367.6406 Y0 F4500
+G01 X367.6406 Y137.3397 F4500
+G01 X0 Y137.3397 F4500
+G01 X0 Y0 F4500
+G4 S2
+
+G21
+G01 Z0 F4500
+G00 X108.5899 Y28.884 F9000
+G01 Z-3 F4500
+G01 X108.7386 Y28.04038 F4500
+G01 X108.7211 Y27.18865 F4500
+G01 X108.0686 Y27.17708 F4500
+G01 X107.6464 Y27.91433 F4500
+G01 X107.7662 Y28.72195 F4500
+G01 X108.5899 Y28.884 F4500
+G01 Z0 F4500
+G00 X109.9219 Y32.884 F9000
+G01 Z-3 F4500
+G01 X110.0707 Y32.04038 F4500
+G01 X110.0532 Y31.18864 F4500
+G01 X109.4006 Y31.17708 F4500
+G01 X108.9785 Y31.91433 F4500
+G01 X109.0982 Y32.72195 F4500
+G01 X109.9219 Y32.884 F4500
+G01 Z0 F4500
+G00 X111.2559 Y36.884 F9000
+G01 Z-3 F4500
+G01 X111.4046 Y36.04038 F4500
+G01 X111.3872 Y35.18865 F4500
+G01 X110.7346 Y35.17708 F4500
+G01 X110.3124 Y35.91433 F4500
+G01 X110.4322 Y36.72195 F4500
+G01 X111.2559 Y36.884 F4500
+G01 Z0 F4500
+G00 X112.5899 Y40.88788 F9000
+G01 Z-3 F4500
+G01 X112.7386 Y40.04427 F4500
+G01 X112.7211 Y39.19254 F4500
+G01 X112.0686 Y39.18099 F4500
+G01 X111.6464 Y39.91823 F4500
+G01 X111.7662 Y40.72584 F4500
+G01 X112.5899 Y40.88788 F4500
+G01 Z0 F4500
+G00 X113.4082 Y44.00507 F9000
+G01 Z-3 F4500
+G01 X113.9635 Y43.80153 F4500
+G01 X114.3672 Y43.33319 F4500
+G01 X113.701 Y42.68617 F4500
+G01 X113.0982 Y43.18245 F4500
+G01 X113.4082 Y44.00507 F4500
+G01 Z0 F4500
+G00 X115.2559 Y47.55409 F9000
+G01 Z-3 F4500
+G01 X115.4046 Y46.71045 F4500
+G01 X115.3872 Y45.8587 F4500
+G01 X114.7346 Y45.84711 F4500
+G01 X114.3124 Y46.58438 F4500
+G01 X114.4322 Y47.39202 F4500
+G01 X115.2559 Y47.55409 F4500
+G01 Z0 F4500
+G00 X116.0762 Y50.67128 F9000
+G01 Z-3 F4500
+G01 X116.6304 Y50.46744 F4500
+G01 X117.0332 Y49.9994 F4500
+G01 X116.3674 Y49.35232 F4500
+G01 X115.7656 Y49.84896 F4500
+G01 X116.0762 Y50.67128 F4500
+G01 Z0 F4500
+G00 X117.9219 Y54.22225 F9000
+G01 Z-3 F4500
+G01 X118.0707 Y53.37861 F4500
+G01 X118.0532 Y52.52685 F4500
+G01 X117.4006 Y52.51526 F4500
+G01 X116.9785 Y53.25253 F4500
+G01 X117.0982 Y54.06018 F4500
+G01 X117.9219 Y54.22225 F4500
+G01 Z0 F4500
+G00 X118.7422 Y57.3396 F9000
+G01 Z-3 F4500
+G01 X119.2975 Y57.13471 F4500
+G01 X119.7012 Y56.66578 F4500
+G01 X119.0346 Y56.01868 F4500
+G01 X118.4322 Y56.51653 F4500
+G01 X118.7422 Y57.3396 F4500
+G01 Z0 F4500
+G00 X120.0762 Y60.00562 F9000
+G01 Z-3 F4500
+G01 X120.6304 Y59.80178 F4500
+G01 X121.0332 Y59.33374 F4500
+G01 X120.3673 Y58.68674 F4500
+G01 X119.7656 Y59.18334 F4500
+G01 X120.0762 Y60.00562 F4500
+G01 Z0 F4500
+G00 X121.4082 Y62.67164 F9000
+G01 Z-3 F4500
+G01 X121.9635 Y62.46809 F4500
+G01 X122.3672 Y61.99976 F4500
+G01 X121.701 Y61.35265 F4500
+G01 X121.0982 Y61.84896 F4500
+G01 X121.4082 Y62.67164 F4500
+G01 Z0 F4500
+G00 X122.7422 Y65.3396 F9000
+G01 Z-3 F4500
+G01 X123.2975 Y65.13472 F4500
+G01 X123.7012 Y64.66578 F4500
+G01 X123.0346 Y64.01868 F4500
+G01 X122.4322 Y64.51653 F4500
+G01 X122.7422 Y65.3396 F4500
+G01 Z0 F4500
+G00 X124.0762 Y68.00562 F9000
+G01 Z-3 F4500
+G01 X124.6304 Y67.80178 F4500
+G01 X125.0332 Y67.33374 F4500
+G01 X124.3673 Y66.68674 F4500
+G01 X123.7656 Y67.18333 F4500
+G01 X124.0762 Y68.00562 F4500
+G01 Z0 F4500
+G00 X126.7422 Y72.00586 F9000
+G01 Z-3 F4500
+G01 X127.2975 Y71.80231 F4500
+G01 X127.7012 Y71.33398 F4500
+G01 X127.035 Y70.68694 F4500
+G01 X126.4323 Y71.18325 F4500
+G01 X126.7422 Y72.00586 F4500
+G01 Z0 F4500
+G00 X128.0762 Y74.67188 F9000
+G01 Z-3 F4500
+G01 X128.6304 Y74.46804 F4500
+G01 X129.0332 Y74.0 F4500
+G01 X128.3674 Y73.35292 F4500
+G01 X127.7656 Y73.84955 F4500
+G01 X128.0762 Y74.67188 F4500
+G01 Z0 F4500
+G00 X129.4082 Y77.33984 F9000
+G01 Z-3 F4500
+G01 X129.9635 Y77.13495 F4500
+G01 X130.3672 Y76.66602 F4500
+G01 X129.7005 Y76.01893 F4500
+G01 X129.0982 Y76.51675 F4500
+G01 X129.4082 Y77.33984 F4500
+G01 Z0 F4500
+G00 X130.7422 Y80.00586 F9000
+G01 Z-3 F4500
+G01 X131.2975 Y79.80231 F4500
+G01 X131.7012 Y79.33398 F4500
+G01 X131.035 Y78.68694 F4500
+G01 X130.4323 Y79.18325 F4500
+G01 X130.7422 Y80.00586 F4500
+G01 Z0 F4500
+G00 X134.8555 Y86.64632 F9000
+G01 Z-3 F4500
+G01 X135.0169 Y86.16425 F4500
+G01 X134.8302 Y85.43338 F4500
+G01 X134.6073 Y84.7142 F4500
+G01 X134.3672 Y84.0 F4500
+G01 X133.8347 Y83.20844 F4500
+G01 X133.2867 Y82.42764 F4500
+G01 X132.7062 Y81.67078 F4500
+G01 X132.1666 Y81.46962 F4500
+G01 X132.4709 Y82.35683 F4500
+G01 X132.8848 Y83.28363 F4500
+G01 X133.2763 Y84.07885 F4500
+G01 X133.7036 Y84.88652 F4500
+G01 X134.2147 Y85.77 F4500
+G01 X134.8555 Y86.64648 F4500
+G01 Z0 F4500
+G00 X138.7422 Y93.33965 F9000
+G01 Z-3 F4500
+G01 X139.2975 Y93.13476 F4500
+G01 X139.7012 Y92.66582 F4500
+G01 X139.0346 Y92.01873 F4500
+G01 X138.4322 Y92.51658 F4500
+G01 X138.7422 Y93.33965 F4500
+G01 Z0 F4500
+G00 X141.5957 Y97.33184 F9000
+G01 Z-3 F4500
+G01 X141.8489 Y96.77975 F4500
+G01 X141.7012 Y95.99981 F4500
+G01 X141.1099 Y95.32381 F4500
+G01 X140.4647 Y94.70022 F4500
+G01 X140.1493 Y95.0377 F4500
+G01 X140.5226 Y95.86629 F4500
+G01 X140.9656 Y96.6093 F4500
+G01 X141.5957 Y97.33184 F4500
+G01 Z0 F4500
+G00 X144.4238 Y100.4199 F9000
+G01 Z-3 F4500
+G01 X144.1094 Y99.77148 F4500
+G01 X144.3672 Y99.99998 F4500
+G01 X144.4238 Y100.4199 F4500
+G01 Z0 F4500
+G00 X150.3261 Y99.33369 F9000
+G00 X150.3262 Y99.33369 F9000
+G01 Z-3 F4500
+G01 X150.2019 Y98.70639 F4500
+G01 X150.0469 Y98.08566 F4500
+G01 X150.7601 Y98.62938 F4500
+G01 X151.5829 Y98.98518 F4500
+G01 X152.4669 Y99.13699 F4500
+G01 X153.3644 Y99.11568 F4500
+G01 X154.2505 Y98.96859 F4500
+G01 X155.1184 Y98.73559 F4500
+G01 X155.9688 Y98.44503 F4500
+G01 X156.4352 Y98.48993 F4500
+G01 X156.8301 Y98.1423 F4500
+G01 X157.7004 Y97.76474 F4500
+G01 X158.5636 Y97.37106 F4500
+G01 X159.4233 Y96.96991 F4500
+G01 X160.2827 Y96.5681 F4500
+G01 X161.1445 Y96.1716 F4500
+G01 X161.5352 Y96.2067 F4500
+G01 X162.125 Y96.2438 F4500
+G01 X162.8083 Y96.18774 F4500
+G01 X163.4164 Y95.89075 F4500
+G01 X163.627 Y95.25747 F4500
+G01 X164.5141 Y94.93031 F4500
+G01 X165.4112 Y94.63166 F4500
+G01 X166.3191 Y94.36758 F4500
+G01 X167.2378 Y94.14441 F4500
+G01 X168.1667 Y93.96851 F4500
+G01 X169.1042 Y93.84627 F4500
+G01 X170.0475 Y93.7836 F4500
+G01 X170.9929 Y93.78558 F4500
+G01 X171.9356 Y93.85601 F4500
+G01 X172.8704 Y93.99686 F4500
+G01 X173.7918 Y94.20821 F4500
+G01 X174.6947 Y94.48808 F4500
+G01 X175.575 Y94.83288 F4500
+G01 X176.4293 Y95.2378 F4500
+G01 X177.2555 Y95.69732 F4500
+G01 X178.0525 Y96.20573 F4500
+G01 X178.8203 Y96.75747 F4500
+G01 X178.3987 Y95.85492 F4500
+G01 X177.9765 Y94.95264 F4500
+G01 X177.5536 Y94.05067 F4500
+G01 X177.1302 Y93.14896 F4500
+G01 X176.7062 Y92.24752 F4500
+G01 X176.2816 Y91.34636 F4500
+G01 X175.8565 Y90.44546 F4500
+G01 X175.4308 Y89.54483 F4500
+G01 X175.0045 Y88.64445 F4500
+G01 X174.5777 Y87.74435 F4500
+G01 X174.1503 Y86.8445 F4500
+G01 X173.7224 Y85.94491 F4500
+G01 X173.294 Y85.04557 F4500
+G01 X172.865 Y84.14648 F4500
+G01 X172.4355 Y83.24767 F4500
+G01 X172.0055 Y82.3491 F4500
+G01 X171.5749 Y81.45079 F4500
+G01 X171.1438 Y80.55272 F4500
+G01 X170.7122 Y79.65491 F4500
+G01 X170.28 Y78.75735 F4500
+G01 X169.8473 Y77.86004 F4500
+G01 X169.4141 Y76.96299 F4500
+G01 X168.9804 Y76.06618 F4500
+G01 X168.5462 Y75.16962 F4500
+G01 X168.1114 Y74.27334 F4500
+G01 X167.6761 Y73.3773 F4500
+G01 X167.2403 Y72.48151 F4500
+G01 X166.804 Y71.58597 F4500
+G01 X166.3671 Y70.6907 F4500
+G01 X165.9298 Y69.79567 F4500
+G01 X165.4918 Y68.90091 F4500
+G01 X165.0534 Y68.00641 F4500
+G01 X164.6144 Y67.11216 F4500
+G01 X164.1749 Y66.21818 F4500
+G01 X163.7349 Y65.32447 F4500
+G01 X163.2943 Y64.43101 F4500
+G01 X162.8532 Y63.53783 F4500
+G01 X162.4115 Y62.64491 F4500
+G01 X161.9693 Y61.75227 F4500
+G01 X161.5266 Y60.85989 F4500
+G01 X161.0832 Y59.9678 F4500
+G01 X160.6394 Y59.07598 F4500
+G01 X160.1949 Y58.18444 F4500
+G01 X159.7499 Y57.29319 F4500
+G01 X159.3043 Y56.40222 F4500
+G01 X158.8582 Y55.51153 F4500
+G01 X158.4115 Y54.62115 F4500
+G01 X157.9641 Y53.73105 F4500
+G01 X157.5162 Y52.84125 F4500
+G01 X157.0677 Y51.95176 F4500
+G01 X156.6186 Y51.06257 F4500
+G01 X156.1689 Y50.17369 F4500
+G01 X155.7185 Y49.28512 F4500
+G01 X155.2675 Y48.39688 F4500
+G01 X154.8159 Y47.50895 F4500
+G01 X154.3637 Y46.62135 F4500
+G01 X153.9108 Y45.73408 F4500
+G01 X153.4572 Y44.84714 F4500
+G01 X153.003 Y43.96055 F4500
+G01 X152.5481 Y43.0743 F4500
+G01 X152.0925 Y42.1884 F4500
+G01 X151.6363 Y41.30286 F4500
+G01 X151.1793 Y40.41768 F4500
+G01 X150.7216 Y39.53287 F4500
+G01 X150.2632 Y38.64844 F4500
+G01 X149.804 Y37.7644 F4500
+G01 X149.3441 Y36.88073 F4500
+G01 X148.8835 Y35.99747 F4500
+G01 X148.422 Y35.11461 F4500
+G01 X147.9598 Y34.23217 F4500
+G01 X147.4968 Y33.35014 F4500
+G01 X147.0329 Y32.46854 F4500
+G01 X146.5682 Y31.58739 F4500
+G01 X146.1027 Y30.70668 F4500
+G01 X145.6363 Y29.82642 F4500
+G01 X145.169 Y28.94664 F4500
+G01 X144.7009 Y28.06734 F4500
+G01 X144.2318 Y27.18852 F4500
+G01 X143.7617 Y26.31021 F4500
+G01 X143.2678 Y25.47379 F4500
+G01 X142.7083 Y24.6797 F4500
+G01 X142.0849 Y23.93481 F4500
+G01 X141.4004 Y23.2456 F4500
+G01 X140.6592 Y22.6178 F4500
+G01 X139.8667 Y22.05612 F4500
+G01 X139.0292 Y21.56411 F4500
+G01 X138.1533 Y21.1441 F4500
+G01 X137.246 Y20.79733 F4500
+G01 X136.3138 Y20.52416 F4500
+G01 X135.3632 Y20.32422 F4500
+G01 X134.4001 Y20.19669 F4500
+G01 X133.4303 Y20.14049 F4500
+G01 X132.459 Y20.15439 F4500
+G01 X131.4911 Y20.23718 F4500
+G01 X130.5314 Y20.38769 F4500
+G01 X129.5845 Y20.60485 F4500
+G01 X128.6552 Y20.88768 F4500
+G01 X127.748 Y21.23524 F4500
+G01 X126.868 Y21.64659 F4500
+G01 X126.0201 Y22.12068 F4500
+G01 X125.2096 Y22.65623 F4500
+G01 X124.4421 Y23.25161 F4500
+G01 X123.723 Y23.90467 F4500
+G01 X123.0578 Y24.6126 F4500
+G01 X122.4519 Y25.37184 F4500
+G01 X121.91 Y26.178 F4500
+G01 X121.4361 Y27.02594 F4500
+G01 X121.0332 Y27.90982 F4500
+G01 X120.2264 Y27.81272 F4500
+G01 X119.6666 Y28.33318 F4500
+G01 X119.6682 Y29.14669 F4500
+G01 X119.8555 Y29.94302 F4500
+G01 X120.0417 Y30.59263 F4500
+G01 X120.2797 Y31.22264 F4500
+G01 X120.5957 Y31.81997 F4500
+G01 X121.1641 Y32.58169 F4500
+G01 X121.1758 Y32.63639 F4500
+G01 X121.2243 Y33.48891 F4500
+G01 X121.349 Y34.33361 F4500
+G01 X121.5526 Y35.16283 F4500
+G01 X121.8301 Y35.97037 F4500
+G01 X121.9648 Y36.25944 F4500
+G01 X122.2235 Y37.22406 F4500
+G01 X122.4937 Y38.18551 F4500
+G01 X122.7753 Y39.14371 F4500
+G01 X123.0677 Y40.09862 F4500
+G01 X123.3709 Y41.0502 F4500
+G01 X123.6844 Y41.99843 F4500
+G01 X124.0079 Y42.94327 F4500
+G01 X124.3411 Y43.88474 F4500
+G01 X124.6838 Y44.82281 F4500
+G01 X125.0356 Y45.75752 F4500
+G01 X125.3961 Y46.68886 F4500
+G01 X125.7652 Y47.61689 F4500
+G01 X126.1424 Y48.54161 F4500
+G01 X126.5274 Y49.46309 F4500
+G01 X126.9201 Y50.38136 F4500
+G01 X127.32 Y51.29649 F4500
+G01 X127.727 Y52.20854 F4500
+G01 X128.1406 Y53.11757 F4500
+G01 X128.5606 Y54.02366 F4500
+G01 X128.9867 Y54.92689 F4500
+G01 X129.4187 Y55.82735 F4500
+G01 X129.8562 Y56.72511 F4500
+G01 X130.299 Y57.62028 F4500
+G01 X130.7469 Y58.51294 F4500
+G01 X131.1994 Y59.40321 F4500
+G01 X131.6565 Y60.29119 F4500
+G01 X132.1178 Y61.17697 F4500
+G01 X132.5831 Y62.06068 F4500
+G01 X133.052 Y62.94242 F4500
+G01 X133.5245 Y63.82232 F4500
+G01 X134.0001 Y64.70048 F4500
+G01 X134.4787 Y65.57703 F4500
+G01 X134.9601 Y66.4521 F4500
+G01 X135.4439 Y67.3258 F4500
+G01 X135.9299 Y68.19826 F4500
+G01 X136.4179 Y69.06962 F4500
+G01 X136.9077 Y69.93999 F4500
+G01 X137.3989 Y70.80952 F4500
+G01 X137.8914 Y71.67833 F4500
+G01 X138.385 Y72.54657 F4500
+G01 X138.8793 Y73.41436 F4500
+G01 X139.3742 Y74.28184 F4500
+G01 X139.8693 Y75.14915 F4500
+G01 X140.3645 Y76.01643 F4500
+G01 X140.8596 Y76.88383 F4500
+G01 X141.3541 Y77.75148 F4500
+G01 X141.848 Y78.61951 F4500
+G01 X142.341 Y79.48809 F4500
+G01 X142.8327 Y80.35733 F4500
+G01 X143.323 Y81.22741 F4500
+G01 X143.8116 Y82.09846 F4500
+G01 X144.2981 Y82.9706 F4500
+G01 X144.7824 Y83.84404 F4500
+G01 X145.2642 Y84.71885 F4500
+G01 X145.7431 Y85.59523 F4500
+G01 X146.219 Y86.47327 F4500
+G01 X146.6914 Y87.35319 F4500
+G01 X146.7868 Y88.22372 F4500
+G01 X146.8978 Y89.09241 F4500
+G01 X147.0257 Y89.95876 F4500
+G01 X147.1716 Y90.82226 F4500
+G01 X147.3362 Y91.68239 F4500
+G01 X147.5195 Y92.53873 F4500
+G01 X146.8508 Y92.11536 F4500
+G01 X146.4678 Y92.74107 F4500
+G01 X146.9483 Y93.25014 F4500
+G01 X147.5761 Y92.75358 F4500
+G01 X147.8035 Y93.66621 F4500
+G01 X148.0643 Y94.56982 F4500
+G01 X148.3769 Y95.4567 F4500
+G01 X147.997 Y96.2159 F4500
+G01 X147.9939 Y97.07777 F4500
+G01 X148.2669 Y97.89571 F4500
+G01 X148.7904 Y98.58049 F4500
+G01 X149.5058 Y99.06258 F4500
+G01 X150.3261 Y99.33369 F4500
+G01 Z0 F4500
+G00 X154.9785 Y108.3515 F9000
+G01 Z-3 F4500
+G01 X155.6343 Y107.8776 F4500
+G01 X156.1143 Y107.1023 F4500
+G01 X156.5495 Y106.3006 F4500
+G01 X156.9618 Y105.4869 F4500
+G01 X157.3594 Y104.666 F4500
+G01 X157.433 Y103.688 F4500
+G01 X157.4651 Y102.7079 F4500
+G01 X157.3846 Y101.7325 F4500
+G01 X156.7579 Y101.8129 F4500
+G01 X156.3203 Y102.6903 F4500
+G01 X155.9632 Y103.6113 F4500
+G01 X155.6633 Y104.5088 F4500
+G01 X155.3881 Y105.4472 F4500
+G01 X155.1391 Y106.4459 F4500
+G01 X154.9531 Y107.4603 F4500
+G01 X154.9785 Y108.3515 F4500
+G01 Z0 F4500
+G00 X155.1387 Y115.9804 F9000
+G01 Z-3 F4500
+G01 X155.0984 Y115.1041 F4500
+G01 X154.7192 Y114.2236 F4500
+G01 X154.2884 Y113.3669 F4500
+G01 X153.832 Y112.5236 F4500
+G01 X153.3594 Y111.6892 F4500
+G01 X152.8754 Y110.8615 F4500
+G01 X152.3826 Y110.039 F4500
+G01 X151.8828 Y109.2206 F4500
+G01 X150.9544 Y109.1855 F4500
+G01 X150.7022 Y110.0222 F4500
+G01 X151.0108 Y110.915 F4500
+G01 X151.4493 Y111.7542 F4500
+G01 X151.9501 Y112.5581 F4500
+G01 X152.4922 Y113.3334 F4500
+G01 X153.0687 Y114.0824 F4500
+G01 X153.6813 Y114.8031 F4500
+G01 X154.3436 Y115.4817 F4500
+G01 X155.1387 Y115.9804 F4500
+G01 Z0 F4500
+G00 X156.918 Y117.123 F9000
+G01 Z-3 F4500
+G01 X157.8382 Y116.9334 F4500
+G01 X158.7256 Y116.6082 F4500
+G01 X159.5992 Y116.2474 F4500
+G01 X160.4648 Y115.8676 F4500
+G01 X161.3248 Y115.4754 F4500
+G01 X162.1806 Y115.0741 F4500
+G01 X163.0332 Y114.666 F4500
+G01 X163.5092 Y113.8548 F4500
+G01 X163.0648 Y113.3051 F4500
+G01 X162.1581 Y113.5565 F4500
+G01 X161.2962 Y113.9333 F4500
+G01 X160.4528 Y114.3665 F4500
+G01 X159.6302 Y114.834 F4500
+G01 X158.8332 Y115.3266 F4500
+G01 X158.0608 Y115.8474 F4500
+G01 X157.3183 Y116.416 F4500
+G01 X156.918 Y117.123 F4500
+G01 Z0 F4500
+G00 X157.502 Y113.2246 F9000
+G01 Z-3 F4500
+G01 X158.1733 Y112.8846 F4500
+G01 X158.6572 Y112.25 F4500
+G01 X159.0768 Y111.5703 F4500
+G01 X159.4629 Y110.871 F4500
+G01 X159.4819 Y109.8779 F4500
+G01 X159.4843 Y108.8845 F4500
+G01 X159.4629 Y107.8914 F4500
+G01 X159.4026 Y106.9 F4500
+G01 X159.2571 Y105.9181 F4500
+G01 X158.6732 Y105.464 F4500
+G01 X158.2157 Y106.3369 F4500
+G01 X157.9067 Y107.2817 F4500
+G01 X157.6523 Y108.2803 F4500
+G01 X157.4591 Y109.2196 F4500
+G01 X157.3083 Y110.1491 F4500
+G01 X157.1995 Y111.1261 F4500
+G01 X157.1701 Y112.1904 F4500
+G01 X157.502 Y113.2246 F4500
+G01 Z0 F4500
+G00 X164.0762 Y134.6719 F9000
+G01 Z-3 F4500
+G01 X164.6304 Y134.468 F4500
+G01 X165.0332 Y134.0 F4500
+G01 X164.3674 Y133.3529 F4500
+G01 X163.7656 Y133.8496 F4500
+G01 X164.0762 Y134.6719 F4500
+G01 Z0 F4500
+G00 X165.4082 Y137.3397 F9000
+G01 Z-3 F4500
+G01 X165.9635 Y137.1348 F4500
+G01 X166.3672 Y136.6659 F4500
+G01 X165.7006 Y136.0188 F4500
+G01 X165.0982 Y136.5166 F4500
+G01 X165.4082 Y137.3397 F4500
+G01 Z0 F4500
+G00 X0.0 Y0.0 F9000
+
+
+
+G21
+G01 Z0 F4500
+G00 X118.5899 Y28.884 F9000
+G01 Z-3 F4500
+G01 X118.7386 Y28.04038 F4500
+G01 X118.7211 Y27.18865 F4500
+G01 X118.0686 Y27.17708 F4500
+G01 X117.6464 Y27.91433 F4500
+G01 X117.7662 Y28.72195 F4500
+G01 X118.5899 Y28.884 F4500
+G01 Z0 F4500
+G00 X119.9219 Y32.884 F9000
+G01 Z-3 F4500
+G01 X120.0707 Y32.04038 F4500
+G01 X120.0532 Y31.18864 F4500
+G01 X119.4006 Y31.17708 F4500
+G01 X118.9785 Y31.91433 F4500
+G01 X119.0982 Y32.72195 F4500
+G01 X119.9219 Y32.884 F4500
+G01 Z0 F4500
+G00 X121.2559 Y36.884 F9000
+G01 Z-3 F4500
+G01 X121.4046 Y36.04038 F4500
+G01 X121.3872 Y35.18865 F4500
+G01 X120.7346 Y35.17708 F4500
+G01 X120.3124 Y35.91433 F4500
+G01 X120.4322 Y36.72195 F4500
+G01 X121.2559 Y36.884 F4500
+G01 Z0 F4500
+G00 X122.5899 Y40.88788 F9000
+G01 Z-3 F4500
+G01 X122.7386 Y40.04427 F4500
+G01 X122.7211 Y39.19254 F4500
+G01 X122.0686 Y39.18099 F4500
+G01 X121.6464 Y39.91823 F4500
+G01 X121.7662 Y40.72584 F4500
+G01 X122.5899 Y40.88788 F4500
+G01 Z0 F4500
+G00 X123.4082 Y44.00507 F9000
+G01 Z-3 F4500
+G01 X123.9635 Y43.80153 F4500
+G01 X124.3672 Y43.33319 F4500
+G01 X123.701 Y42.68617 F4500
+G01 X123.0982 Y43.18245 F4500
+G01 X123.4082 Y44.00507 F4500
+G01 Z0 F4500
+G00 X125.2559 Y47.55409 F9000
+G01 Z-3 F4500
+G01 X125.4046 Y46.71045 F4500
+G01 X125.3872 Y45.8587 F4500
+G01 X124.7346 Y45.84711 F4500
+G01 X124.3124 Y46.58438 F4500
+G01 X124.4322 Y47.39202 F4500
+G01 X125.2559 Y47.55409 F4500
+G01 Z0 F4500
+G00 X126.0762 Y50.67128 F9000
+G01 Z-3 F4500
+G01 X126.6304 Y50.46744 F4500
+G01 X127.0332 Y49.9994 F4500
+G01 X126.3674 Y49.35232 F4500
+G01 X125.7656 Y49.84896 F4500
+G01 X126.0762 Y50.67128 F4500
+G01 Z0 F4500
+G00 X127.9219 Y54.22225 F9000
+G01 Z-3 F4500
+G01 X128.0707 Y53.37861 F4500
+G01 X128.0532 Y52.52685 F4500
+G01 X127.4006 Y52.51526 F4500
+G01 X126.9785 Y53.25253 F4500
+G01 X127.0982 Y54.06018 F4500
+G01 X127.9219 Y54.22225 F4500
+G01 Z0 F4500
+G00 X128.7422 Y57.3396 F9000
+G01 Z-3 F4500
+G01 X129.2975 Y57.13471 F4500
+G01 X129.7012 Y56.66578 F4500
+G01 X129.0346 Y56.01868 F4500
+G01 X128.4322 Y56.51653 F4500
+G01 X128.7422 Y57.3396 F4500
+G01 Z0 F4500
+G00 X130.0762 Y60.00562 F9000
+G01 Z-3 F4500
+G01 X130.6304 Y59.80178 F4500
+G01 X131.0332 Y59.33374 F4500
+G01 X130.3673 Y58.68674 F4500
+G01 X129.7656 Y59.18334 F4500
+G01 X130.0762 Y60.00562 F4500
+G01 Z0 F4500
+G00 X131.4082 Y62.67164 F9000
+G01 Z-3 F4500
+G01 X131.9635 Y62.46809 F4500
+G01 X132.3672 Y61.99976 F4500
+G01 X131.701 Y61.35265 F4500
+G01 X131.09820000000002 Y61.84896 F4500
+G01 X131.4082 Y62.67164 F4500
+G01 Z0 F4500
+G00 X132.7422 Y65.3396 F9000
+G01 Z-3 F4500
+G01 X133.2975 Y65.13472 F4500
+G01 X133.7012 Y64.66578 F4500
+G01 X133.0346 Y64.01868 F4500
+G01 X132.4322 Y64.51653 F4500
+G01 X132.7422 Y65.3396 F4500
+G01 Z0 F4500
+G00 X134.0762 Y68.00562 F9000
+G01 Z-3 F4500
+G01 X134.6304 Y67.80178 F4500
+G01 X135.0332 Y67.33374 F4500
+G01 X134.3673 Y66.68674 F4500
+G01 X133.7656 Y67.18333 F4500
+G01 X134.0762 Y68.00562 F4500
+G01 Z0 F4500
+G00 X136.7422 Y72.00586 F9000
+G01 Z-3 F4500
+G01 X137.2975 Y71.80231 F4500
+G01 X137.7012 Y71.33398 F4500
+G01 X137.035 Y70.68694 F4500
+G01 X136.4323 Y71.18325 F4500
+G01 X136.7422 Y72.00586 F4500
+G01 Z0 F4500
+G00 X138.0762 Y74.67188 F9000
+G01 Z-3 F4500
+G01 X138.6304 Y74.46804 F4500
+G01 X139.0332 Y74.0 F4500
+G01 X138.3674 Y73.35292 F4500
+G01 X137.7656 Y73.84955 F4500
+G01 X138.0762 Y74.67188 F4500
+G01 Z0 F4500
+G00 X139.4082 Y77.33984 F9000
+G01 Z-3 F4500
+G01 X139.9635 Y77.13495 F4500
+G01 X140.3672 Y76.66602 F4500
+G01 X139.7005 Y76.01893 F4500
+G01 X139.0982 Y76.51675 F4500
+G01 X139.4082 Y77.33984 F4500
+G01 Z0 F4500
+G00 X140.7422 Y80.00586 F9000
+G01 Z-3 F4500
+G01 X141.2975 Y79.80231 F4500
+G01 X141.7012 Y79.33398 F4500
+G01 X141.035 Y78.68694 F4500
+G01 X140.4323 Y79.18325 F4500
+G01 X140.7422 Y80.00586 F4500
+G01 Z0 F4500
+G00 X144.8555 Y86.64632 F9000
+G01 Z-3 F4500
+G01 X145.0169 Y86.16425 F4500
+G01 X144.8302 Y85.43338 F4500
+G01 X144.6073 Y84.7142 F4500
+G01 X144.3672 Y84.0 F4500
+G01 X143.8347 Y83.20844 F4500
+G01 X143.2867 Y82.42764 F4500
+G01 X142.7062 Y81.67078 F4500
+G01 X142.1666 Y81.46962 F4500
+G01 X142.4709 Y82.35683 F4500
+G01 X142.8848 Y83.28363 F4500
+G01 X143.2763 Y84.07885 F4500
+G01 X143.7036 Y84.88652 F4500
+G01 X144.2147 Y85.77 F4500
+G01 X144.8555 Y86.64648 F4500
+G01 Z0 F4500
+G00 X148.7422 Y93.33965 F9000
+G01 Z-3 F4500
+G01 X149.2975 Y93.13476 F4500
+G01 X149.7012 Y92.66582 F4500
+G01 X149.0346 Y92.01873 F4500
+G01 X148.4322 Y92.51658 F4500
+G01 X148.7422 Y93.33965 F4500
+G01 Z0 F4500
+G00 X151.5957 Y97.33184 F9000
+G01 Z-3 F4500
+G01 X151.8489 Y96.77975 F4500
+G01 X151.7012 Y95.99981 F4500
+G01 X151.1099 Y95.32381 F4500
+G01 X150.4647 Y94.70022 F4500
+G01 X150.1493 Y95.0377 F4500
+G01 X150.5226 Y95.86629 F4500
+G01 X150.9656 Y96.6093 F4500
+G01 X151.5957 Y97.33184 F4500
+G01 Z0 F4500
+G00 X154.4238 Y100.4199 F9000
+G01 Z-3 F4500
+G01 X154.1094 Y99.77148 F4500
+G01 X154.3672 Y99.99998 F4500
+G01 X154.4238 Y100.4199 F4500
+G01 Z0 F4500
+G00 X160.3261 Y99.33369 F9000
+G00 X160.3262 Y99.33369 F9000
+G01 Z-3 F4500
+G01 X160.2019 Y98.70639 F4500
+G01 X160.0469 Y98.08566 F4500
+G01 X160.7601 Y98.62938 F4500
+G01 X161.5829 Y98.98518 F4500
+G01 X162.4669 Y99.13699 F4500
+G01 X163.3644 Y99.11568 F4500
+G01 X164.2505 Y98.96859 F4500
+G01 X165.1184 Y98.73559 F4500
+G01 X165.9688 Y98.44503 F4500
+G01 X166.4352 Y98.48993 F4500
+G01 X166.8301 Y98.1423 F4500
+G01 X167.7004 Y97.76474 F4500
+G01 X168.5636 Y97.37106 F4500
+G01 X169.4233 Y96.96991 F4500
+G01 X170.2827 Y96.5681 F4500
+G01 X171.1445 Y96.1716 F4500
+G01 X171.5352 Y96.2067 F4500
+G01 X172.125 Y96.2438 F4500
+G01 X172.8083 Y96.18774 F4500
+G01 X173.4164 Y95.89075 F4500
+G01 X173.627 Y95.25747 F4500
+G01 X174.5141 Y94.93031 F4500
+G01 X175.4112 Y94.63166 F4500
+G01 X176.3191 Y94.36758 F4500
+G01 X177.2378 Y94.14441 F4500
+G01 X178.1667 Y93.96851 F4500
+G01 X179.1042 Y93.84627 F4500
+G01 X180.0475 Y93.7836 F4500
+G01 X180.9929 Y93.78558 F4500
+G01 X181.9356 Y93.85601 F4500
+G01 X182.8704 Y93.99686 F4500
+G01 X183.7918 Y94.20821 F4500
+G01 X184.6947 Y94.48808 F4500
+G01 X185.575 Y94.83288 F4500
+G01 X186.4293 Y95.2378 F4500
+G01 X187.2555 Y95.69732 F4500
+G01 X188.0525 Y96.20573 F4500
+G01 X188.8203 Y96.75747 F4500
+G01 X188.3987 Y95.85492 F4500
+G01 X187.9765 Y94.95264 F4500
+G01 X187.5536 Y94.05067 F4500
+G01 X187.1302 Y93.14896 F4500
+G01 X186.7062 Y92.24752 F4500
+G01 X186.2816 Y91.34636 F4500
+G01 X185.8565 Y90.44546 F4500
+G01 X185.4308 Y89.54483 F4500
+G01 X185.0045 Y88.64445 F4500
+G01 X184.5777 Y87.74435 F4500
+G01 X184.1503 Y86.8445 F4500
+G01 X183.7224 Y85.94491 F4500
+G01 X183.294 Y85.04557 F4500
+G01 X182.865 Y84.14648 F4500
+G01 X182.4355 Y83.24767 F4500
+G01 X182.0055 Y82.3491 F4500
+G01 X181.5749 Y81.45079 F4500
+G01 X181.1438 Y80.55272 F4500
+G01 X180.7122 Y79.65491 F4500
+G01 X180.28 Y78.75735 F4500
+G01 X179.8473 Y77.86004 F4500
+G01 X179.4141 Y76.96299 F4500
+G01 X178.9804 Y76.06618 F4500
+G01 X178.5462 Y75.16962 F4500
+G01 X178.1114 Y74.27334 F4500
+G01 X177.6761 Y73.3773 F4500
+G01 X177.2403 Y72.48151 F4500
+G01 X176.804 Y71.58597 F4500
+G01 X176.3671 Y70.6907 F4500
+G01 X175.9298 Y69.79567 F4500
+G01 X175.4918 Y68.90091 F4500
+G01 X175.0534 Y68.00641 F4500
+G01 X174.6144 Y67.11216 F4500
+G01 X174.1749 Y66.21818 F4500
+G01 X173.7349 Y65.32447 F4500
+G01 X173.2943 Y64.43101 F4500
+G01 X172.8532 Y63.53783 F4500
+G01 X172.4115 Y62.64491 F4500
+G01 X171.9693 Y61.75227 F4500
+G01 X171.5266 Y60.85989 F4500
+G01 X171.0832 Y59.9678 F4500
+G01 X170.6394 Y59.07598 F4500
+G01 X170.1949 Y58.18444 F4500
+G01 X169.7499 Y57.29319 F4500
+G01 X169.3043 Y56.40222 F4500
+G01 X168.8582 Y55.51153 F4500
+G01 X168.4115 Y54.62115 F4500
+G01 X167.9641 Y53.73105 F4500
+G01 X167.5162 Y52.84125 F4500
+G01 X167.0677 Y51.95176 F4500
+G01 X166.6186 Y51.06257 F4500
+G01 X166.1689 Y50.17369 F4500
+G01 X165.7185 Y49.28512 F4500
+G01 X165.2675 Y48.39688 F4500
+G01 X164.8159 Y47.50895 F4500
+G01 X164.3637 Y46.62135 F4500
+G01 X163.9108 Y45.73408 F4500
+G01 X163.4572 Y44.84714 F4500
+G01 X163.003 Y43.96055 F4500
+G01 X162.5481 Y43.0743 F4500
+G01 X162.0925 Y42.1884 F4500
+G01 X161.6363 Y41.30286 F4500
+G01 X161.1793 Y40.41768 F4500
+G01 X160.7216 Y39.53287 F4500
+G01 X160.2632 Y38.64844 F4500
+G01 X159.804 Y37.7644 F4500
+G01 X159.3441 Y36.88073 F4500
+G01 X158.8835 Y35.99747 F4500
+G01 X158.422 Y35.11461 F4500
+G01 X157.9598 Y34.23217 F4500
+G01 X157.4968 Y33.35014 F4500
+G01 X157.0329 Y32.46854 F4500
+G01 X156.5682 Y31.58739 F4500
+G01 X156.1027 Y30.70668 F4500
+G01 X155.6363 Y29.82642 F4500
+G01 X155.169 Y28.94664 F4500
+G01 X154.7009 Y28.06734 F4500
+G01 X154.2318 Y27.18852 F4500
+G01 X153.7617 Y26.31021 F4500
+G01 X153.2678 Y25.47379 F4500
+G01 X152.7083 Y24.6797 F4500
+G01 X152.0849 Y23.93481 F4500
+G01 X151.4004 Y23.2456 F4500
+G01 X150.6592 Y22.6178 F4500
+G01 X149.8667 Y22.05612 F4500
+G01 X149.0292 Y21.56411 F4500
+G01 X148.1533 Y21.1441 F4500
+G01 X147.246 Y20.79733 F4500
+G01 X146.3138 Y20.52416 F4500
+G01 X145.3632 Y20.32422 F4500
+G01 X144.4001 Y20.19669 F4500
+G01 X143.4303 Y20.14049 F4500
+G01 X142.459 Y20.15439 F4500
+G01 X141.4911 Y20.23718 F4500
+G01 X140.5314 Y20.38769 F4500
+G01 X139.5845 Y20.60485 F4500
+G01 X138.6552 Y20.88768 F4500
+G01 X137.748 Y21.23524 F4500
+G01 X136.868 Y21.64659 F4500
+G01 X136.0201 Y22.12068 F4500
+G01 X135.2096 Y22.65623 F4500
+G01 X134.44209999999998 Y23.25161 F4500
+G01 X133.723 Y23.90467 F4500
+G01 X133.0578 Y24.6126 F4500
+G01 X132.4519 Y25.37184 F4500
+G01 X131.91 Y26.178 F4500
+G01 X131.4361 Y27.02594 F4500
+G01 X131.0332 Y27.90982 F4500
+G01 X130.2264 Y27.81272 F4500
+G01 X129.66660000000002 Y28.33318 F4500
+G01 X129.6682 Y29.14669 F4500
+G01 X129.8555 Y29.94302 F4500
+G01 X130.0417 Y30.59263 F4500
+G01 X130.2797 Y31.22264 F4500
+G01 X130.5957 Y31.81997 F4500
+G01 X131.16410000000002 Y32.58169 F4500
+G01 X131.17579999999998 Y32.63639 F4500
+G01 X131.2243 Y33.48891 F4500
+G01 X131.349 Y34.33361 F4500
+G01 X131.55259999999998 Y35.16283 F4500
+G01 X131.83010000000002 Y35.97037 F4500
+G01 X131.9648 Y36.25944 F4500
+G01 X132.2235 Y37.22406 F4500
+G01 X132.4937 Y38.18551 F4500
+G01 X132.77530000000002 Y39.14371 F4500
+G01 X133.0677 Y40.09862 F4500
+G01 X133.3709 Y41.0502 F4500
+G01 X133.68439999999998 Y41.99843 F4500
+G01 X134.0079 Y42.94327 F4500
+G01 X134.34109999999998 Y43.88474 F4500
+G01 X134.68380000000002 Y44.82281 F4500
+G01 X135.0356 Y45.75752 F4500
+G01 X135.3961 Y46.68886 F4500
+G01 X135.7652 Y47.61689 F4500
+G01 X136.1424 Y48.54161 F4500
+G01 X136.5274 Y49.46309 F4500
+G01 X136.9201 Y50.38136 F4500
+G01 X137.32 Y51.29649 F4500
+G01 X137.727 Y52.20854 F4500
+G01 X138.1406 Y53.11757 F4500
+G01 X138.5606 Y54.02366 F4500
+G01 X138.9867 Y54.92689 F4500
+G01 X139.4187 Y55.82735 F4500
+G01 X139.8562 Y56.72511 F4500
+G01 X140.299 Y57.62028 F4500
+G01 X140.7469 Y58.51294 F4500
+G01 X141.1994 Y59.40321 F4500
+G01 X141.6565 Y60.29119 F4500
+G01 X142.1178 Y61.17697 F4500
+G01 X142.5831 Y62.06068 F4500
+G01 X143.052 Y62.94242 F4500
+G01 X143.5245 Y63.82232 F4500
+G01 X144.0001 Y64.70048 F4500
+G01 X144.4787 Y65.57703 F4500
+G01 X144.9601 Y66.4521 F4500
+G01 X145.4439 Y67.3258 F4500
+G01 X145.9299 Y68.19826 F4500
+G01 X146.4179 Y69.06962 F4500
+G01 X146.9077 Y69.93999 F4500
+G01 X147.3989 Y70.80952 F4500
+G01 X147.8914 Y71.67833 F4500
+G01 X148.385 Y72.54657 F4500
+G01 X148.8793 Y73.41436 F4500
+G01 X149.3742 Y74.28184 F4500
+G01 X149.8693 Y75.14915 F4500
+G01 X150.3645 Y76.01643 F4500
+G01 X150.8596 Y76.88383 F4500
+G01 X151.3541 Y77.75148 F4500
+G01 X151.848 Y78.61951 F4500
+G01 X152.341 Y79.48809 F4500
+G01 X152.8327 Y80.35733 F4500
+G01 X153.323 Y81.22741 F4500
+G01 X153.8116 Y82.09846 F4500
+G01 X154.2981 Y82.9706 F4500
+G01 X154.7824 Y83.84404 F4500
+G01 X155.2642 Y84.71885 F4500
+G01 X155.7431 Y85.59523 F4500
+G01 X156.219 Y86.47327 F4500
+G01 X156.6914 Y87.35319 F4500
+G01 X156.7868 Y88.22372 F4500
+G01 X156.8978 Y89.09241 F4500
+G01 X157.0257 Y89.95876 F4500
+G01 X157.1716 Y90.82226 F4500
+G01 X157.3362 Y91.68239 F4500
+G01 X157.5195 Y92.53873 F4500
+G01 X156.8508 Y92.11536 F4500
+G01 X156.4678 Y92.74107 F4500
+G01 X156.9483 Y93.25014 F4500
+G01 X157.5761 Y92.75358 F4500
+G01 X157.8035 Y93.66621 F4500
+G01 X158.0643 Y94.56982 F4500
+G01 X158.3769 Y95.4567 F4500
+G01 X157.997 Y96.2159 F4500
+G01 X157.9939 Y97.07777 F4500
+G01 X158.2669 Y97.89571 F4500
+G01 X158.7904 Y98.58049 F4500
+G01 X159.5058 Y99.06258 F4500
+G01 X160.3261 Y99.33369 F4500
+G01 Z0 F4500
+G00 X164.9785 Y108.3515 F9000
+G01 Z-3 F4500
+G01 X165.6343 Y107.8776 F4500
+G01 X166.1143 Y107.1023 F4500
+G01 X166.5495 Y106.3006 F4500
+G01 X166.9618 Y105.4869 F4500
+G01 X167.3594 Y104.666 F4500
+G01 X167.433 Y103.688 F4500
+G01 X167.4651 Y102.7079 F4500
+G01 X167.3846 Y101.7325 F4500
+G01 X166.7579 Y101.8129 F4500
+G01 X166.3203 Y102.6903 F4500
+G01 X165.9632 Y103.6113 F4500
+G01 X165.6633 Y104.5088 F4500
+G01 X165.3881 Y105.4472 F4500
+G01 X165.1391 Y106.4459 F4500
+G01 X164.9531 Y107.4603 F4500
+G01 X164.9785 Y108.3515 F4500
+G01 Z0 F4500
+G00 X165.1387 Y115.9804 F9000
+G01 Z-3 F4500
+G01 X165.0984 Y115.1041 F4500
+G01 X164.7192 Y114.2236 F4500
+G01 X164.2884 Y113.3669 F4500
+G01 X163.832 Y112.5236 F4500
+G01 X163.3594 Y111.6892 F4500
+G01 X162.8754 Y110.8615 F4500
+G01 X162.3826 Y110.039 F4500
+G01 X161.8828 Y109.2206 F4500
+G01 X160.9544 Y109.1855 F4500
+G01 X160.7022 Y110.0222 F4500
+G01 X161.0108 Y110.915 F4500
+G01 X161.4493 Y111.7542 F4500
+G01 X161.9501 Y112.5581 F4500
+G01 X162.4922 Y113.3334 F4500
+G01 X163.0687 Y114.0824 F4500
+G01 X163.6813 Y114.8031 F4500
+G01 X164.3436 Y115.4817 F4500
+G01 X165.1387 Y115.9804 F4500
+G01 Z0 F4500
+G00 X166.918 Y117.123 F9000
+G01 Z-3 F4500
+G01 X167.8382 Y116.9334 F4500
+G01 X168.7256 Y116.6082 F4500
+G01 X169.5992 Y116.2474 F4500
+G01 X170.4648 Y115.8676 F4500
+G01 X171.3248 Y115.4754 F4500
+G01 X172.1806 Y115.0741 F4500
+G01 X173.0332 Y114.666 F4500
+G01 X173.5092 Y113.8548 F4500
+G01 X173.0648 Y113.3051 F4500
+G01 X172.1581 Y113.5565 F4500
+G01 X171.2962 Y113.9333 F4500
+G01 X170.4528 Y114.3665 F4500
+G01 X169.6302 Y114.834 F4500
+G01 X168.8332 Y115.3266 F4500
+G01 X168.0608 Y115.8474 F4500
+G01 X167.3183 Y116.416 F4500
+G01 X166.918 Y117.123 F4500
+G01 Z0 F4500
+G00 X167.502 Y113.2246 F9000
+G01 Z-3 F4500
+G01 X168.1733 Y112.8846 F4500
+G01 X168.6572 Y112.25 F4500
+G01 X169.0768 Y111.5703 F4500
+G01 X169.4629 Y110.871 F4500
+G01 X169.4819 Y109.8779 F4500
+G01 X169.4843 Y108.8845 F4500
+G01 X169.4629 Y107.8914 F4500
+G01 X169.4026 Y106.9 F4500
+G01 X169.2571 Y105.9181 F4500
+G01 X168.6732 Y105.464 F4500
+G01 X168.2157 Y106.3369 F4500
+G01 X167.9067 Y107.2817 F4500
+G01 X167.6523 Y108.2803 F4500
+G01 X167.4591 Y109.2196 F4500
+G01 X167.3083 Y110.1491 F4500
+G01 X167.1995 Y111.1261 F4500
+G01 X167.1701 Y112.1904 F4500
+G01 X167.502 Y113.2246 F4500
+G01 Z0 F4500
+G00 X174.0762 Y134.6719 F9000
+G01 Z-3 F4500
+G01 X174.6304 Y134.468 F4500
+G01 X175.0332 Y134.0 F4500
+G01 X174.3674 Y133.3529 F4500
+G01 X173.7656 Y133.8496 F4500
+G01 X174.0762 Y134.6719 F4500
+G01 Z0 F4500
+G00 X175.4082 Y137.3397 F9000
+G01 Z-3 F4500
+G01 X175.9635 Y137.1348 F4500
+G01 X176.3672 Y136.6659 F4500
+G01 X175.7006 Y136.0188 F4500
+G01 X175.0982 Y136.5166 F4500
+G01 X175.4082 Y137.3397 F4500
+G01 Z0 F4500
+G00 X10.0 Y0.0 F9000
+
+
+
+
+G01 Z-0.0 F4500
+G92 Z0
+;;;;;;;;;;;;;;;;;;;;;;;
+G01 Z0 F4500
+G4 S2
+G01 X100 Y-10 F4500
+M106 S255
+G01 Z-3 F500
+G4 S3
+G01 Z20 F250
+G00 Y200 Z200 F9000
+M107
+G00 X0 Y-10 Z0 F9000
+G00 Z-3 F9000
+G01 X100 F4500
+G01 Z0 F4500
+G00 X0 Y0 F9000
+;;;;;;;;;;;;;;;;;;;;;;;;;;;
+G21
+G01 Z0 F4500
+G00 X108.5899 Y28.884 F9000
+G01 Z-3 F4500
+G01 X108.7386 Y28.04038 F4500
+G01 X108.7211 Y27.18865 F4500
+G01 X108.0686 Y27.17708 F4500
+G01 X107.6464 Y27.91433 F4500
+G01 X107.7662 Y28.72195 F4500
+G01 X108.5899 Y28.884 F4500
+G01 Z0 F4500
+G00 X109.9219 Y32.884 F9000
+G01 Z-3 F4500
+G01 X110.0707 Y32.04038 F4500
+G01 X110.0532 Y31.18864 F4500
+G01 X109.4006 Y31.17708 F4500
+G01 X108.9785 Y31.91433 F4500
+G01 X109.0982 Y32.72195 F4500
+G01 X109.9219 Y32.884 F4500
+G01 Z0 F4500
+G00 X111.2559 Y36.884 F9000
+G01 Z-3 F4500
+G01 X111.4046 Y36.04038 F4500
+G01 X111.3872 Y35.18865 F4500
+G01 X110.7346 Y35.17708 F4500
+G01 X110.3124 Y35.91433 F4500
+G01 X110.4322 Y36.72195 F4500
+G01 X111.2559 Y36.884 F4500
+G01 Z0 F4500
+G00 X112.5899 Y40.88788 F9000
+G01 Z-3 F4500
+G01 X112.7386 Y40.04427 F4500
+G01 X112.7211 Y39.19254 F4500
+G01 X112.0686 Y39.18099 F4500
+G01 X111.6464 Y39.91823 F4500
+G01 X111.7662 Y40.72584 F4500
+G01 X112.5899 Y40.88788 F4500
+G01 Z0 F4500
+G00 X113.4082 Y44.00507 F9000
+G01 Z-3 F4500
+G01 X113.9635 Y43.80153 F4500
+G01 X114.3672 Y43.33319 F4500
+G01 X113.701 Y42.68617 F4500
+G01 X113.0982 Y43.18245 F4500
+G01 X113.4082 Y44.00507 F4500
+G01 Z0 F4500
+G00 X115.2559 Y47.55409 F9000
+G01 Z-3 F4500
+G01 X115.4046 Y46.71045 F4500
+G01 X115.3872 Y45.8587 F4500
+G01 X114.7346 Y45.84711 F4500
+G01 X114.3124 Y46.58438 F4500
+G01 X114.4322 Y47.39202 F4500
+G01 X115.2559 Y47.55409 F4500
+G01 Z0 F4500
+G00 X116.0762 Y50.67128 F9000
+G01 Z-3 F4500
+G01 X116.6304 Y50.46744 F4500
+G01 X117.0332 Y49.9994 F4500
+G01 X116.3674 Y49.35232 F4500
+G01 X115.7656 Y49.84896 F4500
+G01 X116.0762 Y50.67128 F4500
+G01 Z0 F4500
+G00 X117.9219 Y54.22225 F9000
+G01 Z-3 F4500
+G01 X118.0707 Y53.37861 F4500
+G01 X118.0532 Y52.52685 F4500
+G01 X117.4006 Y52.51526 F4500
+G01 X116.9785 Y53.25253 F4500
+G01 X117.0982 Y54.06018 F4500
+G01 X117.9219 Y54.22225 F4500
+G01 Z0 F4500
+G00 X118.7422 Y57.3396 F9000
+G01 Z-3 F4500
+G01 X119.2975 Y57.13471 F4500
+G01 X119.7012 Y56.66578 F4500
+G01 X119.0346 Y56.01868 F4500
+G01 X118.4322 Y56.51653 F4500
+G01 X118.7422 Y57.3396 F4500
+G01 Z0 F4500
+G00 X120.0762 Y60.00562 F9000
+G01 Z-3 F4500
+G01 X120.6304 Y59.80178 F4500
+G01 X121.0332 Y59.33374 F4500
+G01 X120.3673 Y58.68674 F4500
+G01 X119.7656 Y59.18334 F4500
+G01 X120.0762 Y60.00562 F4500
+G01 Z0 F4500
+G00 X121.4082 Y62.67164 F9000
+G01 Z-3 F4500
+G01 X121.9635 Y62.46809 F4500
+G01 X122.3672 Y61.99976 F4500
+G01 X121.701 Y61.35265 F4500
+G01 X121.0982 Y61.84896 F4500
+G01 X121.4082 Y62.67164 F4500
+G01 Z0 F4500
+G00 X122.7422 Y65.3396 F9000
+G01 Z-3 F4500
+G01 X123.2975 Y65.13472 F4500
+G01 X123.7012 Y64.66578 F4500
+G01 X123.0346 Y64.01868 F4500
+G01 X122.4322 Y64.51653 F4500
+G01 X122.7422 Y65.3396 F4500
+G01 Z0 F4500
+G00 X124.0762 Y68.00562 F9000
+G01 Z-3 F4500
+G01 X124.6304 Y67.80178 F4500
+G01 X125.0332 Y67.33374 F4500
+G01 X124.3673 Y66.68674 F4500
+G01 X123.7656 Y67.18333 F4500
+G01 X124.0762 Y68.00562 F4500
+G01 Z0 F4500
+G00 X126.7422 Y72.00586 F9000
+G01 Z-3 F4500
+G01 X127.2975 Y71.80231 F4500
+G01 X127.7012 Y71.33398 F4500
+G01 X127.035 Y70.68694 F4500
+G01 X126.4323 Y71.18325 F4500
+G01 X126.7422 Y72.00586 F4500
+G01 Z0 F4500
+G00 X128.0762 Y74.67188 F9000
+G01 Z-3 F4500
+G01 X128.6304 Y74.46804 F4500
+G01 X129.0332 Y74.0 F4500
+G01 X128.3674 Y73.35292 F4500
+G01 X127.7656 Y73.84955 F4500
+G01 X128.0762 Y74.67188 F4500
+G01 Z0 F4500
+G00 X129.4082 Y77.33984 F9000
+G01 Z-3 F4500
+G01 X129.9635 Y77.13495 F4500
+G01 X130.3672 Y76.66602 F4500
+G01 X129.7005 Y76.01893 F4500
+G01 X129.0982 Y76.51675 F4500
+G01 X129.4082 Y77.33984 F4500
+G01 Z0 F4500
+G00 X130.7422 Y80.00586 F9000
+G01 Z-3 F4500
+G01 X131.2975 Y79.80231 F4500
+G01 X131.7012 Y79.33398 F4500
+G01 X131.035 Y78.68694 F4500
+G01 X130.4323 Y79.18325 F4500
+G01 X130.7422 Y80.00586 F4500
+G01 Z0 F4500
+G00 X134.8555 Y86.64632 F9000
+G01 Z-3 F4500
+G01 X135.0169 Y86.16425 F4500
+G01 X134.8302 Y85.43338 F4500
+G01 X134.6073 Y84.7142 F4500
+G01 X134.3672 Y84.0 F4500
+G01 X133.8347 Y83.20844 F4500
+G01 X133.2867 Y82.42764 F4500
+G01 X132.7062 Y81.67078 F4500
+G01 X132.1666 Y81.46962 F4500
+G01 X132.4709 Y82.35683 F4500
+G01 X132.8848 Y83.28363 F4500
+G01 X133.2763 Y84.07885 F4500
+G01 X133.7036 Y84.88652 F4500
+G01 X134.2147 Y85.77 F4500
+G01 X134.8555 Y86.64648 F4500
+G01 Z0 F4500
+G00 X138.7422 Y93.33965 F9000
+G01 Z-3 F4500
+G01 X139.2975 Y93.13476 F4500
+G01 X139.7012 Y92.66582 F4500
+G01 X139.0346 Y92.01873 F4500
+G01 X138.4322 Y92.51658 F4500
+G01 X138.7422 Y93.33965 F4500
+G01 Z0 F4500
+G00 X141.5957 Y97.33184 F9000
+G01 Z-3 F4500
+G01 X141.8489 Y96.77975 F4500
+G01 X141.7012 Y95.99981 F4500
+G01 X141.1099 Y95.32381 F4500
+G01 X140.4647 Y94.70022 F4500
+G01 X140.1493 Y95.0377 F4500
+G01 X140.5226 Y95.86629 F4500
+G01 X140.9656 Y96.6093 F4500
+G01 X141.5957 Y97.33184 F4500
+G01 Z0 F4500
+G00 X144.4238 Y100.4199 F9000
+G01 Z-3 F4500
+G01 X144.1094 Y99.77148 F4500
+G01 X144.3672 Y99.99998 F4500
+G01 X144.4238 Y100.4199 F4500
+G01 Z0 F4500
+G00 X150.3261 Y99.33369 F9000
+G00 X150.3262 Y99.33369 F9000
+G01 Z-3 F4500
+G01 X150.2019 Y98.70639 F4500
+G01 X150.0469 Y98.08566 F4500
+G01 X150.7601 Y98.62938 F4500
+G01 X151.5829 Y98.98518 F4500
+G01 X152.4669 Y99.13699 F4500
+G01 X153.3644 Y99.11568 F4500
+G01 X154.2505 Y98.96859 F4500
+G01 X155.1184 Y98.73559 F4500
+G01 X155.9688 Y98.44503 F4500
+G01 X156.4352 Y98.48993 F4500
+G01 X156.8301 Y98.1423 F4500
+G01 X157.7004 Y97.76474 F4500
+G01 X158.5636 Y97.37106 F4500
+G01 X159.4233 Y96.96991 F4500
+G01 X160.2827 Y96.5681 F4500
+G01 X161.1445 Y96.1716 F4500
+G01 X161.5352 Y96.2067 F4500
+G01 X162.125 Y96.2438 F4500
+G01 X162.8083 Y96.18774 F4500
+G01 X163.4164 Y95.89075 F4500
+G01 X163.627 Y95.25747 F4500
+G01 X164.5141 Y94.93031 F4500
+G01 X165.4112 Y94.63166 F4500
+G01 X166.3191 Y94.36758 F4500
+G01 X167.2378 Y94.14441 F4500
+G01 X168.1667 Y93.96851 F4500
+G01 X169.1042 Y93.84627 F4500
+G01 X170.0475 Y93.7836 F4500
+G01 X170.9929 Y93.78558 F4500
+G01 X171.9356 Y93.85601 F4500
+G01 X172.8704 Y93.99686 F4500
+G01 X173.7918 Y94.20821 F4500
+G01 X174.6947 Y94.48808 F4500
+G01 X175.575 Y94.83288 F4500
+G01 X176.4293 Y95.2378 F4500
+G01 X177.2555 Y95.69732 F4500
+G01 X178.0525 Y96.20573 F4500
+G01 X178.8203 Y96.75747 F4500
+G01 X178.3987 Y95.85492 F4500
+G01 X177.9765 Y94.95264 F4500
+G01 X177.5536 Y94.05067 F4500
+G01 X177.1302 Y93.14896 F4500
+G01 X176.7062 Y92.24752 F4500
+G01 X176.2816 Y91.34636 F4500
+G01 X175.8565 Y90.44546 F4500
+G01 X175.4308 Y89.54483 F4500
+G01 X175.0045 Y88.64445 F4500
+G01 X174.5777 Y87.74435 F4500
+G01 X174.1503 Y86.8445 F4500
+G01 X173.7224 Y85.94491 F4500
+G01 X173.294 Y85.04557 F4500
+G01 X172.865 Y84.14648 F4500
+G01 X172.4355 Y83.24767 F4500
+G01 X172.0055 Y82.3491 F4500
+G01 X171.5749 Y81.45079 F4500
+G01 X171.1438 Y80.55272 F4500
+G01 X170.7122 Y79.65491 F4500
+G01 X170.28 Y78.75735 F4500
+G01 X169.8473 Y77.86004 F4500
+G01 X169.4141 Y76.96299 F4500
+G01 X168.9804 Y76.06618 F4500
+G01 X168.5462 Y75.16962 F4500
+G01 X168.1114 Y74.27334 F4500
+G01 X167.6761 Y73.3773 F4500
+G01 X167.2403 Y72.48151 F4500
+G01 X166.804 Y71.58597 F4500
+G01 X166.3671 Y70.6907 F4500
+G01 X165.9298 Y69.79567 F4500
+G01 X165.4918 Y68.90091 F4500
+G01 X165.0534 Y68.00641 F4500
+G01 X164.6144 Y67.11216 F4500
+G01 X164.1749 Y66.21818 F4500
+G01 X163.7349 Y65.32447 F4500
+G01 X163.2943 Y64.43101 F4500
+G01 X162.8532 Y63.53783 F4500
+G01 X162.4115 Y62.64491 F4500
+G01 X161.9693 Y61.75227 F4500
+G01 X161.5266 Y60.85989 F4500
+G01 X161.0832 Y59.9678 F4500
+G01 X160.6394 Y59.07598 F4500
+G01 X160.1949 Y58.18444 F4500
+G01 X159.7499 Y57.29319 F4500
+G01 X159.3043 Y56.40222 F4500
+G01 X158.8582 Y55.51153 F4500
+G01 X158.4115 Y54.62115 F4500
+G01 X157.9641 Y53.73105 F4500
+G01 X157.5162 Y52.84125 F4500
+G01 X157.0677 Y51.95176 F4500
+G01 X156.6186 Y51.06257 F4500
+G01 X156.1689 Y50.17369 F4500
+G01 X155.7185 Y49.28512 F4500
+G01 X155.2675 Y48.39688 F4500
+G01 X154.8159 Y47.50895 F4500
+G01 X154.3637 Y46.62135 F4500
+G01 X153.9108 Y45.73408 F4500
+G01 X153.4572 Y44.84714 F4500
+G01 X153.003 Y43.96055 F4500
+G01 X152.5481 Y43.0743 F4500
+G01 X152.0925 Y42.1884 F4500
+G01 X151.6363 Y41.30286 F4500
+G01 X151.1793 Y40.41768 F4500
+G01 X150.7216 Y39.53287 F4500
+G01 X150.2632 Y38.64844 F4500
+G01 X149.804 Y37.7644 F4500
+G01 X149.3441 Y36.88073 F4500
+G01 X148.8835 Y35.99747 F4500
+G01 X148.422 Y35.11461 F4500
+G01 X147.9598 Y34.23217 F4500
+G01 X147.4968 Y33.35014 F4500
+G01 X147.0329 Y32.46854 F4500
+G01 X146.5682 Y31.58739 F4500
+G01 X146.1027 Y30.70668 F4500
+G01 X145.6363 Y29.82642 F4500
+G01 X145.169 Y28.94664 F4500
+G01 X144.7009 Y28.06734 F4500
+G01 X144.2318 Y27.18852 F4500
+G01 X143.7617 Y26.31021 F4500
+G01 X143.2678 Y25.47379 F4500
+G01 X142.7083 Y24.6797 F4500
+G01 X142.0849 Y23.93481 F4500
+G01 X141.4004 Y23.2456 F4500
+G01 X140.6592 Y22.6178 F4500
+G01 X139.8667 Y22.05612 F4500
+G01 X139.0292 Y21.56411 F4500
+G01 X138.1533 Y21.1441 F4500
+G01 X137.246 Y20.79733 F4500
+G01 X136.3138 Y20.52416 F4500
+G01 X135.3632 Y20.32422 F4500
+G01 X134.4001 Y20.19669 F4500
+G01 X133.4303 Y20.14049 F4500
+G01 X132.459 Y20.15439 F4500
+G01 X131.4911 Y20.23718 F4500
+G01 X130.5314 Y20.38769 F4500
+G01 X129.5845 Y20.60485 F4500
+G01 X128.6552 Y20.88768 F4500
+G01 X127.748 Y21.23524 F4500
+G01 X126.868 Y21.64659 F4500
+G01 X126.0201 Y22.12068 F4500
+G01 X125.2096 Y22.65623 F4500
+G01 X124.4421 Y23.25161 F4500
+G01 X123.723 Y23.90467 F4500
+G01 X123.0578 Y24.6126 F4500
+G01 X122.4519 Y25.37184 F4500
+G01 X121.91 Y26.178 F4500
+G01 X121.4361 Y27.02594 F4500
+G01 X121.0332 Y27.90982 F4500
+G01 X120.2264 Y27.81272 F4500
+G01 X119.6666 Y28.33318 F4500
+G01 X119.6682 Y29.14669 F4500
+G01 X119.8555 Y29.94302 F4500
+G01 X120.0417 Y30.59263 F4500
+G01 X120.2797 Y31.22264 F4500
+G01 X120.5957 Y31.81997 F4500
+G01 X121.1641 Y32.58169 F4500
+G01 X121.1758 Y32.63639 F4500
+G01 X121.2243 Y33.48891 F4500
+G01 X121.349 Y34.33361 F4500
+G01 X121.5526 Y35.16283 F4500
+G01 X121.8301 Y35.97037 F4500
+G01 X121.9648 Y36.25944 F4500
+G01 X122.2235 Y37.22406 F4500
+G01 X122.4937 Y38.18551 F4500
+G01 X122.7753 Y39.14371 F4500
+G01 X123.0677 Y40.09862 F4500
+G01 X123.3709 Y41.0502 F4500
+G01 X123.6844 Y41.99843 F4500
+G01 X124.0079 Y42.94327 F4500
+G01 X124.3411 Y43.88474 F4500
+G01 X124.6838 Y44.82281 F4500
+G01 X125.0356 Y45.75752 F4500
+G01 X125.3961 Y46.68886 F4500
+G01 X125.7652 Y47.61689 F4500
+G01 X126.1424 Y48.54161 F4500
+G01 X126.5274 Y49.46309 F4500
+G01 X126.9201 Y50.38136 F4500
+G01 X127.32 Y51.29649 F4500
+G01 X127.727 Y52.20854 F4500
+G01 X128.1406 Y53.11757 F4500
+G01 X128.5606 Y54.02366 F4500
+G01 X128.9867 Y54.92689 F4500
+G01 X129.4187 Y55.82735 F4500
+G01 X129.8562 Y56.72511 F4500
+G01 X130.299 Y57.62028 F4500
+G01 X130.7469 Y58.51294 F4500
+G01 X131.1994 Y59.40321 F4500
+G01 X131.6565 Y60.29119 F4500
+G01 X132.1178 Y61.17697 F4500
+G01 X132.5831 Y62.06068 F4500
+G01 X133.052 Y62.94242 F4500
+G01 X133.5245 Y63.82232 F4500
+G01 X134.0001 Y64.70048 F4500
+G01 X134.4787 Y65.57703 F4500
+G01 X134.9601 Y66.4521 F4500
+G01 X135.4439 Y67.3258 F4500
+G01 X135.9299 Y68.19826 F4500
+G01 X136.4179 Y69.06962 F4500
+G01 X136.9077 Y69.93999 F4500
+G01 X137.3989 Y70.80952 F4500
+G01 X137.8914 Y71.67833 F4500
+G01 X138.385 Y72.54657 F4500
+G01 X138.8793 Y73.41436 F4500
+G01 X139.3742 Y74.28184 F4500
+G01 X139.8693 Y75.14915 F4500
+G01 X140.3645 Y76.01643 F4500
+G01 X140.8596 Y76.88383 F4500
+G01 X141.3541 Y77.75148 F4500
+G01 X141.848 Y78.61951 F4500
+G01 X142.341 Y79.48809 F4500
+G01 X142.8327 Y80.35733 F4500
+G01 X143.323 Y81.22741 F4500
+G01 X143.8116 Y82.09846 F4500
+G01 X144.2981 Y82.9706 F4500
+G01 X144.7824 Y83.84404 F4500
+G01 X145.2642 Y84.71885 F4500
+G01 X145.7431 Y85.59523 F4500
+G01 X146.219 Y86.47327 F4500
+G01 X146.6914 Y87.35319 F4500
+G01 X146.7868 Y88.22372 F4500
+G01 X146.8978 Y89.09241 F4500
+G01 X147.0257 Y89.95876 F4500
+G01 X147.1716 Y90.82226 F4500
+G01 X147.3362 Y91.68239 F4500
+G01 X147.5195 Y92.53873 F4500
+G01 X146.8508 Y92.11536 F4500
+G01 X146.4678 Y92.74107 F4500
+G01 X146.9483 Y93.25014 F4500
+G01 X147.5761 Y92.75358 F4500
+G01 X147.8035 Y93.66621 F4500
+G01 X148.0643 Y94.56982 F4500
+G01 X148.3769 Y95.4567 F4500
+G01 X147.997 Y96.2159 F4500
+G01 X147.9939 Y97.07777 F4500
+G01 X148.2669 Y97.89571 F4500
+G01 X148.7904 Y98.58049 F4500
+G01 X149.5058 Y99.06258 F4500
+G01 X150.3261 Y99.33369 F4500
+G01 Z0 F4500
+G00 X154.9785 Y108.3515 F9000
+G01 Z-3 F4500
+G01 X155.6343 Y107.8776 F4500
+G01 X156.1143 Y107.1023 F4500
+G01 X156.5495 Y106.3006 F4500
+G01 X156.9618 Y105.4869 F4500
+G01 X157.3594 Y104.666 F4500
+G01 X157.433 Y103.688 F4500
+G01 X157.4651 Y102.7079 F4500
+G01 X157.3846 Y101.7325 F4500
+G01 X156.7579 Y101.8129 F4500
+G01 X156.3203 Y102.6903 F4500
+G01 X155.9632 Y103.6113 F4500
+G01 X155.6633 Y104.5088 F4500
+G01 X155.3881 Y105.4472 F4500
+G01 X155.1391 Y106.4459 F4500
+G01 X154.9531 Y107.4603 F4500
+G01 X154.9785 Y108.3515 F4500
+G01 Z0 F4500
+G00 X155.1387 Y115.9804 F9000
+G01 Z-3 F4500
+G01 X155.0984 Y115.1041 F4500
+G01 X154.7192 Y114.2236 F4500
+G01 X154.2884 Y113.3669 F4500
+G01 X153.832 Y112.5236 F4500
+G01 X153.3594 Y111.6892 F4500
+G01 X152.8754 Y110.8615 F4500
+G01 X152.3826 Y110.039 F4500
+G01 X151.8828 Y109.2206 F4500
+G01 X150.9544 Y109.1855 F4500
+G01 X150.7022 Y110.0222 F4500
+G01 X151.0108 Y110.915 F4500
+G01 X151.4493 Y111.7542 F4500
+G01 X151.9501 Y112.5581 F4500
+G01 X152.4922 Y113.3334 F4500
+G01 X153.0687 Y114.0824 F4500
+G01 X153.6813 Y114.8031 F4500
+G01 X154.3436 Y115.4817 F4500
+G01 X155.1387 Y115.9804 F4500
+G01 Z0 F4500
+G00 X156.918 Y117.123 F9000
+G01 Z-3 F4500
+G01 X157.8382 Y116.9334 F4500
+G01 X158.7256 Y116.6082 F4500
+G01 X159.5992 Y116.2474 F4500
+G01 X160.4648 Y115.8676 F4500
+G01 X161.3248 Y115.4754 F4500
+G01 X162.1806 Y115.0741 F4500
+G01 X163.0332 Y114.666 F4500
+G01 X163.5092 Y113.8548 F4500
+G01 X163.0648 Y113.3051 F4500
+G01 X162.1581 Y113.5565 F4500
+G01 X161.2962 Y113.9333 F4500
+G01 X160.4528 Y114.3665 F4500
+G01 X159.6302 Y114.834 F4500
+G01 X158.8332 Y115.3266 F4500
+G01 X158.0608 Y115.8474 F4500
+G01 X157.3183 Y116.416 F4500
+G01 X156.918 Y117.123 F4500
+G01 Z0 F4500
+G00 X157.502 Y113.2246 F9000
+G01 Z-3 F4500
+G01 X158.1733 Y112.8846 F4500
+G01 X158.6572 Y112.25 F4500
+G01 X159.0768 Y111.5703 F4500
+G01 X159.4629 Y110.871 F4500
+G01 X159.4819 Y109.8779 F4500
+G01 X159.4843 Y108.8845 F4500
+G01 X159.4629 Y107.8914 F4500
+G01 X159.4026 Y106.9 F4500
+G01 X159.2571 Y105.9181 F4500
+G01 X158.6732 Y105.464 F4500
+G01 X158.2157 Y106.3369 F4500
+G01 X157.9067 Y107.2817 F4500
+G01 X157.6523 Y108.2803 F4500
+G01 X157.4591 Y109.2196 F4500
+G01 X157.3083 Y110.1491 F4500
+G01 X157.1995 Y111.1261 F4500
+G01 X157.1701 Y112.1904 F4500
+G01 X157.502 Y113.2246 F4500
+G01 Z0 F4500
+G00 X164.0762 Y134.6719 F9000
+G01 Z-3 F4500
+G01 X164.6304 Y134.468 F4500
+G01 X165.0332 Y134.0 F4500
+G01 X164.3674 Y133.3529 F4500
+G01 X163.7656 Y133.8496 F4500
+G01 X164.0762 Y134.6719 F4500
+G01 Z0 F4500
+G00 X165.4082 Y137.3397 F9000
+G01 Z-3 F4500
+G01 X165.9635 Y137.1348 F4500
+G01 X166.3672 Y136.6659 F4500
+G01 X165.7006 Y136.0188 F4500
+G01 X165.0982 Y136.5166 F4500
+G01 X165.4082 Y137.3397 F4500
+G01 Z0 F4500
+G00 X0.0 Y0.0 F9000
+
+
+
+G21
+G01 Z0 F4500
+G00 X118.5899 Y28.884 F9000
+G01 Z-3 F4500
+G01 X118.7386 Y28.04038 F4500
+G01 X118.7211 Y27.18865 F4500
+G01 X118.0686 Y27.17708 F4500
+G01 X117.6464 Y27.91433 F4500
+G01 X117.7662 Y28.72195 F4500
+G01 X118.5899 Y28.884 F4500
+G01 Z0 F4500
+G00 X119.9219 Y32.884 F9000
+G01 Z-3 F4500
+G01 X120.0707 Y32.04038 F4500
+G01 X120.0532 Y31.18864 F4500
+G01 X119.4006 Y31.17708 F4500
+G01 X118.9785 Y31.91433 F4500
+G01 X119.0982 Y32.72195 F4500
+G01 X119.9219 Y32.884 F4500
+G01 Z0 F4500
+G00 X121.2559 Y36.884 F9000
+G01 Z-3 F4500
+G01 X121.4046 Y36.04038 F4500
+G01 X121.3872 Y35.18865 F4500
+G01 X120.7346 Y35.17708 F4500
+G01 X120.3124 Y35.91433 F4500
+G01 X120.4322 Y36.72195 F4500
+G01 X121.2559 Y36.884 F4500
+G01 Z0 F4500
+G00 X122.5899 Y40.88788 F9000
+G01 Z-3 F4500
+G01 X122.7386 Y40.04427 F4500
+G01 X122.7211 Y39.19254 F4500
+G01 X122.0686 Y39.18099 F4500
+G01 X121.6464 Y39.91823 F4500
+G01 X121.7662 Y40.72584 F4500
+G01 X122.5899 Y40.88788 F4500
+G01 Z0 F4500
+G00 X123.4082 Y44.00507 F9000
+G01 Z-3 F4500
+G01 X123.9635 Y43.80153 F4500
+G01 X124.3672 Y43.33319 F4500
+G01 X123.701 Y42.68617 F4500
+G01 X123.0982 Y43.18245 F4500
+G01 X123.4082 Y44.00507 F4500
+G01 Z0 F4500
+G00 X125.2559 Y47.55409 F9000
+G01 Z-3 F4500
+G01 X125.4046 Y46.71045 F4500
+G01 X125.3872 Y45.8587 F4500
+G01 X124.7346 Y45.84711 F4500
+G01 X124.3124 Y46.58438 F4500
+G01 X124.4322 Y47.39202 F4500
+G01 X125.2559 Y47.55409 F4500
+G01 Z0 F4500
+G00 X126.0762 Y50.67128 F9000
+G01 Z-3 F4500
+G01 X126.6304 Y50.46744 F4500
+G01 X127.0332 Y49.9994 F4500
+G01 X126.3674 Y49.35232 F4500
+G01 X125.7656 Y49.84896 F4500
+G01 X126.0762 Y50.67128 F4500
+G01 Z0 F4500
+G00 X127.9219 Y54.22225 F9000
+G01 Z-3 F4500
+G01 X128.0707 Y53.37861 F4500
+G01 X128.0532 Y52.52685 F4500
+G01 X127.4006 Y52.51526 F4500
+G01 X126.9785 Y53.25253 F4500
+G01 X127.0982 Y54.06018 F4500
+G01 X127.9219 Y54.22225 F4500
+G01 Z0 F4500
+G00 X128.7422 Y57.3396 F9000
+G01 Z-3 F4500
+G01 X129.2975 Y57.13471 F4500
+G01 X129.7012 Y56.66578 F4500
+G01 X129.0346 Y56.01868 F4500
+G01 X128.4322 Y56.51653 F4500
+G01 X128.7422 Y57.3396 F4500
+G01 Z0 F4500
+G00 X130.0762 Y60.00562 F9000
+G01 Z-3 F4500
+G01 X130.6304 Y59.80178 F4500
+G01 X131.0332 Y59.33374 F4500
+G01 X130.3673 Y58.68674 F4500
+G01 X129.7656 Y59.18334 F4500
+G01 X130.0762 Y60.00562 F4500
+G01 Z0 F4500
+G00 X131.4082 Y62.67164 F9000
+G01 Z-3 F4500
+G01 X131.9635 Y62.46809 F4500
+G01 X132.3672 Y61.99976 F4500
+G01 X131.701 Y61.35265 F4500
+G01 X131.09820000000002 Y61.84896 F4500
+G01 X131.4082 Y62.67164 F4500
+G01 Z0 F4500
+G00 X132.7422 Y65.3396 F9000
+G01 Z-3 F4500
+G01 X133.2975 Y65.13472 F4500
+G01 X133.7012 Y64.66578 F4500
+G01 X133.0346 Y64.01868 F4500
+G01 X132.4322 Y64.51653 F4500
+G01 X132.7422 Y65.3396 F4500
+G01 Z0 F4500
+G00 X134.0762 Y68.00562 F9000
+G01 Z-3 F4500
+G01 X134.6304 Y67.80178 F4500
+G01 X135.0332 Y67.33374 F4500
+G01 X134.3673 Y66.68674 F4500
+G01 X133.7656 Y67.18333 F4500
+G01 X134.0762 Y68.00562 F4500
+G01 Z0 F4500
+G00 X136.7422 Y72.00586 F9000
+G01 Z-3 F4500
+G01 X137.2975 Y71.80231 F4500
+G01 X137.7012 Y71.33398 F4500
+G01 X137.035 Y70.68694 F4500
+G01 X136.4323 Y71.18325 F4500
+G01 X136.7422 Y72.00586 F4500
+G01 Z0 F4500
+G00 X138.0762 Y74.67188 F9000
+G01 Z-3 F4500
+G01 X138.6304 Y74.46804 F4500
+G01 X139.0332 Y74.0 F4500
+G01 X138.3674 Y73.35292 F4500
+G01 X137.7656 Y73.84955 F4500
+G01 X138.0762 Y74.67188 F4500
+G01 Z0 F4500
+G00 X139.4082 Y77.33984 F9000
+G01 Z-3 F4500
+G01 X139.9635 Y77.13495 F4500
+G01 X140.3672 Y76.66602 F4500
+G01 X139.7005 Y76.01893 F4500
+G01 X139.0982 Y76.51675 F4500
+G01 X139.4082 Y77.33984 F4500
+G01 Z0 F4500
+G00 X140.7422 Y80.00586 F9000
+G01 Z-3 F4500
+G01 X141.2975 Y79.80231 F4500
+G01 X141.7012 Y79.33398 F4500
+G01 X141.035 Y78.68694 F4500
+G01 X140.4323 Y79.18325 F4500
+G01 X140.7422 Y80.00586 F4500
+G01 Z0 F4500
+G00 X144.8555 Y86.64632 F9000
+G01 Z-3 F4500
+G01 X145.0169 Y86.16425 F4500
+G01 X144.8302 Y85.43338 F4500
+G01 X144.6073 Y84.7142 F4500
+G01 X144.3672 Y84.0 F4500
+G01 X143.8347 Y83.20844 F4500
+G01 X143.2867 Y82.42764 F4500
+G01 X142.7062 Y81.67078 F4500
+G01 X142.1666 Y81.46962 F4500
+G01 X142.4709 Y82.35683 F4500
+G01 X142.8848 Y83.28363 F4500
+G01 X143.2763 Y84.07885 F4500
+G01 X143.7036 Y84.88652 F4500
+G01 X144.2147 Y85.77 F4500
+G01 X144.8555 Y86.64648 F4500
+G01 Z0 F4500
+G00 X148.7422 Y93.33965 F9000
+G01 Z-3 F4500
+G01 X149.2975 Y93.13476 F4500
+G01 X149.7012 Y92.66582 F4500
+G01 X149.0346 Y92.01873 F4500
+G01 X148.4322 Y92.51658 F4500
+G01 X148.7422 Y93.33965 F4500
+G01 Z0 F4500
+G00 X151.5957 Y97.33184 F9000
+G01 Z-3 F4500
+G01 X151.8489 Y96.77975 F4500
+G01 X151.7012 Y95.99981 F4500
+G01 X151.1099 Y95.32381 F4500
+G01 X150.4647 Y94.70022 F4500
+G01 X150.1493 Y95.0377 F4500
+G01 X150.5226 Y95.86629 F4500
+G01 X150.9656 Y96.6093 F4500
+G01 X151.5957 Y97.33184 F4500
+G01 Z0 F4500
+G00 X154.4238 Y100.4199 F9000
+G01 Z-3 F4500
+G01 X154.1094 Y99.77148 F4500
+G01 X154.3672 Y99.99998 F4500
+G01 X154.4238 Y100.4199 F4500
+G01 Z0 F4500
+G00 X160.3261 Y99.33369 F9000
+G00 X160.3262 Y99.33369 F9000
+G01 Z-3 F4500
+G01 X160.2019 Y98.70639 F4500
+G01 X160.0469 Y98.08566 F4500
+G01 X160.7601 Y98.62938 F4500
+G01 X161.5829 Y98.98518 F4500
+G01 X162.4669 Y99.13699 F4500
+G01 X163.3644 Y99.11568 F4500
+G01 X164.2505 Y98.96859 F4500
+G01 X165.1184 Y98.73559 F4500
+G01 X165.9688 Y98.44503 F4500
+G01 X166.4352 Y98.48993 F4500
+G01 X166.8301 Y98.1423 F4500
+G01 X167.7004 Y97.76474 F4500
+G01 X168.5636 Y97.37106 F4500
+G01 X169.4233 Y96.96991 F4500
+G01 X170.2827 Y96.5681 F4500
+G01 X171.1445 Y96.1716 F4500
+G01 X171.5352 Y96.2067 F4500
+G01 X172.125 Y96.2438 F4500
+G01 X172.8083 Y96.18774 F4500
+G01 X173.4164 Y95.89075 F4500
+G01 X173.627 Y95.25747 F4500
+G01 X174.5141 Y94.93031 F4500
+G01 X175.4112 Y94.63166 F4500
+G01 X176.3191 Y94.36758 F4500
+G01 X177.2378 Y94.14441 F4500
+G01 X178.1667 Y93.96851 F4500
+G01 X179.1042 Y93.84627 F4500
+G01 X180.0475 Y93.7836 F4500
+G01 X180.9929 Y93.78558 F4500
+G01 X181.9356 Y93.85601 F4500
+G01 X182.8704 Y93.99686 F4500
+G01 X183.7918 Y94.20821 F4500
+G01 X184.6947 Y94.48808 F4500
+G01 X185.575 Y94.83288 F4500
+G01 X186.4293 Y95.2378 F4500
+G01 X187.2555 Y95.69732 F4500
+G01 X188.0525 Y96.20573 F4500
+G01 X188.8203 Y96.75747 F4500
+G01 X188.3987 Y95.85492 F4500
+G01 X187.9765 Y94.95264 F4500
+G01 X187.5536 Y94.05067 F4500
+G01 X187.1302 Y93.14896 F4500
+G01 X186.7062 Y92.24752 F4500
+G01 X186.2816 Y91.34636 F4500
+G01 X185.8565 Y90.44546 F4500
+G01 X185.4308 Y89.54483 F4500
+G01 X185.0045 Y88.64445 F4500
+G01 X184.5777 Y87.74435 F4500
+G01 X184.1503 Y86.8445 F4500
+G01 X183.7224 Y85.94491 F4500
+G01 X183.294 Y85.04557 F4500
+G01 X182.865 Y84.14648 F4500
+G01 X182.4355 Y83.24767 F4500
+G01 X182.0055 Y82.3491 F4500
+G01 X181.5749 Y81.45079 F4500
+G01 X181.1438 Y80.55272 F4500
+G01 X180.7122 Y79.65491 F4500
+G01 X180.28 Y78.75735 F4500
+G01 X179.8473 Y77.86004 F4500
+G01 X179.4141 Y76.96299 F4500
+G01 X178.9804 Y76.06618 F4500
+G01 X178.5462 Y75.16962 F4500
+G01 X178.1114 Y74.27334 F4500
+G01 X177.6761 Y73.3773 F4500
+G01 X177.2403 Y72.48151 F4500
+G01 X176.804 Y71.58597 F4500
+G01 X176.3671 Y70.6907 F4500
+G01 X175.9298 Y69.79567 F4500
+G01 X175.4918 Y68.90091 F4500
+G01 X175.0534 Y68.00641 F4500
+G01 X174.6144 Y67.11216 F4500
+G01 X174.1749 Y66.21818 F4500
+G01 X173.7349 Y65.32447 F4500
+G01 X173.2943 Y64.43101 F4500
+G01 X172.8532 Y63.53783 F4500
+G01 X172.4115 Y62.64491 F4500
+G01 X171.9693 Y61.75227 F4500
+G01 X171.5266 Y60.85989 F4500
+G01 X171.0832 Y59.9678 F4500
+G01 X170.6394 Y59.07598 F4500
+G01 X170.1949 Y58.18444 F4500
+G01 X169.7499 Y57.29319 F4500
+G01 X169.3043 Y56.40222 F4500
+G01 X168.8582 Y55.51153 F4500
+G01 X168.4115 Y54.62115 F4500
+G01 X167.9641 Y53.73105 F4500
+G01 X167.5162 Y52.84125 F4500
+G01 X167.0677 Y51.95176 F4500
+G01 X166.6186 Y51.06257 F4500
+G01 X166.1689 Y50.17369 F4500
+G01 X165.7185 Y49.28512 F4500
+G01 X165.2675 Y48.39688 F4500
+G01 X164.8159 Y47.50895 F4500
+G01 X164.3637 Y46.62135 F4500
+G01 X163.9108 Y45.73408 F4500
+G01 X163.4572 Y44.84714 F4500
+G01 X163.003 Y43.96055 F4500
+G01 X162.5481 Y43.0743 F4500
+G01 X162.0925 Y42.1884 F4500
+G01 X161.6363 Y41.30286 F4500
+G01 X161.1793 Y40.41768 F4500
+G01 X160.7216 Y39.53287 F4500
+G01 X160.2632 Y38.64844 F4500
+G01 X159.804 Y37.7644 F4500
+G01 X159.3441 Y36.88073 F4500
+G01 X158.8835 Y35.99747 F4500
+G01 X158.422 Y35.11461 F4500
+G01 X157.9598 Y34.23217 F4500
+G01 X157.4968 Y33.35014 F4500
+G01 X157.0329 Y32.46854 F4500
+G01 X156.5682 Y31.58739 F4500
+G01 X156.1027 Y30.70668 F4500
+G01 X155.6363 Y29.82642 F4500
+G01 X155.169 Y28.94664 F4500
+G01 X154.7009 Y28.06734 F4500
+G01 X154.2318 Y27.18852 F4500
+G01 X153.7617 Y26.31021 F4500
+G01 X153.2678 Y25.47379 F4500
+G01 X152.7083 Y24.6797 F4500
+G01 X152.0849 Y23.93481 F4500
+G01 X151.4004 Y23.2456 F4500
+G01 X150.6592 Y22.6178 F4500
+G01 X149.8667 Y22.05612 F4500
+G01 X149.0292 Y21.56411 F4500
+G01 X148.1533 Y21.1441 F4500
+G01 X147.246 Y20.79733 F4500
+G01 X146.3138 Y20.52416 F4500
+G01 X145.3632 Y20.32422 F4500
+G01 X144.4001 Y20.19669 F4500
+G01 X143.4303 Y20.14049 F4500
+G01 X142.459 Y20.15439 F4500
+G01 X141.4911 Y20.23718 F4500
+G01 X140.5314 Y20.38769 F4500
+G01 X139.5845 Y20.60485 F4500
+G01 X138.6552 Y20.88768 F4500
+G01 X137.748 Y21.23524 F4500
+G01 X136.868 Y21.64659 F4500
+G01 X136.0201 Y22.12068 F4500
+G01 X135.2096 Y22.65623 F4500
+G01 X134.44209999999998 Y23.25161 F4500
+G01 X133.723 Y23.90467 F4500
+G01 X133.0578 Y24.6126 F4500
+G01 X132.4519 Y25.37184 F4500
+G01 X131.91 Y26.178 F4500
+G01 X131.4361 Y27.02594 F4500
+G01 X131.0332 Y27.90982 F4500
+G01 X130.2264 Y27.81272 F4500
+G01 X129.66660000000002 Y28.33318 F4500
+G01 X129.6682 Y29.14669 F4500
+G01 X129.8555 Y29.94302 F4500
+G01 X130.0417 Y30.59263 F4500
+G01 X130.2797 Y31.22264 F4500
+G01 X130.5957 Y31.81997 F4500
+G01 X131.16410000000002 Y32.58169 F4500
+G01 X131.17579999999998 Y32.63639 F4500
+G01 X131.2243 Y33.48891 F4500
+G01 X131.349 Y34.33361 F4500
+G01 X131.55259999999998 Y35.16283 F4500
+G01 X131.83010000000002 Y35.97037 F4500
+G01 X131.9648 Y36.25944 F4500
+G01 X132.2235 Y37.22406 F4500
+G01 X132.4937 Y38.18551 F4500
+G01 X132.77530000000002 Y39.14371 F4500
+G01 X133.0677 Y40.09862 F4500
+G01 X133.3709 Y41.0502 F4500
+G01 X133.68439999999998 Y41.99843 F4500
+G01 X134.0079 Y42.94327 F4500
+G01 X134.34109999999998 Y43.88474 F4500
+G01 X134.68380000000002 Y44.82281 F4500
+G01 X135.0356 Y45.75752 F4500
+G01 X135.3961 Y46.68886 F4500
+G01 X135.7652 Y47.61689 F4500
+G01 X136.1424 Y48.54161 F4500
+G01 X136.5274 Y49.46309 F4500
+G01 X136.9201 Y50.38136 F4500
+G01 X137.32 Y51.29649 F4500
+G01 X137.727 Y52.20854 F4500
+G01 X138.1406 Y53.11757 F4500
+G01 X138.5606 Y54.02366 F4500
+G01 X138.9867 Y54.92689 F4500
+G01 X139.4187 Y55.82735 F4500
+G01 X139.8562 Y56.72511 F4500
+G01 X140.299 Y57.62028 F4500
+G01 X140.7469 Y58.51294 F4500
+G01 X141.1994 Y59.40321 F4500
+G01 X141.6565 Y60.29119 F4500
+G01 X142.1178 Y61.17697 F4500
+G01 X142.5831 Y62.06068 F4500
+G01 X143.052 Y62.94242 F4500
+G01 X143.5245 Y63.82232 F4500
+G01 X144.0001 Y64.70048 F4500
+G01 X144.4787 Y65.57703 F4500
+G01 X144.9601 Y66.4521 F4500
+G01 X145.4439 Y67.3258 F4500
+G01 X145.9299 Y68.19826 F4500
+G01 X146.4179 Y69.06962 F4500
+G01 X146.9077 Y69.93999 F4500
+G01 X147.3989 Y70.80952 F4500
+G01 X147.8914 Y71.67833 F4500
+G01 X148.385 Y72.54657 F4500
+G01 X148.8793 Y73.41436 F4500
+G01 X149.3742 Y74.28184 F4500
+G01 X149.8693 Y75.14915 F4500
+G01 X150.3645 Y76.01643 F4500
+G01 X150.8596 Y76.88383 F4500
+G01 X151.3541 Y77.75148 F4500
+G01 X151.848 Y78.61951 F4500
+G01 X152.341 Y79.48809 F4500
+G01 X152.8327 Y80.35733 F4500
+G01 X153.323 Y81.22741 F4500
+G01 X153.8116 Y82.09846 F4500
+G01 X154.2981 Y82.9706 F4500
+G01 X154.7824 Y83.84404 F4500
+G01 X155.2642 Y84.71885 F4500
+G01 X155.7431 Y85.59523 F4500
+G01 X156.219 Y86.47327 F4500
+G01 X156.6914 Y87.35319 F4500
+G01 X156.7868 Y88.22372 F4500
+G01 X156.8978 Y89.09241 F4500
+G01 X157.0257 Y89.95876 F4500
+G01 X157.1716 Y90.82226 F4500
+G01 X157.3362 Y91.68239 F4500
+G01 X157.5195 Y92.53873 F4500
+G01 X156.8508 Y92.11536 F4500
+G01 X156.4678 Y92.74107 F4500
+G01 X156.9483 Y93.25014 F4500
+G01 X157.5761 Y92.75358 F4500
+G01 X157.8035 Y93.66621 F4500
+G01 X158.0643 Y94.56982 F4500
+G01 X158.3769 Y95.4567 F4500
+G01 X157.997 Y96.2159 F4500
+G01 X157.9939 Y97.07777 F4500
+G01 X158.2669 Y97.89571 F4500
+G01 X158.7904 Y98.58049 F4500
+G01 X159.5058 Y99.06258 F4500
+G01 X160.3261 Y99.33369 F4500
+G01 Z0 F4500
+G00 X164.9785 Y108.3515 F9000
+G01 Z-3 F4500
+G01 X165.6343 Y107.8776 F4500
+G01 X166.1143 Y107.1023 F4500
+G01 X166.5495 Y106.3006 F4500
+G01 X166.9618 Y105.4869 F4500
+G01 X167.3594 Y104.666 F4500
+G01 X167.433 Y103.688 F4500
+G01 X167.4651 Y102.7079 F4500
+G01 X167.3846 Y101.7325 F4500
+G01 X166.7579 Y101.8129 F4500
+G01 X166.3203 Y102.6903 F4500
+G01 X165.9632 Y103.6113 F4500
+G01 X165.6633 Y104.5088 F4500
+G01 X165.3881 Y105.4472 F4500
+G01 X165.1391 Y106.4459 F4500
+G01 X164.9531 Y107.4603 F4500
+G01 X164.9785 Y108.3515 F4500
+G01 Z0 F4500
+G00 X165.1387 Y115.9804 F9000
+G01 Z-3 F4500
+G01 X165.0984 Y115.1041 F4500
+G01 X164.7192 Y114.2236 F4500
+G01 X164.2884 Y113.3669 F4500
+G01 X163.832 Y112.5236 F4500
+G01 X163.3594 Y111.6892 F4500
+G01 X162.8754 Y110.8615 F4500
+G01 X162.3826 Y110.039 F4500
+G01 X161.8828 Y109.2206 F4500
+G01 X160.9544 Y109.1855 F4500
+G01 X160.7022 Y110.0222 F4500
+G01 X161.0108 Y110.915 F4500
+G01 X161.4493 Y111.7542 F4500
+G01 X161.9501 Y112.5581 F4500
+G01 X162.4922 Y113.3334 F4500
+G01 X163.0687 Y114.0824 F4500
+G01 X163.6813 Y114.8031 F4500
+G01 X164.3436 Y115.4817 F4500
+G01 X165.1387 Y115.9804 F4500
+G01 Z0 F4500
+G00 X166.918 Y117.123 F9000
+G01 Z-3 F4500
+G01 X167.8382 Y116.9334 F4500
+G01 X168.7256 Y116.6082 F4500
+G01 X169.5992 Y116.2474 F4500
+G01 X170.4648 Y115.8676 F4500
+G01 X171.3248 Y115.4754 F4500
+G01 X172.1806 Y115.0741 F4500
+G01 X173.0332 Y114.666 F4500
+G01 X173.5092 Y113.8548 F4500
+G01 X173.0648 Y113.3051 F4500
+G01 X172.1581 Y113.5565 F4500
+G01 X171.2962 Y113.9333 F4500
+G01 X170.4528 Y114.3665 F4500
+G01 X169.6302 Y114.834 F4500
+G01 X168.8332 Y115.3266 F4500
+G01 X168.0608 Y115.8474 F4500
+G01 X167.3183 Y116.416 F4500
+G01 X166.918 Y117.123 F4500
+G01 Z0 F4500
+G00 X167.502 Y113.2246 F9000
+G01 Z-3 F4500
+G01 X168.1733 Y112.8846 F4500
+G01 X168.6572 Y112.25 F4500
+G01 X169.0768 Y111.5703 F4500
+G01 X169.4629 Y110.871 F4500
+G01 X169.4819 Y109.8779 F4500
+G01 X169.4843 Y108.8845 F4500
+G01 X169.4629 Y107.8914 F4500
+G01 X169.4026 Y106.9 F4500
+G01 X169.2571 Y105.9181 F4500
+G01 X168.6732 Y105.464 F4500
+G01 X168.2157 Y106.3369 F4500
+G01 X167.9067 Y107.2817 F4500
+G01 X167.6523 Y108.2803 F4500
+G01 X167.4591 Y109.2196 F4500
+G01 X167.3083 Y110.1491 F4500
+G01 X167.1995 Y111.1261 F4500
+G01 X167.1701 Y112.1904 F4500
+G01 X167.502 Y113.2246 F4500
+G01 Z0 F4500
+G00 X174.0762 Y134.6719 F9000
+G01 Z-3 F4500
+G01 X174.6304 Y134.468 F4500
+G01 X175.0332 Y134.0 F4500
+G01 X174.3674 Y133.3529 F4500
+G01 X173.7656 Y133.8496 F4500
+G01 X174.0762 Y134.6719 F4500
+G01 Z0 F4500
+G00 X175.4082 Y137.3397 F9000
+G01 Z-3 F4500
+G01 X175.9635 Y137.1348 F4500
+G01 X176.3672 Y136.6659 F4500
+G01 X175.7006 Y136.0188 F4500
+G01 X175.0982 Y136.5166 F4500
+G01 X175.4082 Y137.3397 F4500
+G01 Z0 F4500
+G00 X10.0 Y0.0 F9000
+
+
+
+
+G01 Z-0.086 F4500
+G92 Z0
+;;;;;;;;;;;;;;;;;;;;;;;
+G01 Z0 F4500
+G4 S2
+G01 X100 Y-10 F4500
+M106 S255
+G01 Z-3 F500
+G4 S3
+G01 Z20 F250
+G00 Y200 Z200 F9000
+M107
+G00 X0 Y-10 Z0 F9000
+G00 Z-3 F9000
+G01 X100 F4500
+G01 Z0 F4500
+G00 X0 Y0 F9000
+;;;;;;;;;;;;;;;;;;;;;;;;;;;
+G21
+G01 Z0 F4500
+G00 X108.5899 Y28.884 F9000
+G01 Z-3 F4500
+G01 X108.7386 Y28.04038 F4500
+G01 X108.7211 Y27.18865 F4500
+G01 X108.0686 Y27.17708 F4500
+G01 X107.6464 Y27.91433 F4500
+G01 X107.7662 Y28.72195 F4500
+G01 X108.5899 Y28.884 F4500
+G01 Z0 F4500
+G00 X109.9219 Y32.884 F9000
+G01 Z-3 F4500
+G01 X110.0707 Y32.04038 F4500
+G01 X110.0532 Y31.18864 F4500
+G01 X109.4006 Y31.17708 F4500
+G01 X108.9785 Y31.91433 F4500
+G01 X109.0982 Y32.72195 F4500
+G01 X109.9219 Y32.884 F4500
+G01 Z0 F4500
+G00 X111.2559 Y36.884 F9000
+G01 Z-3 F4500
+G01 X111.4046 Y36.04038 F4500
+G01 X111.3872 Y35.18865 F4500
+G01 X110.7346 Y35.17708 F4500
+G01 X110.3124 Y35.91433 F4500
+G01 X110.4322 Y36.72195 F4500
+G01 X111.2559 Y36.884 F4500
+G01 Z0 F4500
+G00 X112.5899 Y40.88788 F9000
+G01 Z-3 F4500
+G01 X112.7386 Y40.04427 F4500
+G01 X112.7211 Y39.19254 F4500
+G01 X112.0686 Y39.18099 F4500
+G01 X111.6464 Y39.91823 F4500
+G01 X111.7662 Y40.72584 F4500
+G01 X112.5899 Y40.88788 F4500
+G01 Z0 F4500
+G00 X113.4082 Y44.00507 F9000
+G01 Z-3 F4500
+G01 X113.9635 Y43.80153 F4500
+G01 X114.3672 Y43.33319 F4500
+G01 X113.701 Y42.68617 F4500
+G01 X113.0982 Y43.18245 F4500
+G01 X113.4082 Y44.00507 F4500
+G01 Z0 F4500
+G00 X115.2559 Y47.55409 F9000
+G01 Z-3 F4500
+G01 X115.4046 Y46.71045 F4500
+G01 X115.3872 Y45.8587 F4500
+G01 X114.7346 Y45.84711 F4500
+G01 X114.3124 Y46.58438 F4500
+G01 X114.4322 Y47.39202 F4500
+G01 X115.2559 Y47.55409 F4500
+G01 Z0 F4500
+G00 X116.0762 Y50.67128 F9000
+G01 Z-3 F4500
+G01 X116.6304 Y50.46744 F4500
+G01 X117.0332 Y49.9994 F4500
+G01 X116.3674 Y49.35232 F4500
+G01 X115.7656 Y49.84896 F4500
+G01 X116.0762 Y50.67128 F4500
+G01 Z0 F4500
+G00 X117.9219 Y54.22225 F9000
+G01 Z-3 F4500
+G01 X118.0707 Y53.37861 F4500
+G01 X118.0532 Y52.52685 F4500
+G01 X117.4006 Y52.51526 F4500
+G01 X116.9785 Y53.25253 F4500
+G01 X117.0982 Y54.06018 F4500
+G01 X117.9219 Y54.22225 F4500
+G01 Z0 F4500
+G00 X118.7422 Y57.3396 F9000
+G01 Z-3 F4500
+G01 X119.2975 Y57.13471 F4500
+G01 X119.7012 Y56.66578 F4500
+G01 X119.0346 Y56.01868 F4500
+G01 X118.4322 Y56.51653 F4500
+G01 X118.7422 Y57.3396 F4500
+G01 Z0 F4500
+G00 X120.0762 Y60.00562 F9000
+G01 Z-3 F4500
+G01 X120.6304 Y59.80178 F4500
+G01 X121.0332 Y59.33374 F4500
+G01 X120.3673 Y58.68674 F4500
+G01 X119.7656 Y59.18334 F4500
+G01 X120.0762 Y60.00562 F4500
+G01 Z0 F4500
+G00 X121.4082 Y62.67164 F9000
+G01 Z-3 F4500
+G01 X121.9635 Y62.46809 F4500
+G01 X122.3672 Y61.99976 F4500
+G01 X121.701 Y61.35265 F4500
+G01 X121.0982 Y61.84896 F4500
+G01 X121.4082 Y62.67164 F4500
+G01 Z0 F4500
+G00 X122.7422 Y65.3396 F9000
+G01 Z-3 F4500
+G01 X123.2975 Y65.13472 F4500
+G01 X123.7012 Y64.66578 F4500
+G01 X123.0346 Y64.01868 F4500
+G01 X122.4322 Y64.51653 F4500
+G01 X122.7422 Y65.3396 F4500
+G01 Z0 F4500
+G00 X124.0762 Y68.00562 F9000
+G01 Z-3 F4500
+G01 X124.6304 Y67.80178 F4500
+G01 X125.0332 Y67.33374 F4500
+G01 X124.3673 Y66.68674 F4500
+G01 X123.7656 Y67.18333 F4500
+G01 X124.0762 Y68.00562 F4500
+G01 Z0 F4500
+G00 X126.7422 Y72.00586 F9000
+G01 Z-3 F4500
+G01 X127.2975 Y71.80231 F4500
+G01 X127.7012 Y71.33398 F4500
+G01 X127.035 Y70.68694 F4500
+G01 X126.4323 Y71.18325 F4500
+G01 X126.7422 Y72.00586 F4500
+G01 Z0 F4500
+G00 X128.0762 Y74.67188 F9000
+G01 Z-3 F4500
+G01 X128.6304 Y74.46804 F4500
+G01 X129.0332 Y74.0 F4500
+G01 X128.3674 Y73.35292 F4500
+G01 X127.7656 Y73.84955 F4500
+G01 X128.0762 Y74.67188 F4500
+G01 Z0 F4500
+G00 X129.4082 Y77.33984 F9000
+G01 Z-3 F4500
+G01 X129.9635 Y77.13495 F4500
+G01 X130.3672 Y76.66602 F4500
+G01 X129.7005 Y76.01893 F4500
+G01 X129.0982 Y76.51675 F4500
+G01 X129.4082 Y77.33984 F4500
+G01 Z0 F4500
+G00 X130.7422 Y80.00586 F9000
+G01 Z-3 F4500
+G01 X131.2975 Y79.80231 F4500
+G01 X131.7012 Y79.33398 F4500
+G01 X131.035 Y78.68694 F4500
+G01 X130.4323 Y79.18325 F4500
+G01 X130.7422 Y80.00586 F4500
+G01 Z0 F4500
+G00 X134.8555 Y86.64632 F9000
+G01 Z-3 F4500
+G01 X135.0169 Y86.16425 F4500
+G01 X134.8302 Y85.43338 F4500
+G01 X134.6073 Y84.7142 F4500
+G01 X134.3672 Y84.0 F4500
+G01 X133.8347 Y83.20844 F4500
+G01 X133.2867 Y82.42764 F4500
+G01 X132.7062 Y81.67078 F4500
+G01 X132.1666 Y81.46962 F4500
+G01 X132.4709 Y82.35683 F4500
+G01 X132.8848 Y83.28363 F4500
+G01 X133.2763 Y84.07885 F4500
+G01 X133.7036 Y84.88652 F4500
+G01 X134.2147 Y85.77 F4500
+G01 X134.8555 Y86.64648 F4500
+G01 Z0 F4500
+G00 X138.7422 Y93.33965 F9000
+G01 Z-3 F4500
+G01 X139.2975 Y93.13476 F4500
+G01 X139.7012 Y92.66582 F4500
+G01 X139.0346 Y92.01873 F4500
+G01 X138.4322 Y92.51658 F4500
+G01 X138.7422 Y93.33965 F4500
+G01 Z0 F4500
+G00 X141.5957 Y97.33184 F9000
+G01 Z-3 F4500
+G01 X141.8489 Y96.77975 F4500
+G01 X141.7012 Y95.99981 F4500
+G01 X141.1099 Y95.32381 F4500
+G01 X140.4647 Y94.70022 F4500
+G01 X140.1493 Y95.0377 F4500
+G01 X140.5226 Y95.86629 F4500
+G01 X140.9656 Y96.6093 F4500
+G01 X141.5957 Y97.33184 F4500
+G01 Z0 F4500
+G00 X144.4238 Y100.4199 F9000
+G01 Z-3 F4500
+G01 X144.1094 Y99.77148 F4500
+G01 X144.3672 Y99.99998 F4500
+G01 X144.4238 Y100.4199 F4500
+G01 Z0 F4500
+G00 X150.3261 Y99.33369 F9000
+G00 X150.3262 Y99.33369 F9000
+G01 Z-3 F4500
+G01 X150.2019 Y98.70639 F4500
+G01 X150.0469 Y98.08566 F4500
+G01 X150.7601 Y98.62938 F4500
+G01 X151.5829 Y98.98518 F4500
+G01 X152.4669 Y99.13699 F4500
+G01 X153.3644 Y99.11568 F4500
+G01 X154.2505 Y98.96859 F4500
+G01 X155.1184 Y98.73559 F4500
+G01 X155.9688 Y98.44503 F4500
+G01 X156.4352 Y98.48993 F4500
+G01 X156.8301 Y98.1423 F4500
+G01 X157.7004 Y97.76474 F4500
+G01 X158.5636 Y97.37106 F4500
+G01 X159.4233 Y96.96991 F4500
+G01 X160.2827 Y96.5681 F4500
+G01 X161.1445 Y96.1716 F4500
+G01 X161.5352 Y96.2067 F4500
+G01 X162.125 Y96.2438 F4500
+G01 X162.8083 Y96.18774 F4500
+G01 X163.4164 Y95.89075 F4500
+G01 X163.627 Y95.25747 F4500
+G01 X164.5141 Y94.93031 F4500
+G01 X165.4112 Y94.63166 F4500
+G01 X166.3191 Y94.36758 F4500
+G01 X167.2378 Y94.14441 F4500
+G01 X168.1667 Y93.96851 F4500
+G01 X169.1042 Y93.84627 F4500
+G01 X170.0475 Y93.7836 F4500
+G01 X170.9929 Y93.78558 F4500
+G01 X171.9356 Y93.85601 F4500
+G01 X172.8704 Y93.99686 F4500
+G01 X173.7918 Y94.20821 F4500
+G01 X174.6947 Y94.48808 F4500
+G01 X175.575 Y94.83288 F4500
+G01 X176.4293 Y95.2378 F4500
+G01 X177.2555 Y95.69732 F4500
+G01 X178.0525 Y96.20573 F4500
+G01 X178.8203 Y96.75747 F4500
+G01 X178.3987 Y95.85492 F4500
+G01 X177.9765 Y94.95264 F4500
+G01 X177.5536 Y94.05067 F4500
+G01 X177.1302 Y93.14896 F4500
+G01 X176.7062 Y92.24752 F4500
+G01 X176.2816 Y91.34636 F4500
+G01 X175.8565 Y90.44546 F4500
+G01 X175.4308 Y89.54483 F4500
+G01 X175.0045 Y88.64445 F4500
+G01 X174.5777 Y87.74435 F4500
+G01 X174.1503 Y86.8445 F4500
+G01 X173.7224 Y85.94491 F4500
+G01 X173.294 Y85.04557 F4500
+G01 X172.865 Y84.14648 F4500
+G01 X172.4355 Y83.24767 F4500
+G01 X172.0055 Y82.3491 F4500
+G01 X171.5749 Y81.45079 F4500
+G01 X171.1438 Y80.55272 F4500
+G01 X170.7122 Y79.65491 F4500
+G01 X170.28 Y78.75735 F4500
+G01 X169.8473 Y77.86004 F4500
+G01 X169.4141 Y76.96299 F4500
+G01 X168.9804 Y76.06618 F4500
+G01 X168.5462 Y75.16962 F4500
+G01 X168.1114 Y74.27334 F4500
+G01 X167.6761 Y73.3773 F4500
+G01 X167.2403 Y72.48151 F4500
+G01 X166.804 Y71.58597 F4500
+G01 X166.3671 Y70.6907 F4500
+G01 X165.9298 Y69.79567 F4500
+G01 X165.4918 Y68.90091 F4500
+G01 X165.0534 Y68.00641 F4500
+G01 X164.6144 Y67.11216 F4500
+G01 X164.1749 Y66.21818 F4500
+G01 X163.7349 Y65.32447 F4500
+G01 X163.2943 Y64.43101 F4500
+G01 X162.8532 Y63.53783 F4500
+G01 X162.4115 Y62.64491 F4500
+G01 X161.9693 Y61.75227 F4500
+G01 X161.5266 Y60.85989 F4500
+G01 X161.0832 Y59.9678 F4500
+G01 X160.6394 Y59.07598 F4500
+G01 X160.1949 Y58.18444 F4500
+G01 X159.7499 Y57.29319 F4500
+G01 X159.3043 Y56.40222 F4500
+G01 X158.8582 Y55.51153 F4500
+G01 X158.4115 Y54.62115 F4500
+G01 X157.9641 Y53.73105 F4500
+G01 X157.5162 Y52.84125 F4500
+G01 X157.0677 Y51.95176 F4500
+G01 X156.6186 Y51.06257 F4500
+G01 X156.1689 Y50.17369 F4500
+G01 X155.7185 Y49.28512 F4500
+G01 X155.2675 Y48.39688 F4500
+G01 X154.8159 Y47.50895 F4500
+G01 X154.3637 Y46.62135 F4500
+G01 X153.9108 Y45.73408 F4500
+G01 X153.4572 Y44.84714 F4500
+G01 X153.003 Y43.96055 F4500
+G01 X152.5481 Y43.0743 F4500
+G01 X152.0925 Y42.1884 F4500
+G01 X151.6363 Y41.30286 F4500
+G01 X151.1793 Y40.41768 F4500
+G01 X150.7216 Y39.53287 F4500
+G01 X150.2632 Y38.64844 F4500
+G01 X149.804 Y37.7644 F4500
+G01 X149.3441 Y36.88073 F4500
+G01 X148.8835 Y35.99747 F4500
+G01 X148.422 Y35.11461 F4500
+G01 X147.9598 Y34.23217 F4500
+G01 X147.4968 Y33.35014 F4500
+G01 X147.0329 Y32.46854 F4500
+G01 X146.5682 Y31.58739 F4500
+G01 X146.1027 Y30.70668 F4500
+G01 X145.6363 Y29.82642 F4500
+G01 X145.169 Y28.94664 F4500
+G01 X144.7009 Y28.06734 F4500
+G01 X144.2318 Y27.18852 F4500
+G01 X143.7617 Y26.31021 F4500
+G01 X143.2678 Y25.47379 F4500
+G01 X142.7083 Y24.6797 F4500
+G01 X142.0849 Y23.93481 F4500
+G01 X141.4004 Y23.2456 F4500
+G01 X140.6592 Y22.6178 F4500
+G01 X139.8667 Y22.05612 F4500
+G01 X139.0292 Y21.56411 F4500
+G01 X138.1533 Y21.1441 F4500
+G01 X137.246 Y20.79733 F4500
+G01 X136.3138 Y20.52416 F4500
+G01 X135.3632 Y20.32422 F4500
+G01 X134.4001 Y20.19669 F4500
+G01 X133.4303 Y20.14049 F4500
+G01 X132.459 Y20.15439 F4500
+G01 X131.4911 Y20.23718 F4500
+G01 X130.5314 Y20.38769 F4500
+G01 X129.5845 Y20.60485 F4500
+G01 X128.6552 Y20.88768 F4500
+G01 X127.748 Y21.23524 F4500
+G01 X126.868 Y21.64659 F4500
+G01 X126.0201 Y22.12068 F4500
+G01 X125.2096 Y22.65623 F4500
+G01 X124.4421 Y23.25161 F4500
+G01 X123.723 Y23.90467 F4500
+G01 X123.0578 Y24.6126 F4500
+G01 X122.4519 Y25.37184 F4500
+G01 X121.91 Y26.178 F4500
+G01 X121.4361 Y27.02594 F4500
+G01 X121.0332 Y27.90982 F4500
+G01 X120.2264 Y27.81272 F4500
+G01 X119.6666 Y28.33318 F4500
+G01 X119.6682 Y29.14669 F4500
+G01 X119.8555 Y29.94302 F4500
+G01 X120.0417 Y30.59263 F4500
+G01 X120.2797 Y31.22264 F4500
+G01 X120.5957 Y31.81997 F4500
+G01 X121.1641 Y32.58169 F4500
+G01 X121.1758 Y32.63639 F4500
+G01 X121.2243 Y33.48891 F4500
+G01 X121.349 Y34.33361 F4500
+G01 X121.5526 Y35.16283 F4500
+G01 X121.8301 Y35.97037 F4500
+G01 X121.9648 Y36.25944 F4500
+G01 X122.2235 Y37.22406 F4500
+G01 X122.4937 Y38.18551 F4500
+G01 X122.7753 Y39.14371 F4500
+G01 X123.0677 Y40.09862 F4500
+G01 X123.3709 Y41.0502 F4500
+G01 X123.6844 Y41.99843 F4500
+G01 X124.0079 Y42.94327 F4500
+G01 X124.3411 Y43.88474 F4500
+G01 X124.6838 Y44.82281 F4500
+G01 X125.0356 Y45.75752 F4500
+G01 X125.3961 Y46.68886 F4500
+G01 X125.7652 Y47.61689 F4500
+G01 X126.1424 Y48.54161 F4500
+G01 X126.5274 Y49.46309 F4500
+G01 X126.9201 Y50.38136 F4500
+G01 X127.32 Y51.29649 F4500
+G01 X127.727 Y52.20854 F4500
+G01 X128.1406 Y53.11757 F4500
+G01 X128.5606 Y54.02366 F4500
+G01 X128.9867 Y54.92689 F4500
+G01 X129.4187 Y55.82735 F4500
+G01 X129.8562 Y56.72511 F4500
+G01 X130.299 Y57.62028 F4500
+G01 X130.7469 Y58.51294 F4500
+G01 X131.1994 Y59.40321 F4500
+G01 X131.6565 Y60.29119 F4500
+G01 X132.1178 Y61.17697 F4500
+G01 X132.5831 Y62.06068 F4500
+G01 X133.052 Y62.94242 F4500
+G01 X133.5245 Y63.82232 F4500
+G01 X134.0001 Y64.70048 F4500
+G01 X134.4787 Y65.57703 F4500
+G01 X134.9601 Y66.4521 F4500
+G01 X135.4439 Y67.3258 F4500
+G01 X135.9299 Y68.19826 F4500
+G01 X136.4179 Y69.06962 F4500
+G01 X136.9077 Y69.93999 F4500
+G01 X137.3989 Y70.80952 F4500
+G01 X137.8914 Y71.67833 F4500
+G01 X138.385 Y72.54657 F4500
+G01 X138.8793 Y73.41436 F4500
+G01 X139.3742 Y74.28184 F4500
+G01 X139.8693 Y75.14915 F4500
+G01 X140.3645 Y76.01643 F4500
+G01 X140.8596 Y76.88383 F4500
+G01 X141.3541 Y77.75148 F4500
+G01 X141.848 Y78.61951 F4500
+G01 X142.341 Y79.48809 F4500
+G01 X142.8327 Y80.35733 F4500
+G01 X143.323 Y81.22741 F4500
+G01 X143.8116 Y82.09846 F4500
+G01 X144.2981 Y82.9706 F4500
+G01 X144.7824 Y83.84404 F4500
+G01 X145.2642 Y84.71885 F4500
+G01 X145.7431 Y85.59523 F4500
+G01 X146.219 Y86.47327 F4500
+G01 X146.6914 Y87.35319 F4500
+G01 X146.7868 Y88.22372 F4500
+G01 X146.8978 Y89.09241 F4500
+G01 X147.0257 Y89.95876 F4500
+G01 X147.1716 Y90.82226 F4500
+G01 X147.3362 Y91.68239 F4500
+G01 X147.5195 Y92.53873 F4500
+G01 X146.8508 Y92.11536 F4500
+G01 X146.4678 Y92.74107 F4500
+G01 X146.9483 Y93.25014 F4500
+G01 X147.5761 Y92.75358 F4500
+G01 X147.8035 Y93.66621 F4500
+G01 X148.0643 Y94.56982 F4500
+G01 X148.3769 Y95.4567 F4500
+G01 X147.997 Y96.2159 F4500
+G01 X147.9939 Y97.07777 F4500
+G01 X148.2669 Y97.89571 F4500
+G01 X148.7904 Y98.58049 F4500
+G01 X149.5058 Y99.06258 F4500
+G01 X150.3261 Y99.33369 F4500
+G01 Z0 F4500
+G00 X154.9785 Y108.3515 F9000
+G01 Z-3 F4500
+G01 X155.6343 Y107.8776 F4500
+G01 X156.1143 Y107.1023 F4500
+G01 X156.5495 Y106.3006 F4500
+G01 X156.9618 Y105.4869 F4500
+G01 X157.3594 Y104.666 F4500
+G01 X157.433 Y103.688 F4500
+G01 X157.4651 Y102.7079 F4500
+G01 X157.3846 Y101.7325 F4500
+G01 X156.7579 Y101.8129 F4500
+G01 X156.3203 Y102.6903 F4500
+G01 X155.9632 Y103.6113 F4500
+G01 X155.6633 Y104.5088 F4500
+G01 X155.3881 Y105.4472 F4500
+G01 X155.1391 Y106.4459 F4500
+G01 X154.9531 Y107.4603 F4500
+G01 X154.9785 Y108.3515 F4500
+G01 Z0 F4500
+G00 X155.1387 Y115.9804 F9000
+G01 Z-3 F4500
+G01 X155.0984 Y115.1041 F4500
+G01 X154.7192 Y114.2236 F4500
+G01 X154.2884 Y113.3669 F4500
+G01 X153.832 Y112.5236 F4500
+G01 X153.3594 Y111.6892 F4500
+G01 X152.8754 Y110.8615 F4500
+G01 X152.3826 Y110.039 F4500
+G01 X151.8828 Y109.2206 F4500
+G01 X150.9544 Y109.1855 F4500
+G01 X150.7022 Y110.0222 F4500
+G01 X151.0108 Y110.915 F4500
+G01 X151.4493 Y111.7542 F4500
+G01 X151.9501 Y112.5581 F4500
+G01 X152.4922 Y113.3334 F4500
+G01 X153.0687 Y114.0824 F4500
+G01 X153.6813 Y114.8031 F4500
+G01 X154.3436 Y115.4817 F4500
+G01 X155.1387 Y115.9804 F4500
+G01 Z0 F4500
+G00 X156.918 Y117.123 F9000
+G01 Z-3 F4500
+G01 X157.8382 Y116.9334 F4500
+G01 X158.7256 Y116.6082 F4500
+G01 X159.5992 Y116.2474 F4500
+G01 X160.4648 Y115.8676 F4500
+G01 X161.3248 Y115.4754 F4500
+G01 X162.1806 Y115.0741 F4500
+G01 X163.0332 Y114.666 F4500
+G01 X163.5092 Y113.8548 F4500
+G01 X163.0648 Y113.3051 F4500
+G01 X162.1581 Y113.5565 F4500
+G01 X161.2962 Y113.9333 F4500
+G01 X160.4528 Y114.3665 F4500
+G01 X159.6302 Y114.834 F4500
+G01 X158.8332 Y115.3266 F4500
+G01 X158.0608 Y115.8474 F4500
+G01 X157.3183 Y116.416 F4500
+G01 X156.918 Y117.123 F4500
+G01 Z0 F4500
+G00 X157.502 Y113.2246 F9000
+G01 Z-3 F4500
+G01 X158.1733 Y112.8846 F4500
+G01 X158.6572 Y112.25 F4500
+G01 X159.0768 Y111.5703 F4500
+G01 X159.4629 Y110.871 F4500
+G01 X159.4819 Y109.8779 F4500
+G01 X159.4843 Y108.8845 F4500
+G01 X159.4629 Y107.8914 F4500
+G01 X159.4026 Y106.9 F4500
+G01 X159.2571 Y105.9181 F4500
+G01 X158.6732 Y105.464 F4500
+G01 X158.2157 Y106.3369 F4500
+G01 X157.9067 Y107.2817 F4500
+G01 X157.6523 Y108.2803 F4500
+G01 X157.4591 Y109.2196 F4500
+G01 X157.3083 Y110.1491 F4500
+G01 X157.1995 Y111.1261 F4500
+G01 X157.1701 Y112.1904 F4500
+G01 X157.502 Y113.2246 F4500
+G01 Z0 F4500
+G00 X164.0762 Y134.6719 F9000
+G01 Z-3 F4500
+G01 X164.6304 Y134.468 F4500
+G01 X165.0332 Y134.0 F4500
+G01 X164.3674 Y133.3529 F4500
+G01 X163.7656 Y133.8496 F4500
+G01 X164.0762 Y134.6719 F4500
+G01 Z0 F4500
+G00 X165.4082 Y137.3397 F9000
+G01 Z-3 F4500
+G01 X165.9635 Y137.1348 F4500
+G01 X166.3672 Y136.6659 F4500
+G01 X165.7006 Y136.0188 F4500
+G01 X165.0982 Y136.5166 F4500
+G01 X165.4082 Y137.3397 F4500
+G01 Z0 F4500
+G00 X0.0 Y0.0 F9000
+
+
+
+G21
+G01 Z0 F4500
+G00 X118.5899 Y28.884 F9000
+G01 Z-3 F4500
+G01 X118.7386 Y28.04038 F4500
+G01 X118.7211 Y27.18865 F4500
+G01 X118.0686 Y27.17708 F4500
+G01 X117.6464 Y27.91433 F4500
+G01 X117.7662 Y28.72195 F4500
+G01 X118.5899 Y28.884 F4500
+G01 Z0 F4500
+G00 X119.9219 Y32.884 F9000
+G01 Z-3 F4500
+G01 X120.0707 Y32.04038 F4500
+G01 X120.0532 Y31.18864 F4500
+G01 X119.4006 Y31.17708 F4500
+G01 X118.9785 Y31.91433 F4500
+G01 X119.0982 Y32.72195 F4500
+G01 X119.9219 Y32.884 F4500
+G01 Z0 F4500
+G00 X121.2559 Y36.884 F9000
+G01 Z-3 F4500
+G01 X121.4046 Y36.04038 F4500
+G01 X121.3872 Y35.18865 F4500
+G01 X120.7346 Y35.17708 F4500
+G01 X120.3124 Y35.91433 F4500
+G01 X120.4322 Y36.72195 F4500
+G01 X121.2559 Y36.884 F4500
+G01 Z0 F4500
+G00 X122.5899 Y40.88788 F9000
+G01 Z-3 F4500
+G01 X122.7386 Y40.04427 F4500
+G01 X122.7211 Y39.19254 F4500
+G01 X122.0686 Y39.18099 F4500
+G01 X121.6464 Y39.91823 F4500
+G01 X121.7662 Y40.72584 F4500
+G01 X122.5899 Y40.88788 F4500
+G01 Z0 F4500
+G00 X123.4082 Y44.00507 F9000
+G01 Z-3 F4500
+G01 X123.9635 Y43.80153 F4500
+G01 X124.3672 Y43.33319 F4500
+G01 X123.701 Y42.68617 F4500
+G01 X123.0982 Y43.18245 F4500
+G01 X123.4082 Y44.00507 F4500
+G01 Z0 F4500
+G00 X125.2559 Y47.55409 F9000
+G01 Z-3 F4500
+G01 X125.4046 Y46.71045 F4500
+G01 X125.3872 Y45.8587 F4500
+G01 X124.7346 Y45.84711 F4500
+G01 X124.3124 Y46.58438 F4500
+G01 X124.4322 Y47.39202 F4500
+G01 X125.2559 Y47.55409 F4500
+G01 Z0 F4500
+G00 X126.0762 Y50.67128 F9000
+G01 Z-3 F4500
+G01 X126.6304 Y50.46744 F4500
+G01 X127.0332 Y49.9994 F4500
+G01 X126.3674 Y49.35232 F4500
+G01 X125.7656 Y49.84896 F4500
+G01 X126.0762 Y50.67128 F4500
+G01 Z0 F4500
+G00 X127.9219 Y54.22225 F9000
+G01 Z-3 F4500
+G01 X128.0707 Y53.37861 F4500
+G01 X128.0532 Y52.52685 F4500
+G01 X127.4006 Y52.51526 F4500
+G01 X126.9785 Y53.25253 F4500
+G01 X127.0982 Y54.06018 F4500
+G01 X127.9219 Y54.22225 F4500
+G01 Z0 F4500
+G00 X128.7422 Y57.3396 F9000
+G01 Z-3 F4500
+G01 X129.2975 Y57.13471 F4500
+G01 X129.7012 Y56.66578 F4500
+G01 X129.0346 Y56.01868 F4500
+G01 X128.4322 Y56.51653 F4500
+G01 X128.7422 Y57.3396 F4500
+G01 Z0 F4500
+G00 X130.0762 Y60.00562 F9000
+G01 Z-3 F4500
+G01 X130.6304 Y59.80178 F4500
+G01 X131.0332 Y59.33374 F4500
+G01 X130.3673 Y58.68674 F4500
+G01 X129.7656 Y59.18334 F4500
+G01 X130.0762 Y60.00562 F4500
+G01 Z0 F4500
+G00 X131.4082 Y62.67164 F9000
+G01 Z-3 F4500
+G01 X131.9635 Y62.46809 F4500
+G01 X132.3672 Y61.99976 F4500
+G01 X131.701 Y61.35265 F4500
+G01 X131.09820000000002 Y61.84896 F4500
+G01 X131.4082 Y62.67164 F4500
+G01 Z0 F4500
+G00 X132.7422 Y65.3396 F9000
+G01 Z-3 F4500
+G01 X133.2975 Y65.13472 F4500
+G01 X133.7012 Y64.66578 F4500
+G01 X133.0346 Y64.01868 F4500
+G01 X132.4322 Y64.51653 F4500
+G01 X132.7422 Y65.3396 F4500
+G01 Z0 F4500
+G00 X134.0762 Y68.00562 F9000
+G01 Z-3 F4500
+G01 X134.6304 Y67.80178 F4500
+G01 X135.0332 Y67.33374 F4500
+G01 X134.3673 Y66.68674 F4500
+G01 X133.7656 Y67.18333 F4500
+G01 X134.0762 Y68.00562 F4500
+G01 Z0 F4500
+G00 X136.7422 Y72.00586 F9000
+G01 Z-3 F4500
+G01 X137.2975 Y71.80231 F4500
+G01 X137.7012 Y71.33398 F4500
+G01 X137.035 Y70.68694 F4500
+G01 X136.4323 Y71.18325 F4500
+G01 X136.7422 Y72.00586 F4500
+G01 Z0 F4500
+G00 X138.0762 Y74.67188 F9000
+G01 Z-3 F4500
+G01 X138.6304 Y74.46804 F4500
+G01 X139.0332 Y74.0 F4500
+G01 X138.3674 Y73.35292 F4500
+G01 X137.7656 Y73.84955 F4500
+G01 X138.0762 Y74.67188 F4500
+G01 Z0 F4500
+G00 X139.4082 Y77.33984 F9000
+G01 Z-3 F4500
+G01 X139.9635 Y77.13495 F4500
+G01 X140.3672 Y76.66602 F4500
+G01 X139.7005 Y76.01893 F4500
+G01 X139.0982 Y76.51675 F4500
+G01 X139.4082 Y77.33984 F4500
+G01 Z0 F4500
+G00 X140.7422 Y80.00586 F9000
+G01 Z-3 F4500
+G01 X141.2975 Y79.80231 F4500
+G01 X141.7012 Y79.33398 F4500
+G01 X141.035 Y78.68694 F4500
+G01 X140.4323 Y79.18325 F4500
+G01 X140.7422 Y80.00586 F4500
+G01 Z0 F4500
+G00 X144.8555 Y86.64632 F9000
+G01 Z-3 F4500
+G01 X145.0169 Y86.16425 F4500
+G01 X144.8302 Y85.43338 F4500
+G01 X144.6073 Y84.7142 F4500
+G01 X144.3672 Y84.0 F4500
+G01 X143.8347 Y83.20844 F4500
+G01 X143.2867 Y82.42764 F4500
+G01 X142.7062 Y81.67078 F4500
+G01 X142.1666 Y81.46962 F4500
+G01 X142.4709 Y82.35683 F4500
+G01 X142.8848 Y83.28363 F4500
+G01 X143.2763 Y84.07885 F4500
+G01 X143.7036 Y84.88652 F4500
+G01 X144.2147 Y85.77 F4500
+G01 X144.8555 Y86.64648 F4500
+G01 Z0 F4500
+G00 X148.7422 Y93.33965 F9000
+G01 Z-3 F4500
+G01 X149.2975 Y93.13476 F4500
+G01 X149.7012 Y92.66582 F4500
+G01 X149.0346 Y92.01873 F4500
+G01 X148.4322 Y92.51658 F4500
+G01 X148.7422 Y93.33965 F4500
+G01 Z0 F4500
+G00 X151.5957 Y97.33184 F9000
+G01 Z-3 F4500
+G01 X151.8489 Y96.77975 F4500
+G01 X151.7012 Y95.99981 F4500
+G01 X151.1099 Y95.32381 F4500
+G01 X150.4647 Y94.70022 F4500
+G01 X150.1493 Y95.0377 F4500
+G01 X150.5226 Y95.86629 F4500
+G01 X150.9656 Y96.6093 F4500
+G01 X151.5957 Y97.33184 F4500
+G01 Z0 F4500
+G00 X154.4238 Y100.4199 F9000
+G01 Z-3 F4500
+G01 X154.1094 Y99.77148 F4500
+G01 X154.3672 Y99.99998 F4500
+G01 X154.4238 Y100.4199 F4500
+G01 Z0 F4500
+G00 X160.3261 Y99.33369 F9000
+G00 X160.3262 Y99.33369 F9000
+G01 Z-3 F4500
+G01 X160.2019 Y98.70639 F4500
+G01 X160.0469 Y98.08566 F4500
+G01 X160.7601 Y98.62938 F4500
+G01 X161.5829 Y98.98518 F4500
+G01 X162.4669 Y99.13699 F4500
+G01 X163.3644 Y99.11568 F4500
+G01 X164.2505 Y98.96859 F4500
+G01 X165.1184 Y98.73559 F4500
+G01 X165.9688 Y98.44503 F4500
+G01 X166.4352 Y98.48993 F4500
+G01 X166.8301 Y98.1423 F4500
+G01 X167.7004 Y97.76474 F4500
+G01 X168.5636 Y97.37106 F4500
+G01 X169.4233 Y96.96991 F4500
+G01 X170.2827 Y96.5681 F4500
+G01 X171.1445 Y96.1716 F4500
+G01 X171.5352 Y96.2067 F4500
+G01 X172.125 Y96.2438 F4500
+G01 X172.8083 Y96.18774 F4500
+G01 X173.4164 Y95.89075 F4500
+G01 X173.627 Y95.25747 F4500
+G01 X174.5141 Y94.93031 F4500
+G01 X175.4112 Y94.63166 F4500
+G01 X176.3191 Y94.36758 F4500
+G01 X177.2378 Y94.14441 F4500
+G01 X178.1667 Y93.96851 F4500
+G01 X179.1042 Y93.84627 F4500
+G01 X180.0475 Y93.7836 F4500
+G01 X180.9929 Y93.78558 F4500
+G01 X181.9356 Y93.85601 F4500
+G01 X182.8704 Y93.99686 F4500
+G01 X183.7918 Y94.20821 F4500
+G01 X184.6947 Y94.48808 F4500
+G01 X185.575 Y94.83288 F4500
+G01 X186.4293 Y95.2378 F4500
+G01 X187.2555 Y95.69732 F4500
+G01 X188.0525 Y96.20573 F4500
+G01 X188.8203 Y96.75747 F4500
+G01 X188.3987 Y95.85492 F4500
+G01 X187.9765 Y94.95264 F4500
+G01 X187.5536 Y94.05067 F4500
+G01 X187.1302 Y93.14896 F4500
+G01 X186.7062 Y92.24752 F4500
+G01 X186.2816 Y91.34636 F4500
+G01 X185.8565 Y90.44546 F4500
+G01 X185.4308 Y89.54483 F4500
+G01 X185.0045 Y88.64445 F4500
+G01 X184.5777 Y87.74435 F4500
+G01 X184.1503 Y86.8445 F4500
+G01 X183.7224 Y85.94491 F4500
+G01 X183.294 Y85.04557 F4500
+G01 X182.865 Y84.14648 F4500
+G01 X182.4355 Y83.24767 F4500
+G01 X182.0055 Y82.3491 F4500
+G01 X181.5749 Y81.45079 F4500
+G01 X181.1438 Y80.55272 F4500
+G01 X180.7122 Y79.65491 F4500
+G01 X180.28 Y78.75735 F4500
+G01 X179.8473 Y77.86004 F4500
+G01 X179.4141 Y76.96299 F4500
+G01 X178.9804 Y76.06618 F4500
+G01 X178.5462 Y75.16962 F4500
+G01 X178.1114 Y74.27334 F4500
+G01 X177.6761 Y73.3773 F4500
+G01 X177.2403 Y72.48151 F4500
+G01 X176.804 Y71.58597 F4500
+G01 X176.3671 Y70.6907 F4500
+G01 X175.9298 Y69.79567 F4500
+G01 X175.4918 Y68.90091 F4500
+G01 X175.0534 Y68.00641 F4500
+G01 X174.6144 Y67.11216 F4500
+G01 X174.1749 Y66.21818 F4500
+G01 X173.7349 Y65.32447 F4500
+G01 X173.2943 Y64.43101 F4500
+G01 X172.8532 Y63.53783 F4500
+G01 X172.4115 Y62.64491 F4500
+G01 X171.9693 Y61.75227 F4500
+G01 X171.5266 Y60.85989 F4500
+G01 X171.0832 Y59.9678 F4500
+G01 X170.6394 Y59.07598 F4500
+G01 X170.1949 Y58.18444 F4500
+G01 X169.7499 Y57.29319 F4500
+G01 X169.3043 Y56.40222 F4500
+G01 X168.8582 Y55.51153 F4500
+G01 X168.4115 Y54.62115 F4500
+G01 X167.9641 Y53.73105 F4500
+G01 X167.5162 Y52.84125 F4500
+G01 X167.0677 Y51.95176 F4500
+G01 X166.6186 Y51.06257 F4500
+G01 X166.1689 Y50.17369 F4500
+G01 X165.7185 Y49.28512 F4500
+G01 X165.2675 Y48.39688 F4500
+G01 X164.8159 Y47.50895 F4500
+G01 X164.3637 Y46.62135 F4500
+G01 X163.9108 Y45.73408 F4500
+G01 X163.4572 Y44.84714 F4500
+G01 X163.003 Y43.96055 F4500
+G01 X162.5481 Y43.0743 F4500
+G01 X162.0925 Y42.1884 F4500
+G01 X161.6363 Y41.30286 F4500
+G01 X161.1793 Y40.41768 F4500
+G01 X160.7216 Y39.53287 F4500
+G01 X160.2632 Y38.64844 F4500
+G01 X159.804 Y37.7644 F4500
+G01 X159.3441 Y36.88073 F4500
+G01 X158.8835 Y35.99747 F4500
+G01 X158.422 Y35.11461 F4500
+G01 X157.9598 Y34.23217 F4500
+G01 X157.4968 Y33.35014 F4500
+G01 X157.0329 Y32.46854 F4500
+G01 X156.5682 Y31.58739 F4500
+G01 X156.1027 Y30.70668 F4500
+G01 X155.6363 Y29.82642 F4500
+G01 X155.169 Y28.94664 F4500
+G01 X154.7009 Y28.06734 F4500
+G01 X154.2318 Y27.18852 F4500
+G01 X153.7617 Y26.31021 F4500
+G01 X153.2678 Y25.47379 F4500
+G01 X152.7083 Y24.6797 F4500
+G01 X152.0849 Y23.93481 F4500
+G01 X151.4004 Y23.2456 F4500
+G01 X150.6592 Y22.6178 F4500
+G01 X149.8667 Y22.05612 F4500
+G01 X149.0292 Y21.56411 F4500
+G01 X148.1533 Y21.1441 F4500
+G01 X147.246 Y20.79733 F4500
+G01 X146.3138 Y20.52416 F4500
+G01 X145.3632 Y20.32422 F4500
+G01 X144.4001 Y20.19669 F4500
+G01 X143.4303 Y20.14049 F4500
+G01 X142.459 Y20.15439 F4500
+G01 X141.4911 Y20.23718 F4500
+G01 X140.5314 Y20.38769 F4500
+G01 X139.5845 Y20.60485 F4500
+G01 X138.6552 Y20.88768 F4500
+G01 X137.748 Y21.23524 F4500
+G01 X136.868 Y21.64659 F4500
+G01 X136.0201 Y22.12068 F4500
+G01 X135.2096 Y22.65623 F4500
+G01 X134.44209999999998 Y23.25161 F4500
+G01 X133.723 Y23.90467 F4500
+G01 X133.0578 Y24.6126 F4500
+G01 X132.4519 Y25.37184 F4500
+G01 X131.91 Y26.178 F4500
+G01 X131.4361 Y27.02594 F4500
+G01 X131.0332 Y27.90982 F4500
+G01 X130.2264 Y27.81272 F4500
+G01 X129.66660000000002 Y28.33318 F4500
+G01 X129.6682 Y29.14669 F4500
+G01 X129.8555 Y29.94302 F4500
+G01 X130.0417 Y30.59263 F4500
+G01 X130.2797 Y31.22264 F4500
+G01 X130.5957 Y31.81997 F4500
+G01 X131.16410000000002 Y32.58169 F4500
+G01 X131.17579999999998 Y32.63639 F4500
+G01 X131.2243 Y33.48891 F4500
+G01 X131.349 Y34.33361 F4500
+G01 X131.55259999999998 Y35.16283 F4500
+G01 X131.83010000000002 Y35.97037 F4500
+G01 X131.9648 Y36.25944 F4500
+G01 X132.2235 Y37.22406 F4500
+G01 X132.4937 Y38.18551 F4500
+G01 X132.77530000000002 Y39.14371 F4500
+G01 X133.0677 Y40.09862 F4500
+G01 X133.3709 Y41.0502 F4500
+G01 X133.68439999999998 Y41.99843 F4500
+G01 X134.0079 Y42.94327 F4500
+G01 X134.34109999999998 Y43.88474 F4500
+G01 X134.68380000000002 Y44.82281 F4500
+G01 X135.0356 Y45.75752 F4500
+G01 X135.3961 Y46.68886 F4500
+G01 X135.7652 Y47.61689 F4500
+G01 X136.1424 Y48.54161 F4500
+G01 X136.5274 Y49.46309 F4500
+G01 X136.9201 Y50.38136 F4500
+G01 X137.32 Y51.29649 F4500
+G01 X137.727 Y52.20854 F4500
+G01 X138.1406 Y53.11757 F4500
+G01 X138.5606 Y54.02366 F4500
+G01 X138.9867 Y54.92689 F4500
+G01 X139.4187 Y55.82735 F4500
+G01 X139.8562 Y56.72511 F4500
+G01 X140.299 Y57.62028 F4500
+G01 X140.7469 Y58.51294 F4500
+G01 X141.1994 Y59.40321 F4500
+G01 X141.6565 Y60.29119 F4500
+G01 X142.1178 Y61.17697 F4500
+G01 X142.5831 Y62.06068 F4500
+G01 X143.052 Y62.94242 F4500
+G01 X143.5245 Y63.82232 F4500
+G01 X144.0001 Y64.70048 F4500
+G01 X144.4787 Y65.57703 F4500
+G01 X144.9601 Y66.4521 F4500
+G01 X145.4439 Y67.3258 F4500
+G01 X145.9299 Y68.19826 F4500
+G01 X146.4179 Y69.06962 F4500
+G01 X146.9077 Y69.93999 F4500
+G01 X147.3989 Y70.80952 F4500
+G01 X147.8914 Y71.67833 F4500
+G01 X148.385 Y72.54657 F4500
+G01 X148.8793 Y73.41436 F4500
+G01 X149.3742 Y74.28184 F4500
+G01 X149.8693 Y75.14915 F4500
+G01 X150.3645 Y76.01643 F4500
+G01 X150.8596 Y76.88383 F4500
+G01 X151.3541 Y77.75148 F4500
+G01 X151.848 Y78.61951 F4500
+G01 X152.341 Y79.48809 F4500
+G01 X152.8327 Y80.35733 F4500
+G01 X153.323 Y81.22741 F4500
+G01 X153.8116 Y82.09846 F4500
+G01 X154.2981 Y82.9706 F4500
+G01 X154.7824 Y83.84404 F4500
+G01 X155.2642 Y84.71885 F4500
+G01 X155.7431 Y85.59523 F4500
+G01 X156.219 Y86.47327 F4500
+G01 X156.6914 Y87.35319 F4500
+G01 X156.7868 Y88.22372 F4500
+G01 X156.8978 Y89.09241 F4500
+G01 X157.0257 Y89.95876 F4500
+G01 X157.1716 Y90.82226 F4500
+G01 X157.3362 Y91.68239 F4500
+G01 X157.5195 Y92.53873 F4500
+G01 X156.8508 Y92.11536 F4500
+G01 X156.4678 Y92.74107 F4500
+G01 X156.9483 Y93.25014 F4500
+G01 X157.5761 Y92.75358 F4500
+G01 X157.8035 Y93.66621 F4500
+G01 X158.0643 Y94.56982 F4500
+G01 X158.3769 Y95.4567 F4500
+G01 X157.997 Y96.2159 F4500
+G01 X157.9939 Y97.07777 F4500
+G01 X158.2669 Y97.89571 F4500
+G01 X158.7904 Y98.58049 F4500
+G01 X159.5058 Y99.06258 F4500
+G01 X160.3261 Y99.33369 F4500
+G01 Z0 F4500
+G00 X164.9785 Y108.3515 F9000
+G01 Z-3 F4500
+G01 X165.6343 Y107.8776 F4500
+G01 X166.1143 Y107.1023 F4500
+G01 X166.5495 Y106.3006 F4500
+G01 X166.9618 Y105.4869 F4500
+G01 X167.3594 Y104.666 F4500
+G01 X167.433 Y103.688 F4500
+G01 X167.4651 Y102.7079 F4500
+G01 X167.3846 Y101.7325 F4500
+G01 X166.7579 Y101.8129 F4500
+G01 X166.3203 Y102.6903 F4500
+G01 X165.9632 Y103.6113 F4500
+G01 X165.6633 Y104.5088 F4500
+G01 X165.3881 Y105.4472 F4500
+G01 X165.1391 Y106.4459 F4500
+G01 X164.9531 Y107.4603 F4500
+G01 X164.9785 Y108.3515 F4500
+G01 Z0 F4500
+G00 X165.1387 Y115.9804 F9000
+G01 Z-3 F4500
+G01 X165.0984 Y115.1041 F4500
+G01 X164.7192 Y114.2236 F4500
+G01 X164.2884 Y113.3669 F4500
+G01 X163.832 Y112.5236 F4500
+G01 X163.3594 Y111.6892 F4500
+G01 X162.8754 Y110.8615 F4500
+G01 X162.3826 Y110.039 F4500
+G01 X161.8828 Y109.2206 F4500
+G01 X160.9544 Y109.1855 F4500
+G01 X160.7022 Y110.0222 F4500
+G01 X161.0108 Y110.915 F4500
+G01 X161.4493 Y111.7542 F4500
+G01 X161.9501 Y112.5581 F4500
+G01 X162.4922 Y113.3334 F4500
+G01 X163.0687 Y114.0824 F4500
+G01 X163.6813 Y114.8031 F4500
+G01 X164.3436 Y115.4817 F4500
+G01 X165.1387 Y115.9804 F4500
+G01 Z0 F4500
+G00 X166.918 Y117.123 F9000
+G01 Z-3 F4500
+G01 X167.8382 Y116.9334 F4500
+G01 X168.7256 Y116.6082 F4500
+G01 X169.5992 Y116.2474 F4500
+G01 X170.4648 Y115.8676 F4500
+G01 X171.3248 Y115.4754 F4500
+G01 X172.1806 Y115.0741 F4500
+G01 X173.0332 Y114.666 F4500
+G01 X173.5092 Y113.8548 F4500
+G01 X173.0648 Y113.3051 F4500
+G01 X172.1581 Y113.5565 F4500
+G01 X171.2962 Y113.9333 F4500
+G01 X170.4528 Y114.3665 F4500
+G01 X169.6302 Y114.834 F4500
+G01 X168.8332 Y115.3266 F4500
+G01 X168.0608 Y115.8474 F4500
+G01 X167.3183 Y116.416 F4500
+G01 X166.918 Y117.123 F4500
+G01 Z0 F4500
+G00 X167.502 Y113.2246 F9000
+G01 Z-3 F4500
+G01 X168.1733 Y112.8846 F4500
+G01 X168.6572 Y112.25 F4500
+G01 X169.0768 Y111.5703 F4500
+G01 X169.4629 Y110.871 F4500
+G01 X169.4819 Y109.8779 F4500
+G01 X169.4843 Y108.8845 F4500
+G01 X169.4629 Y107.8914 F4500
+G01 X169.4026 Y106.9 F4500
+G01 X169.2571 Y105.9181 F4500
+G01 X168.6732 Y105.464 F4500
+G01 X168.2157 Y106.3369 F4500
+G01 X167.9067 Y107.2817 F4500
+G01 X167.6523 Y108.2803 F4500
+G01 X167.4591 Y109.2196 F4500
+G01 X167.3083 Y110.1491 F4500
+G01 X167.1995 Y111.1261 F4500
+G01 X167.1701 Y112.1904 F4500
+G01 X167.502 Y113.2246 F4500
+G01 Z0 F4500
+G00 X174.0762 Y134.6719 F9000
+G01 Z-3 F4500
+G01 X174.6304 Y134.468 F4500
+G01 X175.0332 Y134.0 F4500
+G01 X174.3674 Y133.3529 F4500
+G01 X173.7656 Y133.8496 F4500
+G01 X174.0762 Y134.6719 F4500
+G01 Z0 F4500
+G00 X175.4082 Y137.3397 F9000
+G01 Z-3 F4500
+G01 X175.9635 Y137.1348 F4500
+G01 X176.3672 Y136.6659 F4500
+G01 X175.7006 Y136.0188 F4500
+G01 X175.0982 Y136.5166 F4500
+G01 X175.4082 Y137.3397 F4500
+G01 Z0 F4500
+G00 X10.0 Y0.0 F9000
+
+
+
+
+M02
@@ -0,0 +1,525 @@
+G21
+M10
+G00 X108.5899 Y28.884
+M09
+G01 X108.7386 Y28.04038
+G01 X108.7211 Y27.18865
+G01 X108.0686 Y27.17708
+G01 X107.6464 Y27.91433
+G01 X107.7662 Y28.72195
+G01 X108.5899 Y28.884
+M10
+G00 X109.9219 Y32.884
+M09
+G01 X110.0707 Y32.04038
+G01 X110.0532 Y31.18864
+G01 X109.4006 Y31.17708
+G01 X108.9785 Y31.91433
+G01 X109.0982 Y32.72195
+G01 X109.9219 Y32.884
+M10
+G00 X111.2559 Y36.884
+M09
+G01 X111.4046 Y36.04038
+G01 X111.3872 Y35.18865
+G01 X110.7346 Y35.17708
+G01 X110.3124 Y35.91433
+G01 X110.4322 Y36.72195
+G01 X111.2559 Y36.884
+M10
+G00 X112.5899 Y40.88788
+M09
+G01 X112.7386 Y40.04427
+G01 X112.7211 Y39.19254
+G01 X112.0686 Y39.18099
+G01 X111.6464 Y39.91823
+G01 X111.7662 Y40.72584
+G01 X112.5899 Y40.88788
+M10
+G00 X113.4082 Y44.00507
+M09
+G01 X113.9635 Y43.80153
+G01 X114.3672 Y43.33319
+G01 X113.701 Y42.68617
+G01 X113.0982 Y43.18245
+G01 X113.4082 Y44.00507
+M10
+G00 X115.2559 Y47.55409
+M09
+G01 X115.4046 Y46.71045
+G01 X115.3872 Y45.8587
+G01 X114.7346 Y45.84711
+G01 X114.3124 Y46.58438
+G01 X114.4322 Y47.39202
+G01 X115.2559 Y47.55409
+M10
+G00 X116.0762 Y50.67128
+M09
+G01 X116.6304 Y50.46744
+G01 X117.0332 Y49.9994
+G01 X116.3674 Y49.35232
+G01 X115.7656 Y49.84896
+G01 X116.0762 Y50.67128
+M10
+G00 X117.9219 Y54.22225
+M09
+G01 X118.0707 Y53.37861
+G01 X118.0532 Y52.52685
+G01 X117.4006 Y52.51526
+G01 X116.9785 Y53.25253
+G01 X117.0982 Y54.06018
+G01 X117.9219 Y54.22225
+M10
+G00 X118.7422 Y57.3396
+M09
+G01 X119.2975 Y57.13471
+G01 X119.7012 Y56.66578
+G01 X119.0346 Y56.01868
+G01 X118.4322 Y56.51653
+G01 X118.7422 Y57.3396
+M10
+G00 X120.0762 Y60.00562
+M09
+G01 X120.6304 Y59.80178
+G01 X121.0332 Y59.33374
+G01 X120.3673 Y58.68674
+G01 X119.7656 Y59.18334
+G01 X120.0762 Y60.00562
+M10
+G00 X121.4082 Y62.67164
+M09
+G01 X121.9635 Y62.46809
+G01 X122.3672 Y61.99976
+G01 X121.701 Y61.35265
+G01 X121.0982 Y61.84896
+G01 X121.4082 Y62.67164
+M10
+G00 X122.7422 Y65.3396
+M09
+G01 X123.2975 Y65.13472
+G01 X123.7012 Y64.66578
+G01 X123.0346 Y64.01868
+G01 X122.4322 Y64.51653
+G01 X122.7422 Y65.3396
+M10
+G00 X124.0762 Y68.00562
+M09
+G01 X124.6304 Y67.80178
+G01 X125.0332 Y67.33374
+G01 X124.3673 Y66.68674
+G01 X123.7656 Y67.18333
+G01 X124.0762 Y68.00562
+M10
+G00 X126.7422 Y72.00586
+M09
+G01 X127.2975 Y71.80231
+G01 X127.7012 Y71.33398
+G01 X127.035 Y70.68694
+G01 X126.4323 Y71.18325
+G01 X126.7422 Y72.00586
+M10
+G00 X128.0762 Y74.67188
+M09
+G01 X128.6304 Y74.46804
+G01 X129.0332 Y74
+G01 X128.3674 Y73.35292
+G01 X127.7656 Y73.84955
+G01 X128.0762 Y74.67188
+M10
+G00 X129.4082 Y77.33984
+M09
+G01 X129.9635 Y77.13495
+G01 X130.3672 Y76.66602
+G01 X129.7005 Y76.01893
+G01 X129.0982 Y76.51675
+G01 X129.4082 Y77.33984
+M10
+G00 X130.7422 Y80.00586
+M09
+G01 X131.2975 Y79.80231
+G01 X131.7012 Y79.33398
+G01 X131.035 Y78.68694
+G01 X130.4323 Y79.18325
+G01 X130.7422 Y80.00586
+M10
+G00 X134.8555 Y86.64632
+M09
+G01 X135.0169 Y86.16425
+G01 X134.8302 Y85.43338
+G01 X134.6073 Y84.7142
+G01 X134.3672 Y84
+G01 X133.8347 Y83.20844
+G01 X133.2867 Y82.42764
+G01 X132.7062 Y81.67078
+G01 X132.1666 Y81.46962
+G01 X132.4709 Y82.35683
+G01 X132.8848 Y83.28363
+G01 X133.2763 Y84.07885
+G01 X133.7036 Y84.88652
+G01 X134.2147 Y85.77
+G01 X134.8555 Y86.64648
+M10
+G00 X138.7422 Y93.33965
+M09
+G01 X139.2975 Y93.13476
+G01 X139.7012 Y92.66582
+G01 X139.0346 Y92.01873
+G01 X138.4322 Y92.51658
+G01 X138.7422 Y93.33965
+M10
+G00 X141.5957 Y97.33184
+M09
+G01 X141.8489 Y96.77975
+G01 X141.7012 Y95.99981
+G01 X141.1099 Y95.32381
+G01 X140.4647 Y94.70022
+G01 X140.1493 Y95.0377
+G01 X140.5226 Y95.86629
+G01 X140.9656 Y96.6093
+G01 X141.5957 Y97.33184
+M10
+G00 X144.4238 Y100.4199
+M09
+G01 X144.1094 Y99.77148
+G01 X144.3672 Y99.99998
+G01 X144.4238 Y100.4199
+M10
+G00 X150.3261 Y99.33369
+G00 X150.3262 Y99.33369
+M09
+G01 X150.2019 Y98.70639
+G01 X150.0469 Y98.08566
+G01 X150.7601 Y98.62938
+G01 X151.5829 Y98.98518
+G01 X152.4669 Y99.13699
+G01 X153.3644 Y99.11568
+G01 X154.2505 Y98.96859
+G01 X155.1184 Y98.73559
+G01 X155.9688 Y98.44503
+G01 X156.4352 Y98.48993
+G01 X156.8301 Y98.1423
+G01 X157.7004 Y97.76474
+G01 X158.5636 Y97.37106
+G01 X159.4233 Y96.96991
+G01 X160.2827 Y96.5681
+G01 X161.1445 Y96.1716
+G01 X161.5352 Y96.2067
+G01 X162.125 Y96.2438
+G01 X162.8083 Y96.18774
+G01 X163.4164 Y95.89075
+G01 X163.627 Y95.25747
+G01 X164.5141 Y94.93031
+G01 X165.4112 Y94.63166
+G01 X166.3191 Y94.36758
+G01 X167.2378 Y94.14441
+G01 X168.1667 Y93.96851
+G01 X169.1042 Y93.84627
+G01 X170.0475 Y93.7836
+G01 X170.9929 Y93.78558
+G01 X171.9356 Y93.85601
+G01 X172.8704 Y93.99686
+G01 X173.7918 Y94.20821
+G01 X174.6947 Y94.48808
+G01 X175.575 Y94.83288
+G01 X176.4293 Y95.2378
+G01 X177.2555 Y95.69732
+G01 X178.0525 Y96.20573
+G01 X178.8203 Y96.75747
+G01 X178.3987 Y95.85492
+G01 X177.9765 Y94.95264
+G01 X177.5536 Y94.05067
+G01 X177.1302 Y93.14896
+G01 X176.7062 Y92.24752
+G01 X176.2816 Y91.34636
+G01 X175.8565 Y90.44546
+G01 X175.4308 Y89.54483
+G01 X175.0045 Y88.64445
+G01 X174.5777 Y87.74435
+G01 X174.1503 Y86.8445
+G01 X173.7224 Y85.94491
+G01 X173.294 Y85.04557
+G01 X172.865 Y84.14648
+G01 X172.4355 Y83.24767
+G01 X172.0055 Y82.3491
+G01 X171.5749 Y81.45079
+G01 X171.1438 Y80.55272
+G01 X170.7122 Y79.65491
+G01 X170.28 Y78.75735
+G01 X169.8473 Y77.86004
+G01 X169.4141 Y76.96299
+G01 X168.9804 Y76.06618
+G01 X168.5462 Y75.16962
+G01 X168.1114 Y74.27334
+G01 X167.6761 Y73.3773
+G01 X167.2403 Y72.48151
+G01 X166.804 Y71.58597
+G01 X166.3671 Y70.6907
+G01 X165.9298 Y69.79567
+G01 X165.4918 Y68.90091
+G01 X165.0534 Y68.00641
+G01 X164.6144 Y67.11216
+G01 X164.1749 Y66.21818
+G01 X163.7349 Y65.32447
+G01 X163.2943 Y64.43101
+G01 X162.8532 Y63.53783
+G01 X162.4115 Y62.64491
+G01 X161.9693 Y61.75227
+G01 X161.5266 Y60.85989
+G01 X161.0832 Y59.9678
+G01 X160.6394 Y59.07598
+G01 X160.1949 Y58.18444
+G01 X159.7499 Y57.29319
+G01 X159.3043 Y56.40222
+G01 X158.8582 Y55.51153
+G01 X158.4115 Y54.62115
+G01 X157.9641 Y53.73105
+G01 X157.5162 Y52.84125
+G01 X157.0677 Y51.95176
+G01 X156.6186 Y51.06257
+G01 X156.1689 Y50.17369
+G01 X155.7185 Y49.28512
+G01 X155.2675 Y48.39688
+G01 X154.8159 Y47.50895
+G01 X154.3637 Y46.62135
+G01 X153.9108 Y45.73408
+G01 X153.4572 Y44.84714
+G01 X153.003 Y43.96055
+G01 X152.5481 Y43.0743
+G01 X152.0925 Y42.1884
+G01 X151.6363 Y41.30286
+G01 X151.1793 Y40.41768
+G01 X150.7216 Y39.53287
+G01 X150.2632 Y38.64844
+G01 X149.804 Y37.7644
+G01 X149.3441 Y36.88073
+G01 X148.8835 Y35.99747
+G01 X148.422 Y35.11461
+G01 X147.9598 Y34.23217
+G01 X147.4968 Y33.35014
+G01 X147.0329 Y32.46854
+G01 X146.5682 Y31.58739
+G01 X146.1027 Y30.70668
+G01 X145.6363 Y29.82642
+G01 X145.169 Y28.94664
+G01 X144.7009 Y28.06734
+G01 X144.2318 Y27.18852
+G01 X143.7617 Y26.31021
+G01 X143.2678 Y25.47379
+G01 X142.7083 Y24.6797
+G01 X142.0849 Y23.93481
+G01 X141.4004 Y23.2456
+G01 X140.6592 Y22.6178
+G01 X139.8667 Y22.05612
+G01 X139.0292 Y21.56411
+G01 X138.1533 Y21.1441
+G01 X137.246 Y20.79733
+G01 X136.3138 Y20.52416
+G01 X135.3632 Y20.32422
+G01 X134.4001 Y20.19669
+G01 X133.4303 Y20.14049
+G01 X132.459 Y20.15439
+G01 X131.4911 Y20.23718
+G01 X130.5314 Y20.38769
+G01 X129.5845 Y20.60485
+G01 X128.6552 Y20.88768
+G01 X127.748 Y21.23524
+G01 X126.868 Y21.64659
+G01 X126.0201 Y22.12068
+G01 X125.2096 Y22.65623
+G01 X124.4421 Y23.25161
+G01 X123.723 Y23.90467
+G01 X123.0578 Y24.6126
+G01 X122.4519 Y25.37184
+G01 X121.91 Y26.178
+G01 X121.4361 Y27.02594
+G01 X121.0332 Y27.90982
+G01 X120.2264 Y27.81272
+G01 X119.6666 Y28.33318
+G01 X119.6682 Y29.14669
+G01 X119.8555 Y29.94302
+G01 X120.0417 Y30.59263
+G01 X120.2797 Y31.22264
+G01 X120.5957 Y31.81997
+G01 X121.1641 Y32.58169
+G01 X121.1758 Y32.63639
+G01 X121.2243 Y33.48891
+G01 X121.349 Y34.33361
+G01 X121.5526 Y35.16283
+G01 X121.8301 Y35.97037
+G01 X121.9648 Y36.25944
+G01 X122.2235 Y37.22406
+G01 X122.4937 Y38.18551
+G01 X122.7753 Y39.14371
+G01 X123.0677 Y40.09862
+G01 X123.3709 Y41.0502
+G01 X123.6844 Y41.99843
+G01 X124.0079 Y42.94327
+G01 X124.3411 Y43.88474
+G01 X124.6838 Y44.82281
+G01 X125.0356 Y45.75752
+G01 X125.3961 Y46.68886
+G01 X125.7652 Y47.61689
+G01 X126.1424 Y48.54161
+G01 X126.5274 Y49.46309
+G01 X126.9201 Y50.38136
+G01 X127.32 Y51.29649
+G01 X127.727 Y52.20854
+G01 X128.1406 Y53.11757
+G01 X128.5606 Y54.02366
+G01 X128.9867 Y54.92689
+G01 X129.4187 Y55.82735
+G01 X129.8562 Y56.72511
+G01 X130.299 Y57.62028
+G01 X130.7469 Y58.51294
+G01 X131.1994 Y59.40321
+G01 X131.6565 Y60.29119
+G01 X132.1178 Y61.17697
+G01 X132.5831 Y62.06068
+G01 X133.052 Y62.94242
+G01 X133.5245 Y63.82232
+G01 X134.0001 Y64.70048
+G01 X134.4787 Y65.57703
+G01 X134.9601 Y66.4521
+G01 X135.4439 Y67.3258
+G01 X135.9299 Y68.19826
+G01 X136.4179 Y69.06962
+G01 X136.9077 Y69.93999
+G01 X137.3989 Y70.80952
+G01 X137.8914 Y71.67833
+G01 X138.385 Y72.54657
+G01 X138.8793 Y73.41436
+G01 X139.3742 Y74.28184
+G01 X139.8693 Y75.14915
+G01 X140.3645 Y76.01643
+G01 X140.8596 Y76.88383
+G01 X141.3541 Y77.75148
+G01 X141.848 Y78.61951
+G01 X142.341 Y79.48809
+G01 X142.8327 Y80.35733
+G01 X143.323 Y81.22741
+G01 X143.8116 Y82.09846
+G01 X144.2981 Y82.9706
+G01 X144.7824 Y83.84404
+G01 X145.2642 Y84.71885
+G01 X145.7431 Y85.59523
+G01 X146.219 Y86.47327
+G01 X146.6914 Y87.35319
+G01 X146.7868 Y88.22372
+G01 X146.8978 Y89.09241
+G01 X147.0257 Y89.95876
+G01 X147.1716 Y90.82226
+G01 X147.3362 Y91.68239
+G01 X147.5195 Y92.53873
+G01 X146.8508 Y92.11536
+G01 X146.4678 Y92.74107
+G01 X146.9483 Y93.25014
+G01 X147.5761 Y92.75358
+G01 X147.8035 Y93.66621
+G01 X148.0643 Y94.56982
+G01 X148.3769 Y95.4567
+G01 X147.997 Y96.2159
+G01 X147.9939 Y97.07777
+G01 X148.2669 Y97.89571
+G01 X148.7904 Y98.58049
+G01 X149.5058 Y99.06258
+G01 X150.3261 Y99.33369
+M10
+G00 X154.9785 Y108.3515
+M09
+G01 X155.6343 Y107.8776
+G01 X156.1143 Y107.1023
+G01 X156.5495 Y106.3006
+G01 X156.9618 Y105.4869
+G01 X157.3594 Y104.666
+G01 X157.433 Y103.688
+G01 X157.4651 Y102.7079
+G01 X157.3846 Y101.7325
+G01 X156.7579 Y101.8129
+G01 X156.3203 Y102.6903
+G01 X155.9632 Y103.6113
+G01 X155.6633 Y104.5088
+G01 X155.3881 Y105.4472
+G01 X155.1391 Y106.4459
+G01 X154.9531 Y107.4603
+G01 X154.9785 Y108.3515
+M10
+G00 X155.1387 Y115.9804
+M09
+G01 X155.0984 Y115.1041
+G01 X154.7192 Y114.2236
+G01 X154.2884 Y113.3669
+G01 X153.832 Y112.5236
+G01 X153.3594 Y111.6892
+G01 X152.8754 Y110.8615
+G01 X152.3826 Y110.039
+G01 X151.8828 Y109.2206
+G01 X150.9544 Y109.1855
+G01 X150.7022 Y110.0222
+G01 X151.0108 Y110.915
+G01 X151.4493 Y111.7542
+G01 X151.9501 Y112.5581
+G01 X152.4922 Y113.3334
+G01 X153.0687 Y114.0824
+G01 X153.6813 Y114.8031
+G01 X154.3436 Y115.4817
+G01 X155.1387 Y115.9804
+M10
+G00 X156.918 Y117.123
+M09
+G01 X157.8382 Y116.9334
+G01 X158.7256 Y116.6082
+G01 X159.5992 Y116.2474
+G01 X160.4648 Y115.8676
+G01 X161.3248 Y115.4754
+G01 X162.1806 Y115.0741
+G01 X163.0332 Y114.666
+G01 X163.5092 Y113.8548
+G01 X163.0648 Y113.3051
+G01 X162.1581 Y113.5565
+G01 X161.2962 Y113.9333
+G01 X160.4528 Y114.3665
+G01 X159.6302 Y114.834
+G01 X158.8332 Y115.3266
+G01 X158.0608 Y115.8474
+G01 X157.3183 Y116.416
+G01 X156.918 Y117.123
+M10
+G00 X157.502 Y113.2246
+M09
+G01 X158.1733 Y112.8846
+G01 X158.6572 Y112.25
+G01 X159.0768 Y111.5703
+G01 X159.4629 Y110.871
+G01 X159.4819 Y109.8779
+G01 X159.4843 Y108.8845
+G01 X159.4629 Y107.8914
+G01 X159.4026 Y106.9
+G01 X159.2571 Y105.9181
+G01 X158.6732 Y105.464
+G01 X158.2157 Y106.3369
+G01 X157.9067 Y107.2817
+G01 X157.6523 Y108.2803
+G01 X157.4591 Y109.2196
+G01 X157.3083 Y110.1491
+G01 X157.1995 Y111.1261
+G01 X157.1701 Y112.1904
+G01 X157.502 Y113.2246
+M10
+G00 X164.0762 Y134.6719
+M09
+G01 X164.6304 Y134.468
+G01 X165.0332 Y134
+G01 X164.3674 Y133.3529
+G01 X163.7656 Y133.8496
+G01 X164.0762 Y134.6719
+M10
+G00 X165.4082 Y137.3397
+M09
+G01 X165.9635 Y137.1348
+G01 X166.3672 Y136.6659
+G01 X165.7006 Y136.0188
+G01 X165.0982 Y136.5166
+G01 X165.4082 Y137.3397
+M10
+G00 X0 Y0
+M02
@@ -0,0 +1,22 @@
+# The processed job must stay what the original GUI wrote: streaming the output, the array-backed program
+# and the tile transforms only changed how it's written.
+# The reference outputs were written by the baseline commit's process_file, with the two lines it glued together
+# at every cycle boundary ('G92 Z0' onto the subroutine, and the next cycle's 'G21' onto its closing comment)
+# split apart again.
+import hashlib
+import os
+from tests.conftest import DATA, SAMPLE_GCODE, normalised, read_lines
+
+# the baseline's job for the whole sample, 2 cycles of 2 x 2 tiles, as the sha256 of its normalised lines
+SAMPLE_BASELINE_DIGEST = 'da1843dac13af8152e1af2e9def1c64a76c61e5dbfbc4fcfecef1b699898ca1e'
+
+
+def test_cell_matches_baseline(run_job):
+    summary, lines, _ = run_job(cycles=3, cycle_offset=-0.086, tiling_n_x=2, tiling_s_x=10)
+    assert normalised(lines) == normalised(read_lines(os.path.join(DATA, 'baseline_3_cycles_2x1.gcode')))
+
+
+def test_sample_matches_baseline(run_job):
+    summary, lines, _ = run_job(SAMPLE_GCODE, cycles=2, cycle_offset=-0.086, tiling_n_x=2, tiling_n_y=2)
+    assert hashlib.sha256(repr(normalised(lines)).encode()).hexdigest() == SAMPLE_BASELINE_DIGEST
+    assert (summary['x_bound'], summary['y_bound']) == (645.0606, 510.666)
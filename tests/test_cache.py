@@ -0,0 +1,34 @@
+# Caching the parsed cell, bounds and tile set between runs
+from stage_cache import StageCache
+
+
+def test_second_run_picks_the_stages_up_from_the_cache(run_job, tmp_path):
+    cache = StageCache(str(tmp_path / 'cache'))
+    first, first_lines, _ = run_job(cache=cache, tiling_n_x=2, optimize_travel=True)
+    misses = cache.misses
+    second, second_lines, _ = run_job(cache=cache, tiling_n_x=2, optimize_travel=True, cycles=2)
+    assert cache.misses == misses
+    stages = {stage['name'] for stage in second['stages']}
+    assert {'prepare cell (cached)', 'bounds (cached)', 'tile (cached)'} <= stages
+    # only the cycles changed, so the first cycle is written just the same
+    assert second_lines[:len(first_lines) - 2] == first_lines[:-2]
+
+
+def test_changed_settings_miss_the_cache(run_job, tmp_path):
+    cache = StageCache(str(tmp_path / 'cache'))
+    run_job(cache=cache)
+    hits = cache.hits
+    summary = run_job(cache=cache, simplify_tolerance=0.05)[0]
+    assert 'prepare cell' in {stage['name'] for stage in summary['stages']}
+    assert cache.hits == hits + 1
+
+
+def test_changed_feed_only_finishes_the_lines_again(run_job, tmp_path):
+    cache = StageCache(str(tmp_path / 'cache'))
+    run_job(cache=cache, tiling_n_x=2)
+    summary, lines, _ = run_job(cache=cache, tiling_n_x=2, cut_feed='1234')
+    stages = {stage['name'] for stage in summary['stages']}
+    # the tiles are picked up placed, and only their lines are finished with the new feed
+    assert {'tile', 'offset cell (cached)'} <= stages
+    assert any(line.startswith('G01') and line.endswith('F1234') for line in lines)
+    assert lines == run_job(tiling_n_x=2, cut_feed='1234')[1]
@@ -0,0 +1,57 @@
+# The headless batch command line
+import json
+import os
+import pytest
+from GCODE_CLI import load_manifest, main
+from gcode_processor import DEFAULT_CYCLE_SUBROUTINE
+from tests.conftest import CELL
+
+
+def write_manifest(tmp_path, manifest):
+    path = tmp_path / 'jobs.json'
+    path.write_text(json.dumps(manifest))
+    return str(path)
+
+
+def test_jobs_take_the_defaults_they_do_not_override(tmp_path):
+    (tmp_path / 'sub.gcode').write_text('G4 S1\n')
+    jobs = load_manifest(write_manifest(tmp_path, {
+        'defaults': {'cycles': 2, 'cut_feed': 3000, 'cycle_subroutine_file': 'sub.gcode'},
+        'jobs': [{'input': 'a.gcode', 'output': 'out/a.gcode'},
+                 {'name': 'big', 'input': 'b.gcode', 'output': 'b.gcode', 'cycles': 5, 'cycle_subroutine': ''}]}))
+    assert [job['name'] for job in jobs] == ['a', 'big']
+    assert [job['cycles'] for job in jobs] == [2, 5]
+    # numeric feeds are turned into the text that is spliced into the gcode
+    assert jobs[0]['cut_feed'] == '3000'
+    assert jobs[0]['cycle_subroutine'] == 'G4 S1'
+    assert jobs[1]['cycle_subroutine'] == ''
+    assert jobs[0]['output'] == os.path.join(str(tmp_path), 'out/a.gcode')
+
+
+def test_pen_settings_can_be_set_per_job(tmp_path):
+    jobs = load_manifest(write_manifest(tmp_path, {
+        'defaults': {'batch_pens': True},
+        'jobs': [{'input': 'a.gcode', 'output': 'a_out.gcode', 'alternate_pens': True},
+                 {'input': 'b.gcode', 'output': 'b_out.gcode', 'firmware': 'marlin'}]}))
+    assert [(job['batch_pens'], job.get('alternate_pens', False)) for job in jobs] == [(True, True), (True, False)]
+
+
+def test_unknown_settings_are_refused_before_anything_runs(tmp_path):
+    with pytest.raises(ValueError, match='tiling_n_z'):
+        load_manifest(write_manifest(tmp_path, {'jobs': [{'input': 'a', 'output': 'b', 'tiling_n_z': 2}]}))
+    with pytest.raises(ValueError, match='no jobs'):
+        load_manifest(write_manifest(tmp_path, {'jobs': []}))
+
+
+def test_batch_runs_every_job_and_reports_failures(tmp_path):
+    manifest = write_manifest(tmp_path, {'jobs': [{'input': CELL, 'output': 'cell.gcode', 'tiling_n_x': 2},
+                                                  {'input': 'missing.gcode', 'output': 'missing_out.gcode'}]})
+    report_path = str(tmp_path / 'report.json')
+    assert main([manifest, '--workers', '1', '--no-cache', '--report', report_path]) == 1
+    with open(report_path, 'r') as file:
+        reports = json.load(file)
+    assert [report['status'] for report in reports] == ['ok', 'failed']
+    assert reports[0]['tiles'] == 2
+    assert 'FileNotFoundError' in reports[1]['error']
+    with open(tmp_path / 'cell.gcode', 'r') as file:
+        assert DEFAULT_CYCLE_SUBROUTINE.split('\n')[0] not in file.read()
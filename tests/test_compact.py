@@ -0,0 +1,45 @@
+# The compact output encoder: fixed precision and modal elision
+import os
+from gcode_processor import compact_lines, format_number, track_modal_state
+
+
+def machine_states(lines):
+    # The position and feed after every line that moves the machine, as the firmware would follow them
+    state = {}
+    states = []
+    for line in lines:
+        before = dict(state)
+        track_modal_state([line], state, 'G01 Z-3', 'G01 Z0')
+        if state != before:
+            states.append(dict(state))
+    return states
+
+
+def test_numbers_are_written_without_exponents_or_float_artifacts():
+    assert format_number(102.36720000000001) == '102.36720000000001'
+    assert format_number(102.36720000000001, 4) == '102.3672'
+    assert format_number(2.0) == '2'
+    assert format_number(1e-7) == '0.0000001'
+    assert format_number(-0.00001, 4) == '0'
+    assert format_number(1.23456, 3) == '1.235'
+
+
+def test_compact_lines_drop_only_what_the_modal_state_repeats():
+    lines = ['G01 X1 Y2 F4500', 'G01 X1 Y3 F4500', 'G01 X1 Y3 F4500', 'G00 X5 Y3 F9000', 'G92 Z0', 'G01 X5 Y3 F9000',
+             'G02 X6 Y3 I1 J0 F9000']
+    assert list(compact_lines(lines)) == ['G01 X1 Y2 F4500', 'G01 Y3', 'G00 X5 F9000', 'G92 Z0',
+                                          'G01 X5 Y3 F9000', 'G02 X6 Y3 I1 J0 F9000']
+    assert list(compact_lines(lines[:2], omit_modal_words=True)) == ['G01 X1 Y2 F4500', 'Y3']
+
+
+def test_relative_moves_are_left_alone():
+    lines = ['G91', 'G01 X1 Y0', 'G01 X1 Y0', 'G90']
+    assert list(compact_lines(lines)) == lines
+
+
+def test_compact_job_moves_the_machine_the_same_way(run_job):
+    plain, plain_lines, plain_path = run_job(precision=4, tiling_n_x=2, cycles=2, output_name='plain.gcode')
+    compact, compact_lines_, compact_path = run_job(precision=4, tiling_n_x=2, cycles=2, compact=True,
+                                                    output_name='compact.gcode')
+    assert machine_states(compact_lines_) == machine_states(plain_lines)
+    assert os.path.getsize(compact_path) < 0.9 * os.path.getsize(plain_path)
@@ -0,0 +1,77 @@
+# Reading DXF drawings directly
+import io
+import math
+import pytest
+from dxf_reader import iter_dxf_paths
+from gcode_processor import parse_dxf, parse_gcode, calculate_bounds, OP_RAPID, OP_CCW_ARC
+from tests.conftest import SAMPLE_DXF, SAMPLE_GCODE
+
+
+def dxf(*entities, units=None):
+    # An ASCII DXF file of the given entities, each a type and a list of (group code, value) pairs
+    pairs = []
+    if units is not None:
+        pairs += [(0, 'SECTION'), (2, 'HEADER'), (9, '$INSUNITS'), (70, units), (0, 'ENDSEC')]
+    pairs += [(0, 'SECTION'), (2, 'ENTITIES')]
+    for entity_type, entity_pairs in entities:
+        pairs += [(0, entity_type)] + entity_pairs
+    pairs += [(0, 'ENDSEC'), (0, 'EOF')]
+    return io.StringIO(''.join(f'{code}\n{value}\n' for code, value in pairs))
+
+
+def paths(*entities, **kwargs):
+    return [(layer, [(word, round(x, 9), round(y, 9), i, j) for word, x, y, i, j in moves])
+            for layer, moves in iter_dxf_paths(dxf(*entities, **kwargs))]
+
+
+def test_arc_becomes_an_anticlockwise_arc_about_its_centre():
+    [(layer, moves)] = paths(('ARC', [(8, 'ink'), (10, 10), (20, 10), (40, 5), (50, 0), (51, 90)]))
+    assert layer == 'ink'
+    assert moves[0][:3] == ('G00', 15, 10)
+    word, x, y, i, j = moves[1]
+    assert (word, x, y) == ('G03', 10, 15)
+    assert (i, j) == pytest.approx((-5, 0))
+
+
+def test_circle_is_split_into_two_half_turns():
+    [(layer, moves)] = paths(('CIRCLE', [(10, 0), (20, 0), (40, 2)]))
+    assert [move[:3] for move in moves] == [('G00', 2, 0), ('G03', -2, 0), ('G03', 2, 0)]
+
+
+def test_polyline_bulges_become_arcs():
+    # a bulge of 1 is a half turn anticlockwise, -1 a half turn clockwise
+    [(layer, moves)] = paths(('LWPOLYLINE', [(70, 0), (10, 0), (20, 0), (42, 1), (10, 10), (20, 0), (42, -1),
+                                             (10, 20), (20, 0), (10, 30), (20, 0)]))
+    assert [move[:3] for move in moves] == [('G00', 0, 0), ('G03', 10, 0), ('G02', 20, 0), ('G01', 30, 0)]
+    assert moves[1][3:] == pytest.approx((5, 0))
+    assert moves[2][3:] == pytest.approx((5, 0))
+
+
+def test_closed_polyline_returns_to_its_start():
+    [(layer, moves)] = paths(('LWPOLYLINE', [(70, 1), (10, 0), (20, 0), (10, 10), (20, 0), (10, 10), (20, 10)]))
+    assert moves[-1][:3] == ('G01', 0, 0)
+
+
+def test_inch_drawings_are_scaled_to_millimetres():
+    [(layer, moves)] = paths(('LINE', [(10, 0), (20, 0), (11, 1), (21, 2)]), units=1)
+    assert moves[1][:3] == ('G01', 25.4, 50.8)
+
+
+def test_program_is_laid_out_like_the_converter():
+    program = parse_dxf(dxf(('LINE', [(8, 'a'), (10, 5), (20, 5), (11, 6), (21, 5)]),
+                            ('ARC', [(8, 'b'), (10, 8), (20, 5), (40, 1), (50, 180), (51, 0)])), 'M09', 'M10')
+    texts = [program.texts[program.text[k]] for k in range(len(program)) if program.ops[k] == 0]
+    assert texts == ['G21', 'M10', ';LAYER:a', 'M09', 'M10', ';LAYER:b', 'M09', 'M10', 'M02']
+    # moved so the lower left corner of the drawing (the bottom of the arc, at y = 4) sits at 0, 0
+    assert (program.x[3], program.y[3]) == (0.0, 1.0)
+    arc = list(program.ops).index(OP_CCW_ARC)
+    assert (program.x[arc], program.y[arc]) == pytest.approx((4.0, 1.0))
+    assert program.ops[-2] == OP_RAPID and (program.x[-2], program.y[-2]) == (0.0, 0.0)
+
+
+def test_sample_drawing_matches_the_converters_gcode():
+    with open(SAMPLE_DXF, 'r', errors='replace') as file:
+        from_dxf = calculate_bounds(parse_dxf(file, 'M09', 'M10'))
+    with open(SAMPLE_GCODE, 'r') as file:
+        from_gcode = calculate_bounds(parse_gcode(file))
+    assert from_dxf == pytest.approx(from_gcode, abs=0.05)
@@ -0,0 +1,44 @@
+# Run time estimates from the preamble's motion limits
+import pytest
+from gcode_processor import MotionPlanner, read_machine_limits, format_duration, OP_LINEAR, NAN
+
+
+def test_limits_are_read_from_the_preamble():
+    limits = read_machine_limits('M201 X1000 Y500 ; accelerations\nM203 X400 Y0\nM204 S400 T1250\nM205 X8')
+    assert limits['max_acceleration']['X'] == 1000 and limits['max_acceleration']['Y'] == 500
+    # a zero feedrate would stop the machine, so it keeps the default
+    assert limits['max_feedrate'] == {'X': 400, 'Y': 300, 'Z': 5}
+    assert limits['print_acceleration'] == 400
+    assert limits['jerk']['X'] == 8
+
+
+def test_long_move_takes_its_length_over_its_feed_plus_the_ramps():
+    planner = MotionPlanner(read_machine_limits('M201 X1000 Y1000\nM204 S1000\nM205 X0 Y0'))
+    # 1000mm at 10mm/s, accelerating and braking at 1000mm/s^2 (with no jerk) costs 10/1000 s more
+    seconds = planner.run([('move', OP_LINEAR, 1000.0, 0.0, NAN, 600.0, NAN, NAN)])
+    assert seconds == pytest.approx(100.01)
+    assert planner.position == (1000.0, 0.0, 0.0)
+
+
+def test_dwells_add_their_time():
+    planner = MotionPlanner(read_machine_limits(''))
+    assert planner.run([('dwell', 2.0), ('dwell', 0.5)]) == pytest.approx(2.5)
+
+
+def test_job_total_grows_by_a_cycle_per_cycle(run_job):
+    one = run_job(cycles=1, tiling_n_x=2)[0]
+    three = run_job(cycles=3, tiling_n_x=2)[0]
+    assert len(three['tile_times']) == 2
+    assert three['total_time'] - one['total_time'] == pytest.approx(2 * three['cycle_time'], rel=1e-3)
+
+
+def test_estimate_can_be_left_out(run_job):
+    estimated, estimated_lines, path = run_job(cycles=2, output_name='estimated.gcode')
+    summary, lines, path = run_job(cycles=2, estimate=False)
+    assert (summary['tile_times'], summary['cycle_time'], summary['total_time']) == ([], None, None)
+    assert 'estimate time' not in [stage['name'] for stage in summary['stages']]
+    assert lines == estimated_lines
+
+
+def test_durations_are_shown_as_hours_minutes_seconds():
+    assert format_duration(3725.4) == '1:02:05'
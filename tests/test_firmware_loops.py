@@ -0,0 +1,96 @@
+# Firmware loops that repeat the cycles instead of writing them out
+import re
+import pytest
+from gcode_processor import job_loop, FIRMWARE_LOOPS
+
+# the lines opening and closing each firmware's loop, and how its loop counts its iterations
+LOOP_BEGIN = re.compile(r'(?:M808 L|while iterations < |SDCARD_LOOP_BEGIN COUNT=)(\d+)$')
+LOOP_END = {'M808', 'SDCARD_LOOP_END', 'M02'}
+ITERATIONS = re.compile(r'\{iterations \* (-?[\d.]+)\}')
+
+
+def cell_starts(lines):
+    return sum(line.strip() == 'G21' for line in lines)
+
+
+def unrolled(lines):
+    # The lines the firmware runs, with its loop written out (RepRapFirmware's loop ends at the M02 after it)
+    lines = [line.strip() for line in lines if line.strip()]
+    begin = next((k for k, line in enumerate(lines) if LOOP_BEGIN.match(line)), None)
+    if begin is None:
+        return lines
+    end = next(k for k in range(begin + 1, len(lines)) if lines[k] in LOOP_END)
+    body = lines[begin + 1:end]
+    runs = [[ITERATIONS.sub(lambda match: repr(iteration * float(match.group(1))), line) for line in body]
+            for iteration in range(int(LOOP_BEGIN.match(lines[begin]).group(1)))]
+    return lines[:begin] + [line for run in runs for line in run] + lines[end + (lines[end] != 'M02'):]
+
+
+def pen_heights(lines):
+    # Where every Z move takes the pen, in machine coordinates (G92 Z0 makes the pen's height the new zero)
+    z = origin = 0.0
+    heights = []
+    for line in unrolled(lines):
+        words = line.partition(';')[0].split()
+        if words[:2] == ['G92', 'Z0']:
+            origin += z
+            z = 0.0
+        elif words and words[0] in ('G00', 'G01'):
+            for word in words[1:]:
+                if word.startswith('Z'):
+                    z = float(word[1:])
+                    heights.append(round(origin + z, 9))
+    return heights
+
+
+def test_loops_only_pay_off_past_two_cycles():
+    assert job_loop('expanded', 10) is None
+    assert job_loop('marlin', 2) is None
+    assert job_loop('marlin', 3) is FIRMWARE_LOOPS['marlin']
+    with pytest.raises(ValueError, match='unknown firmware loop'):
+        job_loop('grbl', 3)
+
+
+def test_marlin_loop_runs_the_second_cycle_for_the_rest(run_job):
+    expanded, expanded_lines, path = run_job(cycles=5, tiling_n_x=2, output_name='expanded.gcode')
+    looped, lines, path = run_job(cycles=5, tiling_n_x=2, firmware='marlin')
+    assert cell_starts(expanded_lines) == 10
+    assert cell_starts(lines) == 4
+    begin = lines.index('M808 L4')
+    end = len(lines) - 1 - lines[::-1].index('M808')
+    assert begin < end
+    # the first cycle before the loop, the second inside it
+    assert cell_starts(lines[:begin]) == 2 and cell_starts(lines[begin:end]) == 2
+    assert lines[begin + 1:begin + 3] == ['G01 Z0 F4500', 'G92 Z0']
+    assert [line for line in lines[end + 1:] if line] == ['M02']
+    assert looped['total_time'] == pytest.approx(expanded['total_time'], rel=0.01)
+
+
+def test_reprap_loop_is_indented_and_steps_by_iteration(run_job):
+    summary, lines, path = run_job(cycles=4, cycle_offset=-0.1, firmware='reprap')
+    begin = lines.index('while iterations < 3')
+    body = lines[begin + 1:lines.index('M02')]
+    assert body[0].startswith('  G01 Z{iterations * -0.1}')
+    assert all(line.startswith('  ') for line in body if line)
+    assert cell_starts(body) == 1
+
+
+def test_looped_job_cannot_be_indexed(run_job):
+    summary, lines, path = run_job(cycles=3, firmware='klipper', index=True)
+    assert 'SDCARD_LOOP_BEGIN COUNT=2' in lines and 'SDCARD_LOOP_END' in lines
+    with pytest.raises(FileNotFoundError):
+        open(path + '.index.json')
+
+
+@pytest.mark.parametrize('firmware', sorted(FIRMWARE_LOOPS))
+@pytest.mark.parametrize('cycle_offset', [0, -0.1])
+def test_loops_move_the_pen_like_the_expanded_job(run_job, firmware, cycle_offset):
+    summary, expanded, path = run_job(cycles=5, cycle_offset=cycle_offset, output_name='expanded.gcode')
+    if FIRMWARE_LOOPS[firmware]['constant_step'] and cycle_offset:
+        # these loops can only repeat the same z move, which can't follow the expanded job down
+        with pytest.raises(ValueError, match='cycle offset'):
+            run_job(cycles=5, cycle_offset=cycle_offset, firmware=firmware)
+        return
+    summary, looped, path = run_job(cycles=5, cycle_offset=cycle_offset, firmware=firmware)
+    assert cell_starts(unrolled(looped)) == cell_starts(expanded) == 5
+    assert pen_heights(looped) == pen_heights(expanded)
@@ -0,0 +1,54 @@
+# Nesting parts on the bed
+import itertools
+import pytest
+from gcode_processor import (nest_transforms, convex_separation, convex_hull, transform_points, part_outline,
+                             parse_gcode, IDENTITY)
+from tests.conftest import CELL
+
+TRIANGLE = convex_hull([(0.0, 0.0), (30.0, 0.0), (0.0, 20.0)])
+
+
+def check_layout(outline, transforms, bed_width, bed_height, margin, spacing):
+    placed = [transform_points(transform, outline) for transform in transforms]
+    for points in placed:
+        assert all(margin - 1e-6 <= x <= bed_width - margin + 1e-6 for x, y in points)
+        assert all(margin - 1e-6 <= y <= bed_height - margin + 1e-6 for x, y in points)
+    for first, second in itertools.combinations(placed, 2):
+        assert convex_separation(first, second) >= spacing - 1e-6
+
+
+@pytest.mark.parametrize('rotate, stagger', [(False, False), (False, True), (True, True)])
+def test_copies_keep_the_spacing_and_margin(rotate, stagger):
+    transforms = nest_transforms(TRIANGLE, IDENTITY, 200.0, 150.0, 5.0, 3.0, rotate, stagger)
+    assert len(transforms) > 1
+    check_layout(TRIANGLE, transforms, 200.0, 150.0, 5.0, 3.0)
+
+
+def test_staggered_rows_pack_tighter_than_boxes():
+    # a grid of 23 x 23 boxes fits 7 x 5 diamonds in the usable 170 x 120, staggered rows slot them in between
+    diamond = convex_hull([(10.0, 0.0), (20.0, 10.0), (10.0, 20.0), (0.0, 10.0)])
+    assert len(nest_transforms(diamond, IDENTITY, 180.0, 130.0, 5.0, 3.0, stagger=False)) == 35
+    transforms = nest_transforms(diamond, IDENTITY, 180.0, 130.0, 5.0, 3.0, stagger=True)
+    assert len(transforms) > 35
+    check_layout(diamond, transforms, 180.0, 130.0, 5.0, 3.0)
+
+
+def test_a_part_larger_than_the_bed_gets_no_copies():
+    assert nest_transforms(TRIANGLE, IDENTITY, 30.0, 30.0, 5.0, 3.0) == []
+
+
+def test_nested_job_stays_on_the_bed(run_job):
+    with open(CELL, 'r') as file:
+        outline = part_outline(parse_gcode(file))
+    # the cell is about 179 x 137mm, a quarter of that fits four times
+    summary, lines, path = run_job(nest=True, tiling_scale=0.25, bed_width=120.0, bed_height=90.0, bed_margin=4.0,
+                                   nest_spacing=2.0, preview=True)
+    transforms = summary['preview']['transforms']
+    assert summary['tiles'] == len(transforms) > 1
+    check_layout(outline, transforms, 120.0, 90.0, 4.0, 2.0)
+    assert summary['x_work_bound'] <= 116.0 + 1e-6 and summary['y_work_bound'] <= 86.0 + 1e-6
+
+
+def test_part_that_does_not_fit_is_an_error(run_job):
+    with pytest.raises(ValueError, match='does not fit'):
+        run_job(nest=True, bed_width=10.0, bed_height=10.0)
@@ -0,0 +1,44 @@
+# Parsing into the array-backed program and tiling through affine transforms
+import math
+from gcode_processor import (parse_gcode, offset_cell, move_suffixes, grid_transforms, grid_cells, finish_texts,
+                             OP_TEXT, OP_LINEAR, OP_CW_ARC)
+
+
+def test_moves_become_rows_and_texts_are_interned():
+    program = parse_gcode(['G21', 'G01 X1 Y2', 'M09', 'G02 X3 Y4 I1 J0', 'G01 X1 E5', 'M09'])
+    assert list(program.ops) == [OP_TEXT, OP_LINEAR, OP_TEXT, OP_CW_ARC, OP_TEXT, OP_TEXT]
+    assert (program.x[1], program.y[1]) == (1.0, 2.0)
+    assert math.isnan(program.z[1]) and math.isnan(program.f[1])
+    assert (program.i[3], program.j[3]) == (1.0, 0.0)
+    # a move with words other than X, Y, Z and F is kept as text, and each text is only stored once
+    assert program.texts == ['G21', 'M09', 'G01 X1 E5']
+    assert program.text[2] == program.text[5]
+
+
+def tiled_lines(program, transforms):
+    texts = finish_texts(program.texts, [], '4500', '9000')
+    return list(offset_cell(transforms, program, texts, move_suffixes(program, '4500', '9000')))
+
+
+def test_grid_offsets_every_tile_by_the_spacing():
+    transforms = grid_transforms(2, 15, 3, 20, 1.0)
+    assert [(e, f) for a, b, c, d, e, f in transforms] == [(15.0 * i, 20.0 * j) for i, j in grid_cells(2, 3)]
+    lines = tiled_lines(parse_gcode(['G01 X1 Y2']), transforms[-2:])
+    assert lines == ['G01 X16 Y22 F4500', 'G01 X16 Y42 F4500']
+
+
+def test_serpentine_grid_runs_every_other_column_back():
+    assert grid_cells(2, 3, serpentine=True) == [(0, 0), (0, 1), (0, 2), (1, 2), (1, 1), (1, 0)]
+
+
+def test_mirroring_turns_arcs_round():
+    program = parse_gcode(['G00 X0 Y0', 'G02 X10 Y0 I5 J0'])
+    plain, mirrored = (tiled_lines(program, grid_transforms(1, 0, 1, 0, 1.0, mirror_x=mirror, centre=(5, 0)))
+                       for mirror in (False, True))
+    assert plain[1] == 'G02 X10 Y0 I5 J0 F4500'
+    assert mirrored[1] == 'G03 X0 Y0 I-5 J0 F4500'
+
+
+def test_rotation_keeps_quarter_turns_exact():
+    transform = grid_transforms(1, 0, 1, 0, 2.0, rotation=90)[0]
+    assert transform[:4] == (0, -2.0, 2.0, 0)
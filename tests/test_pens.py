@@ -0,0 +1,126 @@
+# Batching strokes by pen
+import json
+import pytest
+from gcode_processor import parse_gcode, split_layers, join_programs, resume_job, OP_TEXT
+from tests.conftest import read_lines
+
+TWO_PENS = """G21
+;LAYER:black
+M10
+G00 X0 Y0
+M09
+G01 X10 Y0
+M10
+;LAYER:red
+G00 X0 Y5
+M09
+G01 X10 Y5
+M10
+;LAYER:black
+G00 X0 Y10
+M09
+G01 X10 Y10
+M10
+G00 X0 Y0
+M02
+"""
+
+
+def stroke_rows(lines):
+    # The Y word of every stroke drawn, in order
+    return [line.split()[2] for previous, line in zip(lines, lines[1:]) if previous == 'G01 Z-3 F4500']
+
+
+@pytest.fixture
+def two_pens(tmp_path):
+    path = tmp_path / 'two_pens.gcode'
+    path.write_text(TWO_PENS)
+    return str(path)
+
+
+def test_layers_keep_their_strokes_in_order():
+    layers = split_layers(parse_gcode(TWO_PENS.split('\n')))
+    assert [name for name, _ in layers] == ['black', 'red']
+    black, red = (layer for _, layer in layers)
+    assert [y for y in black.y if y == y] == [0, 0, 10, 10, 0]
+    assert [y for y in red.y if y == y] == [5, 5]
+    joined = join_programs([black, red])
+    assert len(joined) == len(black) + len(red)
+    assert joined.texts[joined.text[0]] == 'G21' and joined.ops[0] == OP_TEXT
+
+
+def test_single_layer_is_left_alone():
+    program = parse_gcode(['G21', ';LAYER:black', 'G00 X0 Y0'])
+    assert split_layers(program) == [('black', program)]
+
+
+def test_each_pen_draws_every_tile_before_a_change(run_job, two_pens):
+    summary, lines, path = run_job(two_pens, tiling_n_x=2, batch_pens=True,
+                                   pen_change='M0 ; pen {pen}: {layer}')
+    assert summary['pens'] == ['black', 'red']
+    changes = [k for k, line in enumerate(lines) if line.startswith('M0 ;')]
+    assert [lines[k] for k in changes] == ['M0 ; pen 1: black', 'M0 ; pen 2: red']
+    # both tiles of black (two strokes each) come before the first red stroke at y 5
+    assert stroke_rows(lines) == ['Y0', 'Y10', 'Y0', 'Y10', 'Y5', 'Y5']
+
+
+def test_without_batching_the_layers_stay_interleaved(run_job, two_pens):
+    summary, lines, path = run_job(two_pens, tiling_n_x=2, pen_change='M0 ; pen {pen}')
+    assert summary['pens'] == []
+    assert not any(line.startswith('M0 ;') for line in lines)
+    assert stroke_rows(lines) == ['Y0', 'Y5', 'Y10'] * 2
+
+
+def test_every_cycle_starts_with_the_first_pen_by_default(run_job, two_pens):
+    summary, lines, path = run_job(two_pens, tiling_n_x=2, cycles=2, batch_pens=True,
+                                   pen_change='M0 ; pen {pen}: {layer}')
+    changes = [line for line in lines if line.startswith('M0 ;')]
+    assert changes == ['M0 ; pen 1: black', 'M0 ; pen 2: red'] * 2
+    assert stroke_rows(lines) == ['Y0', 'Y10', 'Y0', 'Y10', 'Y5', 'Y5'] * 2
+
+
+def test_every_other_cycle_starts_with_the_pen_already_loaded(run_job, two_pens):
+    summary, lines, path = run_job(two_pens, tiling_n_x=2, cycles=3, batch_pens=True, alternate_pens=True,
+                                   pen_change='M0 ; pen {pen}: {layer}')
+    changes = [line for line in lines if line.startswith('M0 ;')]
+    # the second cycle goes from red back to black, the third from black to red again
+    assert changes == ['M0 ; pen 1: black', 'M0 ; pen 2: red', 'M0 ; pen 1: black', 'M0 ; pen 2: red']
+    assert stroke_rows(lines) == ['Y0', 'Y10', 'Y0', 'Y10', 'Y5', 'Y5',
+                                  'Y5', 'Y5', 'Y0', 'Y10', 'Y0', 'Y10',
+                                  'Y0', 'Y10', 'Y0', 'Y10', 'Y5', 'Y5']
+
+
+def test_firmware_loop_keeps_the_pen_order(run_job, two_pens):
+    summary, lines, path = run_job(two_pens, tiling_n_x=2, cycles=3, batch_pens=True, firmware='marlin',
+                                   pen_change='M0 ; pen {pen}: {layer}')
+    changes = [line.strip() for line in lines if line.strip().startswith('M0 ;')]
+    # the loop runs the same cycle every time, so it has to load the first pen again
+    assert changes == ['M0 ; pen 1: black', 'M0 ; pen 2: red'] * 2
+    with pytest.raises(ValueError, match='alternate the pen order'):
+        run_job(two_pens, cycles=3, batch_pens=True, alternate_pens=True, firmware='marlin')
+
+
+def test_estimate_counts_the_pen_changes_alternating_saves(run_job, two_pens):
+    # each pen change dwells for 10s, and the two cycles after the first save one of them each
+    settings = dict(tiling_n_x=2, cycles=3, batch_pens=True, pen_change='G4 S10\nM0 ; pen {pen}')
+    fixed = run_job(two_pens, **settings)[0]['total_time']
+    alternating = run_job(two_pens, alternate_pens=True, **settings)[0]['total_time']
+    assert fixed - alternating == pytest.approx(20, abs=1)
+
+
+def test_resume_follows_the_order_the_pens_drew_in(run_job, two_pens, tmp_path):
+    summary, lines, path = run_job(two_pens, tiling_n_x=2, cycles=2, batch_pens=True, alternate_pens=True,
+                                   index=True, pen_change='M0 ; pen {pen}: {layer}')
+    with open(path + '.index.json', 'r') as file:
+        index = json.load(file)
+    assert [(entry['cycle'], entry['tile']) for entry in index['entries']] == \
+           [(1, 1), (1, 2), (1, 3), (1, 4), (2, 3), (2, 4), (2, 1), (2, 2)]
+    resumed = str(tmp_path / 'resumed.gcode')
+    # black is loaded again before its first tile of the second cycle, red is still in from the first cycle
+    entry = resume_job(path, resumed, 2, 1)
+    assert entry['layer'] == 'black'
+    assert [line for line in read_lines(resumed) if line.startswith('M0 ;')] == ['M0 ; pen 1: black']
+    entry = resume_job(path, resumed, 2, 3)
+    assert entry['layer'] == 'red'
+    assert [line for line in read_lines(resumed) if line.startswith('M0 ;')] == ['M0 ; pen 1: black']
+    assert stroke_rows(read_lines(resumed)) == ['Y5', 'Y5', 'Y0', 'Y10', 'Y0', 'Y10']
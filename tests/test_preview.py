@@ -0,0 +1,46 @@
+# The toolpath preview's levels of detail, overlap and off-bed detection. Only the parts that don't
+# need a window are tested here.
+from toolpath_preview import PathLevels, tile_outline, overlapping_tiles, off_bed
+
+
+def test_coarser_levels_have_fewer_points_and_drop_tiny_paths():
+    circle = ([50 + 40 * (k % 2) * 0.001 + k * 0.01 for k in range(1000)], [0.001 * (k % 3) for k in range(1000)])
+    speck = ([0.0, 0.01], [0.0, 0.01])
+    levels = PathLevels([circle, speck])
+    assert levels.level(0.0) == [circle, speck]
+    coarse = levels.level(0.1)
+    assert len(coarse) == 1 and len(coarse[0][0]) < 10
+    # levels are only built once
+    assert levels.level(0.1) is coarse
+
+
+def test_overlapping_tiles_are_found():
+    preview = {'outline': [(0, 0), (10, 0), (0, 10)], 'extents': (0, 0, 10, 10)}
+    # a second triangle shifted diagonally: their boxes overlap up to a shift of 10, the triangles only up to 5
+    for shift, expected in ((6, set()), (4, {0, 1})):
+        outlines = [tile_outline(transform, preview) for transform in ((1, 0, 0, 1, 0, 0), (1, 0, 0, 1, shift, shift))]
+        boxes = [(min(x for x, y in outline), min(y for x, y in outline),
+                  max(x for x, y in outline), max(y for x, y in outline)) for outline in outlines]
+        assert overlapping_tiles(boxes, outlines) == expected
+
+
+def test_thin_parts_fall_back_to_their_extents():
+    outline = tile_outline((1, 0, 0, 1, 5, 0), {'outline': [(0, 0), (10, 0)], 'extents': (0, 0, 10, 0)})
+    assert outline == [(5, 0), (15, 0), (15, 0), (5, 0)]
+
+
+def test_tiles_past_the_bed_are_found():
+    boxes = [(0, 0, 100, 100), (110, 0, 210, 100), (-1, 0, 50, 50), (0, 0, 200, 200)]
+    assert off_bed(boxes, (0, 0, 200, 200)) == {1, 2}
+
+
+def test_every_job_previews_its_bed(run_job):
+    summary, lines, path = run_job(tiling_n_x=2, tiling_s_x=190, preview=True, bed_width=300.0, bed_height=250.0)
+    preview = summary['preview']
+    assert preview['bed'] == (0.0, 0.0, 300.0, 250.0)
+    outlines = [tile_outline(transform, preview) for transform in preview['transforms']]
+    boxes = [(min(x for x, y in outline), min(y for x, y in outline),
+              max(x for x, y in outline), max(y for x, y in outline)) for outline in outlines]
+    # the cell is about 179 x 137mm, so the second tile, 190mm along, reaches past 300mm but not the first
+    assert off_bed(boxes, preview['bed']) == {1}
+    assert off_bed(preview['skirts'], preview['bed']) == {1}
@@ -0,0 +1,150 @@
+# Running a job: progress and cancelling, and stage profiles
+import json
+import os
+import math
+import tracemalloc
+import pytest
+import gcode_processor
+from gcode_processor import (ProcessingCancelled, parse_gcode, simplify_paths, order_strokes, nest_transforms,
+                             estimate_job_time, motion_steps, read_machine_limits, part_outline, DEFAULT_PREAMBLE,
+                             IDENTITY)
+from toolpath_preview import preview_outline
+from tests.conftest import CELL
+
+
+def test_progress_runs_from_start_to_done(run_job):
+    reports = []
+    run_job(tiling_n_x=2, cycles=2, progress=lambda stage, fraction: reports.append((stage, fraction)))
+    fractions = [fraction for stage, fraction in reports]
+    assert fractions == sorted(fractions)
+    assert reports[-1] == ('Done', 1.0)
+    assert ('Writing cycle 2/2, tile 2/2', 0.875) in reports
+
+
+def test_cancelled_run_leaves_the_old_output_alone(run_job, tmp_path):
+    output_path = tmp_path / 'out.gcode'
+    output_path.write_text('old job\n')
+
+    def progress(stage, fraction):
+        if stage.startswith('Writing cycle 2'):
+            raise ProcessingCancelled()
+
+    with pytest.raises(ProcessingCancelled):
+        run_job(cycles=3, progress=progress)
+    assert output_path.read_text() == 'old job\n'
+    assert os.listdir(tmp_path) == ['out.gcode']
+
+
+def test_every_stage_is_timed_with_its_lines(run_job):
+    summary, lines, _ = run_job(tiling_n_x=2, simplify_tolerance=0.02)
+    stages = {stage['name']: stage for stage in summary['stages']}
+    assert {'prepare cell', 'simplify', 'bounds', 'tile', 'estimate time', 'write'} <= set(stages)
+    # the outline is only worked out for nesting
+    assert 'outline' not in stages
+    assert stages['simplify']['depth'] == 1
+    assert stages['write']['lines_out'] == len(lines) - 1
+    assert stages['tile']['lines_out'] == 2 * summary['cell_lines_after'] - 2
+    assert all(stage['seconds'] >= 0 and stage['peak_bytes'] is None for stage in summary['stages'])
+
+
+def test_profile_traces_memory_and_writes_a_report(run_job):
+    summary, lines, output_path = run_job(profile=True)
+    assert all(stage['peak_bytes'] >= 0 for stage in summary['stages'])
+    with open(output_path + '.profile.json', 'r') as file:
+        profile = json.load(file)
+    assert profile['memory_traced'] and profile['output'] == output_path
+    assert [stage['name'] for stage in profile['stages']] == [stage['name'] for stage in summary['stages']]
+
+
+@pytest.mark.parametrize('stop', ['cancel', 'fail'])
+def test_memory_tracing_stops_however_the_run_ends(run_job, stop):
+    def progress(stage, fraction):
+        if stage.startswith('Writing'):
+            raise ProcessingCancelled() if stop == 'cancel' else RuntimeError('disk full')
+
+    with pytest.raises(ProcessingCancelled if stop == 'cancel' else RuntimeError):
+        run_job(profile=True, progress=progress)
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.fixture
+def frequent_progress(monkeypatch):
+    # progress every few strokes or steps, so that the test cell gets it within its stages
+    monkeypatch.setattr(gcode_processor, 'PROGRESS_INTERVAL', 10)
+
+
+def cancel_after(calls):
+    # A progress(fraction) callback that records the fractions and cancels once it has been called enough
+    fractions = []
+
+    def progress(fraction):
+        fractions.append(fraction)
+        if len(fractions) == calls:
+            raise ProcessingCancelled()
+    return progress, fractions
+
+
+def test_long_stages_report_progress_and_can_be_cancelled(frequent_progress):
+    with open(CELL, 'r') as file:
+        program = parse_gcode(file)
+    ends = [((math.cos(k), math.sin(k)), (k % 7, k % 5)) for k in range(100)]
+    steps = motion_steps(program, program.texts, '4500', '9000')
+    stages = {
+        'simplify': lambda progress: simplify_paths(program, 0.05, progress=progress),
+        'order': lambda progress: order_strokes(ends, [True] * len(ends), (0.0, 0.0), progress),
+        'nest': lambda progress: nest_transforms([(0.0, 0.0), (10.0, 0.0), (0.0, 10.0)], IDENTITY, 100.0, 100.0,
+                                                 5.0, 2.0, rotate=True, progress=progress),
+        'estimate': lambda progress: estimate_job_time(read_machine_limits(DEFAULT_PREAMBLE), [], [steps], [[]],
+                                                       [IDENTITY], 3, -0.1, [], '4500', progress=progress),
+    }
+    for name, run in stages.items():
+        progress, fractions = cancel_after(None)
+        run(progress)
+        assert len(fractions) > 3, name
+        assert fractions == sorted(fractions) and 0 <= fractions[0] and fractions[-1] <= 1, name
+        progress, fractions = cancel_after(3)
+        with pytest.raises(ProcessingCancelled):
+            run(progress)
+
+
+def test_job_can_be_cancelled_within_a_stage(run_job, tmp_path, frequent_progress):
+    reports = []
+
+    def progress(stage, fraction):
+        reports.append((stage, fraction))
+        if stage == 'Simplifying' and fraction > 0.25:
+            raise ProcessingCancelled()
+
+    with pytest.raises(ProcessingCancelled):
+        run_job(optimize_travel=True, simplify_tolerance=0.05, progress=progress)
+    assert len([stage for stage, fraction in reports if stage == 'Optimising stroke order']) > 2
+    assert not (tmp_path / 'out.gcode').exists()
+
+
+def test_progress_within_stages_keeps_going_forward(run_job, frequent_progress):
+    reports = []
+    run_job(optimize_travel=True, simplify_tolerance=0.05, nest=True, tiling_scale=0.25, bed_width=120.0,
+            bed_height=90.0, progress=lambda stage, fraction: reports.append((stage, fraction)))
+    fractions = [fraction for stage, fraction in reports]
+    assert fractions == sorted(fractions)
+    stages = {stage for stage, fraction in reports}
+    assert {'Optimising stroke order', 'Simplifying', 'Nesting', 'Estimating run time'} <= stages
+    assert len(reports) > 50
+
+
+def test_preview_works_out_the_outline_when_it_is_drawn(run_job):
+    summary, lines, path = run_job(preview=True)
+    assert 'outline' not in [stage['name'] for stage in summary['stages']]
+    preview = summary['preview']
+    assert preview['outline'] is None
+    with open(CELL, 'r') as file:
+        outline = part_outline(parse_gcode(file))
+    assert preview_outline(preview) == outline
+    # worked out once, then kept with the preview
+    assert preview_outline(preview) is preview['outline']
+
+
+def test_nested_job_brings_its_outline_to_the_preview(run_job):
+    summary, lines, path = run_job(preview=True, nest=True, tiling_scale=0.25, bed_width=120.0, bed_height=90.0)
+    assert 'outline' in [stage['name'] for stage in summary['stages']]
+    assert len(summary['preview']['outline']) > 3
@@ -0,0 +1,67 @@
+# The resume index and restarting a job from any tile
+import json
+import pytest
+from gcode_processor import resume_job
+from tests.conftest import read_lines
+
+
+def read_index(output_path):
+    with open(output_path + '.index.json', 'r') as file:
+        return json.load(file)
+
+
+def test_offsets_point_at_the_start_of_every_tile(run_job):
+    summary, lines, path = run_job(cycles=3, cycle_offset=-0.1, tiling_n_x=2, tiling_n_y=2, index=True)
+    index = read_index(path)
+    assert (index['cycles'], index['tiles']) == (3, 4)
+    assert [(entry['cycle'], entry['tile']) for entry in index['entries']] == \
+           [(cycle, tile) for cycle in (1, 2, 3) for tile in (1, 2, 3, 4)]
+    with open(path, 'rb') as file:
+        content = file.read()
+    for entry in index['entries']:
+        # every tile of the cell starts with its G21
+        assert content[entry['offset'] - 1:entry['offset'] + 4] == b'\nG21\n'
+    # the z origin moves down by the offset of every cycle boundary before it
+    assert [entry['z_origin'] for entry in index['entries'][::4]] == pytest.approx([0.0, -0.0, -0.1])
+
+
+def test_resumed_job_is_the_rest_of_the_output(run_job, tmp_path):
+    summary, lines, path = run_job(cycles=2, tiling_n_x=2, index=True)
+    entry = resume_job(path, str(tmp_path / 'resumed.gcode'), 2, 2)
+    assert (entry['cycle'], entry['tile']) == (2, 2)
+    resumed = read_lines(str(tmp_path / 'resumed.gcode'))
+    with open(path, 'rb') as file:
+        file.seek(entry['offset'])
+        rest = file.read().decode().split('\n')
+    assert resumed[-len(rest):] == rest
+    header = resumed[:-len(rest)]
+    assert header[0].startswith('; resumed at cycle 2, tile 2')
+    # the preamble, pen up, a travel to where the previous tile left the machine and its feed
+    assert header[-3:] == ["G01 Z0 F4500", 'G00 X0 Y0 F9000', 'G01 F9000']
+
+
+def test_grid_column_and_row_select_the_tile(run_job, tmp_path):
+    summary, lines, path = run_job(tiling_n_x=3, tiling_n_y=2, index=True)
+    index = read_index(path)
+    tile = index['grid'].index([2, 1]) + 1
+    assert resume_job(path, str(tmp_path / 'resumed.gcode'), 1, (3, 2))['tile'] == tile
+    with pytest.raises(ValueError, match='no tile at column 4'):
+        resume_job(path, str(tmp_path / 'resumed.gcode'), 1, (4, 1))
+    with pytest.raises(ValueError, match='1 cycles of 6 tiles'):
+        resume_job(path, str(tmp_path / 'resumed.gcode'), 2, 1)
+
+
+def test_changed_output_is_refused(run_job, tmp_path):
+    summary, lines, path = run_job(index=True)
+    with open(path, 'a') as file:
+        file.write('M117 edited\n')
+    with pytest.raises(ValueError, match='has changed'):
+        resume_job(path, str(tmp_path / 'resumed.gcode'), 1, 1)
+    assert not (tmp_path / 'resumed.gcode').exists()
+
+
+def test_index_is_removed_when_the_output_is_rewritten_without_one(run_job):
+    summary, lines, path = run_job(index=True)
+    run_job()
+    with pytest.raises(FileNotFoundError):
+        read_index(path)
@@ -0,0 +1,70 @@
+# Streaming to the plotter over serial, against the fake printer on a pseudo-terminal
+import os
+import pytest
+from serial_sender import (GcodeSender, FakePrinter, SenderError, open_serial, numbered_line, clean_command,
+                           waits_for_user)
+
+pytest.importorskip('serial')
+pytestmark = pytest.mark.skipif(not hasattr(os, 'openpty'), reason='the fake printer needs a pseudo-terminal')
+
+JOB = [f'G01 X{k * 0.5:.1f} Y{k % 7} F4500 ; move {k}' for k in range(300)]
+
+
+def send(printer, lines, **settings):
+    # Streams lines to the fake printer, returning the sender once everything is acknowledged
+    with GcodeSender(open_serial(printer.port), **settings) as sender:
+        sender.start()
+        sender.stream(lines)
+    return sender
+
+
+def test_lines_are_numbered_and_checksummed():
+    assert numbered_line(1, 'G28') == 'N1 G28*18'
+    assert clean_command('  G01 X1 ; to the left  ') == 'G01 X1'
+    assert clean_command('M117 Café ; été') == 'M117 Caf?'
+    assert [waits_for_user(line) for line in ('N12 M0*3', 'M01', 'M1 S5', 'M105', 'G01 X1', '')] == \
+           [True, True, True, False, False, False]
+
+
+@pytest.mark.parametrize('flow_control', ['ok', 'count'])
+def test_every_line_arrives_in_order(flow_control):
+    with FakePrinter(rx_buffer=128) as printer:
+        sender = send(printer, JOB, flow_control=flow_control)
+    assert printer.commands == [clean_command(line) for line in JOB]
+    assert sender.lines_acked == len(JOB)
+    assert (printer.errors, printer.overflows, sender.resends) == (0, 0, 0)
+
+
+@pytest.mark.parametrize('flow_control', ['ok', 'count'])
+def test_damaged_lines_are_sent_again(flow_control):
+    # the printer drops the lines in flight behind a damaged one without answering them, so the sender must not
+    # wait for them (the short timeout) but send them again
+    with FakePrinter(corrupt_lines=[5, 120, 121]) as printer:
+        sender = send(printer, JOB, flow_control=flow_control, timeout=2.0)
+    assert printer.commands == [clean_command(line) for line in JOB]
+    assert sender.lines_acked == len(JOB)
+    # 121 goes again with 120, and is only damaged then
+    if flow_control == 'ok':
+        assert sender.resends == printer.errors == 3
+    else:
+        # the lines in flight behind a damaged one are refused too, mostly answered by going back once
+        assert printer.errors >= sender.resends >= 3
+
+
+def test_non_ascii_text_is_sent_as_question_marks():
+    with FakePrinter() as printer:
+        send(printer, ['M117 über ; pen é', 'G01 X1'])
+    assert printer.commands == ['M117 ?ber', 'G01 X1']
+
+
+def test_waiting_for_the_user_does_not_time_out():
+    with FakePrinter(user_wait_seconds=1.0) as printer:
+        sender = send(printer, ['G01 X1', 'M0 Load pen 2', 'G01 X2'], timeout=0.3)
+    assert printer.commands == ['G01 X1', 'M0 Load pen 2', 'G01 X2']
+    assert sender.lines_acked == 3
+
+
+def test_silent_firmware_times_out():
+    with FakePrinter(line_seconds=1.0) as printer:
+        with pytest.raises(SenderError, match='no response'):
+            send(printer, ['G01 X1', 'G01 X2'], timeout=0.3)
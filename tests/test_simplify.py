@@ -0,0 +1,110 @@
+# Simplifying dense G01 runs into fewer lines and arcs
+import math
+import random
+import pytest
+from gcode_processor import (parse_gcode, resolve_positions, is_plain_cut, simplify_polyline, simplify_paths, fit_arc,
+                             OP_LINEAR, OP_CW_ARC, OP_CCW_ARC)
+from tests.conftest import CELL
+
+
+def point_segment_distance(px, py, x0, y0, x1, y1):
+    dx, dy = x1 - x0, y1 - y0
+    length_squared = dx * dx + dy * dy
+    t = 0.0 if not length_squared else min(max(((px - x0) * dx + (py - y0) * dy) / length_squared, 0.0), 1.0)
+    return math.hypot(x0 + t * dx - px, y0 + t * dy - py)
+
+
+def arc_points(x0, y0, op, x1, y1, i, j, count=200):
+    centre_x, centre_y = x0 + i, y0 + j
+    radius = math.hypot(i, j)
+    start = math.atan2(y0 - centre_y, x0 - centre_x)
+    sweep = (math.atan2(y1 - centre_y, x1 - centre_x) - start) % (2 * math.pi)
+    if op == OP_CW_ARC:
+        sweep -= 2 * math.pi
+    return [(centre_x + radius * math.cos(start + sweep * k / count),
+             centre_y + radius * math.sin(start + sweep * k / count)) for k in range(count + 1)]
+
+
+def deviation(xs, ys, moves):
+    # The furthest any simplified move gets from the part of the polyline it replaces, and the furthest any
+    # replaced point gets from its move, sampled finely along the arcs
+    worst = 0.0
+    start = 0
+    for op, x, y, i, j in moves:
+        end = next(k for k in range(start + 1, len(xs)) if (xs[k], ys[k]) == (x, y))
+        segments = list(zip(xs[start:end], ys[start:end], xs[start + 1:end + 1], ys[start + 1:end + 1]))
+        if op == OP_LINEAR:
+            drawn = [(xs[start], ys[start], x, y)]
+        else:
+            samples = arc_points(xs[start], ys[start], op, x, y, i, j)
+            worst = max(worst, max(min(point_segment_distance(px, py, *segment) for segment in segments)
+                                   for px, py in samples))
+            drawn = [(x0, y0, x1, y1) for (x0, y0), (x1, y1) in zip(samples, samples[1:])]
+        worst = max(worst, max(min(point_segment_distance(px, py, *segment) for segment in drawn)
+                               for px, py in zip(xs[start:end + 1], ys[start:end + 1])))
+        start = end
+    return worst
+
+
+def cell_runs():
+    with open(CELL, 'r') as file:
+        program = parse_gcode(file)
+    xs, ys = resolve_positions(program)
+    k = 0
+    while k < len(program):
+        if not is_plain_cut(program, k):
+            k += 1
+            continue
+        end = k
+        while end < len(program) and is_plain_cut(program, end):
+            end += 1
+        yield [xs[k - 1]] + list(xs[k:end]), [ys[k - 1]] + list(ys[k:end])
+        k = end
+
+
+@pytest.mark.parametrize('tolerance', [0.02, 0.05])
+def test_simplified_cell_stays_within_tolerance(tolerance):
+    for xs, ys in cell_runs():
+        assert deviation(xs, ys, simplify_polyline(xs, ys, tolerance)) <= tolerance * 1.001
+
+
+@pytest.mark.parametrize('tolerance', [0.01, 0.05])
+def test_coarse_noisy_circle_stays_within_tolerance(tolerance):
+    # few points, each off the circle by up to nearly the tolerance: the chords between them cut well inside
+    generator = random.Random(5)
+    angles = [k * 0.35 for k in range(16)]
+    radii = [20 + generator.uniform(-0.9, 0.9) * tolerance for _ in angles]
+    xs = [radius * math.cos(angle) for radius, angle in zip(radii, angles)]
+    ys = [radius * math.sin(angle) for radius, angle in zip(radii, angles)]
+    moves = simplify_polyline(xs, ys, tolerance)
+    assert deviation(xs, ys, moves) <= tolerance * 1.001
+
+
+def test_dense_circle_becomes_one_arc():
+    # three quarters of a circle, its chords 0.03 inside it
+    angles = [k * math.pi / 20 for k in range(31)]
+    xs = [5 + 10 * math.cos(angle) for angle in angles]
+    ys = [-3 + 10 * math.sin(angle) for angle in angles]
+    assert len(simplify_polyline(xs, ys, 0.02)) > 1
+    moves = simplify_polyline(xs, ys, 0.05)
+    assert len(moves) == 1
+    op, x, y, i, j = moves[0]
+    assert op == OP_CCW_ARC and (x, y) == (xs[-1], ys[-1])
+    assert (xs[0] + i, ys[0] + j) == (pytest.approx(5), pytest.approx(-3))
+
+
+def test_straight_and_reversing_runs_are_not_arcs():
+    xs = [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert fit_arc(xs, [0.0, 0.001, 0.0, -0.001, 0.0], 0, 4, 0.01) is None
+    # a full turn, and a run that doubles back, both through points on one circle
+    assert fit_arc([0.0, 1.0, 2.0, 1.0, 0.0], [0.0, 1.0, 0.0, -1.0, 0.0], 0, 4, 0.01) is None
+    assert fit_arc([0.0, 1.0, 2.0, 1.0, 2.0], [0.0, 1.0, 0.0, 1.0, 0.0], 0, 4, 0.01) is None
+
+
+def test_simplified_cell_keeps_everything_but_the_runs():
+    with open(CELL, 'r') as file:
+        program = parse_gcode(file)
+    simplified = simplify_paths(program, 0.05)
+    assert len(simplified) < len(program)
+    texts = [program.texts[text_id] for op, text_id in zip(program.ops, program.text) if not op]
+    assert [simplified.texts[text_id] for op, text_id in zip(simplified.ops, simplified.text) if not op] == texts
@@ -0,0 +1,33 @@
+# Reordering strokes to cut pen-up travel
+from gcode_processor import (parse_gcode, optimize_stroke_order, split_strokes, resolve_positions, travel_distance,
+                             OP_TEXT, OP_RAPID)
+from tests.conftest import CELL
+
+
+def drawn_strokes(program):
+    # Every stroke as the points it draws through, from where the pen goes down, the same either way round
+    xs, ys = resolve_positions(program)
+    strokes = []
+    for stroke in split_strokes(program, 'M09', 'M10')[1]:
+        points = tuple((round(xs[k], 6), round(ys[k], 6)) for k in stroke[:-1])
+        strokes.append(min(points, points[::-1]))
+    return sorted(strokes)
+
+
+def test_reordering_draws_the_same_strokes_with_less_travel():
+    with open(CELL, 'r') as file:
+        program = parse_gcode(file)
+    optimized = optimize_stroke_order(program, 'M09', 'M10')
+    assert drawn_strokes(optimized) == drawn_strokes(program)
+    assert travel_distance(optimized) < travel_distance(program)
+
+
+def test_strokes_are_not_moved_across_other_lines():
+    program = parse_gcode(['G00 X10 Y0', 'M09', 'G01 X11 Y0', 'M10', 'M106', 'G00 X0 Y0', 'M09', 'G01 X1 Y0', 'M10',
+                           'G00 X5 Y0', 'M09', 'G01 X6 Y0', 'M10'])
+    optimized = optimize_stroke_order(program, 'M09', 'M10')
+    xs, ys = resolve_positions(optimized)
+    texts = [optimized.texts[optimized.text[k]] for k in range(len(optimized)) if optimized.ops[k] == OP_TEXT]
+    assert texts.index('M106') == 2
+    # the first stroke stays ahead of the M106; the two after it are taken nearest first, drawn backwards
+    assert [xs[k] for k in range(len(optimized)) if optimized.ops[k] == OP_RAPID] == [10.0, 6.0, 1.0]
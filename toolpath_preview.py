@@ -0,0 +1,253 @@
+# Toolpath preview window for the pen plotting GCODE processor.
+# Draws the tiled job (every tile of the tile set, which each cycle plots again in the same place),
+# the skirts and, optionally, the travel moves on a Tk canvas, from the parsed cell rather than the
+# output file. Drag to pan, use the mouse wheel to zoom.
+# Jobs with hundreds of thousands of segments stay interactive because nothing is drawn in more
+# detail than the screen can show: each polyline is simplified (Douglas-Peucker) to about a pixel
+# at the current zoom, from a handful of precomputed levels of detail, tiles off screen are skipped,
+# and tiles too small to make out are drawn as their outline only. While panning or zooming the
+# drawing is just moved or scaled, and is redrawn at the right level of detail once it settles.
+import time
+import tkinter as tk
+from gcode_processor import douglas_peucker, transform_points, convex_separation, convex_hull
+
+# simplification tolerances of the levels of detail, in mm of the cell
+LEVEL_TOLERANCES = (0.0, 0.02, 0.08, 0.32, 1.28, 5.12, 20.48)
+# tiles smaller than this on screen (pixels) are only drawn as their outline
+MIN_TILE_PIXELS = 24
+CUT_COLOUR = '#1f4e9a'
+TRAVEL_COLOUR = '#b0b0b0'
+SKIRT_COLOURS = ('#e08a00', '#c05000')
+OUTLINE_COLOUR = '#60a060'
+OVERLAP_COLOUR = '#d02020'
+BED_COLOUR = '#808080'
+
+
+class PathLevels:
+    # Polylines (lists of (xs, ys)) kept at several levels of detail, each built the first time it's asked for.
+    # A level drops the polylines that are smaller than its tolerance altogether.
+    def __init__(self, polylines):
+        self.polylines = polylines
+        self.levels = {}
+
+    def level(self, tolerance):
+        # The coarsest level that is still within tolerance, as a list of (xs, ys)
+        level = max(t for t in LEVEL_TOLERANCES if t <= max(tolerance, 0.0))
+        if level not in self.levels:
+            self.levels[level] = self.build(level)
+        return self.levels[level]
+
+    def build(self, tolerance):
+        if tolerance == 0:
+            return self.polylines
+        simplified = []
+        for xs, ys in self.polylines:
+            if max(max(xs) - min(xs), max(ys) - min(ys)) < tolerance:
+                continue
+            keep = douglas_peucker(xs, ys, 0, len(xs) - 1, tolerance)
+            simplified.append(([xs[k] for k in keep], [ys[k] for k in keep]))
+        return simplified
+
+
+def preview_outline(preview):
+    # The part's outline (the convex hull of its cuts, as part_outline works it out), found the first time the
+    # preview needs it rather than for every job processed. A nested job comes with the outline it was nested by.
+    if preview.get('outline') is None:
+        preview['outline'] = convex_hull([point for xs, ys in preview['cuts'] for point in zip(xs, ys)])
+    return preview['outline']
+
+
+def tile_outline(transform, preview):
+    # A tile's outline: the part's convex hull (or, for a part too thin to have one, the corners of its extents),
+    # mapped through the tile's transform
+    outline = preview_outline(preview)
+    if len(outline) < 3:
+        min_x, min_y, max_x, max_y = preview['extents']
+        outline = [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)]
+    return transform_points(transform, outline)
+
+
+def overlapping_tiles(boxes, outlines):
+    # Indices of the tiles whose outlines overlap another one's: a sweep along X finds the tiles
+    # whose boxes (min_x, min_y, max_x, max_y) overlap, and the separating axis test settles it
+    order = sorted(range(len(boxes)), key=lambda k: boxes[k][0])
+    overlapping = set()
+    active = []
+    for k in order:
+        min_x, min_y, max_x, max_y = boxes[k]
+        active = [other for other in active if boxes[other][2] > min_x]
+        for other in active:
+            if (boxes[other][1] < max_y and min_y < boxes[other][3]
+                    and convex_separation(outlines[k], outlines[other]) < -1e-9):
+                overlapping.update((k, other))
+        active.append(k)
+    return overlapping
+
+
+def off_bed(boxes, bed, tolerance=1e-6):
+    # Indices of the boxes (min_x, min_y, max_x, max_y) that reach past the bed's
+    min_x, min_y, max_x, max_y = bed
+    return {k for k, box in enumerate(boxes)
+            if box[0] < min_x - tolerance or box[1] < min_y - tolerance
+            or box[2] > max_x + tolerance or box[3] > max_y + tolerance}
+
+
+class ToolpathPreview(tk.Toplevel):
+    # A window showing the preview from process_gcode(..., preview=True)
+    def __init__(self, master, preview, title='Toolpath Preview'):
+        super().__init__(master)
+        self.title(title)
+        self.preview = preview
+        self.cuts = PathLevels(preview['cuts'])
+        self.travels = PathLevels(preview['travels'])
+        self.outlines = [tile_outline(transform, preview) for transform in preview['transforms']]
+        self.boxes = [(min(x for x, y in outline), min(y for x, y in outline),
+                       max(x for x, y in outline), max(y for x, y in outline)) for outline in self.outlines]
+        self.overlapping = overlapping_tiles(self.boxes, self.outlines)
+        # tiles and skirts that the machine can't reach
+        self.off_bed = off_bed(self.boxes, preview['bed']) if preview.get('bed') else set()
+        self.skirts_off_bed = off_bed(preview['skirts'], preview['bed']) if preview.get('bed') else set()
+        # drawn in red, overlapping or off the bed
+        self.flagged = self.overlapping | self.off_bed
+        # view: screen x = offset_x + scale * x, screen y = offset_y - scale * y (Y up, as on the machine)
+        self.scale = 1.0
+        self.offset_x = self.offset_y = 0.0
+        self.drag_start = None
+        self.pending_redraw = None
+
+        self.canvas = tk.Canvas(self, width=900, height=650, background='white', highlightthickness=0)
+        self.canvas.grid(row=0, column=0, columnspan=4, sticky='nsew')
+        self.show_travel_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(self, text="Show travel moves", variable=self.show_travel_var,
+                       command=self.redraw).grid(row=1, column=0, sticky='w', padx=5, pady=5)
+        tk.Button(self, text="Fit", command=self.fit).grid(row=1, column=1, sticky='w', padx=5, pady=5)
+        self.status_var = tk.StringVar()
+        tk.Label(self, textvariable=self.status_var).grid(row=1, column=2, columnspan=2, sticky='w', padx=5)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(3, weight=1)
+
+        self.canvas.bind('<ButtonPress-1>', self.start_drag)
+        self.canvas.bind('<B1-Motion>', self.drag)
+        self.canvas.bind('<ButtonRelease-1>', self.end_drag)
+        self.canvas.bind('<MouseWheel>', lambda event: self.zoom(event, 1.25 if event.delta > 0 else 0.8))
+        self.canvas.bind('<Button-4>', lambda event: self.zoom(event, 1.25))
+        self.canvas.bind('<Button-5>', lambda event: self.zoom(event, 0.8))
+        self.canvas.bind('<Configure>', self.resize)
+        self.fitted = False
+
+    def world_bounds(self):
+        # Everything the job reaches: the tiles, the skirts, the bed and the origin
+        boxes = self.boxes + list(self.preview['skirts'])
+        if self.preview.get('bed'):
+            boxes.append(self.preview['bed'])
+        return (min([box[0] for box in boxes] + [0.0]), min([box[1] for box in boxes] + [0.0]),
+                max([box[2] for box in boxes] + [0.0]), max([box[3] for box in boxes] + [0.0]))
+
+    def resize(self, event):
+        # fit the job to the window the first time it's shown, and keep the view after that
+        if not self.fitted:
+            self.fitted = True
+            self.fit()
+        else:
+            self.redraw()
+
+    def fit(self):
+        min_x, min_y, max_x, max_y = self.world_bounds()
+        width = max(self.canvas.winfo_width(), 100)
+        height = max(self.canvas.winfo_height(), 100)
+        self.scale = 0.9 * min(width / max(max_x - min_x, 1e-6), height / max(max_y - min_y, 1e-6))
+        self.offset_x = width / 2 - self.scale * (min_x + max_x) / 2
+        self.offset_y = height / 2 + self.scale * (min_y + max_y) / 2
+        self.redraw()
+
+    def start_drag(self, event):
+        self.drag_start = (event.x, event.y)
+
+    def drag(self, event):
+        # only move what's drawn while dragging; tiles coming into view are drawn when the drag ends
+        if self.drag_start is None:
+            return
+        dx, dy = event.x - self.drag_start[0], event.y - self.drag_start[1]
+        self.canvas.move('all', dx, dy)
+        self.offset_x += dx
+        self.offset_y += dy
+        self.drag_start = (event.x, event.y)
+
+    def end_drag(self, event):
+        self.drag_start = None
+        self.redraw()
+
+    def zoom(self, event, factor):
+        # scale what's drawn about the pointer straight away, and redraw it in the right detail once the wheel stops
+        self.canvas.scale('all', event.x, event.y, factor, factor)
+        self.scale *= factor
+        self.offset_x = event.x - factor * (event.x - self.offset_x)
+        self.offset_y = event.y - factor * (event.y - self.offset_y)
+        if self.pending_redraw is not None:
+            self.after_cancel(self.pending_redraw)
+        self.pending_redraw = self.after(150, self.redraw)
+
+    def screen_coordinates(self, transform, xs, ys):
+        # Flat screen coordinate list for a polyline of the cell drawn in a tile
+        a, b, c, d, e, f = transform
+        s = self.scale
+        a, b, c, d = s * a, s * b, -s * c, -s * d
+        e, f = self.offset_x + s * e, self.offset_y - s * f
+        coordinates = []
+        for x, y in zip(xs, ys):
+            coordinates.append(a * x + b * y + e)
+            coordinates.append(c * x + d * y + f)
+        return coordinates
+
+    def redraw(self):
+        self.pending_redraw = None
+        start = time.perf_counter()
+        canvas = self.canvas
+        canvas.delete('all')
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        s = self.scale
+
+        # the machine origin and axes
+        canvas.create_line(self.offset_x, 0, self.offset_x, height, fill='#e8e8e8')
+        canvas.create_line(0, self.offset_y, width, self.offset_y, fill='#e8e8e8')
+        if self.preview.get('bed'):
+            min_x, min_y, max_x, max_y = self.preview['bed']
+            canvas.create_rectangle(self.offset_x + s * min_x, self.offset_y - s * min_y,
+                                    self.offset_x + s * max_x, self.offset_y - s * max_y, outline=BED_COLOUR, width=2)
+        for index, ((min_x, min_y, max_x, max_y), colour) in enumerate(zip(self.preview['skirts'], SKIRT_COLOURS)):
+            canvas.create_rectangle(self.offset_x + s * min_x, self.offset_y - s * min_y,
+                                    self.offset_x + s * max_x, self.offset_y - s * max_y,
+                                    outline=OVERLAP_COLOUR if index in self.skirts_off_bed else colour, dash=(6, 3))
+
+        drawn_tiles = segments = 0
+        for index, (transform, outline, box) in enumerate(zip(self.preview['transforms'], self.outlines, self.boxes)):
+            left, right = self.offset_x + s * box[0], self.offset_x + s * box[2]
+            top, bottom = self.offset_y - s * box[3], self.offset_y - s * box[1]
+            if right < 0 or left > width or bottom < 0 or top > height:
+                continue
+            points = [value for x, y in outline for value in (self.offset_x + s * x, self.offset_y - s * y)]
+            canvas.create_polygon(points, fill='', width=2 if index in self.flagged else 1,
+                                  outline=OVERLAP_COLOUR if index in self.flagged else OUTLINE_COLOUR)
+            if max(right - left, bottom - top) < MIN_TILE_PIXELS:
+                continue
+            drawn_tiles += 1
+            # about a pixel, in mm of the cell (scaled tiles draw their cell bigger or smaller)
+            a, b, c, d, e, f = transform
+            tolerance = 1.0 / (s * max(abs(a * d - b * c), 1e-12) ** 0.5)
+            for xs, ys in self.cuts.level(tolerance):
+                canvas.create_line(self.screen_coordinates(transform, xs, ys), fill=CUT_COLOUR)
+                segments += len(xs) - 1
+            if self.show_travel_var.get():
+                for xs, ys in self.travels.level(tolerance):
+                    canvas.create_line(self.screen_coordinates(transform, xs, ys), fill=TRAVEL_COLOUR, dash=(2, 4))
+
+        status = (f"{len(self.preview['transforms'])} tiles x {self.preview['cycles']} cycles, "
+                  f"{drawn_tiles} drawn in detail, {segments} segments, "
+                  f"{1000 * (time.perf_counter() - start):.0f}ms")
+        if self.overlapping:
+            status += f"  -  {len(self.overlapping)} tiles overlap (red)"
+        if self.off_bed or self.skirts_off_bed:
+            skirt = ' and the skirt' if self.skirts_off_bed else ''
+            status += f"  -  {len(self.off_bed)} tiles{skirt} off the bed (red)"
+        self.status_var.set(status)